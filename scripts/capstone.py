@@ -2,6 +2,16 @@ __AUTHOR__ = "hugsy"
 __VERSION__ = 0.3
 __LICENSE__ = "MIT"
 
+import array
+import bisect
+import collections
+import json
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, Generator, List, Optional, Tuple
 
 import gdb
@@ -12,9 +22,6 @@ if TYPE_CHECKING:
     from . import gdb
 
 
-__cs: Optional[capstone.Cs] = None
-
-
 _CS_ARCH_ARM64_NAME = "CS_ARCH_AARCH64" if hasattr(capstone, "CS_ARCH_AARCH64") else "CS_ARCH_ARM64"
 
 def gef_to_cs_arch() -> Tuple[str, str, str]:
@@ -80,6 +87,79 @@ def gef_to_cs_arch() -> Tuple[str, str, str]:
     raise ValueError
 
 
+@lru_cache(maxsize=None)
+def cs_get_handle(arch: str, mode: str, endian: str, skipdata: bool = False) -> capstone.Cs:
+    "Return the Capstone handle for the given arch/mode, created only once."
+    cs = capstone.Cs(getattr(capstone, arch), getattr(capstone, mode) | getattr(capstone, endian))
+    cs.skipdata = skipdata
+    return cs
+
+
+class CapstoneInstructionCache:
+    """LRU cache of the decoded instructions. Entries are indexed by the Capstone arch/mode,
+    the address of the instruction and the hash of the content of its page: as long as the
+    code page does not change, an instruction is decoded (and symbolized) only once."""
+
+    def __init__(self, maxsize: int = 0x2000) -> None:
+        self.maxsize = maxsize
+        self.__entries: "collections.OrderedDict[Tuple[Tuple[str, str, str], int, int], Instruction]" = \
+            collections.OrderedDict()
+        return
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: Tuple[Tuple[str, str, str], int, int]) -> Optional[Instruction]:
+        insn = self.__entries.get(key)
+        if insn is not None:
+            self.__entries.move_to_end(key)
+        return insn
+
+    def put(self, key: Tuple[Tuple[str, str, str], int, int], insn: Instruction) -> None:
+        self.__entries[key] = insn
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
+        return
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        return
+
+
+cs_insn_cache = CapstoneInstructionCache()
+
+
+def cs_reset_caches(_: "gdb.MemoryChangedEvent") -> None:
+    "The code may have been patched from GDB, decode it again."
+    cs_insn_cache.clear()
+    cs_get_handle.cache_clear()
+    return
+
+
+# largest instruction size of the supported architectures, read past the end of a page to
+# decode the instructions crossing the page boundary
+CS_MAX_INSN_SIZE = 16
+
+
+def cs_insn_to_gef_insn(cs_insn: capstone.CsInsn) -> Instruction:
+    sym_info = symbol_index.lookup(cs_insn.address)
+    loc = f"<{sym_info[0]}+{sym_info[1]}>" if sym_info else ""
+    ops = [] + cs_insn.op_str.split(", ")
+    return Instruction(cs_insn.address, loc, cs_insn.mnemonic, ops, cs_insn.bytes)
+
+
+def cs_read_page(page_start: int) -> Optional[bytes]:
+    "Read a code page, plus the beginning of the next one if it is readable."
+    pagesize = gef.session.pagesize
+    for size in (pagesize + CS_MAX_INSN_SIZE, pagesize):
+        try:
+            return bytes(gef.memory.read(page_start, size))
+        except gdb.MemoryError:
+            continue
+    return None
+
+
 def cs_disassemble(
     location: int, nb_insn: int, **kwargs: Any
 ) -> Generator[Instruction, None, None]:
@@ -87,21 +167,8 @@ def cs_disassemble(
     `addr` using the Capstone-Engine disassembler, if available.
     Return an iterator of Instruction objects."""
 
-    def cs_insn_to_gef_insn(cs_insn: capstone.CsInsn) -> Instruction:
-        sym_info = gdb_get_location_from_symbol(cs_insn.address)
-        loc = f"<{sym_info[0]}+{sym_info[1]}>" if sym_info else ""
-        ops = [] + cs_insn.op_str.split(", ")
-        return Instruction(cs_insn.address, loc, cs_insn.mnemonic, ops, cs_insn.bytes)
-
-    arch_s, mode_s, endian_s = gef_to_cs_arch()
-    cs_arch: int = getattr(capstone, arch_s)
-    cs_mode: int = getattr(capstone, mode_s)
-    cs_endian: int = getattr(capstone, endian_s)
-
-    cs = capstone.Cs(cs_arch, cs_mode | cs_endian)
-    cs.detail = True
-    page_start = align_address_to_page(location)
-    offset = location - page_start
+    cs_arch = gef_to_cs_arch()
+    cs = cs_get_handle(*cs_arch)
 
     skip = int(kwargs.get("skip", 0))
     nb_prev = int(kwargs.get("nb_prev", 0))
@@ -113,20 +180,168 @@ def cs_disassemble(
             return
         nb_insn += nb_prev
 
-    code = kwargs.get(
-        "code", gef.memory.read(location, gef.session.pagesize - offset - 1)
-    )
-    for insn in cs.disasm(code, location):
+    if "code" in kwargs:
+        # explicit buffer, bypass the cache
+        for insn in cs.disasm(kwargs["code"], location):
+            if skip:
+                skip -= 1
+                continue
+            nb_insn -= 1
+            yield cs_insn_to_gef_insn(insn)
+            if nb_insn == 0:
+                break
+        return
+
+    pagesize = gef.session.pagesize
+    address = location
+    page_start, page_data, page_hash = -1, b"", 0
+    while nb_insn > 0:
+        if not page_start <= address < page_start + pagesize:
+            page_start = align_address_to_page(address)
+            data = cs_read_page(page_start)
+            if not data:
+                return
+            page_data, page_hash = data, hash(data)
+
+        key = (cs_arch, address, page_hash)
+        insn = cs_insn_cache.get(key)
+        if insn is None:
+            # decode (and symbolize) all the instructions needed at once
+            offset = address - page_start
+            for cs_insn in cs.disasm(page_data[offset:], address, skip + nb_insn):
+                if cs_insn.address >= page_start + pagesize:
+                    break
+                cs_insn_cache.put((cs_arch, cs_insn.address, page_hash),
+                                  cs_insn_to_gef_insn(cs_insn))
+            insn = cs_insn_cache.get(key)
+            if insn is None:
+                # invalid instruction
+                return
+
+        address += len(insn.opcodes)
         if skip:
             skip -= 1
             continue
         nb_insn -= 1
-        yield cs_insn_to_gef_insn(insn)
-        if nb_insn == 0:
-            break
+        yield insn
     return
 
 
+def cs_linear_sweep(
+    start: int, end: int, chunk_size: int = 0x100000
+) -> Generator[Tuple[int, str, str, bytes], None, None]:
+    """Linear sweep disassembly of [`start`, `end`), reading the memory `chunk_size` bytes
+    at a time. Bytes that cannot be decoded are emitted as data (`.byte`) and the sweep goes on.
+    Yield (address, mnemonic, operands, opcodes) tuples."""
+    cs = cs_get_handle(*gef_to_cs_arch(), skipdata=True)
+    # a chunk must hold more than one instruction for the sweep to progress
+    chunk_size = max(chunk_size, CS_MAX_INSN_SIZE + 1)
+    address = start
+    while address < end:
+        size = min(chunk_size, end - address)
+        code = gef.memory.read(address, size)
+        # stop a bit before the end of the chunk, unless it is the last one, so that an
+        # instruction crossing the chunk boundary is decoded from the next chunk
+        limit = size if address + size >= end else size - CS_MAX_INSN_SIZE
+        next_address = address + size
+        for insn_address, insn_size, mnemonic, op_str in cs.disasm_lite(code, address):
+            offset = insn_address - address
+            if offset >= limit:
+                next_address = insn_address
+                break
+            yield insn_address, mnemonic, op_str, code[offset:offset + insn_size]
+        address = next_address
+    return
+
+
+def cs_format_sweep_insn(address: int, mnemonic: str, op_str: str, opcodes: bytes,
+                        show_opcodes: bool = False) -> str:
+    "Format one line of the linear sweep listing, prefixed by a label on function starts."
+    sym = symbol_index.lookup(address, fallback=False)
+    label = f"\n<{sym[0]}>:\n" if sym and sym[1] == 0 else ""
+    opcodes_str = f"{opcodes.hex():{CS_MAX_INSN_SIZE * 2}s}  " if show_opcodes else ""
+    return f"{label}  {address:#x}:  {opcodes_str}{mnemonic:8s} {op_str}"
+
+
+CS_INDEX_MAGIC = b"GEFCSIX1"
+# one index entry every CS_INDEX_STRIDE instructions of the listing
+CS_INDEX_STRIDE = 64
+# bytes decoded past the end of each chunk of a parallel sweep to resynchronize with the next one
+CS_SWEEP_OVERLAP = 0x400
+
+# (region start, region bytes, capstone arch, show opcodes, temporary directory), set by the
+# parent before forking the workers of a parallel sweep
+cs_sweep_snapshot: Optional[Tuple[int, bytes, Tuple[str, str, str], bool, str]] = None
+
+
+def cs_parallel_sweep_worker(job: Tuple[int, int, int]) -> Tuple[int, bytes, bytes]:
+    """Linear sweep of the chunk [`start`, `end`) of the snapshot, written as text in a part file.
+    Return the chunk id and the addresses/file offsets (`array('Q')` bytes) of its instructions."""
+    idx, start, end = job
+    base, region, cs_arch, show_opcodes, tmpdir = cs_sweep_snapshot
+    cs = cs_get_handle(*cs_arch, skipdata=True)
+    code = region[start - base:end - base]
+    addresses, offsets = array.array("Q"), array.array("Q")
+    lines: List[bytes] = []
+    offset = 0
+    for address, size, mnemonic, op_str in cs.disasm_lite(code, start):
+        opcodes = code[address - start:address - start + size]
+        line = (cs_format_sweep_insn(address, mnemonic, op_str, opcodes, show_opcodes) + "\n").encode()
+        addresses.append(address)
+        offsets.append(offset)
+        lines.append(line)
+        offset += len(line)
+    with open(os.path.join(tmpdir, f"{idx}.part"), "wb") as fd:
+        fd.write(b"".join(lines))
+    return idx, addresses.tobytes(), offsets.tobytes()
+
+
+def cs_sweep_resync(prev_addresses: "array.array[int]", prev_end: int,
+                    next_addresses: "array.array[int]") -> Tuple[int, int]:
+    """Find where the sweep of a chunk (decoded past its end `prev_end`) and the sweep of the next
+    chunk agree on an instruction boundary. Return the index of that instruction in both."""
+    i = bisect.bisect_left(prev_addresses, prev_end)
+    if i == len(prev_addresses):
+        return i, bisect.bisect_left(next_addresses, prev_end)
+    overlap_end = bisect.bisect_right(next_addresses, prev_addresses[-1])
+    candidates = set(next_addresses[:overlap_end])
+    for k in range(i, len(prev_addresses)):
+        if prev_addresses[k] in candidates:
+            return k, bisect.bisect_left(next_addresses, prev_addresses[k])
+    # no common boundary in the overlap, cut at the first instruction past the chunk
+    return i, bisect.bisect_left(next_addresses, prev_addresses[i])
+
+
+class CapstoneSweepIndex:
+    """Sparse address index of a listing produced by a parallel sweep: sorted (address, offset in
+    the listing) pairs, one every `stride` instructions, stored in `<listing>.idx`."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(f"{path}.idx", "rb") as fd:
+            if fd.read(len(CS_INDEX_MAGIC)) != CS_INDEX_MAGIC:
+                raise ValueError(f"'{path}.idx' is not a capstone-disassemble index")
+            header_len = struct.unpack("<H", fd.read(2))[0]
+            header = json.loads(fd.read(header_len))
+            entries = array.array("Q")
+            entries.frombytes(fd.read())
+        self.start, self.end = header["start"], header["end"]
+        self.cs_arch = tuple(header["cs"])
+        self.addresses = entries[0::2]
+        self.offsets = entries[1::2]
+        return
+
+    def offset_of(self, address: int) -> int:
+        "Offset in the listing from which to read forward to find `address`."
+        idx = bisect.bisect_right(self.addresses, address) - 1
+        return self.offsets[idx] if idx >= 0 else 0
+
+
+@lru_cache(maxsize=8)
+def cs_load_sweep_index(path: str, mtime: float) -> CapstoneSweepIndex:
+    return CapstoneSweepIndex(path)
+
+
 InstructionGenerator = Callable[[int, int, Any], Generator[Instruction, None, None]]
 
 
@@ -135,14 +350,21 @@ class CapstoneDisassembleCommand(GenericCommand):
     """Use capstone disassembly framework to disassemble code."""
 
     _cmdline_ = "capstone-disassemble"
-    _syntax_ = f"{_cmdline_} [-h] [--show-opcodes] [--length LENGTH] [LOCATION]"
+    _syntax_ = (f"{_cmdline_} [-h] [--show-opcodes] [--length LENGTH] [LOCATION]\n"
+                f"{_cmdline_} [-h] [--show-opcodes] (--section NAME | --range START-END) [--output PATH]\n"
+                f"{_cmdline_} [-h] [--show-opcodes] (--section NAME | --range START-END) --index PATH\n"
+                f"{_cmdline_} [-h] --index PATH [--length LENGTH] [LOCATION]")
     _aliases_ = ["cs-dis", "cs"]
-    _example_ = f"{_cmdline_} --length 50 $pc"
+    _example_ = [f"{_cmdline_} --length 50 $pc",
+                 f"{_cmdline_} --section .text --output /tmp/text.asm",
+                 f"{_cmdline_} --section .text --index /tmp/text.asm",
+                 f"{_cmdline_} --index /tmp/text.asm --length 20 0x555555556000"]
 
     def __init__(self) -> None:
         super().__init__(complete=gdb.COMPLETE_LOCATION)
         ctx = gef.gdb.commands["context"]
         assert isinstance(ctx, ContextCommand)
+        gef_on_memchanged_hook(cs_reset_caches)
 
         gef.config[f"{self._cmdline_}.use-capstone"] = GefSetting(
             value=False,
@@ -155,6 +377,8 @@ class CapstoneDisassembleCommand(GenericCommand):
             },
         )
 
+        self["sweep_chunk_size"] = (0x100000, "Size of the memory chunks read when disassembling a whole section/range (at least one page)")
+        self["sweep_jobs"] = (0, "Number of processes used to build a disassembly index (0: one per CPU)")
         self.__original_disassembler: InstructionGenerator = ctx.instruction_iterator
         return
 
@@ -182,17 +406,32 @@ class CapstoneDisassembleCommand(GenericCommand):
 
     @only_if_gdb_running
     @parse_arguments(
-        {("location"): "$pc"}, {("--show-opcodes", "-s"): False, "--length": 0}
+        {("location"): "$pc"}, {("--show-opcodes", "-s"): False, "--length": 0,
+                                "--section": "", "--range": "", "--output": "", "--index": ""}
     )
     def do_invoke(self, _: List[str], **kwargs: Any) -> None:
         args = kwargs["arguments"]
         show_opcodes = args.show_opcodes
+
+        if args.section or args.range:
+            bounds = self.get_sweep_bounds(args.section, args.range)
+            if not bounds:
+                return
+            if args.index:
+                self.build_index(*bounds, show_opcodes=show_opcodes, path=args.index)
+            else:
+                self.sweep(*bounds, show_opcodes=show_opcodes, output=args.output)
+            return
         length = args.length or gef.config["context.nb_lines_code"]
         location = parse_address(args.location)
         if not location:
             info(f"Can't find address for {args.location}")
             return
 
+        if args.index:
+            self.query_index(args.index, location, length)
+            return
+
         insns = []
         opcodes_len = 0
         for insn in cs_disassemble(
@@ -219,6 +458,190 @@ class CapstoneDisassembleCommand(GenericCommand):
             gef_print(msg)
         return
 
+    @property
+    def sweep_chunk_size(self) -> int:
+        "The `sweep_chunk_size` setting, clamped to at least one page."
+        return max(self["sweep_chunk_size"], gef.session.pagesize)
+
+    def get_sweep_bounds(self, section_name: str, range_str: str) -> Optional[Tuple[int, int]]:
+        if range_str:
+            try:
+                start, end = [parse_address(x) for x in range_str.split("-", 1)]
+            except (ValueError, gdb.error):
+                err(f"Invalid range '{range_str}', expected START-END")
+                return None
+        else:
+            zones = [z for z in get_info_files() if z.name == section_name]
+            if not zones:
+                err(f"Section '{section_name}' not found")
+                return None
+            # prefer the section of the debugged binary over the libraries' ones
+            main = [z for z in zones if z.filename == str(gef.session.file)]
+            zone = (main or zones)[0]
+            start, end = zone.zone_start, zone.zone_end
+        if start >= end:
+            err(f"Invalid range {start:#x}-{end:#x}")
+            return None
+        return start, end
+
+    def sweep(self, start: int, end: int, show_opcodes: bool = False, output: str = "") -> None:
+        """Disassemble the whole range [`start`, `end`) in streaming: the instructions are written
+        chunk by chunk as they are decoded, either to the screen or to the file `output`."""
+        fd = open(output, "w") if output else None
+        nb_insn = 0
+        lines: List[str] = []
+        start_time = time.perf_counter()
+        ok(f"Disassembling {start:#x}-{end:#x} ({end - start:#x} bytes)")
+        try:
+            for address, mnemonic, op_str, opcodes in cs_linear_sweep(start, end, self.sweep_chunk_size):
+                lines.append(cs_format_sweep_insn(address, mnemonic, op_str, opcodes, show_opcodes))
+                nb_insn += 1
+                if len(lines) >= 0x1000:
+                    self.__sweep_write(fd, lines)
+                    lines = []
+        except gdb.MemoryError as e:
+            err(f"Stopping the disassembly: {e}")
+        finally:
+            self.__sweep_write(fd, lines)
+            if fd:
+                fd.close()
+
+        elapsed = time.perf_counter() - start_time
+        rate = nb_insn / elapsed if elapsed else 0
+        info(f"{nb_insn} instructions disassembled in {elapsed:.2f}s ({rate:.0f} insn/s)"
+             + (f", written to '{output}'" if output else ""))
+        return
+
+    def build_index(self, start: int, end: int, show_opcodes: bool = False, path: str = "") -> None:
+        """Disassemble [`start`, `end`) with a pool of processes, each sweeping one chunk of the
+        region (plus an overlap to resynchronize with the next chunk). The chunks are merged in
+        address order into the listing `path`, and its sparse index into `path.idx`."""
+        global cs_sweep_snapshot
+        start_time = time.perf_counter()
+        chunk_size = self.sweep_chunk_size
+        region = bytearray()
+        try:
+            for address in range(start, end, chunk_size):
+                region += gef.memory.read(address, min(chunk_size, end - address))
+        except gdb.MemoryError as e:
+            err(f"Cannot read the region: {e}")
+            return
+
+        jobs = self["sweep_jobs"] or os.cpu_count() or 1
+        # a few chunks per process to balance the load, but not too small ones
+        chunk_size = max(chunk_size, -(-(end - start) // (jobs * 4)))
+        chunks = [(i, address, min(address + chunk_size + CS_SWEEP_OVERLAP, end))
+                  for i, address in enumerate(range(start, end, chunk_size))]
+        chunk_ends = [min(address + chunk_size, end) for _, address, _ in chunks]
+        ok(f"Disassembling {start:#x}-{end:#x} ({end - start:#x} bytes) in {len(chunks)} chunk(s) "
+           f"with {jobs} process(es)")
+
+        # make sure the symbol index is up-to-date before the workers inherit it
+        symbol_index.lookup(start, fallback=False)
+        cs_arch = gef_to_cs_arch()
+        nb_insn = 0
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cs_sweep_snapshot = (start, bytes(region), cs_arch, show_opcodes, tmpdir)
+            del region
+            entries = array.array("Q")
+            try:
+                with open(path, "wb") as listing, \
+                        multiprocessing.get_context("fork").Pool(jobs) as pool:
+                    prev = None
+                    from_idx = 0
+                    for idx, raw_addresses, raw_offsets in pool.imap(cs_parallel_sweep_worker, chunks):
+                        addresses, offsets = array.array("Q"), array.array("Q")
+                        addresses.frombytes(raw_addresses)
+                        offsets.frombytes(raw_offsets)
+                        cur = (idx, addresses, offsets)
+                        if prev is None:
+                            prev = cur
+                            continue
+                        to_idx, next_from_idx = cs_sweep_resync(prev[1], chunk_ends[prev[0]], addresses)
+                        nb_insn += self.__merge_part(listing, entries, tmpdir, prev, from_idx, to_idx, nb_insn)
+                        prev, from_idx = cur, next_from_idx
+                    if prev:
+                        nb_insn += self.__merge_part(listing, entries, tmpdir, prev, from_idx,
+                                                     len(prev[1]), nb_insn)
+            finally:
+                cs_sweep_snapshot = None
+
+        header = json.dumps({"start": start, "end": end, "cs": cs_arch,
+                             "stride": CS_INDEX_STRIDE}).encode()
+        with open(f"{path}.idx", "wb") as fd:
+            fd.write(CS_INDEX_MAGIC)
+            fd.write(struct.pack("<H", len(header)))
+            fd.write(header)
+            entries.tofile(fd)
+
+        elapsed = time.perf_counter() - start_time
+        rate = nb_insn / elapsed if elapsed else 0
+        info(f"{nb_insn} instructions disassembled in {elapsed:.2f}s ({rate:.0f} insn/s), "
+             f"written to '{path}' (index '{path}.idx')")
+        return
+
+    def __merge_part(self, listing: Any, entries: "array.array[int]", tmpdir: str,
+                     part: Tuple[int, "array.array[int]", "array.array[int]"],
+                     from_idx: int, to_idx: int, nb_insn: int) -> int:
+        "Append the instructions [`from_idx`, `to_idx`) of a chunk to the listing and its index."
+        idx, addresses, offsets = part
+        part_path = os.path.join(tmpdir, f"{idx}.part")
+        if from_idx < to_idx:
+            start_offset = offsets[from_idx]
+            end_offset = offsets[to_idx] if to_idx < len(offsets) else os.path.getsize(part_path)
+            base = listing.tell()
+            # keep one entry every CS_INDEX_STRIDE instructions of the whole listing
+            first = from_idx + (-nb_insn % CS_INDEX_STRIDE)
+            for k in range(first, to_idx, CS_INDEX_STRIDE):
+                entries.extend((addresses[k], base + offsets[k] - start_offset))
+            with open(part_path, "rb") as fd:
+                fd.seek(start_offset)
+                listing.write(fd.read(end_offset - start_offset))
+        os.unlink(part_path)
+        return max(0, to_idx - from_idx)
+
+    def query_index(self, path: str, location: int, length: int) -> None:
+        "Print `length` instructions from `location`, read from a listing built with `--index`."
+        try:
+            index = cs_load_sweep_index(path, os.stat(f"{path}.idx").st_mtime)
+        except (OSError, ValueError, struct.error) as e:
+            err(f"Cannot load the index of '{path}': {e}")
+            return
+        if not index.start <= location < index.end:
+            err(f"{location:#x} is outside of the indexed region {index.start:#x}-{index.end:#x}")
+            return
+
+        lines: List[str] = []
+        labels: List[str] = []
+        with open(path, "rb") as fd:
+            fd.seek(index.offset_of(location))
+            for raw in fd:
+                line = raw.decode("utf-8", "replace").rstrip("\n")
+                if not line.startswith("  0x"):
+                    if line:
+                        labels.append(line)
+                    continue
+                if int(line.split(":", 1)[0], 16) < location:
+                    labels.clear()
+                    continue
+                lines += labels
+                lines.append(line)
+                labels.clear()
+                length -= 1
+                if length == 0:
+                    break
+        gef_print("\n".join(lines))
+        return
+
+    def __sweep_write(self, fd: Optional[Any], lines: List[str]) -> None:
+        if not lines:
+            return
+        if fd:
+            fd.write("\n".join(lines) + "\n")
+        else:
+            gef_print("\n".join(lines))
+        return
+
     def capstone_analyze_pc(self, insn: Instruction, nb_insn: int) -> Tuple[bool, str]:
         if gef.arch.is_conditional_branch(insn):
             is_taken, reason = gef.arch.is_branch_taken(insn)
@@ -2,10 +2,17 @@ __AUTHOR__ = "hugsy"
 __VERSION__ = 0.2
 __LICENSE__ = "MIT"
 
+import array
+import bisect
+import json
+import multiprocessing
+import multiprocessing.util
 import os
 import pathlib
 import sys
 import tempfile
+from functools import lru_cache
+from multiprocessing import shared_memory
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import capstone
@@ -31,6 +38,9 @@ def uc_registers(to_string: bool = False) -> Union[Dict[str, int], Dict[str, str
     const = getattr(unicorn, f"{arch}_const")
     for reg in gef.arch.all_registers:
         regname = f"UC_{arch.upper()}_REG_{reg[1:].upper()}"
+        if not hasattr(const, regname):
+            # register unknown to unicorn (e.g. `$fs_base` on older bindings), skip it
+            continue
         if to_string:
             regs[reg] = f"{const.__name__}.{regname}"
         else:
@@ -69,6 +79,42 @@ def gef_to_uc_arch() -> Tuple[str, str, str]:
     raise ValueError
 
 
+def uc_registers_values() -> Dict[int, int]:
+    "Return the current values of the registers, indexed by their Unicorn identifier."
+    regs = uc_registers()
+    values = {uc_reg: gef.arch.register(reg) for reg, uc_reg in regs.items()}
+    if is_x86_64():
+        # the segment bases are not always part of `gef.arch.all_registers`
+        x86_const = unicorn.x86_const
+        for reg, uc_reg in (("$fs_base", "UC_X86_REG_FS_BASE"), ("$gs_base", "UC_X86_REG_GS_BASE")):
+            if reg in regs or not hasattr(x86_const, uc_reg):
+                continue
+            try:
+                values[getattr(x86_const, uc_reg)] = gef.arch.register(reg)
+            except (gdb.error, ValueError):
+                continue
+    return values
+
+
+def gef_to_uc_arch_values() -> Tuple[int, int]:
+    "Return the `(arch, mode)` integer tuple to pass to `unicorn.Uc` for the current architecture."
+    arch, mode, endian = gef_to_uc_arch()
+    uc_mode = getattr(unicorn, mode) if mode != "0" else 0
+    return getattr(unicorn, arch), uc_mode | getattr(unicorn, endian)
+
+
+def gef_to_uc_permission(perm: Permission) -> int:
+    "Convert a GEF `Permission` to its unicorn `UC_PROT_*` equivalent."
+    uc_perm = unicorn.UC_PROT_NONE
+    if perm & Permission.READ:
+        uc_perm |= unicorn.UC_PROT_READ
+    if perm & Permission.WRITE:
+        uc_perm |= unicorn.UC_PROT_WRITE
+    if perm & Permission.EXECUTE:
+        uc_perm |= unicorn.UC_PROT_EXEC
+    return uc_perm
+
+
 _CS_ARCH_ARM64_NAME = "CS_ARCH_AARCH64" if hasattr(capstone, "CS_ARCH_AARCH64") else "CS_ARCH_ARM64"
 
 def gef_to_cs_arch() -> Tuple[str, str, str]:
@@ -102,6 +148,369 @@ def gef_to_cs_arch() -> Tuple[str, str, str]:
     raise ValueError
 
 
+@lru_cache(maxsize=None)
+def cs_handle(cs_arch: str, cs_mode: str, cs_endian: str) -> capstone.Cs:
+    "Return a Capstone handle for the given arch/mode, created only once."
+    return capstone.Cs(getattr(capstone, cs_arch),
+                       getattr(capstone, cs_mode) | getattr(capstone, cs_endian))
+
+
+UNICORN_TRACE_MAGIC = b"GEFUCTR1"
+
+
+class UnicornTraceWriter:
+    """Record the basic blocks executed by the emulation into a compact binary trace file.
+    The file starts with `UNICORN_TRACE_MAGIC`, followed by the length (u16) of a JSON header
+    describing the architecture, followed by (block address, block size) pairs stored as
+    native unsigned 64-bit integers."""
+
+    FLUSH_THRESHOLD = 0x10000
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self.fd = path.open("wb")
+        header = json.dumps({"cs": gef_to_cs_arch(), "byteorder": sys.byteorder}).encode()
+        self.fd.write(UNICORN_TRACE_MAGIC + len(header).to_bytes(2, "little") + header)
+        self.records = array.array("Q")
+        self.nb_blocks = 0
+        return
+
+    def block_hook(self, uc: unicorn.Uc, address: int, size: int, user_data: Any) -> None:
+        self.records.append(address)
+        self.records.append(size)
+        if len(self.records) >= self.FLUSH_THRESHOLD:
+            self.flush()
+        return
+
+    def flush(self) -> None:
+        self.nb_blocks += len(self.records) // 2
+        self.records.tofile(self.fd)
+        self.records = array.array("Q")
+        return
+
+    def close(self) -> None:
+        self.flush()
+        self.fd.close()
+        return
+
+
+def read_unicorn_trace(path: pathlib.Path) -> Tuple[Dict[str, Any], array.array]:
+    "Load a trace written by `UnicornTraceWriter`, return its header and its records."
+    with path.open("rb") as fd:
+        if fd.read(len(UNICORN_TRACE_MAGIC)) != UNICORN_TRACE_MAGIC:
+            raise ValueError(f"'{path}' is not a unicorn-emulate trace file")
+        header = json.loads(fd.read(int.from_bytes(fd.read(2), "little")))
+        records = array.array("Q")
+        records.frombytes(fd.read())
+    if header["byteorder"] != sys.byteorder:
+        records.byteswap()
+    return header, records
+
+
+class UnicornPageCache:
+    """Page-granular snapshot of the inferior memory, shared by all the emulation runs done from
+    the same stop: the in-process engines, the `--batch` snapshots and the `--output-file`
+    memory dumps. Pages are read on demand and stored as immutable `bytes`: engines copy them
+    when mapping a page, so the emulated code never alters the snapshot. Only the pages mapped by
+    the engines are stored, the bulk copies reuse them but do not fill the cache. The whole cache
+    is dropped whenever the inferior stops again or its memory is modified from GDB."""
+
+    def __init__(self) -> None:
+        self.generation: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__pages: Dict[Tuple[int, int], bytes] = {}
+        return
+
+    def __len__(self) -> int:
+        return len(self.__pages)
+
+    def invalidate(self, _: Optional["gdb.Event"] = None) -> None:
+        self.generation += 1
+        self.hits = self.misses = 0
+        self.__pages.clear()
+        return
+
+    def read(self, page: int, size: int) -> bytes:
+        "Return the content of the page starting at `page`, raise `gdb.MemoryError` if unreadable."
+        key = (page, self.generation)
+        data = self.__pages.get(key)
+        if data is not None:
+            self.hits += 1
+            return data
+        self.misses += 1
+        data = bytes(gef.memory.read(page, size))
+        self.__pages[key] = data
+        return data
+
+    def read_into(self, start: int, buffer: memoryview) -> None:
+        """Fill `buffer` with the content of the pages from `start`. The cached pages are copied
+        from the cache, and every run of missing pages is read with a single memory request
+        straight into `buffer`, without being cached: the bulk copies of the whole memory keep
+        no second copy of it. Raise `gdb.MemoryError` if unreadable."""
+        pagesize = gef.session.pagesize
+        size = len(buffer)
+        offset = 0
+        while offset < size:
+            data = self.__pages.get((start + offset, self.generation))
+            if data is not None:
+                self.hits += 1
+                buffer[offset:offset + pagesize] = data
+                offset += pagesize
+                continue
+            run_end = offset + pagesize
+            while run_end < size and (start + run_end, self.generation) not in self.__pages:
+                run_end += pagesize
+            buffer[offset:run_end] = gef.memory.read(start + offset, run_end - offset)
+            self.misses += (run_end - offset) // pagesize
+            offset = run_end
+        return
+
+    def __str__(self) -> str:
+        return f"{len(self)} page(s) cached, {self.hits} hit(s), {self.misses} miss(es)"
+
+
+uc_page_cache = UnicornPageCache()
+
+
+class UnicornSession:
+    """In-process unicorn-engine mirroring the current debugging context. Memory is not copied
+    upfront: pages are mapped from the inferior the first time the emulated code touches them,
+    and the engine can be reused as long as the inferior does not resume."""
+
+    def __init__(self) -> None:
+        self.arch = gef_to_uc_arch()
+        self.generation = uc_page_cache.generation
+        self.pagesize = gef.session.pagesize
+        self.registers = uc_registers()
+        self.uc = unicorn.Uc(*gef_to_uc_arch_values())
+        self.cs = cs_handle(*gef_to_cs_arch())
+        # original content of the pages mapped so far, to restore them between runs
+        self.pages: Dict[int, bytes] = {}
+        self.sections = sorted((s for s in gef.memory.maps if s.path != "[vvar]"),
+                               key=lambda s: s.page_start)
+        self.section_starts = [s.page_start for s in self.sections]
+        self.uc.hook_add(unicorn.UC_HOOK_MEM_UNMAPPED, self.__map_page_hook)
+        return
+
+    def is_valid(self) -> bool:
+        """Whether the engine still matches the debugged process: same stop, and same architecture
+        (e.g. ARM/Thumb switch)."""
+        return self.generation == uc_page_cache.generation and self.arch == gef_to_uc_arch()
+
+    def lookup_section(self, address: int) -> Optional[Section]:
+        idx = bisect.bisect_right(self.section_starts, address) - 1
+        if idx < 0:
+            return None
+        section = self.sections[idx]
+        return section if address < section.page_end else None
+
+    def map_page(self, page: int) -> bool:
+        "Map one page of the inferior into the engine. Return False if it cannot be accessed."
+        section = self.lookup_section(page)
+        if not section or not section.permission & Permission.READ:
+            return False
+        try:
+            data = uc_page_cache.read(page, self.pagesize)
+        except gdb.MemoryError:
+            return False
+        self.uc.mem_map(page, self.pagesize, gef_to_uc_permission(section.permission))
+        self.uc.mem_write(page, data)
+        self.pages[page] = data
+        return True
+
+    def __map_page_hook(self, uc: unicorn.Uc, access: int, address: int, size: int,
+                        value: int, user_data: Any) -> bool:
+        return self.map_page(address & ~(self.pagesize - 1))
+
+    def reset(self) -> None:
+        "Restore the registers and the pages touched by a previous run to the inferior state."
+        for uc_reg, value in uc_registers_values().items():
+            try:
+                self.uc.reg_write(uc_reg, value)
+            except unicorn.UcError:
+                # e.g. segment selectors cannot be written in 64-bit mode
+                continue
+        for page, data in self.pages.items():
+            self.uc.mem_write(page, data)
+        return
+
+    def print_registers(self) -> None:
+        width = gef.arch.ptrsize * 2 + 2  # two hex chars per byte plus "0x" prefix
+        regs = sorted(self.registers.items())
+        line = ""
+        for i, (name, uc_reg) in enumerate(regs):
+            line += f"{name.strip():7s} = {self.uc.reg_read(uc_reg):#0{width}x}  "
+            if (i % 4 == 3) or (i == len(regs) - 1):
+                gef_print(line)
+                line = ""
+        return
+
+    def __code_hook(self, uc: unicorn.Uc, address: int, size: int, user_data: Any) -> None:
+        insn = next(self.cs.disasm(bytes(uc.mem_read(address, size)), address), None)
+        if insn:
+            gef_print(f">>> {insn.address:#x}: {insn.mnemonic:s} {insn.op_str:s}")
+        else:
+            gef_print(f">>> {address:#x}: (bad)")
+        return
+
+    def __intr_hook(self, uc: unicorn.Uc, intno: int, user_data: Any) -> None:
+        gef_print(f" \\-> interrupt={intno:d}")
+        return
+
+    def __syscall_hook(self, uc: unicorn.Uc, user_data: Any) -> None:
+        sysno = uc.reg_read(self.registers[gef.arch.syscall_register])
+        gef_print(f" \\-> syscall={sysno:d}")
+        return
+
+    def emulate(self, start: int, end: int, trace: Optional[UnicornTraceWriter] = None) -> None:
+        """Emulate from `start` to `end`. Every executed instruction is printed, unless `trace`
+        is provided: in that case, only the executed basic blocks are recorded into it."""
+        self.reset()
+        hooks = [self.uc.hook_add(unicorn.UC_HOOK_INTR, self.__intr_hook)]
+        if trace:
+            hooks.append(self.uc.hook_add(unicorn.UC_HOOK_BLOCK, trace.block_hook))
+        else:
+            hooks.append(self.uc.hook_add(unicorn.UC_HOOK_CODE, self.__code_hook))
+        if is_x86_64():
+            hooks.append(self.uc.hook_add(unicorn.UC_HOOK_INSN, self.__syscall_hook, None, 1, 0,
+                                          unicorn.x86_const.UC_X86_INS_SYSCALL))
+
+        if self.arch[1] == "UC_MODE_THUMB":
+            start |= 1
+
+        gef_print("========================= Initial registers =========================")
+        self.print_registers()
+        try:
+            gef_print("========================= Starting emulation =========================")
+            self.uc.emu_start(start, end)
+        except unicorn.UcError as e:
+            self.uc.emu_stop()
+            gef_print("========================= Emulation failed =========================")
+            gef_print(f"[!] Error: {e}")
+        finally:
+            for hook in hooks:
+                self.uc.hook_del(hook)
+
+        gef_print("========================= Final registers =========================")
+        self.print_registers()
+        return
+
+
+def uc_parse_batch_value(value: Union[int, str]) -> int:
+    return value if isinstance(value, int) else int(value, 0)
+
+
+class UnicornBatchWorker:
+    """Emulation engine living in a batch worker process. The memory of the inferior is read
+    from the shared memory snapshot (pages are mapped lazily, exactly like `UnicornSession`
+    does from GDB), and restored before every variant."""
+
+    def __init__(self, context: Dict[str, Any]) -> None:
+        self.context = context
+        self.pagesize: int = context["pagesize"]
+        self.shm = shared_memory.SharedMemory(name=context["shm_name"])
+        self.snapshot = self.shm.buf
+        # sections are (page_start, page_end, uc_permission, offset in the snapshot)
+        self.sections: List[Tuple[int, int, int, int]] = context["sections"]
+        self.section_starts = [s[0] for s in self.sections]
+        self.mapped: Dict[int, int] = {}  # page -> offset in the snapshot
+        self.uc = unicorn.Uc(context["uc_arch"], context["uc_mode"])
+        self.uc.hook_add(unicorn.UC_HOOK_MEM_UNMAPPED, self.__map_page_hook)
+        self.uc.hook_add(unicorn.UC_HOOK_CODE, self.__count_hook)
+        self.nb_insn = 0
+        return
+
+    def close(self) -> None:
+        "Release the snapshot, when the worker process exits."
+        self.snapshot = None
+        self.shm.close()
+        return
+
+    def map_page(self, page: int) -> bool:
+        idx = bisect.bisect_right(self.section_starts, page) - 1
+        if idx < 0:
+            return False
+        start, end, perm, offset = self.sections[idx]
+        if page >= end:
+            return False
+        offset += page - start
+        self.uc.mem_map(page, self.pagesize, perm)
+        self.uc.mem_write(page, bytes(self.snapshot[offset:offset + self.pagesize]))
+        self.mapped[page] = offset
+        return True
+
+    def __map_page_hook(self, uc: unicorn.Uc, access: int, address: int, size: int,
+                        value: int, user_data: Any) -> bool:
+        return self.map_page(address & ~(self.pagesize - 1))
+
+    def __count_hook(self, uc: unicorn.Uc, address: int, size: int, user_data: Any) -> None:
+        self.nb_insn += 1
+        return
+
+    def write_memory(self, address: int, data: bytes) -> None:
+        page = address & ~(self.pagesize - 1)
+        while page < address + len(data):
+            if page not in self.mapped and not self.map_page(page):
+                raise ValueError(f"{page:#x} is not mapped in the snapshot")
+            page += self.pagesize
+        self.uc.mem_write(address, data)
+        return
+
+    def reset(self) -> None:
+        for uc_reg, value in self.context["values"].items():
+            try:
+                self.uc.reg_write(uc_reg, value)
+            except unicorn.UcError:
+                continue
+        for page, offset in self.mapped.items():
+            self.uc.mem_write(page, bytes(self.snapshot[offset:offset + self.pagesize]))
+        self.nb_insn = 0
+        return
+
+    def run(self, variant: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+        idx, overrides = variant
+        registers: Dict[str, int] = self.context["registers"]
+        result: Dict[str, Any] = {"id": idx}
+        self.reset()
+        try:
+            for name, value in overrides.get("registers", {}).items():
+                name = name if name.startswith("$") else f"${name}"
+                self.uc.reg_write(registers[name], uc_parse_batch_value(value))
+            for address, data in overrides.get("memory", {}).items():
+                self.write_memory(uc_parse_batch_value(address), bytes.fromhex(data))
+        except (KeyError, ValueError, unicorn.UcError) as e:
+            result["stop_reason"] = f"invalid variant: {e!s}"
+            return result
+
+        start, end = self.context["start"], self.context["end"]
+        try:
+            self.uc.emu_start(start, end, timeout=self.context["timeout"])
+            pc = self.uc.reg_read(registers[self.context["pc"]])
+            result["stop_reason"] = "end" if pc == end else "timeout"
+        except unicorn.UcError as e:
+            result["stop_reason"] = f"error: {e!s}"
+        result["instructions"] = self.nb_insn
+        result["registers"] = {name: self.uc.reg_read(uc_reg) for name, uc_reg in registers.items()}
+        return result
+
+
+uc_batch_worker: Optional[UnicornBatchWorker] = None
+
+
+def uc_batch_worker_init(context: Dict[str, Any]) -> None:
+    global uc_batch_worker
+    uc_batch_worker = UnicornBatchWorker(context)
+    # run when the worker exits normally, i.e. after `Pool.close()`
+    multiprocessing.util.Finalize(uc_batch_worker, uc_batch_worker.close, exitpriority=10)
+    return
+
+
+def uc_batch_worker_run(variant: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+    assert uc_batch_worker
+    return uc_batch_worker.run(variant)
+
+
 @register
 class UnicornEmulateCommand(GenericCommand):
     """Use Unicorn-Engine to emulate the behavior of the binary, without affecting the GDB runtime.
@@ -110,11 +519,16 @@ class UnicornEmulateCommand(GenericCommand):
     the next instruction from current PC."""
 
     _cmdline_ = "unicorn-emulate"
-    _syntax_ = (f"{_cmdline_} [--start LOCATION] [--until LOCATION] [--skip-emulation] [--output-file PATH] [NB_INSTRUCTION]"
+    _syntax_ = (f"{_cmdline_} [--start LOCATION] [--until LOCATION] [--skip-emulation] [--output-file PATH] [--batch FILE [--batch-output PATH]] [--trace PATH] [NB_INSTRUCTION]"
                 "\n\t--start LOCATION specifies the start address of the emulated run (default $pc)."
                 "\t--until LOCATION specifies the end address of the emulated run."
                 "\t--skip-emulation\t do not execute the script once generated."
-                "\t--output-file /PATH/TO/SCRIPT.py writes the persistent Unicorn script into this file."
+                "\t--output-file /PATH/TO/SCRIPT.py exports the emulation as a standalone Unicorn script into this file"
+                " (by default the emulation runs inside GDB)."
+                "\t--batch /PATH/TO/VARIANTS.jsonl runs one emulation per line of register/memory overrides, in parallel."
+                "\t--batch-output /PATH/TO/RESULTS.jsonl writes the batch results into this file instead of the screen."
+                "\t--trace /PATH/TO/TRACE.bin records the executed basic blocks into this file instead of printing"
+                " every instruction (see `emulate-trace show`)."
                 "\tNB_INSTRUCTION indicates the number of instructions to execute"
                 "\nAdditional options can be setup via `gef config unicorn-emulate`")
     _aliases_ = ["emulate", ]
@@ -124,17 +538,58 @@ class UnicornEmulateCommand(GenericCommand):
         super().__init__(complete=gdb.COMPLETE_LOCATION)
         self["verbose"] = (False, "Set unicorn-engine in verbose mode")
         self["show_disassembly"] = (False, "Show every instruction executed")
+        self["batch_workers"] = (0, "Number of processes used by `--batch` (0 means one per CPU)")
+        self["batch_timeout"] = (1000, "Maximum time (in milliseconds) spent emulating one `--batch` variant")
+        self.__session: Optional[UnicornSession] = None
+        gef_on_stop_hook(uc_page_cache.invalidate)
+        gef_on_memchanged_hook(uc_page_cache.invalidate)
         return
 
+    @property
+    def session(self) -> UnicornSession:
+        if not self.__session or not self.__session.is_valid():
+            self.__session = UnicornSession()
+        return self.__session
+
     @only_if_gdb_running
-    @parse_arguments({"nb": 1}, {"--start": "", "--until": "", "--skip-emulation": False, "--output-file": ""})
+    @parse_arguments({"nb": 1}, {"--start": "", "--until": "", "--skip-emulation": False, "--output-file": "",
+                                 "--batch": "", "--batch-output": "", "--trace": ""})
     def do_invoke(self, _: List[str], **kwargs: Any) -> None:
         args = kwargs["arguments"]
         start_address = parse_address(str(args.start or gef.arch.pc))
         end_address = parse_address(
             str(args.until or self.get_unicorn_end_addr(start_address, args.nb)))
-        self.run_unicorn(start_address, end_address,
-                         skip_emulation=args.skip_emulation, to_file=args.output_file)
+
+        if args.trace and (args.batch or args.output_file):
+            err("--trace cannot be used with --batch or --output-file")
+            return
+
+        if args.batch:
+            self.run_batch(start_address, end_address, pathlib.Path(args.batch).expanduser(),
+                           args.batch_output)
+            return
+
+        if args.output_file:
+            self.run_unicorn(start_address, end_address,
+                             skip_emulation=args.skip_emulation, to_file=args.output_file)
+            return
+
+        if args.skip_emulation:
+            warn("Nothing to do: --skip-emulation requires --output-file")
+            return
+
+        ok(f"Starting emulation: {start_address:#x} {RIGHT_ARROW} {end_address:#x}")
+        if args.trace:
+            trace = UnicornTraceWriter(pathlib.Path(args.trace).expanduser())
+            try:
+                self.session.emulate(start_address, end_address, trace=trace)
+            finally:
+                trace.close()
+            info(f"{trace.nb_blocks} basic block(s) traced into '{trace.path}'")
+        else:
+            self.session.emulate(start_address, end_address)
+        if self["verbose"]:
+            info(f"Page cache: {uc_page_cache!s}")
         return
 
     def get_unicorn_end_addr(self, start_addr: int, nb: int) -> int:
@@ -142,6 +597,88 @@ class UnicornEmulateCommand(GenericCommand):
         last_insn = dis[-1]
         return last_insn.address
 
+    def run_batch(self, start_insn_addr: int, end_insn_addr: int, batch_file: pathlib.Path,
+                  output: str) -> None:
+        """Emulate every variant of `batch_file` from the current context. The memory is
+        snapshotted once into a shared memory block, which all the workers map from."""
+        try:
+            with batch_file.open() as fd:
+                variants = [json.loads(line) for line in fd if line.strip()]
+        except (OSError, json.JSONDecodeError) as e:
+            err(f"Cannot load batch file '{batch_file}': {e}")
+            return
+
+        sections = []
+        total_size = 0
+        for sect in gef.memory.maps:
+            if sect.path == "[vvar]" or not sect.permission & Permission.READ:
+                continue
+            sections.append(sect)
+            total_size += sect.size
+
+        shm = shared_memory.SharedMemory(create=True, size=max(total_size, 1))
+        try:
+            offset = 0
+            snapshot_sections = []
+            for sect in sections:
+                try:
+                    uc_page_cache.read_into(sect.page_start, shm.buf[offset:offset + sect.size])
+                except gdb.MemoryError:
+                    warn(f"Skipping unreadable segment {sect.path} at {sect.page_start:#x}")
+                    continue
+                snapshot_sections.append((sect.page_start, sect.page_end,
+                                          gef_to_uc_permission(sect.permission), offset))
+                offset += sect.size
+
+            uc_arch, uc_mode = gef_to_uc_arch_values()
+            context = {
+                "uc_arch": uc_arch,
+                "uc_mode": uc_mode,
+                "pagesize": gef.session.pagesize,
+                "shm_name": shm.name,
+                "sections": snapshot_sections,
+                "registers": uc_registers(),
+                "values": uc_registers_values(),
+                "start": start_insn_addr | 1 if gef_to_uc_arch()[1] == "UC_MODE_THUMB" else start_insn_addr,
+                "end": end_insn_addr,
+                "timeout": self["batch_timeout"] * 1000,
+            }
+            context["pc"] = next(r for r in ("$rip", "$eip", "$pc") if r in context["registers"])
+
+            if self["verbose"]:
+                info(f"Page cache: {uc_page_cache!s}")
+
+            nb_workers = self["batch_workers"] or os.cpu_count() or 1
+            ok(f"Emulating {len(variants)} variant(s) of {start_insn_addr:#x} {RIGHT_ARROW} "
+               f"{end_insn_addr:#x} with {nb_workers} worker(s)")
+
+            out = open(output, "w") if output else None
+            try:
+                # The workers are forked: `spawn` and `forkserver` start a new interpreter from
+                # `sys.executable` (GDB itself here) which re-imports `__main__`, i.e. the GEF
+                # namespace. Forking is safe as the workers only run unicorn on the snapshot and
+                # never call into GDB: only the forking thread is duplicated, and the inferior
+                # stays traced by GDB alone.
+                mp = multiprocessing.get_context("fork")
+                with mp.Pool(nb_workers, initializer=uc_batch_worker_init, initargs=(context,)) as pool:
+                    for result in pool.imap(uc_batch_worker_run, enumerate(variants)):
+                        line = json.dumps(result)
+                        if out:
+                            out.write(line + "\n")
+                        else:
+                            gef_print(line)
+                    # let the workers exit and release the snapshot, instead of terminating them
+                    pool.close()
+                    pool.join()
+            finally:
+                if out:
+                    out.close()
+                    info(f"Batch results written to '{output}'")
+        finally:
+            shm.close()
+            shm.unlink()
+        return
+
     def run_unicorn(self, start_insn_addr: int, end_insn_addr: int, **kwargs: Any) -> None:
         verbose = self["verbose"] or False
         skip_emulation = kwargs.get("skip_emulation", False)
@@ -209,8 +746,9 @@ uc = None
 verbose = {verbose}
 syscall_register = "{syscall_reg}"
 
+cs = capstone.Cs(capstone.{cs_arch}, capstone.{cs_mode}|capstone.{cs_endian})
+
 def disassemble(code, addr):
-    cs = capstone.Cs(capstone.{cs_arch}, capstone.{cs_mode}|capstone.{cs_endian})
     for i in cs.disasm(code, addr):
         return i
 
@@ -261,9 +799,9 @@ def reset():
         if verbose:
             info("Duplicating registers")
 
-        for r in gef.arch.all_registers:
+        for r, uc_reg in unicorn_registers.items():
             gregval = gef.arch.register(r)
-            content += f"    emu.reg_write({unicorn_registers[r]}, {gregval:#x})\n"
+            content += f"    emu.reg_write({uc_reg}, {gregval:#x})\n"
 
         vmmap = gef.memory.maps
         if not vmmap:
@@ -287,19 +825,23 @@ def reset():
             content += f"    emu.mem_map({page_start:#x}, {size:#x}, {perm.value:#o})\n"
 
             if perm & Permission.READ:
+                code = bytearray(size)
                 try:
-                    code = gef.memory.read(page_start, size)
+                    uc_page_cache.read_into(page_start, memoryview(code))
                 except gdb.MemoryError:
                     warn(f"Skipping unreadable segment {sect.path} at {page_start:#x}")
                     continue
 
                 loc = f"/tmp/gef-{fname}-{page_start:#x}.raw"
                 with open(loc, "wb") as f:
-                    f.write(bytes(code))
+                    f.write(code)
 
                 content += f"    emu.mem_write({page_start:#x}, open('{loc}', 'rb').read())\n"
                 content += "\n"
 
+        if verbose:
+            info(f"Page cache: {uc_page_cache!s}")
+
         content += "    emu.hook_add(unicorn.UC_HOOK_CODE, code_hook)\n"
         content += "    emu.hook_add(unicorn.UC_HOOK_INTR, intr_hook)\n"
         if is_x86_64():
@@ -349,3 +891,73 @@ emulate(uc, {start:#x}, {end:#x})
         if not kwargs.get("to_file", None):
             os.unlink(tmp_filename)
         return
+
+
+@register
+class UnicornEmulateTraceCommand(GenericCommand):
+    """Inspect the basic block traces recorded by `unicorn-emulate --trace`."""
+
+    _cmdline_ = "emulate-trace"
+    _syntax_ = f"{_cmdline_} (show)"
+
+    def __init__(self) -> None:
+        super().__init__(prefix=True)
+        return
+
+    def do_invoke(self, _: List[str]) -> None:
+        self.usage()
+        return
+
+
+@register
+class UnicornEmulateTraceShowCommand(GenericCommand):
+    """Decode and print a trace recorded by `unicorn-emulate --trace`. The code is read from the
+    current process, each basic block being disassembled only once."""
+
+    _cmdline_ = "emulate-trace show"
+    _syntax_ = f"{_cmdline_} [--limit NB_BLOCKS] [--summary] PATH"
+    _example_ = f"{_cmdline_} --limit 100 /tmp/trace.bin"
+
+    def __init__(self) -> None:
+        super().__init__(complete=gdb.COMPLETE_FILENAME)
+        return
+
+    @only_if_gdb_running
+    @parse_arguments({"path": ""}, {"--limit": 0, "--summary": False})
+    def do_invoke(self, _: List[str], **kwargs: Any) -> None:
+        args = kwargs["arguments"]
+        if not args.path:
+            self.usage()
+            return
+
+        try:
+            header, records = read_unicorn_trace(pathlib.Path(args.path).expanduser())
+        except (OSError, ValueError) as e:
+            err(f"Cannot load trace: {e}")
+            return
+
+        cs = cs_handle(*header["cs"])
+        blocks: Dict[Tuple[int, int], List[str]] = {}
+        nb_blocks = len(records) // 2
+        if args.limit:
+            nb_blocks = min(nb_blocks, args.limit)
+        nb_insn = 0
+
+        for i in range(0, nb_blocks * 2, 2):
+            block = (records[i], records[i + 1])
+            lines = blocks.get(block)
+            if lines is None:
+                address, size = block
+                try:
+                    code = gef.memory.read(address, size)
+                    lines = [f">>> {insn.address:#x}: {insn.mnemonic:s} {insn.op_str:s}"
+                             for insn in cs.disasm(code, address)]
+                except gdb.MemoryError:
+                    lines = [f">>> {address:#x}: <unreadable block of {size:d} bytes>"]
+                blocks[block] = lines
+            nb_insn += len(lines)
+            if not args.summary:
+                gef_print("\n".join(lines))
+
+        info(f"{nb_blocks} basic block(s) ({len(blocks)} unique), {nb_insn} instruction(s)")
+        return
@@ -5,9 +5,11 @@ __AUTHOR__ = "your_name"
 __VERSION__ = 0.1
 __LICENSE__ = "MIT"
 
+import argparse
 import collections
-import pathlib
-from typing import TYPE_CHECKING, Optional
+import json
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TextIO, Tuple
 
 if TYPE_CHECKING:
     from . import *
@@ -15,24 +17,225 @@ if TYPE_CHECKING:
 
 
 PLUGIN_FTRACE_DEFAULT_OUTPUT = "/dev/stderr"
+PLUGIN_FTRACE_FORMATS = ("text", "jsonl")
+
+FtraceRecord = collections.namedtuple(
+    "FtraceRecord", "id parent depth enter exit insns thread function args retval")
+
+
+def ftrace_instruction_count() -> Optional[int]:
+    """Return the number of instructions executed so far, if the execution is recorded with
+    `record btrace`."""
+    try:
+        recording = gdb.current_recording()
+        if recording is None or recording.method != "btrace":
+            return None
+        return recording.end.number
+    except (gdb.error, AttributeError, NotImplementedError):
+        return None
+
+
+class FtraceFrame:
+    """A traced call not returned yet."""
+
+    __slots__ = ("id", "parent", "path", "enter", "insns", "children_time")
+
+    def __init__(self, id: int, parent: Optional[int], path: Tuple[str, ...], enter: float,
+                 insns: Optional[int]) -> None:
+        self.id = id
+        self.parent = parent
+        self.path = path
+        self.enter = enter
+        self.insns = insns
+        self.children_time = 0.0
+        return
+
+
+class FtraceProfile:
+    """Number of calls, inclusive and exclusive time (and instructions, when counted) of the
+    traced calls, per function and per call path."""
+
+    def __init__(self) -> None:
+        # key -> [calls, inclusive, exclusive, max inclusive, instructions]
+        self.functions: Dict[str, List[float]] = {}
+        self.paths: Dict[Tuple[str, ...], List[float]] = {}
+        return
+
+    def add(self, path: Tuple[str, ...], inclusive: float, exclusive: float,
+            insns: Optional[int]) -> None:
+        for table, key in ((self.functions, path[-1]), (self.paths, path)):
+            stats = table.get(key)
+            if stats is None:
+                stats = table[key] = [0, 0.0, 0.0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += inclusive
+            stats[2] += exclusive
+            if inclusive > stats[3]:
+                stats[3] = inclusive
+            stats[4] += insns or 0
+        return
+
+    def print_summary(self, sort: str) -> None:
+        color = gef.config["theme.table_heading"]
+        column = {"calls": 0, "inclusive": 1, "exclusive": 2}[sort]
+        with_insns = any(stats[4] for stats in self.functions.values())
+        gef_print(Color.colorify(f"{'Function':<32} {'Calls':>10} {'Incl. (ms)':>12} "
+                                 f"{'Excl. (ms)':>12} {'Mean (us)':>12} {'Max (us)':>12}"
+                                 + (f" {'Insns':>12}" if with_insns else ""), color))
+        for function, (calls, inclusive, exclusive, highest, insns) in \
+                sorted(self.functions.items(), key=lambda x: -x[1][column]):
+            gef_print(f"{function:<32} {calls:>10} {inclusive * 1e3:>12.3f} "
+                      f"{exclusive * 1e3:>12.3f} {inclusive / calls * 1e6:>12.1f} "
+                      f"{highest * 1e6:>12.1f}" + (f" {insns:>12}" if with_insns else ""))
+        return
+
+    def print_tree(self, sort: str) -> None:
+        column = {"calls": 0, "inclusive": 1, "exclusive": 2}[sort]
+        children: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+        for path in self.paths:
+            children.setdefault(path[:-1], []).append(path)
+        stack = sorted(children.get((), []), key=lambda x: self.paths[x][column])
+        while stack:
+            path = stack.pop()
+            calls, inclusive, exclusive, _, _ = self.paths[path]
+            gef_print(f"{'  ' * (len(path) - 1)}{path[-1]}() calls={calls} "
+                      f"incl={inclusive * 1e3:.3f}ms excl={exclusive * 1e3:.3f}ms")
+            stack += sorted(children.get(path, []), key=lambda x: self.paths[x][column])
+        return
+
+
+class FtraceCallStacks:
+    """Per-thread shadow stacks of the traced calls not returned yet, so that the nested traced
+    calls form a tree, and the time spent in the callees is excluded from the caller."""
+
+    def __init__(self, profile: FtraceProfile) -> None:
+        self.profile = profile
+        self.stacks: Dict[int, List[FtraceFrame]] = {}
+        # the call ids must stay unique when several traces are appended to the same file
+        self.next_id = time.time_ns() // 1000
+        return
+
+    def enter(self, thread: int, function: str, enter: float, insns: Optional[int]) -> FtraceFrame:
+        stack = self.stacks.setdefault(thread, [])
+        parent = stack[-1] if stack else None
+        self.next_id += 1
+        frame = FtraceFrame(self.next_id, parent.id if parent else None,
+                            parent.path + (function,) if parent else (function,), enter, insns)
+        stack.append(frame)
+        return frame
+
+    def discard(self, thread: int, frame: FtraceFrame) -> None:
+        "Drop `frame`, and the calls it made that did not return (longjmp, exceptions...)."
+        stack = self.stacks.get(thread, [])
+        if frame in stack:
+            del stack[stack.index(frame):]
+        return
+
+    def leave(self, thread: int, frame: FtraceFrame, exit_time: float,
+              insns: Optional[int]) -> Tuple[float, Optional[int]]:
+        "Pop `frame`, return its inclusive time and instruction count."
+        self.discard(thread, frame)
+        inclusive = exit_time - frame.enter
+        stack = self.stacks.get(thread)
+        if stack:
+            stack[-1].children_time += inclusive
+        insns = insns - frame.insns if insns is not None and frame.insns is not None else None
+        self.profile.add(frame.path, inclusive, inclusive - frame.children_time, insns)
+        return inclusive, insns
+
+
+class FtraceSink:
+    """Output of the traced calls. The records are stored in a preallocated buffer, and
+    written in batch to the output (opened once, in append mode) when the buffer is full, when
+    the last write is older than `interval` seconds, and when the process stops or exits.
+
+    In `text` format, the arguments are dereferenced when the call returns. In `jsonl` format,
+    only the raw values are recorded, and serialized when written."""
+
+    def __init__(self, output: TextIO, size: int, interval: float, fmt: str,
+                 use_color: bool) -> None:
+        self.output = output
+        self.format = fmt
+        self.use_color = use_color
+        self.interval = interval
+        self.records: List[Any] = [None] * max(size, 1)
+        self.nb_pending = 0
+        self.last_flush = time.monotonic()
+        return
+
+    def push(self, record: FtraceRecord) -> None:
+        self.records[self.nb_pending] = self.format_text(record) if self.format == "text" else record
+        self.nb_pending += 1
+        if self.nb_pending == len(self.records) or \
+                time.monotonic() - self.last_flush >= self.interval:
+            self.flush()
+        return
+
+    def format_text(self, record: FtraceRecord) -> str:
+        location = Color.yellowify(record.function) if self.use_color else record.function
+        lines = ["{:s}() = {} {{\n".format(location, format_address(abs(record.retval)))]
+        for reg, regval in zip(gef.arch.function_parameters, record.args):
+            lines.append("\t{} {} {}\n".format(reg, RIGHT_ARROW,
+                         RIGHT_ARROW.join(dereference_from(regval))))
+        lines.append("}\n")
+        return "".join(lines)
+
+    @staticmethod
+    def format_jsonl(record: FtraceRecord) -> str:
+        return json.dumps(record._asdict()) + "\n"
+
+    def flush(self, _: Optional["gdb.Event"] = None) -> None:
+        if self.nb_pending:
+            records = self.records[:self.nb_pending]
+            if self.format == "jsonl":
+                records = map(self.format_jsonl, records)
+            self.output.write("".join(records))
+            self.output.flush()
+            self.records[:self.nb_pending] = [None] * self.nb_pending
+            self.nb_pending = 0
+        self.last_flush = time.monotonic()
+        return
+
+    def close(self) -> None:
+        self.flush()
+        self.output.close()
+        return
 
 
 class FtraceEnterBreakpoint(gdb.Breakpoint):
-    def __init__(self, location: str, nb_args: int):
+    def __init__(self, location: str, nb_args: int, sink: FtraceSink, stacks: FtraceCallStacks,
+                 count_insns: bool = False, name: Optional[str] = None, max_hits: int = 0):
         super().__init__(location, gdb.BP_BREAKPOINT, internal=True)
         self.silent: bool = True
         self.nb_args: int = nb_args
-        self.retbp: Optional[FtraceExitBreakpoint] = None
+        self.sink = sink
+        self.stacks = stacks
+        self.count_insns = count_insns
+        self.name = name or location
+        self.max_hits = max_hits
+        # `hit_count` is only incremented when the breakpoint stops
+        self.nb_hits = 0
+        return
+
+    def disable(self) -> None:
+        self.enabled = False
+        warn(f"'{self.name}()' is not traced anymore after {self.max_hits} calls")
         return
 
     def stop(self):
-        regs = collections.OrderedDict()
-        for idx, r in enumerate(gef.arch.function_parameters):
-            if idx >= self.nb_args:
-                break
-            regs[r] = gef.arch.register(r)
-            self.retbp = FtraceExitBreakpoint(
-                location=self.location, regs=regs)
+        self.nb_hits += 1
+        if self.max_hits and self.nb_hits >= self.max_hits:
+            if self.nb_hits > self.max_hits:
+                return False
+            # breakpoints must not be modified from `stop()`
+            gdb.post_event(self.disable)
+        args = tuple(gef.arch.register(r) for r in gef.arch.function_parameters[:self.nb_args])
+        thread = gdb.selected_thread().num
+        insns = ftrace_instruction_count() if self.count_insns else None
+        frame = self.stacks.enter(thread, self.name, time.monotonic(), insns)
+        FtraceExitBreakpoint(location=self.name, args=args, sink=self.sink,
+                             stacks=self.stacks, frame=frame, thread=thread,
+                             count_insns=self.count_insns)
         return False
 
 
@@ -45,62 +248,243 @@ class FtraceExitBreakpoint(gdb.FinishBreakpoint):
         return
 
     def stop(self):
-        if self.return_value:
-            retval = format_address(abs(self.return_value))
+        exit_time = time.monotonic()
+        insns = ftrace_instruction_count() if self.args["count_insns"] else None
+        if self.return_value is not None:
+            retval = int(self.return_value)
         else:
             retval = gef.arch.register(gef.arch.return_register)
-
-        output = pathlib.Path(gef.config["ftrace.output"])
-        use_color = PLUGIN_FTRACE_DEFAULT_OUTPUT == gef.config["ftrace.output"]
-
-        with output.open("w") as fd:
-            if use_color:
-                fd.write("{:s}() = {} {{\n".format(
-                    Color.yellowify(self.args["location"]), retval))
-            else:
-                fd.write("{:s}() = {} {{\n".format(
-                    self.args["location"], retval))
-            for reg in self.args["regs"].keys():
-                regval = self.args["regs"][reg]
-                fd.write("\t{} {} {}\n".format(reg, RIGHT_ARROW,
-                         RIGHT_ARROW.join(dereference_from(regval))))
-            fd.write("}\n")
-            fd.flush()
+        frame, thread = self.args["frame"], self.args["thread"]
+        _, insns = self.args["stacks"].leave(thread, frame, exit_time, insns)
+        self.args["sink"].push(FtraceRecord(frame.id, frame.parent, len(frame.path), frame.enter,
+                                            exit_time, insns, thread, self.args["location"],
+                                            self.args["args"], retval))
         return False
 
+    def out_of_scope(self):
+        self.args["stacks"].discard(self.args["thread"], self.args["frame"])
+        return
+
 
 @register
 class FtraceCommand(GenericCommand):
-    """Tracks a function given in parameter for arguments and return code."""
+    """Tracks a function given in parameter for arguments and return code. With `--regex` and/or
+    `--library`, all the matching functions of the loaded objfiles are traced, with their number
+    of arguments taken from the libc function definitions when known (`--nb-args` otherwise).
+    `--max-hits` stops tracing a function after the given number of calls."""
     _cmdline_ = "ftrace"
-    _syntax_ = "{:s} <function_name1>,<nb_args1> [<function_name2>,<nb_args2> ...]".format(
-        _cmdline_)
+    _syntax_ = ("{:s} [--regex REGEX] [--library NAME] [--nb-args N] [--max-hits N] "
+                "[<function_name1>,<nb_args1> <function_name2>,<nb_args2> ...]".format(_cmdline_))
+    _example_ = ["{:s} malloc,1 calloc,2 free,1".format(_cmdline_),
+                 "{:s} --regex '^str' --library libc.so.6 --max-hits 1000".format(_cmdline_)]
 
     def __init__(self) -> None:
         super().__init__()
         self["output"] = (PLUGIN_FTRACE_DEFAULT_OUTPUT,
-                          "Path to store/load the syscall tables files")
+                          "Path of the file where the traced calls are appended")
+        self["buffer_size"] = (4096, "Number of traced calls buffered before being written")
+        self["flush_interval"] = (1.0, "Maximum delay (in seconds) before writing the buffered calls")
+        self["format"] = ("text", f"Format of the output ({', '.join(PLUGIN_FTRACE_FORMATS)})")
+        self["count_instructions"] = (False, "Count the instructions executed by the traced calls "
+                                             "(requires `record btrace`)")
+        self.bkps: List[FtraceEnterBreakpoint] = []
+        self.sink: Optional[FtraceSink] = None
+        # profile of the last trace, shown by `ftrace-report` without file
+        self.profile = FtraceProfile()
         return
 
-    def do_invoke(self, args):
-        if len(args) < 1:
+    @parse_arguments({"functions": [""]}, {"--regex": "", "--library": "", "--nb-args": 0,
+                                           "--max-hits": 0})
+    def do_invoke(self, _: List[str], **kwargs: Any) -> None:
+        args: argparse.Namespace = kwargs["arguments"]
+
+        # (location, name, number of arguments)
+        functions: List[Tuple[str, str, int]] = []
+        for item in args.functions:
+            if not item:
+                continue
+            funcname, nb_args = item.split(",")
+            functions.append((funcname, funcname, int(nb_args)))
+
+        if args.regex or args.library:
+            if not is_alive():
+                err("Tracing by --regex or --library requires a running process")
+                return
+            resolved = self.resolve(args.regex or ".", args.library, args.nb_args)
+            if not resolved:
+                err("No matching function")
+                return
+            functions += resolved
+
+        if not functions:
             self.usage()
             return
 
-        self.bkps = []
+        if self["format"] not in PLUGIN_FTRACE_FORMATS:
+            err(f"Invalid format '{self['format']}', expected one of {', '.join(PLUGIN_FTRACE_FORMATS)}")
+            return
 
-        for item in args:
-            funcname, nb_args = item.split(",")
-            self.bkps.append(FtraceEnterBreakpoint(funcname, int(nb_args)))
-            ok("added '{}()' (with {} args) to tracking list".format(funcname, nb_args))
+        if self.sink:
+            self.cleanup()
+        output = open(self["output"], "a", buffering=0x10000)
+        self.sink = FtraceSink(output, self["buffer_size"], self["flush_interval"], self["format"],
+                               self["output"] == PLUGIN_FTRACE_DEFAULT_OUTPUT)
 
+        self.profile = FtraceProfile()
+        stacks = FtraceCallStacks(self.profile)
+        for location, funcname, nb_args in functions:
+            self.bkps.append(FtraceEnterBreakpoint(location, nb_args, self.sink, stacks,
+                                                   self["count_instructions"], funcname,
+                                                   args.max_hits))
+            if len(functions) <= 10:
+                ok("added '{}()' (with {} args) to tracking list".format(funcname, nb_args))
+        if len(functions) > 10:
+            ok(f"added {len(functions)} functions to tracking list")
+
+        gef_on_stop_hook(self.sink.flush)
         gdb.events.exited.connect(self.cleanup)
         return
 
-    def cleanup(self, _: gdb.ExitedEvent):
+    @staticmethod
+    def resolve(pattern: str, library: str, default_nb_args: int) -> List[Tuple[str, str, int]]:
+        """Return the functions matching `pattern` in `library`, located by address so that GDB
+        does not have to resolve them one by one, with their number of arguments. The indirect
+        functions are located by name, for GDB to break on their implementation instead of
+        their resolver."""
+        try:
+            GlibcFunctionArguments.load_libc_args()
+        except (RuntimeError, ImportError, OSError):
+            pass
+        arch_mode = f"{gef.arch.arch.lower()}_{gef.arch.mode}"
+        known = GlibcFunctionArguments.argument_table.get(arch_mode, {})
+        max_args = len(gef.arch.function_parameters)
+
+        functions = []
+        located = set()
+        for name, address in symbol_index.search(pattern, library):
+            if name in known:
+                nb_args = len([x for x in known[name].values() if x not in ("void", "...")])
+            else:
+                nb_args = default_nb_args
+            location = name if address is None else f"*{address:#x}"
+            if location in located:
+                continue
+            located.add(location)
+            functions.append((location, name, min(nb_args, max_args)))
+        return functions
+
+    def cleanup(self, _: Optional[gdb.ExitedEvent] = None):
         for bp in self.bkps:
-            if bp.retbp:
-                bp.retbp.delete()
             bp.delete()
+        self.bkps = []
+        # the pending finish breakpoints are temporary, and deleted by gdb once out of scope
+        gef_on_stop_unhook(self.sink.flush)
+        self.sink.close()
+        self.sink = None
         gdb.events.exited.disconnect(self.cleanup)
         return
+
+
+@register
+class FtraceReportCommand(GenericCommand):
+    """Show the profile of the traced calls: number of calls, inclusive and exclusive time per
+    function, or the call tree with `--tree`. Without FILE, the profile of the current (or last)
+    `ftrace` session is shown, otherwise the calls recorded in FILE in `jsonl` format are
+    aggregated. With `--function`, the most frequent argument and return values of a function
+    recorded in FILE are also shown."""
+
+    _cmdline_ = "ftrace-report"
+    _syntax_ = (f"{_cmdline_} [--sort inclusive|exclusive|calls] [--tree] [--function NAME] "
+                "[--top N] [FILE]")
+    _example_ = [f"{_cmdline_}",
+                 f"{_cmdline_} --sort exclusive --tree /tmp/trace.jsonl",
+                 f"{_cmdline_} --function malloc --top 10 /tmp/trace.jsonl"]
+
+    @parse_arguments({"file": ""}, {"--sort": "inclusive", "--tree": False, "--function": "",
+                                    "--top": 5})
+    def do_invoke(self, _: List[str], **kwargs: Any) -> None:
+        args: argparse.Namespace = kwargs["arguments"]
+        if args.sort not in ("inclusive", "exclusive", "calls"):
+            self.usage()
+            return
+
+        arg_values: List[collections.Counter] = []
+        retvals: collections.Counter = collections.Counter()
+        if not args.file:
+            profile = gef.gdb.commands["ftrace"].profile
+        else:
+            try:
+                profile = self.load(args.file, args.function, arg_values, retvals)
+            except (OSError, ValueError, KeyError) as e:
+                err(f"Failed to read '{args.file}': {e}")
+                return
+
+        if not profile.functions:
+            warn("No traced call")
+            return
+        if args.tree:
+            profile.print_tree(args.sort)
+        else:
+            profile.print_summary(args.sort)
+        if args.file and args.function:
+            self.print_distribution(args.function, arg_values, retvals, args.top)
+        return
+
+    @staticmethod
+    def load(path: str, function: str, arg_values: List[collections.Counter],
+             retvals: collections.Counter) -> FtraceProfile:
+        """Aggregate the records of `path`, and the argument and return values of `function`
+        in `arg_values` and `retvals`."""
+        # the callees return (and are recorded) before their caller
+        records: Dict[int, Tuple[Optional[int], str, float, Optional[int]]] = {}
+        children_time: Dict[int, float] = collections.defaultdict(float)
+        with open(path) as fd:
+            for line in fd:
+                record = json.loads(line)
+                inclusive = record["exit"] - record["enter"]
+                if record["parent"] is not None:
+                    children_time[record["parent"]] += inclusive
+                records[record["id"]] = (record["parent"], record["function"], inclusive,
+                                         record["insns"])
+                if record["function"] == function:
+                    for i, value in enumerate(record["args"]):
+                        if i == len(arg_values):
+                            arg_values.append(collections.Counter())
+                        arg_values[i][value] += 1
+                    retvals[record["retval"]] += 1
+
+        profile = FtraceProfile()
+        paths: Dict[int, Tuple[str, ...]] = {}
+
+        def path_of(call_id: int) -> Tuple[str, ...]:
+            ids = []
+            while call_id not in paths:
+                ids.append(call_id)
+                parent = records[call_id][0]
+                # the caller may not have returned before the end of the trace
+                if parent is None or parent not in records:
+                    paths[call_id] = (records[call_id][1],)
+                    ids.pop()
+                    break
+                call_id = parent
+            for i in reversed(ids):
+                paths[i] = paths[records[i][0]] + (records[i][1],)
+            return paths[ids[0]] if ids else paths[call_id]
+
+        for call_id, (_, _, inclusive, insns) in records.items():
+            profile.add(path_of(call_id), inclusive, inclusive - children_time.get(call_id, 0.0),
+                        insns)
+        return profile
+
+    @staticmethod
+    def print_distribution(function: str, arg_values: List[collections.Counter],
+                           retvals: collections.Counter, top: int) -> None:
+        if not retvals:
+            warn(f"No call to '{function}' recorded")
+            return
+        calls = sum(retvals.values())
+        for title, counter in [(f"arg{i}", c) for i, c in enumerate(arg_values)] + [("retval", retvals)]:
+            gef_print(titlify(f"{function}() {title}"))
+            for value, count in counter.most_common(top):
+                gef_print(f"    {value:<#20x} {count:>10} ({count * 100 / calls:.1f}%)")
+        return
@@ -1,10 +1,12 @@
-
 __AUTHOR__ = "bkth"
-__VERSION__ = 0.2
+__VERSION__ = 0.3
 __LICENSE__ = "MIT"
 
+import array
+import bisect
 import pathlib
-from typing import TYPE_CHECKING, List
+import sys
+from typing import TYPE_CHECKING, Generator, List, Tuple
 
 if TYPE_CHECKING:
     from . import *
@@ -18,6 +20,9 @@ class PeekPointers(GenericCommand):
     _cmdline_ = "peek-pointers"
     _syntax_ = f"{_cmdline_} starting_address <object_name> <all>"
 
+    # size of the memory blocks read at once
+    read_size = 0x10000
+
     @only_if_gdb_running
     def do_invoke(self, argv: List[str]):
         argc = len(argv)
@@ -25,8 +30,8 @@ class PeekPointers(GenericCommand):
             self.usage()
             return
 
-        addr = lookup_address(int(argv[0], 16))
-        if (addr.value % DEFAULT_PAGE_SIZE):
+        start = int(argv[0], 16)
+        if start % DEFAULT_PAGE_SIZE:
             err("<starting_address> must be aligned to a page")
             return
 
@@ -49,26 +54,87 @@ class PeekPointers(GenericCommand):
         else:
             sections = [(s.path, s.page_start, s.page_end) for s in vmmap]
 
-        while addr.valid:
-            addr_value = gef.memory.read_integer(addr.value)
+        if not sections:
+            return
+
+        # sorted interval index of the target sections
+        sections.sort(key=lambda x: x[1])
+        starts = [s[1] for s in sections]
+        lowest, highest = starts[0], max(s[2] for s in sections)
+        found = set()
+
+        # the pointer and symbol indexes are provided by other scripts, which may not be loaded
+        index = globals().get("pointer_index")
+        symbols = globals().get("symbol_index")
+        blocks = self.indexed_words(index, start) if index and index.built else self.read_words(start)
+        for address, values, source in blocks:
+            for i, value in enumerate(values):
+                if not lowest <= value < highest:
+                    continue
+                idx = bisect.bisect_right(starts, value) - 1
+                if idx < 0 or idx in found:
+                    continue
+                name, _, end_addr = sections[idx]
+                if value >= end_addr:
+                    continue
 
-            if lookup_address(addr_value):
-                for i, section in enumerate(sections):
-                    name, start_addr, end_addr = section
-                    if start_addr <= addr_value < end_addr:
-                        sym = gdb_get_location_from_symbol(addr_value)
-                        sym = "<{:s}+{:04x}>".format(*sym) if sym else ''
-                        if name.startswith("/"):
-                            name = pathlib.Path(name)
-                        elif not name:
-                            name = gef.session.file
+                sym = symbols.lookup(value) if symbols else gdb_get_location_from_symbol(value)
+                sym = "<{:s}+{:04x}>".format(*sym) if sym else ''
+                if name.startswith("/"):
+                    name = pathlib.Path(name)
+                elif not name:
+                    name = gef.session.file
 
-                        msg = f" Found pointer at 0x{addr.value:x} to 0x{addr_value:x} {sym} ('{name}', perm: {str(addr.section.permission)})"
-                        ok(msg)
+                pointer = address + i * gef.arch.ptrsize
+                msg = f" Found pointer at 0x{pointer:x} to 0x{value:x} {sym} ('{name}', perm: {str(source.permission)})"
+                ok(msg)
 
-                        if unique:
-                            del sections[i]
-                        break
+                if unique:
+                    found.add(idx)
+                    if len(found) == len(sections):
+                        return
+        return
+
+    def contiguous_sections(self, start: int) -> Generator["Section", None, None]:
+        "Yield the sections of the contiguous mapped region starting at `start`."
+        address = start
+        for section in sorted(gef.memory.maps, key=lambda s: s.page_start):
+            if section.page_end <= address:
+                continue
+            if section.page_start > address:
+                break
+            yield section
+            address = section.page_end
+        return
+
+    def indexed_words(self, index: "PointerIndex",
+                      start: int) -> Generator[Tuple[int, Tuple[int], "Section"], None, None]:
+        """Same as `read_words()`, but only yield the words known as pointers by the pointer
+        `index` (as 1-word blocks), without reading the memory."""
+        for section in self.contiguous_sections(start):
+            for source, target in index.edges_from(max(start, section.page_start),
+                                                           section.page_end):
+                yield source, (target,), section
+        return
 
-            addr = lookup_address(addr.value + gef.arch.ptrsize)
+    def read_words(self, start: int) -> Generator[Tuple[int, "array.array[int]", "Section"], None, None]:
+        """Read the memory from `start` up to the end of the contiguous mapped region, by blocks of
+        `read_size` bytes. Yield every block as (address, array of words, section)."""
+        ptrsize = gef.arch.ptrsize
+        fmt = "Q" if ptrsize == 8 else "I"
+        byteswap = (gef.arch.endianness == Endianness.BIG_ENDIAN) != (sys.byteorder == "big")
+        address = start
+        for section in self.contiguous_sections(start):
+            while address < section.page_end:
+                size = min(self.read_size, section.page_end - address)
+                try:
+                    data = gef.memory.read(address, size)
+                except gdb.MemoryError:
+                    return
+                words = array.array(fmt)
+                words.frombytes(memoryview(data)[:size - size % ptrsize])
+                if byteswap:
+                    words.byteswap()
+                yield address, words, section
+                address += size
         return
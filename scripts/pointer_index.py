@@ -0,0 +1,339 @@
+"""
+Whole-process index of the pointers found in memory: every aligned word of the readable mappings
+whose value points inside a mapped region is recorded once, both as a forward edge (source ->
+target, in address order) and in a CSR-like reverse edge list (target -> sources), so that
+`peek-pointers` and `xref-telescope` queries become lookups instead of memory scans.
+
+After the process stops, the index is refreshed lazily: only the writable pages whose content
+changed since the last scan are scanned again.
+
+The memory is scanned by large blocks: the words outside of the span of all the mappings are
+filtered out first, then only the remaining candidates are looked up in the mappings. With
+numpy, both steps are vectorized.
+"""
+
+__AUTHOR__ = "hugsy"
+__VERSION__ = 0.1
+__LICENSE__ = "MIT"
+
+import array
+import bisect
+import sys
+import time
+from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from . import *
+    from . import gdb
+
+
+class PointerIndex:
+    """Pointer graph of the process memory, built by `pointer-index build`."""
+
+    # size of the memory blocks read at once, must be a multiple of the page size
+    read_size = 0x100000
+
+    def __init__(self) -> None:
+        # forward edges, per page: page -> (sources, targets)
+        self.__pages: Dict[int, Tuple["array.array[int]", "array.array[int]"]] = {}
+        # keys of `__pages` in address order, rebuilt when pages are added or removed
+        self.__sorted_pages: Optional[List[int]] = None
+        # content hash of the writable pages, to detect the modified ones
+        self.__hashes: Dict[int, int] = {}
+        self.__layout: List[Tuple[int, int, int]] = []
+        self.__map_starts: List[int] = []
+        self.__map_ends: List[int] = []
+        # reverse edges (CSR): sorted unique targets, offsets into the sources, sources
+        self.__reverse: Optional[Tuple["array.array[int]", "array.array[int]", "array.array[int]"]] = None
+        self.__stale = False
+        self.built = False
+        gef_on_stop_hook(self.__on_stop)
+        gef_on_exit_hook(self.clear)
+        return
+
+    def __on_stop(self, _: "gdb.StopEvent") -> None:
+        self.__stale = True
+        return
+
+    def clear(self, _: Optional["gdb.ExitedEvent"] = None) -> None:
+        self.__pages.clear()
+        self.__sorted_pages = None
+        self.__hashes.clear()
+        self.__layout = []
+        self.__reverse = None
+        self.__stale = False
+        self.built = False
+        return
+
+    @property
+    def nb_edges(self) -> int:
+        return sum(len(sources) for sources, _ in self.__pages.values())
+
+    @property
+    def nb_pages(self) -> int:
+        return len(self.__pages)
+
+    @staticmethod
+    def __current_layout() -> List[Tuple[int, int, int]]:
+        return sorted((s.page_start, s.page_end, s.permission.value) for s in gef.memory.maps)
+
+    def __blocks(self, start: int, end: int) -> Generator[Tuple[int, int, Optional[bytes]], None, None]:
+        "Read [`start`, `end`) by blocks, yield (address, size, content or None if unreadable)."
+        for address in range(start, end, self.read_size):
+            size = min(self.read_size, end - address)
+            try:
+                yield address, size, gef.memory.read(address, size)
+            except gdb.MemoryError:
+                yield address, size, None
+        return
+
+    def __find_pointers(self, address: int, data: bytes) -> Tuple["array.array[int]", "array.array[int]"]:
+        "Return the (sources, targets) of the pointers to mapped memory found in `data`."
+        ptrsize = gef.arch.ptrsize
+        big_endian = gef.arch.endianness == Endianness.BIG_ENDIAN
+        data = data[:len(data) - len(data) % ptrsize]
+        starts, ends = self.__map_starts, self.__map_ends
+        lowest, highest = starts[0], ends[-1]
+        sources, targets = array.array("Q"), array.array("Q")
+
+        if numpy:
+            words = numpy.frombuffer(data, dtype=f"{'>' if big_endian else '<'}u{ptrsize}")
+            candidates = numpy.flatnonzero((words >= lowest) & (words < highest))
+            values = words[candidates].astype(numpy.uint64)
+            idx = numpy.searchsorted(numpy.array(starts, dtype=numpy.uint64), values, side="right") - 1
+            found = (idx >= 0) & (values < numpy.array(ends, dtype=numpy.uint64)[numpy.maximum(idx, 0)])
+            sources.frombytes((candidates[found].astype(numpy.uint64) * ptrsize + address)
+                              .astype(numpy.uint64).tobytes())
+            targets.frombytes(values[found].tobytes())
+            return sources, targets
+
+        words = array.array("Q" if ptrsize == 8 else "I")
+        words.frombytes(data)
+        if big_endian != (sys.byteorder == "big"):
+            words.byteswap()
+        # most of the words are not pointers, only look up the candidates in the mappings, and
+        # only bisect again when a candidate is outside of the mapping of the previous one
+        map_start = map_end = 0
+        for i in [i for i, value in enumerate(words) if lowest <= value < highest]:
+            value = words[i]
+            if not map_start <= value < map_end:
+                idx = bisect.bisect_right(starts, value) - 1
+                if idx < 0 or value >= ends[idx]:
+                    continue
+                map_start, map_end = starts[idx], ends[idx]
+            sources.append(address + i * ptrsize)
+            targets.append(value)
+        return sources, targets
+
+    def __set_page(self, page: int, sources: "array.array[int]", targets: "array.array[int]") -> None:
+        if sources:
+            if page not in self.__pages:
+                self.__sorted_pages = None
+            self.__pages[page] = (sources, targets)
+        elif self.__pages.pop(page, None) is not None:
+            self.__sorted_pages = None
+        return
+
+    def __scan_range(self, address: int, data: bytes) -> None:
+        "Scan the consecutive pages of `data` at once, and store the pointers found per page."
+        pagesize = gef.session.pagesize
+        sources, targets = self.__find_pointers(address, data)
+        lo = 0
+        for page in range(address, address + len(data), pagesize):
+            hi = bisect.bisect_left(sources, page + pagesize, lo)
+            self.__set_page(page, sources[lo:hi], targets[lo:hi])
+            lo = hi
+        return
+
+    def __scan(self, only_writable: bool) -> int:
+        "Scan the readable mappings, return the number of pages scanned."
+        pagesize = gef.session.pagesize
+        nb_scanned = 0
+        for section in gef.memory.maps:
+            if not section.permission & Permission.READ or section.path == "[vvar]":
+                continue
+            writable = bool(section.permission & Permission.WRITE)
+            if only_writable and not writable:
+                continue
+            for address, size, block in self.__blocks(section.page_start, section.page_end):
+                if block is None:
+                    # the pointers found there by a previous scan are gone
+                    for page in range(address, address + size, pagesize):
+                        self.__set_page(page, array.array("Q"), array.array("Q"))
+                        self.__hashes.pop(page, None)
+                    continue
+                # runs of consecutive pages to scan, all of them unless only the modified
+                # writable pages are scanned again
+                runs: List[List[int]] = []
+                for offset in range(0, len(block), pagesize):
+                    page = address + offset
+                    if writable:
+                        digest = hash(block[offset:offset + pagesize])
+                        if only_writable and self.__hashes.get(page) == digest:
+                            continue
+                        self.__hashes[page] = digest
+                    if runs and runs[-1][1] == offset:
+                        runs[-1][1] = offset + pagesize
+                    else:
+                        runs.append([offset, offset + pagesize])
+                for run_start, run_end in runs:
+                    self.__scan_range(address + run_start, block[run_start:run_end])
+                    nb_scanned += (run_end - run_start) // pagesize
+        self.__reverse = None
+        return nb_scanned
+
+    def build(self) -> int:
+        "Scan the whole memory of the process. Return the number of pages scanned."
+        self.clear()
+        self.__layout = self.__current_layout()
+        self.__map_starts = [x[0] for x in self.__layout]
+        self.__map_ends = [x[1] for x in self.__layout]
+        nb_scanned = self.__scan(only_writable=False)
+        self.built = True
+        return nb_scanned
+
+    def refresh(self) -> int:
+        """Scan again the writable pages modified since the last scan (or everything if the
+        memory layout changed). Return the number of pages scanned."""
+        self.__stale = False
+        if self.__current_layout() != self.__layout:
+            return self.build()
+        return self.__scan(only_writable=True)
+
+    def __ensure_fresh(self) -> None:
+        if self.__stale:
+            self.refresh()
+        return
+
+    def __build_reverse(self) -> None:
+        sources, targets = array.array("Q"), array.array("Q")
+        for page in sorted(self.__pages):
+            page_sources, page_targets = self.__pages[page]
+            sources.extend(page_sources)
+            targets.extend(page_targets)
+
+        # stable sort: the sources of a given target stay in address order
+        order = sorted(range(len(targets)), key=targets.__getitem__)
+        unique_targets, offsets, sorted_sources = array.array("Q"), array.array("Q"), array.array("Q")
+        for i in order:
+            target = targets[i]
+            if not unique_targets or unique_targets[-1] != target:
+                unique_targets.append(target)
+                offsets.append(len(sorted_sources))
+            sorted_sources.append(sources[i])
+        offsets.append(len(sorted_sources))
+        self.__reverse = (unique_targets, offsets, sorted_sources)
+        return
+
+    def sources_of(self, target: int) -> "array.array[int]":
+        "Return the addresses of all the pointers to `target`."
+        self.__ensure_fresh()
+        if self.__reverse is None:
+            self.__build_reverse()
+        unique_targets, offsets, sources = self.__reverse
+        idx = bisect.bisect_left(unique_targets, target)
+        if idx == len(unique_targets) or unique_targets[idx] != target:
+            return array.array("Q")
+        return sources[offsets[idx]:offsets[idx + 1]]
+
+    def edges_from(self, start: int, end: int) -> Generator[Tuple[int, int], None, None]:
+        "Yield the (source, target) pointers located in [`start`, `end`), in address order."
+        self.__ensure_fresh()
+        pagesize = gef.session.pagesize
+        if self.__sorted_pages is None:
+            self.__sorted_pages = sorted(self.__pages)
+        pages = self.__sorted_pages
+        lo = bisect.bisect_right(pages, start - pagesize)
+        hi = bisect.bisect_left(pages, end, lo)
+        for page in pages[lo:hi]:
+            for source, target in zip(*self.__pages[page]):
+                if start <= source < end:
+                    yield source, target
+        return
+
+
+pointer_index = PointerIndex()
+
+
+@register
+class PointerIndexCommand(GenericCommand):
+    """Manage the whole-process pointer index used by `peek-pointers` and `xref-telescope`."""
+
+    _cmdline_ = "pointer-index"
+    _syntax_ = f"{_cmdline_} (build|refresh|status|clear)"
+
+    def __init__(self) -> None:
+        super().__init__(prefix=True)
+        return
+
+    def do_invoke(self, _: List[str]) -> None:
+        self.usage()
+        return
+
+
+@register
+class PointerIndexBuildCommand(GenericCommand):
+    """Scan all the readable memory of the process and index every pointer found."""
+
+    _cmdline_ = "pointer-index build"
+    _syntax_ = f"{_cmdline_}"
+
+    @only_if_gdb_running
+    def do_invoke(self, _: List[str]) -> None:
+        start_time = time.perf_counter()
+        nb_scanned = pointer_index.build()
+        ok(f"{pointer_index.nb_edges} pointer(s) indexed from {nb_scanned} page(s) "
+           f"in {time.perf_counter() - start_time:.2f}s")
+        return
+
+
+@register
+class PointerIndexRefreshCommand(GenericCommand):
+    """Scan again the writable pages modified since the last scan. This is done automatically
+    by the queries after the process stopped."""
+
+    _cmdline_ = "pointer-index refresh"
+    _syntax_ = f"{_cmdline_}"
+
+    @only_if_gdb_running
+    def do_invoke(self, _: List[str]) -> None:
+        if not pointer_index.built:
+            err("The pointer index is not built, use `pointer-index build`")
+            return
+        start_time = time.perf_counter()
+        nb_scanned = pointer_index.refresh()
+        ok(f"{nb_scanned} page(s) scanned again in {time.perf_counter() - start_time:.2f}s, "
+           f"{pointer_index.nb_edges} pointer(s) indexed")
+        return
+
+
+@register
+class PointerIndexStatusCommand(GenericCommand):
+    """Show the size of the pointer index."""
+
+    _cmdline_ = "pointer-index status"
+    _syntax_ = f"{_cmdline_}"
+
+    def do_invoke(self, _: List[str]) -> None:
+        if not pointer_index.built:
+            info("The pointer index is not built")
+            return
+        info(f"{pointer_index.nb_edges} pointer(s) indexed in {pointer_index.nb_pages} page(s)")
+        return
+
+
+@register
+class PointerIndexClearCommand(GenericCommand):
+    """Drop the pointer index."""
+
+    _cmdline_ = "pointer-index clear"
+    _syntax_ = f"{_cmdline_}"
+
+    def do_invoke(self, _: List[str]) -> None:
+        pointer_index.clear()
+        return
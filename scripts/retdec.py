@@ -137,9 +137,10 @@ class RetDecCommand(GenericCommand):
             for match in pattern.finditer(line):
                 s = match.group(1)
                 pc = int(s, 16)
-                insn = gef_current_instruction(pc)
-                if insn.location:
-                    line = line.replace("unknown_{:s}".format(s), insn.location)
+                sym = symbol_index.lookup(pc)
+                if sym:
+                    name = sym[0] if sym[1] == 0 else "{:s}+{:d}".format(*sym)
+                    line = line.replace("unknown_{:s}".format(s), name)
             gef_print(highlight(line, CLexer(), Terminal256Formatter(style=theme)), end="")
         return
 
@@ -1,13 +1,147 @@
 __AUTHOR__ = "hugsy"
-__VERSION__ = 0.2
+__VERSION__ = 0.3
 
-from typing import TYPE_CHECKING
+import array
+import string
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     from . import *
     from . import gdb
 
 
+class StackDereferencer:
+    """Dereference the words of a memory range read at once, with the same output as
+    `dereference_from()`. The memory reads, the address lookups and the dereference chains
+    are cached for the lifetime of the object, i.e. a single rendering of the stack."""
+
+    PRINTABLE = frozenset(string.printable.encode()) - {ord("\\")}
+
+    def __init__(self, start: int, data: bytes, max_depth: int) -> None:
+        self.start = start
+        self.data = data
+        self.max_depth = max_depth
+        self.ptrsize = gef.arch.ptrsize
+        fmt = "Q" if self.ptrsize == 8 else "I"
+        size = len(data) - len(data) % self.ptrsize
+        if (gef.arch.endianness == Endianness.BIG_ENDIAN) == (sys.byteorder == "big"):
+            self.words = memoryview(data)[:size].cast(fmt)
+        else:
+            words = array.array(fmt)
+            words.frombytes(memoryview(data)[:size])
+            words.byteswap()
+            self.words = memoryview(words)
+        self.__addresses: Dict[int, "Address"] = {}
+        self.__values: Dict[int, Optional[int]] = {}
+        self.__strings: Dict[int, bool] = {}
+        # (address, remaining depth) -> (end of the dereference chain, addresses traversed)
+        self.__chains: Dict[Tuple[int, int], Tuple[List[str], Set[int]]] = {}
+        return
+
+    def lookup(self, address: int) -> "Address":
+        if address not in self.__addresses:
+            self.__addresses[address] = lookup_address(address)
+        return self.__addresses[address]
+
+    def read(self, address: int) -> Optional[int]:
+        "Read a word, from the range read at once when possible."
+        offset = address - self.start
+        if 0 <= offset < len(self.words) * self.ptrsize and offset % self.ptrsize == 0:
+            return self.words[offset // self.ptrsize]
+        if address not in self.__values:
+            self.__values[address] = self.lookup(address).dereference()
+        return self.__values[address]
+
+    def read_string(self, address: int) -> Optional[str]:
+        """Same as `gef.memory.read_cstring(address)` for the printable strings located in the
+        range read at once, None if the memory must be read."""
+        offset = address - self.start
+        if not 0 <= offset < len(self.data):
+            return None
+        window = bytes(self.data[offset:offset + GEF_MAX_STRING_LENGTH + 1])
+        raw = window.split(b"\0", 1)[0]
+        if len(raw) == len(window) and len(window) <= GEF_MAX_STRING_LENGTH:
+            # the string may continue after the range
+            return None
+        if not self.PRINTABLE.issuperset(raw):
+            return None
+        res = raw.decode("ascii")
+        ustr = res.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+        if len(res) > GEF_MAX_STRING_LENGTH:
+            return f"{ustr[:GEF_MAX_STRING_LENGTH]}[...]"
+        return ustr
+
+    def is_ascii_string(self, address: int) -> bool:
+        offset = address - self.start
+        if 0 <= offset < len(self.data):
+            # a string cannot start with a non printable character
+            if self.data[offset] not in self.PRINTABLE and self.data[offset] != ord("\\"):
+                return False
+            if self.read_string(address):
+                return True
+        if address not in self.__strings:
+            self.__strings[address] = is_ascii_string(address)
+        return self.__strings[address]
+
+    def chain(self, address: int) -> List[str]:
+        "Same as `dereference_from(address)`."
+        msg, _ = self.__chain(self.lookup(align_address(address)), self.max_depth, set())
+        return [format_address(address)] + msg
+
+    def __chain(self, addr: "Address", depth: int, seen: Set[int]) -> Tuple[List[str], Set[int]]:
+        "Return the end of the chain starting at `addr`, and the addresses it traverses."
+        if not addr.section or not depth:
+            return [], set()
+        if addr.value in seen:
+            return ["[loop detected]"], set()
+
+        # a cached chain is valid as long as it does not loop back to an address already seen
+        key = (addr.value, depth)
+        if key in self.__chains and seen.isdisjoint(self.__chains[key][1]):
+            return self.__chains[key]
+
+        deref = self.read(addr.value)
+        traversed = {addr.value}
+        if deref is None:
+            # dereferencing addr has triggered a MemoryError, no need to go further
+            msg = [str(addr)]
+        else:
+            new_addr = self.lookup(deref)
+            if new_addr.valid:
+                tail, tail_traversed = self.__chain(new_addr, depth - 1, seen | traversed)
+                msg = [str(new_addr)] + tail
+                traversed |= tail_traversed
+            else:
+                msg = [self.describe(addr, deref)]
+
+        if "[loop detected]" not in msg:
+            self.__chains[key] = (msg, traversed)
+        return msg, traversed
+
+    def describe(self, addr: "Address", deref: int) -> str:
+        "Format the value `deref` pointed by `addr`, when it is not a pointer itself."
+        code_color = gef.config["theme.dereference_code"]
+        string_color = gef.config["theme.dereference_string"]
+        if addr.section.is_executable() and addr.is_in_text_segment() \
+                and not self.is_ascii_string(addr.value):
+            insn = gef_current_instruction(addr.value)
+            insn_str = f"{insn.location} {insn.mnemonic} {', '.join(insn.operands)}"
+            return Color.colorify(insn_str, code_color)
+
+        if addr.section.permission & Permission.READ and self.is_ascii_string(addr.value):
+            s = self.read_string(addr.value)
+            if s is None:
+                s = gef.memory.read_cstring(addr.value)
+            if len(s) < self.ptrsize:
+                return f'{format_address(deref)} ("{Color.colorify(s, string_color)}"?)'
+            if len(s) > 50:
+                return Color.colorify(f'"{s[:50]}[...]"', string_color)
+            return Color.colorify(f'"{s}"', string_color)
+
+        return format_address(deref)
+
+
 @register
 class CurrentFrameStack(GenericCommand):
     """Show the entire stack of the current frame."""
@@ -36,11 +170,35 @@ class CurrentFrameStack(GenericCommand):
 
         stack_lo = align_address(int(frame.read_register("sp")))
         should_stack_grow_down = gef.config["context.grow_stack_down"] == True
-        results = []
 
-        for offset, address in enumerate(range(stack_lo, stack_hi, ptrsize)):
-            pprint_str = DereferenceCommand.pprint_dereferenced(stack_lo, offset)
-            if saved_ip and dereference(address) == saved_ip:
+        # the whole frame is read at once, then only the pointed values are read
+        try:
+            data = gef.memory.read(stack_lo, stack_hi - stack_lo) if stack_hi > stack_lo else b""
+        except gdb.MemoryError:
+            err(f"Cannot read the stack frame {stack_lo:#x}-{stack_hi:#x}")
+            return
+        dereferencer = StackDereferencer(stack_lo, data,
+                                         gef.config["dereference.max_recursion"] or 10)
+
+        base_address_color = gef.config["theme.dereference_base_address"]
+        registers_color = gef.config["theme.dereference_register_value"]
+        sep = f" {RIGHT_ARROW} "
+        width = ptrsize * 2 + 2
+        register_hints: Dict[int, List[str]] = {}
+        for regname in gef.arch.all_registers:
+            register_hints.setdefault(gef.arch.register(regname), []).append(regname)
+
+        results = []
+        for idx, value in enumerate(dereferencer.words):
+            offset = idx * ptrsize
+            address = stack_lo + offset
+            addrs = dereferencer.chain(address)
+            pprint_str = (f"{Color.colorify(format_address(address), base_address_color)}{VERTICAL_LINE}"
+                          f"{offset:+#07x}: {sep.join(addrs[1:]):{width}s}")
+            if address in register_hints:
+                hint = f"\t{LEFT_ARROW}{', '.join(register_hints[address])}"
+                pprint_str += Color.colorify(hint, registers_color)
+            if saved_ip and value == saved_ip:
                 pprint_str += " " + Color.colorify("($savedip)", attrs="gray underline")
             results.append(pprint_str)
 
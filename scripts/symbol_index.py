@@ -0,0 +1,220 @@
+"""
+Range-based index of the function symbols of all the objfiles loaded in GDB, so that resolving
+an address to `<function+offset>` costs a bisect instead of a GDB round-trip. The symbols are
+parsed once per objfile directly from the `.symtab`/`.dynsym` of its ELF file, and the index
+is refreshed only when GDB loads new objfiles.
+
+Other scripts should use `symbol_index.lookup(address)`, which has the same semantic as
+`gdb_get_location_from_symbol(address)` (and falls back to it for addresses the index does not
+cover).
+"""
+
+__AUTHOR__ = "hugsy"
+__VERSION__ = 0.1
+__LICENSE__ = "MIT"
+
+import array
+import bisect
+import os
+import re
+import struct
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from . import *
+    from . import gdb
+
+
+ELF_SHT_SYMTAB = 2
+ELF_SHT_DYNSYM = 11
+ELF_PT_LOAD = 1
+ELF_STT_FUNC = 2
+ELF_STT_GNU_IFUNC = 10
+
+
+class ElfFunctionSymbols:
+    """Function symbols of one ELF file, sorted by (unrelocated) address."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.starts = array.array("Q")
+        self.ends = array.array("Q")
+        self.names: List[str] = []
+        # addresses of the STT_GNU_IFUNC symbols, i.e. of the resolvers of these functions
+        self.ifuncs: Set[int] = set()
+        self.min_vaddr = 0
+        self.__parse()
+        return
+
+    def __parse(self) -> None:
+        with open(self.path, "rb") as fd:
+            ident = fd.read(16)
+            if ident[:4] != b"\x7fELF":
+                raise ValueError(f"'{self.path}' is not an ELF file")
+            is_64 = ident[4] == 2
+            endian = "<" if ident[5] == 1 else ">"
+            hdr_fmt = f"{endian}HHIQQQIHHHHHH" if is_64 else f"{endian}HHIIIIIHHHHHH"
+            (_, _, _, _, e_phoff, e_shoff, _, _, e_phentsize, e_phnum, e_shentsize, e_shnum, _) = \
+                struct.unpack(hdr_fmt, fd.read(struct.calcsize(hdr_fmt)))
+
+            # lowest loaded address, to compute the load bias of PIE/shared objects
+            fd.seek(e_phoff)
+            phdrs = fd.read(e_phentsize * e_phnum)
+            vaddrs = []
+            for i in range(e_phnum):
+                phdr = phdrs[i * e_phentsize:(i + 1) * e_phentsize]
+                if is_64:
+                    p_type, _, _, p_vaddr = struct.unpack(f"{endian}IIQQ", phdr[:24])
+                else:
+                    p_type, _, p_vaddr = struct.unpack(f"{endian}III", phdr[:12])
+                if p_type == ELF_PT_LOAD:
+                    vaddrs.append(p_vaddr)
+            self.min_vaddr = min(vaddrs) if vaddrs else 0
+
+            fd.seek(e_shoff)
+            shdrs_raw = fd.read(e_shentsize * e_shnum)
+            shdr_fmt = f"{endian}IIQQQQIIQQ" if is_64 else f"{endian}IIIIIIIIII"
+            shdrs = [struct.unpack(shdr_fmt, shdrs_raw[i * e_shentsize:(i + 1) * e_shentsize])
+                     for i in range(e_shnum)]
+
+            symbols: Dict[int, Tuple[int, str, bool]] = {}
+            for shdr in shdrs:
+                sh_type, sh_offset, sh_size, sh_link = shdr[1], shdr[4], shdr[5], shdr[6]
+                if sh_type not in (ELF_SHT_SYMTAB, ELF_SHT_DYNSYM) or sh_link >= len(shdrs):
+                    continue
+                fd.seek(shdrs[sh_link][4])
+                strtab = fd.read(shdrs[sh_link][5])
+                fd.seek(sh_offset)
+                raw = fd.read(sh_size)
+                sym_fmt = f"{endian}IBBHQQ" if is_64 else f"{endian}IIIBBH"
+                raw = raw[:len(raw) - len(raw) % struct.calcsize(sym_fmt)]
+                for sym in struct.iter_unpack(sym_fmt, raw):
+                    if is_64:
+                        st_name, st_info, _, st_shndx, st_value, st_size = sym
+                    else:
+                        st_name, st_value, st_size, st_info, _, st_shndx = sym
+                    if st_info & 0xf not in (ELF_STT_FUNC, ELF_STT_GNU_IFUNC) or not st_value \
+                            or not st_shndx:
+                        continue
+                    # prefer the sized symbol when several names share the same address
+                    if st_value in symbols and symbols[st_value][0] >= st_size:
+                        continue
+                    name = strtab[st_name:strtab.index(b"\0", st_name)].decode("utf-8", "replace")
+                    symbols[st_value] = (st_size, name, st_info & 0xf == ELF_STT_GNU_IFUNC)
+
+        for start in sorted(symbols):
+            size, name, is_ifunc = symbols[start]
+            self.starts.append(start)
+            self.ends.append(start + size)
+            self.names.append(name)
+            if is_ifunc:
+                self.ifuncs.add(start)
+        return
+
+    def lookup(self, address: int) -> Optional[Tuple[str, int]]:
+        idx = bisect.bisect_right(self.starts, address) - 1
+        if idx < 0:
+            return None
+        start = self.starts[idx]
+        # symbols without size only match their exact address
+        if address < self.ends[idx] or address == start:
+            return self.names[idx], address - start
+        return None
+
+
+class SymbolIndex:
+    """Address index of the function symbols of every objfile mapped in the process. The ELF
+    symbols are parsed only once per file, and the index itself is rebuilt lazily after GDB
+    signals new objfiles."""
+
+    def __init__(self) -> None:
+        self.__files: Dict[str, Optional[ElfFunctionSymbols]] = {}
+        # (mapped start, mapped end, load bias, symbols, objfile name), sorted by mapped start
+        self.__ranges: List[Tuple[int, int, int, ElfFunctionSymbols, str]] = []
+        self.__range_starts: List[int] = []
+        self.__dirty = True
+        gef_on_new_hook(self.invalidate)
+        gef_on_exit_hook(self.invalidate)
+        return
+
+    def invalidate(self, _: Optional["gdb.Event"] = None) -> None:
+        self.__dirty = True
+        return
+
+    def __symbols_for(self, path: str) -> Optional[ElfFunctionSymbols]:
+        if path not in self.__files:
+            try:
+                self.__files[path] = ElfFunctionSymbols(path)
+            except (OSError, ValueError, struct.error):
+                self.__files[path] = None
+        return self.__files[path]
+
+    def rebuild(self) -> None:
+        ranges: Dict[str, List[int]] = {}
+        for section in gef.memory.maps:
+            if not section.path.startswith("/"):
+                continue
+            path = os.path.realpath(section.path)
+            bounds = ranges.setdefault(path, [section.page_start, section.page_end])
+            bounds[0] = min(bounds[0], section.page_start)
+            bounds[1] = max(bounds[1], section.page_end)
+
+        self.__ranges = []
+        for objfile in gdb.objfiles():
+            if not objfile.filename:
+                continue
+            path = os.path.realpath(objfile.filename)
+            if path not in ranges:
+                continue
+            symbols = self.__symbols_for(path)
+            if not symbols:
+                continue
+            start, end = ranges[path]
+            bias = start - (symbols.min_vaddr & ~(gef.session.pagesize - 1))
+            self.__ranges.append((start, end, bias, symbols, objfile.filename))
+
+        self.__ranges.sort(key=lambda x: x[0])
+        self.__range_starts = [x[0] for x in self.__ranges]
+        self.__dirty = False
+        return
+
+    def lookup(self, address: int, fallback: bool = True) -> Optional[Tuple[str, int]]:
+        """Return the `(function_name, offset)` tuple of `address`, like
+        `gdb_get_location_from_symbol()`. If `fallback` is False, never query GDB for the
+        addresses the index does not know."""
+        if self.__dirty and is_alive():
+            self.rebuild()
+
+        idx = bisect.bisect_right(self.__range_starts, address) - 1
+        if idx >= 0:
+            start, end, bias, symbols, _ = self.__ranges[idx]
+            if address < end:
+                sym = symbols.lookup(address - bias)
+                if sym:
+                    return sym
+
+        # not covered by the index (PLT stubs, JIT code, vDSO, etc.)
+        return gdb_get_location_from_symbol(address) if fallback else None
+
+    def search(self, pattern: str, library: str = "") -> List[Tuple[str, Optional[int]]]:
+        """Return the `(function_name, address)` of all the functions whose name matches the
+        regular expression `pattern`, in the objfiles whose file name contains `library` (all
+        of them by default). The address of the GNU indirect functions (most of the str*/mem*
+        functions of the glibc) is None: their symbol points to their resolver, and only GDB
+        can resolve them by name to the implementation selected at runtime."""
+        if self.__dirty and is_alive():
+            self.rebuild()
+
+        regex = re.compile(pattern)
+        found = []
+        for start, end, bias, symbols, filename in self.__ranges:
+            if library and library not in os.path.basename(filename) \
+                    and library not in os.path.basename(symbols.path):
+                continue
+            for address, name in zip(symbols.starts, symbols.names):
+                if regex.search(name) and start <= address + bias < end:
+                    found.append((name, None if address in symbols.ifuncs else address + bias))
+        return found
+
+
+symbol_index = SymbolIndex()
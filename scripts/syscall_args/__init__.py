@@ -6,20 +6,62 @@ __AUTHOR__ = "daniellimws"
 __VERSION__ = 0.1
 __LICENSE__ = "MIT"
 
+import collections
 import inspect
 import pathlib
-import re
+import time
+import types
 from importlib.machinery import SourceFileLoader
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Mapping, Optional, TextIO, Tuple, Type, Union
 
 if TYPE_CHECKING:
     from .. import *
+    from .. import gdb
 
 CURRENT_FILE = pathlib.Path(inspect.getfile(inspect.currentframe())).resolve()
 CURRENT_DIRECTORY = pathlib.Path(inspect.getfile(inspect.currentframe())).parent.resolve()
 CONTEXT_PANE_INDEX = "syscall_args"
 CONTEXT_PANE_DESCRIPTION = "Syscall Arguments"
 
+# loader of the syscall tables, also used to compile them
+syscall_tables_format = SourceFileLoader(
+    "syscall_tables_format", str(CURRENT_DIRECTORY / "syscall-tables" / "generator.py")).load_module(None)
+
+
+class SyscallTableCache:
+    """Syscall tables, loaded once per architecture and dropped when the architecture changes.
+    The tables are read-only mappings of syscall number to `SyscallEntry`."""
+
+    def __init__(self) -> None:
+        self.__arch: Optional[Type["Architecture"]] = None
+        self.__tables: Dict[Tuple[str, pathlib.Path], Mapping[int, Any]] = {}
+        return
+
+    def clear(self) -> None:
+        self.__arch = None
+        self.__tables.clear()
+        return
+
+    def get(self, arch: Type["Architecture"], path: pathlib.Path) -> Mapping[int, Any]:
+        if arch is not self.__arch:
+            self.clear()
+            self.__arch = arch
+        key = (arch.__name__, path)
+        if key not in self.__tables:
+            self.__tables[key] = self.__load(arch.__name__, path)
+        return self.__tables[key]
+
+    @staticmethod
+    def __load(modname: str, path: pathlib.Path) -> Mapping[int, Any]:
+        # compiled tables first, then the legacy Python modules
+        for _fpath in (path / f"{modname}.json", path / f"{modname}.py"):
+            if _fpath.is_file():
+                return types.MappingProxyType(syscall_tables_format.syscall_table_load(_fpath))
+        raise FileNotFoundError
+
+
+syscall_tables = SyscallTableCache()
+
 
 @register
 class IsSyscallCommand(GenericCommand):
@@ -43,7 +85,7 @@ class SyscallArgsCommand(GenericCommand):
 
     def __init__(self) -> None:
         super().__init__(prefix=False, complete=gdb.COMPLETE_NONE)
-        self.__path: Optional[pathlib.Path] = None
+        self.__path: Optional[Tuple[str, pathlib.Path]] = None
         path = CURRENT_DIRECTORY / "syscall-tables"
         self["path"] = (str(path),
                         "Path to store/load the syscall tables files")
@@ -51,13 +93,13 @@ class SyscallArgsCommand(GenericCommand):
 
     @property
     def path(self) -> pathlib.Path:
-        if not self.__path:
+        if not self.__path or self.__path[0] != self["path"]:
             path = pathlib.Path(self["path"]).expanduser()
             if not path.is_dir():
                 raise FileNotFoundError(
-                    f"'{self.__path}' is not valid directory")
-            self.__path = path
-        return self.__path
+                    f"'{path}' is not valid directory")
+            self.__path = (self["path"], path)
+        return self.__path[1]
 
     @only_if_gdb_running
     def do_invoke(self, _: List[str]) -> None:
@@ -68,8 +110,7 @@ class SyscallArgsCommand(GenericCommand):
             return
 
         color = gef.config["theme.table_heading"]
-        arch = gef.arch.__class__.__name__
-        syscall_table = self.__get_syscall_table(arch)
+        syscall_table = syscall_tables.get(gef.arch.__class__, self.path)
 
         if is_syscall(gef.arch.pc):
             # if $pc is before the `syscall` instruction is executed:
@@ -97,7 +138,7 @@ class SyscallArgsCommand(GenericCommand):
         gef_print(f"    {syscall_entry.name}({', '.join(parameters)})")
 
         headers = ["Parameter", "Register", "Value"]
-        param_names = [re.split(r" |\*", p)[-1] for p in parameters]
+        param_names = [s.name for s in syscall_entry.params]
         info(Color.colorify("{:<20} {:<20} {}".format(*headers), color))
         for name, register, value in zip(param_names, registers, values):
             line = f"    {name:<20} {register:<20} {value:#x}"
@@ -107,16 +148,267 @@ class SyscallArgsCommand(GenericCommand):
             gef_print(line)
         return
 
-    def __get_syscall_table(self, modname: str) -> Dict[str, Any]:
-        def load_module(modname: str) -> Any:
-            _fpath = self.path / f"{modname}.py"
-            if not _fpath.is_file():
-                raise FileNotFoundError
-            _fullname = str(_fpath.absolute())
-            return SourceFileLoader(modname, _fullname).load_module(None)
 
-        _mod = load_module(modname)
-        return getattr(_mod, "syscall_table")
+SyscallRecord = collections.namedtuple("SyscallRecord", "thread nr name args retval")
+
+
+class SyscallTracer:
+    """Log the syscalls of the inferior from the Python `stop` method of a `catch syscall`
+    catchpoint. The method records the arguments (on syscall entry) or the return value (on
+    syscall exit) and returns False, so GDB resumes the execution by itself without reporting a
+    stop: neither the context nor the stop hooks run for the traced syscalls. The registers are
+    read directly from the frame, and the records are only formatted when written to a file or
+    displayed."""
+
+    def __init__(self) -> None:
+        self.catchpoint: Optional[int] = None
+        self.records: Deque[SyscallRecord] = collections.deque()
+        self.output: Optional[TextIO] = None
+        self.depth = 1
+        self.string_size = 32
+        self.nb_records = 0
+        self.start_time = 0.0
+        self.elapsed = 0.0
+        self.__table: Optional[Mapping[int, Any]] = None
+        self.__nr_register = ""
+        self.__mask = 0
+        # syscall entries waiting for their return value, per thread
+        self.__pending: Dict[int, Tuple[int, str, tuple]] = {}
+        gef_on_exit_hook(self.__on_exit)
+        return
+
+    @property
+    def active(self) -> bool:
+        return self.catchpoint is not None
+
+    @property
+    def rate(self) -> float:
+        "Number of syscalls recorded per second of tracing."
+        elapsed = time.perf_counter() - self.start_time if self.active else self.elapsed
+        return self.nb_records / elapsed if elapsed else 0.0
+
+    def start(self, syscalls: List[str], output: Optional[TextIO], depth: int, size: int) -> None:
+        gdb.execute(f"catch syscall {' '.join(syscalls)}", to_string=True)
+        number = int(gdb.parse_and_eval("$bpnum"))
+        try:
+            catchpoint = next((bp for bp in gdb.breakpoints() if bp.number == number), None)
+            if catchpoint is None:
+                raise gdb.error("syscall-trace requires a GDB exposing the catchpoints to Python "
+                                "(GDB 13 or later)")
+            catchpoint.stop = self.record
+        except (gdb.error, AttributeError) as e:
+            # do not leave a stopping catchpoint behind
+            gdb.execute(f"delete {number}", to_string=True)
+            raise gdb.error(str(e)) from e
+        self.catchpoint = number
+        self.records = collections.deque(self.records, maxlen=size or None)
+        self.output = output
+        self.depth = depth
+        self.nb_records = 0
+        self.__table = None
+        self.__pending.clear()
+        self.start_time = time.perf_counter()
+        return
+
+    def stop(self) -> None:
+        if self.catchpoint is None:
+            return
+        # the syscalls that never returned (exit, exit_group, ...)
+        for thread, (nr, name, args) in self.__pending.items():
+            self.__push(SyscallRecord(thread, nr, name, args, None))
+        self.__pending.clear()
+        gdb.execute(f"delete {self.catchpoint}", to_string=True)
+        self.catchpoint = None
+        self.elapsed = time.perf_counter() - self.start_time
+        if self.output:
+            self.output.close()
+            self.output = None
+        return
+
+    def __on_exit(self, _: "gdb.ExitedEvent") -> None:
+        if self.active:
+            self.stop()
+            ok(f"Syscall trace stopped, {self.nb_records} syscall(s) recorded "
+               f"({self.rate:.0f} syscalls/s)")
+        return
+
+    def __load(self) -> None:
+        self.__table = syscall_tables.get(gef.arch.__class__,
+                                          gef.gdb.commands["syscall-args"].path)
+        self.__mask = (1 << (8 * gef.arch.ptrsize)) - 1
+        # the syscall number register is overwritten by the return value on some architectures
+        register = gef.arch.syscall_register.lstrip("$")
+        try:
+            gdb.selected_frame().read_register(f"orig_{register}")
+            self.__nr_register = f"orig_{register}"
+        except ValueError:
+            self.__nr_register = register
+        return
+
+    def record(self) -> bool:
+        """Stop method of the catchpoint, called on every syscall entry and exit. Always return
+        False to resume the execution."""
+        if self.__table is None:
+            self.__load()
+        frame = gdb.selected_frame()
+        thread = gdb.selected_thread().num
+        mask = self.__mask
+
+        if thread in self.__pending:
+            nr, name, args = self.__pending.pop(thread)
+            retval = int(frame.read_register(gef.arch.return_register.lstrip("$"))) & mask
+            if retval & (1 << (8 * gef.arch.ptrsize - 1)):
+                retval -= mask + 1
+            self.__push(SyscallRecord(thread, nr, name, args, retval))
+            return False
+
+        nr = int(frame.read_register(self.__nr_register)) & mask
+        entry = self.__table.get(nr)
+        if entry is None:
+            self.__pending[thread] = (nr, f"syscall_{nr:#x}", ())
+            return False
+        args = []
+        for param in entry.params:
+            value = int(frame.read_register(param.reg.lstrip("$"))) & mask
+            args.append((param.name, value,
+                         self.dereference(value, "char *" in param.param)))
+        self.__pending[thread] = (nr, entry.name, tuple(args))
+        return False
+
+    def dereference(self, value: int, is_string: bool) -> Union[str, Tuple[int, ...], None]:
+        """Follow `value` as a pointer up to `depth` times, or read it as a C string."""
+        if not self.depth or value < DEFAULT_PAGE_SIZE:
+            return None
+        try:
+            if is_string:
+                return gef.memory.read_cstring(value, max_length=self.string_size)
+            chain = []
+            for _ in range(self.depth):
+                value = gef.memory.read_integer(value)
+                chain.append(value)
+                if value < DEFAULT_PAGE_SIZE:
+                    break
+        except gdb.MemoryError:
+            return None
+        return tuple(chain) if chain else None
+
+    def __push(self, record: SyscallRecord) -> None:
+        self.nb_records += 1
+        if self.output:
+            self.output.write(self.format(record) + "\n")
+        else:
+            self.records.append(record)
+        return
+
+    @staticmethod
+    def format(record: SyscallRecord) -> str:
+        args = []
+        for name, value, deref in record.args:
+            arg = f"{name}={value:#x}"
+            if isinstance(deref, str):
+                arg += f'{RIGHT_ARROW}"{deref}"'
+            elif deref:
+                arg += RIGHT_ARROW + RIGHT_ARROW.join(f"{x:#x}" for x in deref)
+            args.append(arg)
+        retval = "?" if record.retval is None else f"{record.retval:#x}" if record.retval >= 0 \
+            else str(record.retval)
+        return f"[{record.thread}] {record.name}({', '.join(args)}) = {retval}"
+
+
+syscall_tracer = SyscallTracer()
+
+
+@register
+class SyscallTraceCommand(GenericCommand):
+    """Trace the syscalls of the inferior, like strace, without stopping at every syscall."""
+
+    _cmdline_ = "syscall-trace"
+    _syntax_ = f"{_cmdline_} (start|stop|show|clear)"
+
+    def __init__(self) -> None:
+        super().__init__(prefix=True)
+        return
+
+    def do_invoke(self, _: List[str]) -> None:
+        self.usage()
+        return
+
+
+@register
+class SyscallTraceStartCommand(GenericCommand):
+    """Start tracing all the syscalls, or only the given ones (names, numbers or groups, as
+    accepted by `catch syscall`). The decoded syscalls are kept in a ring buffer of SIZE entries
+    (0 for unlimited), or written to FILE. Pointer arguments are dereferenced up to DEPTH times
+    (0 to disable). The inferior does not stop on the traced syscalls."""
+
+    _cmdline_ = "syscall-trace start"
+    _syntax_ = f"{_cmdline_} [--output FILE] [--depth DEPTH] [--size SIZE] [SYSCALL ...]"
+    _example_ = [f"{_cmdline_}",
+                 f"{_cmdline_} --depth 0 --output /tmp/trace.log openat read write close",
+                 f"{_cmdline_} --size 100 g:network"]
+
+    @parse_arguments({"syscalls": [""]}, {"--output": "", "--depth": 1, "--size": 10000})
+    def do_invoke(self, _: List[str], **kwargs: Any) -> None:
+        args = kwargs["arguments"]
+        if syscall_tracer.active:
+            err("A syscall trace is already running, use `syscall-trace stop` first")
+            return
+        output = open(args.output, "a", buffering=0x100000) if args.output else None
+        try:
+            syscall_tracer.start([x for x in args.syscalls if x], output, args.depth, args.size)
+        except gdb.error as e:
+            if output:
+                output.close()
+            err(str(e))
+            return
+        ok(f"Tracing syscalls with catchpoint {syscall_tracer.catchpoint}")
+        return
+
+
+@register
+class SyscallTraceStopCommand(GenericCommand):
+    """Stop tracing the syscalls."""
+
+    _cmdline_ = "syscall-trace stop"
+    _syntax_ = f"{_cmdline_}"
+
+    def do_invoke(self, _: List[str]) -> None:
+        if not syscall_tracer.active:
+            err("No syscall trace is running")
+            return
+        syscall_tracer.stop()
+        ok(f"{syscall_tracer.nb_records} syscall(s) recorded in {syscall_tracer.elapsed:.2f}s "
+           f"({syscall_tracer.rate:.0f} syscalls/s)")
+        return
+
+
+@register
+class SyscallTraceShowCommand(GenericCommand):
+    """Show the last COUNT syscalls of the ring buffer (all of them by default)."""
+
+    _cmdline_ = "syscall-trace show"
+    _syntax_ = f"{_cmdline_} [COUNT]"
+
+    @parse_arguments({"count": 0}, {})
+    def do_invoke(self, _: List[str], **kwargs: Any) -> None:
+        count = kwargs["arguments"].count
+        records = list(syscall_tracer.records)
+        if count:
+            records = records[-count:]
+        gef_print("\n".join(syscall_tracer.format(record) for record in records))
+        return
+
+
+@register
+class SyscallTraceClearCommand(GenericCommand):
+    """Empty the ring buffer of the syscall trace."""
+
+    _cmdline_ = "syscall-trace clear"
+    _syntax_ = f"{_cmdline_}"
+
+    def do_invoke(self, _: List[str]) -> None:
+        syscall_tracer.records.clear()
+        return
 
 
 def __syscall_args_pane_condition() -> bool:
@@ -125,7 +417,7 @@ def __syscall_args_pane_condition() -> bool:
 
 
 def __syscall_args_pane_content() -> None:
-    gdb.execute("syscall-args")
+    gef.gdb.commands["syscall-args"].do_invoke([])
     return
 
 
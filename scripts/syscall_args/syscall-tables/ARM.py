@@ -1,691 +0,0 @@
-from collections import namedtuple
-
-Entry = namedtuple('Entry', 'name params')
-Param = namedtuple('Param', 'reg param')
-
-# contains both OABI and EABI since gef itself doesn't seem to make a distinction in this
-
-syscall_table = {}
-syscall_table[0x000000] = Entry('restart_syscall', [])
-syscall_table[0x000001] = Entry('exit', [Param('$rr0', 'int error_code')])
-syscall_table[0x000002] = Entry('fork', [])
-syscall_table[0x000003] = Entry('read', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'char *buf'), Param('$rr2', 'size_t count')])
-syscall_table[0x000004] = Entry('write', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'const char *buf'), Param('$rr2', 'size_t count')])
-syscall_table[0x000005] = Entry('open', [Param('$rr0', 'const char *filename'), Param('$rr1', 'int flags'), Param('$rr2', 'umode_t mode')])
-syscall_table[0x000006] = Entry('close', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x000008] = Entry('creat', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x000009] = Entry('link', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'const char *newname')])
-syscall_table[0x00000a] = Entry('unlink', [Param('$rr0', 'const char *pathname')])
-syscall_table[0x00000b] = Entry('execve', [Param('$rr0', 'const char *filenamei'), Param('$rr1', 'const char *const *argv'), Param('$rr2', 'const char *const *envp')])
-syscall_table[0x00000c] = Entry('chdir', [Param('$rr0', 'const char *filename')])
-syscall_table[0x00000d] = Entry('time', [Param('$rr0', 'time_t *tloc')])
-syscall_table[0x00000e] = Entry('mknod', [Param('$rr0', 'const char *filename'), Param('$rr1', 'umode_t mode'), Param('$rr2', 'unsigned dev')])
-syscall_table[0x00000f] = Entry('chmod', [Param('$rr0', 'const char *filename'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x000010] = Entry('lchown', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x000013] = Entry('lseek', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'off_t offset'), Param('$rr2', 'unsigned int origin')])
-syscall_table[0x000014] = Entry('getpid', [])
-syscall_table[0x000015] = Entry('mount', [Param('$rr0', 'char *dev_name'), Param('$rr1', 'char *dir_name'), Param('$rr2', 'char *type'), Param('$rr3', 'unsigned long flags'), Param('$rr4', 'void *data')])
-syscall_table[0x000016] = Entry('umount', [Param('$rr0', 'char *name'), Param('$rr1', 'int flags')])
-syscall_table[0x000017] = Entry('setuid', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x000018] = Entry('getuid', [])
-syscall_table[0x000019] = Entry('stime', [Param('$rr0', 'time_t *tptr')])
-syscall_table[0x00001a] = Entry('ptrace', [Param('$rr0', 'long request'), Param('$rr1', 'long pid'), Param('$rr2', 'unsigned long addr'), Param('$rr3', 'unsigned long data')])
-syscall_table[0x00001b] = Entry('alarm', [Param('$rr0', 'unsigned int seconds')])
-syscall_table[0x00001d] = Entry('pause', [])
-syscall_table[0x00001e] = Entry('utime', [Param('$rr0', 'char *filename'), Param('$rr1', 'struct utimbuf *times')])
-syscall_table[0x000021] = Entry('access', [Param('$rr0', 'const char *filename'), Param('$rr1', 'int mode')])
-syscall_table[0x000022] = Entry('nice', [Param('$rr0', 'int increment')])
-syscall_table[0x000024] = Entry('sync', [])
-syscall_table[0x000025] = Entry('kill', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int sig')])
-syscall_table[0x000026] = Entry('rename', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'const char *newname')])
-syscall_table[0x000027] = Entry('mkdir', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x000028] = Entry('rmdir', [Param('$rr0', 'const char *pathname')])
-syscall_table[0x000029] = Entry('dup', [Param('$rr0', 'unsigned int fildes')])
-syscall_table[0x00002a] = Entry('pipe', [Param('$rr0', 'int *fildes')])
-syscall_table[0x00002b] = Entry('times', [Param('$rr0', 'struct tms *tbuf')])
-syscall_table[0x00002d] = Entry('brk', [Param('$rr0', 'unsigned long brk')])
-syscall_table[0x00002e] = Entry('setgid', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x00002f] = Entry('getgid', [])
-syscall_table[0x000031] = Entry('geteuid', [])
-syscall_table[0x000032] = Entry('getegid', [])
-syscall_table[0x000033] = Entry('acct', [Param('$rr0', 'const char *name')])
-syscall_table[0x000034] = Entry('umount2', [Param('$rr0', 'char *name'), Param('$rr1', 'int flags')])
-syscall_table[0x000036] = Entry('ioctl', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd'), Param('$rr2', 'unsigned long arg')])
-syscall_table[0x000037] = Entry('fcntl', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd'), Param('$rr2', 'unsigned long arg')])
-syscall_table[0x000039] = Entry('setpgid', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'pid_t pgid')])
-syscall_table[0x00003c] = Entry('umask', [Param('$rr0', 'int mask')])
-syscall_table[0x00003d] = Entry('chroot', [Param('$rr0', 'const char *filename')])
-syscall_table[0x00003e] = Entry('ustat', [Param('$rr0', 'unsigned dev'), Param('$rr1', 'struct ustat *ubuf')])
-syscall_table[0x00003f] = Entry('dup2', [Param('$rr0', 'unsigned int oldfd'), Param('$rr1', 'unsigned int newfd')])
-syscall_table[0x000040] = Entry('getppid', [])
-syscall_table[0x000041] = Entry('getpgrp', [])
-syscall_table[0x000042] = Entry('setsid', [])
-syscall_table[0x000043] = Entry('sigaction', [Param('$rr0', 'int sig'), Param('$rr1', 'const struct old_sigaction *act'), Param('$rr2', 'struct old_sigaction *oact')])
-syscall_table[0x000046] = Entry('setreuid', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid')])
-syscall_table[0x000047] = Entry('setregid', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid')])
-syscall_table[0x000048] = Entry('sigsuspend', [Param('$rr0', 'int restart'), Param('$rr1', 'unsigned long oldmask'), Param('$rr2', 'old_sigset_t mask')])
-syscall_table[0x000049] = Entry('sigpending', [Param('$rr0', 'old_sigset_t *set')])
-syscall_table[0x00004a] = Entry('sethostname', [Param('$rr0', 'char *name'), Param('$rr1', 'int len')])
-syscall_table[0x00004b] = Entry('setrlimit', [Param('$rr0', 'unsigned int resource'), Param('$rr1', 'struct rlimit *rlim')])
-syscall_table[0x00004c] = Entry('getrlimit', [Param('$rr0', 'unsigned int resource'), Param('$rr1', 'struct rlimit *rlim')])
-syscall_table[0x00004d] = Entry('getrusage', [Param('$rr0', 'int who'), Param('$rr1', 'struct rusage *ru')])
-syscall_table[0x00004e] = Entry('gettimeofday', [Param('$rr0', 'struct timeval *tv'), Param('$rr1', 'struct timezone *tz')])
-syscall_table[0x00004f] = Entry('settimeofday', [Param('$rr0', 'struct timeval *tv'), Param('$rr1', 'struct timezone *tz')])
-syscall_table[0x000050] = Entry('getgroups', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x000051] = Entry('setgroups', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x000052] = Entry('select', [Param('$rr0', 'int n'), Param('$rr1', 'fd_set *inp'), Param('$rr2', 'fd_set *outp'), Param('$rr3', 'fd_set *exp'), Param('$rr4', 'struct timeval *tvp')])
-syscall_table[0x000053] = Entry('symlink', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'const char *newname')])
-syscall_table[0x000055] = Entry('readlink', [Param('$rr0', 'const char *path'), Param('$rr1', 'char *buf'), Param('$rr2', 'int bufsiz')])
-syscall_table[0x000056] = Entry('uselib', [Param('$rr0', 'const char *library')])
-syscall_table[0x000057] = Entry('swapon', [Param('$rr0', 'const char *specialfile'), Param('$rr1', 'int swap_flags')])
-syscall_table[0x000058] = Entry('reboot', [Param('$rr0', 'int magic1'), Param('$rr1', 'int magic2'), Param('$rr2', 'unsigned int cmd'), Param('$rr3', 'void *arg')])
-syscall_table[0x000059] = Entry('readdir', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct old_linux_dirent *dirent'), Param('$rr2', 'unsigned int count')])
-syscall_table[0x00005a] = Entry('mmap', [Param('$rr0', 'struct mmap_arg_struct *arg')])
-syscall_table[0x00005b] = Entry('munmap', [Param('$rr0', 'unsigned long addr'), Param('$rr1', 'size_t len')])
-syscall_table[0x00005c] = Entry('truncate', [Param('$rr0', 'const char *path'), Param('$rr1', 'long length')])
-syscall_table[0x00005d] = Entry('ftruncate', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned long length')])
-syscall_table[0x00005e] = Entry('fchmod', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x00005f] = Entry('fchown', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x000060] = Entry('getpriority', [Param('$rr0', 'int which'), Param('$rr1', 'int who')])
-syscall_table[0x000061] = Entry('setpriority', [Param('$rr0', 'int which'), Param('$rr1', 'int who'), Param('$rr2', 'int niceval')])
-syscall_table[0x000063] = Entry('statfs', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'struct statfs *buf')])
-syscall_table[0x000064] = Entry('fstatfs', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct statfs *buf')])
-syscall_table[0x000066] = Entry('socketcall', [Param('$rr0', 'int call'), Param('$rr1', 'unsigned long *args')])
-syscall_table[0x000067] = Entry('syslog', [Param('$rr0', 'int type'), Param('$rr1', 'char *buf'), Param('$rr2', 'int len')])
-syscall_table[0x000068] = Entry('setitimer', [Param('$rr0', 'int which'), Param('$rr1', 'struct itimerval *value'), Param('$rr2', 'struct itimerval *ovalue')])
-syscall_table[0x000069] = Entry('getitimer', [Param('$rr0', 'int which'), Param('$rr1', 'struct itimerval *value')])
-syscall_table[0x00006a] = Entry('stat', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x00006b] = Entry('lstat', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x00006c] = Entry('fstat', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x00006f] = Entry('vhangup', [])
-syscall_table[0x000071] = Entry('syscall', [])
-syscall_table[0x000072] = Entry('wait4', [Param('$rr0', 'pid_t upid'), Param('$rr1', 'int *stat_addr'), Param('$rr2', 'int options'), Param('$rr3', 'struct rusage *ru')])
-syscall_table[0x000073] = Entry('swapoff', [Param('$rr0', 'const char *specialfile')])
-syscall_table[0x000074] = Entry('sysinfo', [Param('$rr0', 'struct sysinfo *info')])
-syscall_table[0x000075] = Entry('ipc', [Param('$rr0', 'unsigned int call'), Param('$rr1', 'int first'), Param('$rr2', 'unsigned long second'), Param('$rr3', 'unsigned long third'), Param('$rr4', 'void *ptr'), Param('$rr5', 'long fifth')])
-syscall_table[0x000076] = Entry('fsync', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x000077] = Entry('sigreturn', [])
-syscall_table[0x000078] = Entry('clone', [Param('$rr0', 'unsigned long clone_flags'), Param('$rr1', 'unsigned long newsp'), Param('$rr2', 'int *parent_tidptr'), Param('$rr3', 'int tls_val'), Param('$rr4', 'int *child_tidptr')])
-syscall_table[0x000079] = Entry('setdomainname', [Param('$rr0', 'char *name'), Param('$rr1', 'int len')])
-syscall_table[0x00007a] = Entry('uname', [Param('$rr0', 'struct old_utsname *name')])
-syscall_table[0x00007c] = Entry('adjtimex', [Param('$rr0', 'struct timex *txc_p')])
-syscall_table[0x00007d] = Entry('mprotect', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len'), Param('$rr2', 'unsigned long prot')])
-syscall_table[0x00007e] = Entry('sigprocmask', [Param('$rr0', 'int how'), Param('$rr1', 'old_sigset_t *nset'), Param('$rr2', 'old_sigset_t *oset')])
-syscall_table[0x000080] = Entry('init_module', [Param('$rr0', 'void *umod'), Param('$rr1', 'unsigned long len'), Param('$rr2', 'const char *uargs')])
-syscall_table[0x000081] = Entry('delete_module', [Param('$rr0', 'const char *name_user'), Param('$rr1', 'unsigned int flags')])
-syscall_table[0x000083] = Entry('quotactl', [Param('$rr0', 'unsigned int cmd'), Param('$rr1', 'const char *special'), Param('$rr2', 'qid_t id'), Param('$rr3', 'void *addr')])
-syscall_table[0x000084] = Entry('getpgid', [Param('$rr0', 'pid_t pid')])
-syscall_table[0x000085] = Entry('fchdir', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x000086] = Entry('bdflush', [Param('$rr0', 'int func'), Param('$rr1', 'long data')])
-syscall_table[0x000087] = Entry('sysfs', [Param('$rr0', 'int option'), Param('$rr1', 'unsigned long arg1'), Param('$rr2', 'unsigned long arg2')])
-syscall_table[0x000088] = Entry('personality', [Param('$rr0', 'unsigned int personality')])
-syscall_table[0x00008a] = Entry('setfsuid', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x00008b] = Entry('setfsgid', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x00008c] = Entry('_llseek', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned long offset_high'), Param('$rr2', 'unsigned long offset_low'), Param('$rr3', 'loff_t *result'), Param('$rr4', 'unsigned int origin')])
-syscall_table[0x00008d] = Entry('getdents', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct linux_dirent *dirent'), Param('$rr2', 'unsigned int count')])
-syscall_table[0x00008e] = Entry('_newselect', [Param('$rr0', 'int n'), Param('$rr1', 'fd_set *inp'), Param('$rr2', 'fd_set *outp'), Param('$rr3', 'fd_set *exp'), Param('$rr4', 'struct timeval *tvp')])
-syscall_table[0x00008f] = Entry('flock', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd')])
-syscall_table[0x000090] = Entry('msync', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len'), Param('$rr2', 'int flags')])
-syscall_table[0x000091] = Entry('readv', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen')])
-syscall_table[0x000092] = Entry('writev', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen')])
-syscall_table[0x000093] = Entry('getsid', [Param('$rr0', 'pid_t pid')])
-syscall_table[0x000094] = Entry('fdatasync', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x000095] = Entry('_sysctl', [Param('$rr0', 'struct __sysctl_args *args')])
-syscall_table[0x000096] = Entry('mlock', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len')])
-syscall_table[0x000097] = Entry('munlock', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len')])
-syscall_table[0x000098] = Entry('mlockall', [Param('$rr0', 'int flags')])
-syscall_table[0x000099] = Entry('munlockall', [])
-syscall_table[0x00009a] = Entry('sched_setparam', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'struct sched_param *param')])
-syscall_table[0x00009b] = Entry('sched_getparam', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'struct sched_param *param')])
-syscall_table[0x00009c] = Entry('sched_setscheduler', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int policy'), Param('$rr2', 'struct sched_param *param')])
-syscall_table[0x00009d] = Entry('sched_getscheduler', [Param('$rr0', 'pid_t pid')])
-syscall_table[0x00009e] = Entry('sched_yield', [])
-syscall_table[0x00009f] = Entry('sched_get_priority_max', [Param('$rr0', 'int policy')])
-syscall_table[0x0000a0] = Entry('sched_get_priority_min', [Param('$rr0', 'int policy')])
-syscall_table[0x0000a1] = Entry('sched_rr_get_interval', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'struct timespec *interval')])
-syscall_table[0x0000a2] = Entry('nanosleep', [Param('$rr0', 'struct timespec *rqtp'), Param('$rr1', 'struct timespec *rmtp')])
-syscall_table[0x0000a3] = Entry('mremap', [Param('$rr0', 'unsigned long addr'), Param('$rr1', 'unsigned long old_len'), Param('$rr2', 'unsigned long new_len'), Param('$rr3', 'unsigned long flags'), Param('$rr4', 'unsigned long new_addr')])
-syscall_table[0x0000a4] = Entry('setresuid', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid'), Param('$rr2', 'uid_t suid')])
-syscall_table[0x0000a5] = Entry('getresuid', [Param('$rr0', 'uid_t *ruidp'), Param('$rr1', 'uid_t *euidp'), Param('$rr2', 'uid_t *suidp')])
-syscall_table[0x0000a8] = Entry('poll', [Param('$rr0', 'struct pollfd *ufds'), Param('$rr1', 'unsigned int nfds'), Param('$rr2', 'int timeout_msecs')])
-syscall_table[0x0000aa] = Entry('setresgid', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid'), Param('$rr2', 'gid_t sgid')])
-syscall_table[0x0000ab] = Entry('getresgid', [Param('$rr0', 'gid_t *rgidp'), Param('$rr1', 'gid_t *egidp'), Param('$rr2', 'gid_t *sgidp')])
-syscall_table[0x0000ac] = Entry('prctl', [Param('$rr0', 'int option'), Param('$rr1', 'unsigned long arg2'), Param('$rr2', 'unsigned long arg3'), Param('$rr3', 'unsigned long arg4'), Param('$rr4', 'unsigned long arg5')])
-syscall_table[0x0000ad] = Entry('rt_sigreturn', [])
-syscall_table[0x0000ae] = Entry('rt_sigaction', [Param('$rr0', 'int sig'), Param('$rr1', 'const struct sigaction *act'), Param('$rr2', 'struct sigaction *oact'), Param('$rr3', 'size_t sigsetsize')])
-syscall_table[0x0000af] = Entry('rt_sigprocmask', [Param('$rr0', 'int how'), Param('$rr1', 'sigset_t *nset'), Param('$rr2', 'sigset_t *oset'), Param('$rr3', 'size_t sigsetsize')])
-syscall_table[0x0000b0] = Entry('rt_sigpending', [Param('$rr0', 'sigset_t *set'), Param('$rr1', 'size_t sigsetsize')])
-syscall_table[0x0000b1] = Entry('rt_sigtimedwait', [Param('$rr0', 'const sigset_t *uthese'), Param('$rr1', 'siginfo_t *uinfo'), Param('$rr2', 'const struct timespec *uts'), Param('$rr3', 'size_t sigsetsize')])
-syscall_table[0x0000b2] = Entry('rt_sigqueueinfo', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int sig'), Param('$rr2', 'siginfo_t *uinfo')])
-syscall_table[0x0000b3] = Entry('rt_sigsuspend', [Param('$rr0', 'sigset_t *unewset'), Param('$rr1', 'size_t sigsetsize')])
-syscall_table[0x0000b4] = Entry('pread64', [Param('$rr0', 'char *buf size_t count'), Param('$rr1', 'loff_t pos')])
-syscall_table[0x0000b5] = Entry('pwrite64', [Param('$rr0', 'const char *buf size_t count'), Param('$rr1', 'loff_t pos')])
-syscall_table[0x0000b6] = Entry('chown', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x0000b7] = Entry('getcwd', [Param('$rr0', 'char *buf'), Param('$rr1', 'unsigned long size')])
-syscall_table[0x0000b8] = Entry('capget', [Param('$rr0', 'cap_user_header_t header'), Param('$rr1', 'cap_user_data_t dataptr')])
-syscall_table[0x0000b9] = Entry('capset', [Param('$rr0', 'cap_user_header_t header'), Param('$rr1', 'const cap_user_data_t data')])
-syscall_table[0x0000bb] = Entry('sendfile', [Param('$rr0', 'int out_fd'), Param('$rr1', 'int in_fd'), Param('$rr2', 'off_t *offset'), Param('$rr3', 'size_t count')])
-syscall_table[0x0000be] = Entry('vfork', [])
-syscall_table[0x0000bf] = Entry('ugetrlimit', [Param('$rr0', 'unsigned int resource'), Param('$rr1', 'struct rlimit *rlim')])
-syscall_table[0x0000c0] = Entry('mmap2', [Param('$rr0', 'unsigned long addr'), Param('$rr1', 'unsigned long len'), Param('$rr2', 'unsigned long prot'), Param('$rr3', 'unsigned long flags'), Param('$rr4', 'unsigned long fd'), Param('$rr5', 'unsigned long pgoff')])
-syscall_table[0x0000c1] = Entry('truncate64', [Param('$rr0', 'loff_t length')])
-syscall_table[0x0000c2] = Entry('ftruncate64', [Param('$rr0', 'loff_t length')])
-syscall_table[0x0000c3] = Entry('stat64', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct stat64 *statbuf')])
-syscall_table[0x0000c4] = Entry('lstat64', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct stat64 *statbuf')])
-syscall_table[0x0000c5] = Entry('fstat64', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'struct stat64 *statbuf')])
-syscall_table[0x0000c6] = Entry('lchown32', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x0000c7] = Entry('getuid32', [])
-syscall_table[0x0000c8] = Entry('getgid32', [])
-syscall_table[0x0000c9] = Entry('geteuid32', [])
-syscall_table[0x0000ca] = Entry('getegid32', [])
-syscall_table[0x0000cb] = Entry('setreuid32', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid')])
-syscall_table[0x0000cc] = Entry('setregid32', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid')])
-syscall_table[0x0000cd] = Entry('getgroups32', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x0000ce] = Entry('setgroups32', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x0000cf] = Entry('fchown32', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x0000d0] = Entry('setresuid32', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid'), Param('$rr2', 'uid_t suid')])
-syscall_table[0x0000d1] = Entry('getresuid32', [Param('$rr0', 'uid_t *ruidp'), Param('$rr1', 'uid_t *euidp'), Param('$rr2', 'uid_t *suidp')])
-syscall_table[0x0000d2] = Entry('setresgid32', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid'), Param('$rr2', 'gid_t sgid')])
-syscall_table[0x0000d3] = Entry('getresgid32', [Param('$rr0', 'gid_t *rgidp'), Param('$rr1', 'gid_t *egidp'), Param('$rr2', 'gid_t *sgidp')])
-syscall_table[0x0000d4] = Entry('chown32', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x0000d5] = Entry('setuid32', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x0000d6] = Entry('setgid32', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x0000d7] = Entry('setfsuid32', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x0000d8] = Entry('setfsgid32', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x0000d9] = Entry('getdents64', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct linux_dirent64 *dirent'), Param('$rr2', 'unsigned int count')])
-syscall_table[0x0000da] = Entry('pivot_root', [Param('$rr0', 'const char *new_root'), Param('$rr1', 'const char *put_old')])
-syscall_table[0x0000db] = Entry('mincore', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len'), Param('$rr2', 'unsigned char *vec')])
-syscall_table[0x0000dc] = Entry('madvise', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len_in'), Param('$rr2', 'int behavior')])
-syscall_table[0x0000dd] = Entry('fcntl64', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd'), Param('$rr2', 'unsigned long arg')])
-syscall_table[0x0000e0] = Entry('gettid', [])
-syscall_table[0x0000e1] = Entry('readahead', [Param('$rr0', 'loff_t offset size_t count')])
-syscall_table[0x0000e2] = Entry('setxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'const void *value'), Param('$rr3', 'size_t size'), Param('$rr4', 'int flags')])
-syscall_table[0x0000e3] = Entry('lsetxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'const void *value'), Param('$rr3', 'size_t size'), Param('$rr4', 'int flags')])
-syscall_table[0x0000e4] = Entry('fsetxattr', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *name'), Param('$rr2', 'const void *value'), Param('$rr3', 'size_t size'), Param('$rr4', 'int flags')])
-syscall_table[0x0000e5] = Entry('getxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'void *value'), Param('$rr3', 'size_t size')])
-syscall_table[0x0000e6] = Entry('lgetxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'void *value'), Param('$rr3', 'size_t size')])
-syscall_table[0x0000e7] = Entry('fgetxattr', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *name'), Param('$rr2', 'void *value'), Param('$rr3', 'size_t size')])
-syscall_table[0x0000e8] = Entry('listxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'char *list'), Param('$rr2', 'size_t size')])
-syscall_table[0x0000e9] = Entry('llistxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'char *list'), Param('$rr2', 'size_t size')])
-syscall_table[0x0000ea] = Entry('flistxattr', [Param('$rr0', 'int fd'), Param('$rr1', 'char *list'), Param('$rr2', 'size_t size')])
-syscall_table[0x0000eb] = Entry('removexattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name')])
-syscall_table[0x0000ec] = Entry('lremovexattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name')])
-syscall_table[0x0000ed] = Entry('fremovexattr', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *name')])
-syscall_table[0x0000ee] = Entry('tkill', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int sig')])
-syscall_table[0x0000ef] = Entry('sendfile64', [Param('$rr0', 'int out_fd'), Param('$rr1', 'int in_fd'), Param('$rr2', 'loff_t *offset'), Param('$rr3', 'size_t count')])
-syscall_table[0x0000f0] = Entry('futex', [Param('$rr0', 'u32 *uaddr'), Param('$rr1', 'int op'), Param('$rr2', 'u32 val'), Param('$rr3', 'struct timespec *utime'), Param('$rr4', 'u32 *uaddr2'), Param('$rr5', 'u32 val3')])
-syscall_table[0x0000f1] = Entry('sched_setaffinity', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned int len'), Param('$rr2', 'unsigned long *user_mask_ptr')])
-syscall_table[0x0000f2] = Entry('sched_getaffinity', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned int len'), Param('$rr2', 'unsigned long *user_mask_ptr')])
-syscall_table[0x0000f3] = Entry('io_setup', [Param('$rr0', 'unsigned nr_events'), Param('$rr1', 'aio_context_t *ctxp')])
-syscall_table[0x0000f4] = Entry('io_destroy', [Param('$rr0', 'aio_context_t ctx')])
-syscall_table[0x0000f5] = Entry('io_getevents', [Param('$rr0', 'aio_context_t ctx_id'), Param('$rr1', 'long min_nr'), Param('$rr2', 'long nr'), Param('$rr3', 'struct io_event *events'), Param('$rr4', 'struct timespec *timeout')])
-syscall_table[0x0000f6] = Entry('io_submit', [Param('$rr0', 'aio_context_t ctx_id'), Param('$rr1', 'long nr'), Param('$rr2', 'struct iocb * *iocbpp')])
-syscall_table[0x0000f7] = Entry('io_cancel', [Param('$rr0', 'aio_context_t ctx_id'), Param('$rr1', 'struct iocb *iocb'), Param('$rr2', 'struct io_event *result')])
-syscall_table[0x0000f8] = Entry('exit_group', [Param('$rr0', 'int error_code')])
-syscall_table[0x0000f9] = Entry('lookup_dcookie', [Param('$rr0', 'char *buf size_t len')])
-syscall_table[0x0000fa] = Entry('epoll_create', [Param('$rr0', 'int size')])
-syscall_table[0x0000fb] = Entry('epoll_ctl', [Param('$rr0', 'int epfd'), Param('$rr1', 'int op'), Param('$rr2', 'int fd'), Param('$rr3', 'struct epoll_event *event')])
-syscall_table[0x0000fc] = Entry('epoll_wait', [Param('$rr0', 'int epfd'), Param('$rr1', 'struct epoll_event *events'), Param('$rr2', 'int maxevents'), Param('$rr3', 'int timeout')])
-syscall_table[0x0000fd] = Entry('remap_file_pages', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'unsigned long size'), Param('$rr2', 'unsigned long prot'), Param('$rr3', 'unsigned long pgoff'), Param('$rr4', 'unsigned long flags')])
-syscall_table[0x000100] = Entry('set_tid_address', [Param('$rr0', 'int *tidptr')])
-syscall_table[0x000101] = Entry('timer_create', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct sigevent *timer_event_spec'), Param('$rr2', 'timer_t *created_timer_id')])
-syscall_table[0x000102] = Entry('timer_settime', [Param('$rr0', 'timer_t timer_id'), Param('$rr1', 'int flags'), Param('$rr2', 'const struct itimerspec *new_setting'), Param('$rr3', 'struct itimerspec *old_setting')])
-syscall_table[0x000103] = Entry('timer_gettime', [Param('$rr0', 'timer_t timer_id'), Param('$rr1', 'struct itimerspec *setting')])
-syscall_table[0x000104] = Entry('timer_getoverrun', [Param('$rr0', 'timer_t timer_id')])
-syscall_table[0x000105] = Entry('timer_delete', [Param('$rr0', 'timer_t timer_id')])
-syscall_table[0x000106] = Entry('clock_settime', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'const struct timespec *tp')])
-syscall_table[0x000107] = Entry('clock_gettime', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct timespec *tp')])
-syscall_table[0x000108] = Entry('clock_getres', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct timespec *tp')])
-syscall_table[0x000109] = Entry('clock_nanosleep', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'int flags'), Param('$rr2', 'const struct timespec *rqtp'), Param('$rr3', 'struct timespec *rmtp')])
-syscall_table[0x00010a] = Entry('statfs64', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'size_t sz'), Param('$rr2', 'struct statfs64 *buf')])
-syscall_table[0x00010b] = Entry('fstatfs64', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'size_t sz'), Param('$rr2', 'struct statfs64 *buf')])
-syscall_table[0x00010c] = Entry('tgkill', [Param('$rr0', 'pid_t tgid'), Param('$rr1', 'pid_t pid'), Param('$rr2', 'int sig')])
-syscall_table[0x00010d] = Entry('utimes', [Param('$rr0', 'char *filename'), Param('$rr1', 'struct timeval *utimes')])
-syscall_table[0x00010e] = Entry('arm_fadvise64_64', [Param('$rr0', 'int fd'), Param('$rr1', 'int advice'), Param('$rr2', 'loff_t offset'), Param('$rr3', 'loff_t len')])
-syscall_table[0x000110] = Entry('pciconfig_read', [Param('$rr0', 'unsigned long bus'), Param('$rr1', 'unsigned long dfn'), Param('$rr2', 'unsigned long off'), Param('$rr3', 'unsigned long len'), Param('$rr4', 'void *buf')])
-syscall_table[0x000111] = Entry('pciconfig_write', [Param('$rr0', 'unsigned long bus'), Param('$rr1', 'unsigned long dfn'), Param('$rr2', 'unsigned long off'), Param('$rr3', 'unsigned long len'), Param('$rr4', 'void *buf')])
-syscall_table[0x000112] = Entry('mq_open', [Param('$rr0', 'const char *u_name'), Param('$rr1', 'int oflag'), Param('$rr2', 'umode_t mode'), Param('$rr3', 'struct mq_attr *u_attr')])
-syscall_table[0x000113] = Entry('mq_unlink', [Param('$rr0', 'const char *u_name')])
-syscall_table[0x000114] = Entry('mq_timedsend', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'const char *u_msg_ptr'), Param('$rr2', 'size_t msg_len'), Param('$rr3', 'unsigned int msg_prio'), Param('$rr4', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x000115] = Entry('mq_timedreceive', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'char *u_msg_ptr'), Param('$rr2', 'size_t msg_len'), Param('$rr3', 'unsigned int *u_msg_prio'), Param('$rr4', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x000116] = Entry('mq_notify', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'const struct sigevent *u_notification')])
-syscall_table[0x000117] = Entry('mq_getsetattr', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'const struct mq_attr *u_mqstat'), Param('$rr2', 'struct mq_attr *u_omqstat')])
-syscall_table[0x000118] = Entry('waitid', [Param('$rr0', 'int which'), Param('$rr1', 'pid_t upid'), Param('$rr2', 'struct siginfo *infop'), Param('$rr3', 'int options'), Param('$rr4', 'struct rusage *ru')])
-syscall_table[0x000119] = Entry('socket', [Param('$rr0', 'int family'), Param('$rr1', 'int type'), Param('$rr2', 'int protocol')])
-syscall_table[0x00011a] = Entry('bind', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *umyaddr'), Param('$rr2', 'int addrlen')])
-syscall_table[0x00011b] = Entry('connect', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *uservaddr'), Param('$rr2', 'int addrlen')])
-syscall_table[0x00011c] = Entry('listen', [Param('$rr0', 'int fd'), Param('$rr1', 'int backlog')])
-syscall_table[0x00011d] = Entry('accept', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *upeer_sockaddr'), Param('$rr2', 'int *upeer_addrlen')])
-syscall_table[0x00011e] = Entry('getsockname', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *usockaddr'), Param('$rr2', 'int *usockaddr_len')])
-syscall_table[0x00011f] = Entry('getpeername', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *usockaddr'), Param('$rr2', 'int *usockaddr_len')])
-syscall_table[0x000120] = Entry('socketpair', [Param('$rr0', 'int family'), Param('$rr1', 'int type'), Param('$rr2', 'int protocol'), Param('$rr3', 'int *usockvec')])
-syscall_table[0x000121] = Entry('send', [Param('$rr0', 'int fd'), Param('$rr1', 'void *buff'), Param('$rr2', 'size_t len'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x000122] = Entry('sendto', [Param('$rr0', 'int fd'), Param('$rr1', 'void *buff'), Param('$rr2', 'size_t len'), Param('$rr3', 'unsigned int flags'), Param('$rr4', 'struct sockaddr *addr'), Param('$rr5', 'int addr_len')])
-syscall_table[0x000123] = Entry('recv', [Param('$rr0', 'int fd'), Param('$rr1', 'void *ubuf'), Param('$rr2', 'size_t size'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x000124] = Entry('recvfrom', [Param('$rr0', 'int fd'), Param('$rr1', 'void *ubuf'), Param('$rr2', 'size_t size'), Param('$rr3', 'unsigned int flags'), Param('$rr4', 'struct sockaddr *addr'), Param('$rr5', 'int *addr_len')])
-syscall_table[0x000125] = Entry('shutdown', [Param('$rr0', 'int fd'), Param('$rr1', 'int how')])
-syscall_table[0x000126] = Entry('setsockopt', [Param('$rr0', 'int fd'), Param('$rr1', 'int level'), Param('$rr2', 'int optname'), Param('$rr3', 'char *optval'), Param('$rr4', 'int optlen')])
-syscall_table[0x000127] = Entry('getsockopt', [Param('$rr0', 'int fd'), Param('$rr1', 'int level'), Param('$rr2', 'int optname'), Param('$rr3', 'char *optval'), Param('$rr4', 'int *optlen')])
-syscall_table[0x000128] = Entry('sendmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct msghdr *msg'), Param('$rr2', 'unsigned int flags')])
-syscall_table[0x000129] = Entry('recvmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct msghdr *msg'), Param('$rr2', 'unsigned int flags')])
-syscall_table[0x00012a] = Entry('semop', [Param('$rr0', 'int semid'), Param('$rr1', 'struct sembuf *tsops'), Param('$rr2', 'unsigned nsops')])
-syscall_table[0x00012b] = Entry('semget', [Param('$rr0', 'key_t key'), Param('$rr1', 'int nsems'), Param('$rr2', 'int semflg')])
-syscall_table[0x00012c] = Entry('semctl', [Param('$rr0', 'int semnum int cmd'), Param('$rr1', 'union semun arg')])
-syscall_table[0x00012d] = Entry('msgsnd', [Param('$rr0', 'int msqid'), Param('$rr1', 'struct msgbuf *msgp'), Param('$rr2', 'size_t msgsz'), Param('$rr3', 'int msgflg')])
-syscall_table[0x00012e] = Entry('msgrcv', [Param('$rr0', 'int msqid'), Param('$rr1', 'struct msgbuf *msgp'), Param('$rr2', 'size_t msgsz'), Param('$rr3', 'long msgtyp'), Param('$rr4', 'int msgflg')])
-syscall_table[0x00012f] = Entry('msgget', [Param('$rr0', 'key_t key'), Param('$rr1', 'int msgflg')])
-syscall_table[0x000130] = Entry('msgctl', [Param('$rr0', 'int msqid'), Param('$rr1', 'int cmd'), Param('$rr2', 'struct msqid_ds *buf')])
-syscall_table[0x000131] = Entry('shmat', [Param('$rr0', 'int shmid'), Param('$rr1', 'char *shmaddr'), Param('$rr2', 'int shmflg')])
-syscall_table[0x000132] = Entry('shmdt', [Param('$rr0', 'char *shmaddr')])
-syscall_table[0x000133] = Entry('shmget', [Param('$rr0', 'key_t key'), Param('$rr1', 'size_t size'), Param('$rr2', 'int shmflg')])
-syscall_table[0x000134] = Entry('shmctl', [Param('$rr0', 'int shmid'), Param('$rr1', 'int cmd'), Param('$rr2', 'struct shmid_ds *buf')])
-syscall_table[0x000135] = Entry('add_key', [Param('$rr0', 'const char *_type'), Param('$rr1', 'const char *_description'), Param('$rr2', 'const void *_payload'), Param('$rr3', 'size_t plen'), Param('$rr4', 'key_serial_t ringid')])
-syscall_table[0x000136] = Entry('request_key', [Param('$rr0', 'const char *_type'), Param('$rr1', 'const char *_description'), Param('$rr2', 'const char *_callout_info'), Param('$rr3', 'key_serial_t destringid')])
-syscall_table[0x000137] = Entry('keyctl', [Param('$rr0', 'int option'), Param('$rr1', 'unsigned long arg2'), Param('$rr2', 'unsigned long arg3'), Param('$rr3', 'unsigned long arg4'), Param('$rr4', 'unsigned long arg5')])
-syscall_table[0x000138] = Entry('semtimedop', [Param('$rr0', 'int semid'), Param('$rr1', 'struct sembuf *tsops'), Param('$rr2', 'unsigned nsops'), Param('$rr3', 'const struct timespec *timeout')])
-syscall_table[0x00013a] = Entry('ioprio_set', [Param('$rr0', 'int which'), Param('$rr1', 'int who'), Param('$rr2', 'int ioprio')])
-syscall_table[0x00013b] = Entry('ioprio_get', [Param('$rr0', 'int which'), Param('$rr1', 'int who')])
-syscall_table[0x00013c] = Entry('inotify_init', [])
-syscall_table[0x00013d] = Entry('inotify_add_watch', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'u32 mask')])
-syscall_table[0x00013e] = Entry('inotify_rm_watch', [Param('$rr0', 'int fd'), Param('$rr1', '__s32 wd')])
-syscall_table[0x00013f] = Entry('mbind', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'unsigned long len'), Param('$rr2', 'unsigned long mode'), Param('$rr3', 'unsigned long *nmask'), Param('$rr4', 'unsigned long maxnode'), Param('$rr5', 'unsigned flags')])
-syscall_table[0x000140] = Entry('get_mempolicy', [Param('$rr0', 'int *policy'), Param('$rr1', 'unsigned long *nmask'), Param('$rr2', 'unsigned long maxnode'), Param('$rr3', 'unsigned long addr'), Param('$rr4', 'unsigned long flags')])
-syscall_table[0x000141] = Entry('set_mempolicy', [Param('$rr0', 'int mode'), Param('$rr1', 'unsigned long *nmask'), Param('$rr2', 'unsigned long maxnode')])
-syscall_table[0x000142] = Entry('openat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'int flags'), Param('$rr3', 'umode_t mode')])
-syscall_table[0x000143] = Entry('mkdirat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'umode_t mode')])
-syscall_table[0x000144] = Entry('mknodat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'umode_t mode'), Param('$rr3', 'unsigned dev')])
-syscall_table[0x000145] = Entry('fchownat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'uid_t user'), Param('$rr3', 'gid_t group'), Param('$rr4', 'int flag')])
-syscall_table[0x000146] = Entry('futimesat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'struct timeval *utimes')])
-syscall_table[0x000147] = Entry('fstatat64', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'struct stat64 *statbuf'), Param('$rr3', 'int flag')])
-syscall_table[0x000148] = Entry('unlinkat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'int flag')])
-syscall_table[0x000149] = Entry('renameat', [Param('$rr0', 'int olddfd'), Param('$rr1', 'const char *oldname'), Param('$rr2', 'int newdfd'), Param('$rr3', 'const char *newname')])
-syscall_table[0x00014a] = Entry('linkat', [Param('$rr0', 'int olddfd'), Param('$rr1', 'const char *oldname'), Param('$rr2', 'int newdfd'), Param('$rr3', 'const char *newname'), Param('$rr4', 'int flags')])
-syscall_table[0x00014b] = Entry('symlinkat', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'int newdfd'), Param('$rr2', 'const char *newname')])
-syscall_table[0x00014c] = Entry('readlinkat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'char *buf'), Param('$rr3', 'int bufsiz')])
-syscall_table[0x00014d] = Entry('fchmodat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'umode_t mode')])
-syscall_table[0x00014e] = Entry('faccessat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'int mode')])
-syscall_table[0x00014f] = Entry('pselect6', [Param('$rr0', 'int n'), Param('$rr1', 'fd_set *inp'), Param('$rr2', 'fd_set *outp'), Param('$rr3', 'fd_set *exp'), Param('$rr4', 'struct timespec *tsp'), Param('$rr5', 'void *sig')])
-syscall_table[0x000150] = Entry('ppoll', [Param('$rr0', 'struct pollfd *ufds'), Param('$rr1', 'unsigned int nfds'), Param('$rr2', 'struct timespec *tsp'), Param('$rr3', 'const sigset_t *sigmask'), Param('$rr4', 'size_t sigsetsize')])
-syscall_table[0x000151] = Entry('unshare', [Param('$rr0', 'unsigned long unshare_flags')])
-syscall_table[0x000152] = Entry('set_robust_list', [Param('$rr0', 'struct robust_list_head *head'), Param('$rr1', 'size_t len')])
-syscall_table[0x000153] = Entry('get_robust_list', [Param('$rr0', 'int pid'), Param('$rr1', 'struct robust_list_head * *head_ptr'), Param('$rr2', 'size_t *len_ptr')])
-syscall_table[0x000154] = Entry('splice', [Param('$rr0', 'int fd_in'), Param('$rr1', 'loff_t *off_in'), Param('$rr2', 'int fd_out'), Param('$rr3', 'loff_t *off_out'), Param('$rr4', 'size_t len'), Param('$rr5', 'unsigned int flags')])
-syscall_table[0x000155] = Entry('sync_file_range2', [Param('$rr0', 'unsigned int flags loff_t offset'), Param('$rr1', 'loff_t nbytes')])
-syscall_table[0x000156] = Entry('tee', [Param('$rr0', 'int fdin'), Param('$rr1', 'int fdout'), Param('$rr2', 'size_t len'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x000157] = Entry('vmsplice', [Param('$rr0', 'int fd'), Param('$rr1', 'const struct iovec *iov'), Param('$rr2', 'unsigned long nr_segs'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x000158] = Entry('move_pages', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned long nr_pages'), Param('$rr2', 'const void * *pages'), Param('$rr3', 'const int *nodes'), Param('$rr4', 'int *status'), Param('$rr5', 'int flags')])
-syscall_table[0x000159] = Entry('getcpu', [Param('$rr0', 'unsigned *cpup'), Param('$rr1', 'unsigned *nodep'), Param('$rr2', 'struct getcpu_cache *unused')])
-syscall_table[0x00015a] = Entry('epoll_pwait', [Param('$rr0', 'int epfd'), Param('$rr1', 'struct epoll_event *events'), Param('$rr2', 'int maxevents'), Param('$rr3', 'int timeout'), Param('$rr4', 'const sigset_t *sigmask'), Param('$rr5', 'size_t sigsetsize')])
-syscall_table[0x00015b] = Entry('kexec_load', [Param('$rr0', 'unsigned long entry'), Param('$rr1', 'unsigned long nr_segments'), Param('$rr2', 'struct kexec_segment *segments'), Param('$rr3', 'unsigned long flags')])
-syscall_table[0x00015c] = Entry('utimensat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'struct timespec *utimes'), Param('$rr3', 'int flags')])
-syscall_table[0x00015d] = Entry('signalfd', [Param('$rr0', 'int ufd'), Param('$rr1', 'sigset_t *user_mask'), Param('$rr2', 'size_t sizemask')])
-syscall_table[0x00015e] = Entry('timerfd_create', [Param('$rr0', 'int clockid'), Param('$rr1', 'int flags')])
-syscall_table[0x00015f] = Entry('eventfd', [Param('$rr0', 'unsigned int count')])
-syscall_table[0x000160] = Entry('fallocate', [Param('$rr0', 'int mode loff_t offset'), Param('$rr1', 'loff_t len')])
-syscall_table[0x000161] = Entry('timerfd_settime', [Param('$rr0', 'int ufd'), Param('$rr1', 'int flags'), Param('$rr2', 'const struct itimerspec *utmr'), Param('$rr3', 'struct itimerspec *otmr')])
-syscall_table[0x000162] = Entry('timerfd_gettime', [Param('$rr0', 'int ufd'), Param('$rr1', 'struct itimerspec *otmr')])
-syscall_table[0x000163] = Entry('signalfd4', [Param('$rr0', 'int ufd'), Param('$rr1', 'sigset_t *user_mask'), Param('$rr2', 'size_t sizemask'), Param('$rr3', 'int flags')])
-syscall_table[0x000164] = Entry('eventfd2', [Param('$rr0', 'unsigned int count'), Param('$rr1', 'int flags')])
-syscall_table[0x000165] = Entry('epoll_create1', [Param('$rr0', 'int flags')])
-syscall_table[0x000166] = Entry('dup3', [Param('$rr0', 'unsigned int oldfd'), Param('$rr1', 'unsigned int newfd'), Param('$rr2', 'int flags')])
-syscall_table[0x000167] = Entry('pipe2', [Param('$rr0', 'int *fildes'), Param('$rr1', 'int flags')])
-syscall_table[0x000168] = Entry('inotify_init1', [Param('$rr0', 'int flags')])
-syscall_table[0x000169] = Entry('preadv', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen'), Param('$rr3', 'unsigned long pos_l'), Param('$rr4', 'unsigned long pos_h')])
-syscall_table[0x00016a] = Entry('pwritev', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen'), Param('$rr3', 'unsigned long pos_l'), Param('$rr4', 'unsigned long pos_h')])
-syscall_table[0x00016b] = Entry('rt_tgsigqueueinfo', [Param('$rr0', 'pid_t tgid'), Param('$rr1', 'pid_t pid'), Param('$rr2', 'int sig'), Param('$rr3', 'siginfo_t *uinfo')])
-syscall_table[0x00016c] = Entry('perf_event_open', [Param('$rr0', 'struct perf_event_attr *attr_uptr'), Param('$rr1', 'pid_t pid'), Param('$rr2', 'int cpu'), Param('$rr3', 'int group_fd'), Param('$rr4', 'unsigned long flags')])
-syscall_table[0x00016d] = Entry('recvmmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct mmsghdr *mmsg'), Param('$rr2', 'unsigned int vlen'), Param('$rr3', 'unsigned int flags'), Param('$rr4', 'struct timespec *timeout')])
-syscall_table[0x00016e] = Entry('accept4', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *upeer_sockaddr'), Param('$rr2', 'int *upeer_addrlen'), Param('$rr3', 'int flags')])
-syscall_table[0x00016f] = Entry('fanotify_init', [Param('$rr0', 'unsigned int flags'), Param('$rr1', 'unsigned int event_f_flags')])
-syscall_table[0x000170] = Entry('fanotify_mark', [Param('$rr0', 'unsigned int flags __u64 mask'), Param('$rr1', 'int dfd const char *pathname')])
-syscall_table[0x000171] = Entry('prlimit64', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned int resource'), Param('$rr2', 'const struct rlimit64 *new_rlim'), Param('$rr3', 'struct rlimit64 *old_rlim')])
-syscall_table[0x000172] = Entry('name_to_handle_at', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *name'), Param('$rr2', 'struct file_handle *handle'), Param('$rr3', 'int *mnt_id'), Param('$rr4', 'int flag')])
-syscall_table[0x000173] = Entry('open_by_handle_at', [Param('$rr0', 'int mountdirfd'), Param('$rr1', 'struct file_handle *handle'), Param('$rr2', 'int flags')])
-syscall_table[0x000174] = Entry('clock_adjtime', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct timex *utx')])
-syscall_table[0x000175] = Entry('syncfs', [Param('$rr0', 'int fd')])
-syscall_table[0x000176] = Entry('sendmmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct mmsghdr *mmsg'), Param('$rr2', 'unsigned int vlen'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x000177] = Entry('setns', [Param('$rr0', 'int fd'), Param('$rr1', 'int nstype')])
-syscall_table[0x000178] = Entry('process_vm_readv', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'const struct iovec *lvec'), Param('$rr2', 'unsigned long liovcnt'), Param('$rr3', 'const struct iovec *rvec'), Param('$rr4', 'unsigned long riovcnt'), Param('$rr5', 'unsigned long flags')])
-syscall_table[0x000179] = Entry('process_vm_writev', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'const struct iovec *lvec'), Param('$rr2', 'unsigned long liovcnt'), Param('$rr3', 'const struct iovec *rvec'), Param('$rr4', 'unsigned long riovcnt'), Param('$rr5', 'unsigned long flags')])
-
-syscall_table[0x900000] = Entry('restart_syscall', [])
-syscall_table[0x900001] = Entry('exit', [Param('$rr0', 'int error_code')])
-syscall_table[0x900002] = Entry('fork', [])
-syscall_table[0x900003] = Entry('read', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'char *buf'), Param('$rr2', 'size_t count')])
-syscall_table[0x900004] = Entry('write', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'const char *buf'), Param('$rr2', 'size_t count')])
-syscall_table[0x900005] = Entry('open', [Param('$rr0', 'const char *filename'), Param('$rr1', 'int flags'), Param('$rr2', 'umode_t mode')])
-syscall_table[0x900006] = Entry('close', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x900008] = Entry('creat', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x900009] = Entry('link', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'const char *newname')])
-syscall_table[0x90000a] = Entry('unlink', [Param('$rr0', 'const char *pathname')])
-syscall_table[0x90000b] = Entry('execve', [Param('$rr0', 'const char *filenamei'), Param('$rr1', 'const char *const *argv'), Param('$rr2', 'const char *const *envp')])
-syscall_table[0x90000c] = Entry('chdir', [Param('$rr0', 'const char *filename')])
-syscall_table[0x90000d] = Entry('time', [Param('$rr0', 'time_t *tloc')])
-syscall_table[0x90000e] = Entry('mknod', [Param('$rr0', 'const char *filename'), Param('$rr1', 'umode_t mode'), Param('$rr2', 'unsigned dev')])
-syscall_table[0x90000f] = Entry('chmod', [Param('$rr0', 'const char *filename'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x900010] = Entry('lchown', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x900013] = Entry('lseek', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'off_t offset'), Param('$rr2', 'unsigned int origin')])
-syscall_table[0x900014] = Entry('getpid', [])
-syscall_table[0x900015] = Entry('mount', [Param('$rr0', 'char *dev_name'), Param('$rr1', 'char *dir_name'), Param('$rr2', 'char *type'), Param('$rr3', 'unsigned long flags'), Param('$rr4', 'void *data')])
-syscall_table[0x900016] = Entry('umount', [Param('$rr0', 'char *name'), Param('$rr1', 'int flags')])
-syscall_table[0x900017] = Entry('setuid', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x900018] = Entry('getuid', [])
-syscall_table[0x900019] = Entry('stime', [Param('$rr0', 'time_t *tptr')])
-syscall_table[0x90001a] = Entry('ptrace', [Param('$rr0', 'long request'), Param('$rr1', 'long pid'), Param('$rr2', 'unsigned long addr'), Param('$rr3', 'unsigned long data')])
-syscall_table[0x90001b] = Entry('alarm', [Param('$rr0', 'unsigned int seconds')])
-syscall_table[0x90001d] = Entry('pause', [])
-syscall_table[0x90001e] = Entry('utime', [Param('$rr0', 'char *filename'), Param('$rr1', 'struct utimbuf *times')])
-syscall_table[0x900021] = Entry('access', [Param('$rr0', 'const char *filename'), Param('$rr1', 'int mode')])
-syscall_table[0x900022] = Entry('nice', [Param('$rr0', 'int increment')])
-syscall_table[0x900024] = Entry('sync', [])
-syscall_table[0x900025] = Entry('kill', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int sig')])
-syscall_table[0x900026] = Entry('rename', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'const char *newname')])
-syscall_table[0x900027] = Entry('mkdir', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x900028] = Entry('rmdir', [Param('$rr0', 'const char *pathname')])
-syscall_table[0x900029] = Entry('dup', [Param('$rr0', 'unsigned int fildes')])
-syscall_table[0x90002a] = Entry('pipe', [Param('$rr0', 'int *fildes')])
-syscall_table[0x90002b] = Entry('times', [Param('$rr0', 'struct tms *tbuf')])
-syscall_table[0x90002d] = Entry('brk', [Param('$rr0', 'unsigned long brk')])
-syscall_table[0x90002e] = Entry('setgid', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x90002f] = Entry('getgid', [])
-syscall_table[0x900031] = Entry('geteuid', [])
-syscall_table[0x900032] = Entry('getegid', [])
-syscall_table[0x900033] = Entry('acct', [Param('$rr0', 'const char *name')])
-syscall_table[0x900034] = Entry('umount2', [Param('$rr0', 'char *name'), Param('$rr1', 'int flags')])
-syscall_table[0x900036] = Entry('ioctl', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd'), Param('$rr2', 'unsigned long arg')])
-syscall_table[0x900037] = Entry('fcntl', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd'), Param('$rr2', 'unsigned long arg')])
-syscall_table[0x900039] = Entry('setpgid', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'pid_t pgid')])
-syscall_table[0x90003c] = Entry('umask', [Param('$rr0', 'int mask')])
-syscall_table[0x90003d] = Entry('chroot', [Param('$rr0', 'const char *filename')])
-syscall_table[0x90003e] = Entry('ustat', [Param('$rr0', 'unsigned dev'), Param('$rr1', 'struct ustat *ubuf')])
-syscall_table[0x90003f] = Entry('dup2', [Param('$rr0', 'unsigned int oldfd'), Param('$rr1', 'unsigned int newfd')])
-syscall_table[0x900040] = Entry('getppid', [])
-syscall_table[0x900041] = Entry('getpgrp', [])
-syscall_table[0x900042] = Entry('setsid', [])
-syscall_table[0x900043] = Entry('sigaction', [Param('$rr0', 'int sig'), Param('$rr1', 'const struct old_sigaction *act'), Param('$rr2', 'struct old_sigaction *oact')])
-syscall_table[0x900046] = Entry('setreuid', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid')])
-syscall_table[0x900047] = Entry('setregid', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid')])
-syscall_table[0x900048] = Entry('sigsuspend', [Param('$rr0', 'int restart'), Param('$rr1', 'unsigned long oldmask'), Param('$rr2', 'old_sigset_t mask')])
-syscall_table[0x900049] = Entry('sigpending', [Param('$rr0', 'old_sigset_t *set')])
-syscall_table[0x90004a] = Entry('sethostname', [Param('$rr0', 'char *name'), Param('$rr1', 'int len')])
-syscall_table[0x90004b] = Entry('setrlimit', [Param('$rr0', 'unsigned int resource'), Param('$rr1', 'struct rlimit *rlim')])
-syscall_table[0x90004c] = Entry('getrlimit', [Param('$rr0', 'unsigned int resource'), Param('$rr1', 'struct rlimit *rlim')])
-syscall_table[0x90004d] = Entry('getrusage', [Param('$rr0', 'int who'), Param('$rr1', 'struct rusage *ru')])
-syscall_table[0x90004e] = Entry('gettimeofday', [Param('$rr0', 'struct timeval *tv'), Param('$rr1', 'struct timezone *tz')])
-syscall_table[0x90004f] = Entry('settimeofday', [Param('$rr0', 'struct timeval *tv'), Param('$rr1', 'struct timezone *tz')])
-syscall_table[0x900050] = Entry('getgroups', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x900051] = Entry('setgroups', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x900052] = Entry('select', [Param('$rr0', 'int n'), Param('$rr1', 'fd_set *inp'), Param('$rr2', 'fd_set *outp'), Param('$rr3', 'fd_set *exp'), Param('$rr4', 'struct timeval *tvp')])
-syscall_table[0x900053] = Entry('symlink', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'const char *newname')])
-syscall_table[0x900055] = Entry('readlink', [Param('$rr0', 'const char *path'), Param('$rr1', 'char *buf'), Param('$rr2', 'int bufsiz')])
-syscall_table[0x900056] = Entry('uselib', [Param('$rr0', 'const char *library')])
-syscall_table[0x900057] = Entry('swapon', [Param('$rr0', 'const char *specialfile'), Param('$rr1', 'int swap_flags')])
-syscall_table[0x900058] = Entry('reboot', [Param('$rr0', 'int magic1'), Param('$rr1', 'int magic2'), Param('$rr2', 'unsigned int cmd'), Param('$rr3', 'void *arg')])
-syscall_table[0x900059] = Entry('readdir', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct old_linux_dirent *dirent'), Param('$rr2', 'unsigned int count')])
-syscall_table[0x90005a] = Entry('mmap', [Param('$rr0', 'struct mmap_arg_struct *arg')])
-syscall_table[0x90005b] = Entry('munmap', [Param('$rr0', 'unsigned long addr'), Param('$rr1', 'size_t len')])
-syscall_table[0x90005c] = Entry('truncate', [Param('$rr0', 'const char *path'), Param('$rr1', 'long length')])
-syscall_table[0x90005d] = Entry('ftruncate', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned long length')])
-syscall_table[0x90005e] = Entry('fchmod', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'umode_t mode')])
-syscall_table[0x90005f] = Entry('fchown', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x900060] = Entry('getpriority', [Param('$rr0', 'int which'), Param('$rr1', 'int who')])
-syscall_table[0x900061] = Entry('setpriority', [Param('$rr0', 'int which'), Param('$rr1', 'int who'), Param('$rr2', 'int niceval')])
-syscall_table[0x900063] = Entry('statfs', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'struct statfs *buf')])
-syscall_table[0x900064] = Entry('fstatfs', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct statfs *buf')])
-syscall_table[0x900066] = Entry('socketcall', [Param('$rr0', 'int call'), Param('$rr1', 'unsigned long *args')])
-syscall_table[0x900067] = Entry('syslog', [Param('$rr0', 'int type'), Param('$rr1', 'char *buf'), Param('$rr2', 'int len')])
-syscall_table[0x900068] = Entry('setitimer', [Param('$rr0', 'int which'), Param('$rr1', 'struct itimerval *value'), Param('$rr2', 'struct itimerval *ovalue')])
-syscall_table[0x900069] = Entry('getitimer', [Param('$rr0', 'int which'), Param('$rr1', 'struct itimerval *value')])
-syscall_table[0x90006a] = Entry('stat', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x90006b] = Entry('lstat', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x90006c] = Entry('fstat', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x90006f] = Entry('vhangup', [])
-syscall_table[0x900071] = Entry('syscall', [])
-syscall_table[0x900072] = Entry('wait4', [Param('$rr0', 'pid_t upid'), Param('$rr1', 'int *stat_addr'), Param('$rr2', 'int options'), Param('$rr3', 'struct rusage *ru')])
-syscall_table[0x900073] = Entry('swapoff', [Param('$rr0', 'const char *specialfile')])
-syscall_table[0x900074] = Entry('sysinfo', [Param('$rr0', 'struct sysinfo *info')])
-syscall_table[0x900075] = Entry('ipc', [Param('$rr0', 'unsigned int call'), Param('$rr1', 'int first'), Param('$rr2', 'unsigned long second'), Param('$rr3', 'unsigned long third'), Param('$rr4', 'void *ptr'), Param('$rr5', 'long fifth')])
-syscall_table[0x900076] = Entry('fsync', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x900077] = Entry('sigreturn', [])
-syscall_table[0x900078] = Entry('clone', [Param('$rr0', 'unsigned long clone_flags'), Param('$rr1', 'unsigned long newsp'), Param('$rr2', 'int *parent_tidptr'), Param('$rr3', 'int tls_val'), Param('$rr4', 'int *child_tidptr')])
-syscall_table[0x900079] = Entry('setdomainname', [Param('$rr0', 'char *name'), Param('$rr1', 'int len')])
-syscall_table[0x90007a] = Entry('uname', [Param('$rr0', 'struct old_utsname *name')])
-syscall_table[0x90007c] = Entry('adjtimex', [Param('$rr0', 'struct timex *txc_p')])
-syscall_table[0x90007d] = Entry('mprotect', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len'), Param('$rr2', 'unsigned long prot')])
-syscall_table[0x90007e] = Entry('sigprocmask', [Param('$rr0', 'int how'), Param('$rr1', 'old_sigset_t *nset'), Param('$rr2', 'old_sigset_t *oset')])
-syscall_table[0x900080] = Entry('init_module', [Param('$rr0', 'void *umod'), Param('$rr1', 'unsigned long len'), Param('$rr2', 'const char *uargs')])
-syscall_table[0x900081] = Entry('delete_module', [Param('$rr0', 'const char *name_user'), Param('$rr1', 'unsigned int flags')])
-syscall_table[0x900083] = Entry('quotactl', [Param('$rr0', 'unsigned int cmd'), Param('$rr1', 'const char *special'), Param('$rr2', 'qid_t id'), Param('$rr3', 'void *addr')])
-syscall_table[0x900084] = Entry('getpgid', [Param('$rr0', 'pid_t pid')])
-syscall_table[0x900085] = Entry('fchdir', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x900086] = Entry('bdflush', [Param('$rr0', 'int func'), Param('$rr1', 'long data')])
-syscall_table[0x900087] = Entry('sysfs', [Param('$rr0', 'int option'), Param('$rr1', 'unsigned long arg1'), Param('$rr2', 'unsigned long arg2')])
-syscall_table[0x900088] = Entry('personality', [Param('$rr0', 'unsigned int personality')])
-syscall_table[0x90008a] = Entry('setfsuid', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x90008b] = Entry('setfsgid', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x90008c] = Entry('_llseek', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned long offset_high'), Param('$rr2', 'unsigned long offset_low'), Param('$rr3', 'loff_t *result'), Param('$rr4', 'unsigned int origin')])
-syscall_table[0x90008d] = Entry('getdents', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct linux_dirent *dirent'), Param('$rr2', 'unsigned int count')])
-syscall_table[0x90008e] = Entry('_newselect', [Param('$rr0', 'int n'), Param('$rr1', 'fd_set *inp'), Param('$rr2', 'fd_set *outp'), Param('$rr3', 'fd_set *exp'), Param('$rr4', 'struct timeval *tvp')])
-syscall_table[0x90008f] = Entry('flock', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd')])
-syscall_table[0x900090] = Entry('msync', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len'), Param('$rr2', 'int flags')])
-syscall_table[0x900091] = Entry('readv', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen')])
-syscall_table[0x900092] = Entry('writev', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen')])
-syscall_table[0x900093] = Entry('getsid', [Param('$rr0', 'pid_t pid')])
-syscall_table[0x900094] = Entry('fdatasync', [Param('$rr0', 'unsigned int fd')])
-syscall_table[0x900095] = Entry('_sysctl', [Param('$rr0', 'struct __sysctl_args *args')])
-syscall_table[0x900096] = Entry('mlock', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len')])
-syscall_table[0x900097] = Entry('munlock', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len')])
-syscall_table[0x900098] = Entry('mlockall', [Param('$rr0', 'int flags')])
-syscall_table[0x900099] = Entry('munlockall', [])
-syscall_table[0x90009a] = Entry('sched_setparam', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'struct sched_param *param')])
-syscall_table[0x90009b] = Entry('sched_getparam', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'struct sched_param *param')])
-syscall_table[0x90009c] = Entry('sched_setscheduler', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int policy'), Param('$rr2', 'struct sched_param *param')])
-syscall_table[0x90009d] = Entry('sched_getscheduler', [Param('$rr0', 'pid_t pid')])
-syscall_table[0x90009e] = Entry('sched_yield', [])
-syscall_table[0x90009f] = Entry('sched_get_priority_max', [Param('$rr0', 'int policy')])
-syscall_table[0x9000a0] = Entry('sched_get_priority_min', [Param('$rr0', 'int policy')])
-syscall_table[0x9000a1] = Entry('sched_rr_get_interval', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'struct timespec *interval')])
-syscall_table[0x9000a2] = Entry('nanosleep', [Param('$rr0', 'struct timespec *rqtp'), Param('$rr1', 'struct timespec *rmtp')])
-syscall_table[0x9000a3] = Entry('mremap', [Param('$rr0', 'unsigned long addr'), Param('$rr1', 'unsigned long old_len'), Param('$rr2', 'unsigned long new_len'), Param('$rr3', 'unsigned long flags'), Param('$rr4', 'unsigned long new_addr')])
-syscall_table[0x9000a4] = Entry('setresuid', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid'), Param('$rr2', 'uid_t suid')])
-syscall_table[0x9000a5] = Entry('getresuid', [Param('$rr0', 'uid_t *ruidp'), Param('$rr1', 'uid_t *euidp'), Param('$rr2', 'uid_t *suidp')])
-syscall_table[0x9000a8] = Entry('poll', [Param('$rr0', 'struct pollfd *ufds'), Param('$rr1', 'unsigned int nfds'), Param('$rr2', 'int timeout_msecs')])
-syscall_table[0x9000aa] = Entry('setresgid', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid'), Param('$rr2', 'gid_t sgid')])
-syscall_table[0x9000ab] = Entry('getresgid', [Param('$rr0', 'gid_t *rgidp'), Param('$rr1', 'gid_t *egidp'), Param('$rr2', 'gid_t *sgidp')])
-syscall_table[0x9000ac] = Entry('prctl', [Param('$rr0', 'int option'), Param('$rr1', 'unsigned long arg2'), Param('$rr2', 'unsigned long arg3'), Param('$rr3', 'unsigned long arg4'), Param('$rr4', 'unsigned long arg5')])
-syscall_table[0x9000ad] = Entry('rt_sigreturn', [])
-syscall_table[0x9000ae] = Entry('rt_sigaction', [Param('$rr0', 'int sig'), Param('$rr1', 'const struct sigaction *act'), Param('$rr2', 'struct sigaction *oact'), Param('$rr3', 'size_t sigsetsize')])
-syscall_table[0x9000af] = Entry('rt_sigprocmask', [Param('$rr0', 'int how'), Param('$rr1', 'sigset_t *nset'), Param('$rr2', 'sigset_t *oset'), Param('$rr3', 'size_t sigsetsize')])
-syscall_table[0x9000b0] = Entry('rt_sigpending', [Param('$rr0', 'sigset_t *set'), Param('$rr1', 'size_t sigsetsize')])
-syscall_table[0x9000b1] = Entry('rt_sigtimedwait', [Param('$rr0', 'const sigset_t *uthese'), Param('$rr1', 'siginfo_t *uinfo'), Param('$rr2', 'const struct timespec *uts'), Param('$rr3', 'size_t sigsetsize')])
-syscall_table[0x9000b2] = Entry('rt_sigqueueinfo', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int sig'), Param('$rr2', 'siginfo_t *uinfo')])
-syscall_table[0x9000b3] = Entry('rt_sigsuspend', [Param('$rr0', 'sigset_t *unewset'), Param('$rr1', 'size_t sigsetsize')])
-syscall_table[0x9000b4] = Entry('pread64', [Param('$rr0', 'char *buf size_t count'), Param('$rr1', 'loff_t pos')])
-syscall_table[0x9000b5] = Entry('pwrite64', [Param('$rr0', 'const char *buf size_t count'), Param('$rr1', 'loff_t pos')])
-syscall_table[0x9000b6] = Entry('chown', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x9000b7] = Entry('getcwd', [Param('$rr0', 'char *buf'), Param('$rr1', 'unsigned long size')])
-syscall_table[0x9000b8] = Entry('capget', [Param('$rr0', 'cap_user_header_t header'), Param('$rr1', 'cap_user_data_t dataptr')])
-syscall_table[0x9000b9] = Entry('capset', [Param('$rr0', 'cap_user_header_t header'), Param('$rr1', 'const cap_user_data_t data')])
-syscall_table[0x9000bb] = Entry('sendfile', [Param('$rr0', 'int out_fd'), Param('$rr1', 'int in_fd'), Param('$rr2', 'off_t *offset'), Param('$rr3', 'size_t count')])
-syscall_table[0x9000be] = Entry('vfork', [])
-syscall_table[0x9000bf] = Entry('ugetrlimit', [Param('$rr0', 'unsigned int resource'), Param('$rr1', 'struct rlimit *rlim')])
-syscall_table[0x9000c0] = Entry('mmap2', [Param('$rr0', 'unsigned long addr'), Param('$rr1', 'unsigned long len'), Param('$rr2', 'unsigned long prot'), Param('$rr3', 'unsigned long flags'), Param('$rr4', 'unsigned long fd'), Param('$rr5', 'unsigned long pgoff')])
-syscall_table[0x9000c1] = Entry('truncate64', [Param('$rr0', 'loff_t length')])
-syscall_table[0x9000c2] = Entry('ftruncate64', [Param('$rr0', 'loff_t length')])
-syscall_table[0x9000c3] = Entry('stat64', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct stat64 *statbuf')])
-syscall_table[0x9000c4] = Entry('lstat64', [Param('$rr0', 'const char *filename'), Param('$rr1', 'struct stat64 *statbuf')])
-syscall_table[0x9000c5] = Entry('fstat64', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'struct stat64 *statbuf')])
-syscall_table[0x9000c6] = Entry('lchown32', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x9000c7] = Entry('getuid32', [])
-syscall_table[0x9000c8] = Entry('getgid32', [])
-syscall_table[0x9000c9] = Entry('geteuid32', [])
-syscall_table[0x9000ca] = Entry('getegid32', [])
-syscall_table[0x9000cb] = Entry('setreuid32', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid')])
-syscall_table[0x9000cc] = Entry('setregid32', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid')])
-syscall_table[0x9000cd] = Entry('getgroups32', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x9000ce] = Entry('setgroups32', [Param('$rr0', 'int gidsetsize'), Param('$rr1', 'gid_t *grouplist')])
-syscall_table[0x9000cf] = Entry('fchown32', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x9000d0] = Entry('setresuid32', [Param('$rr0', 'uid_t ruid'), Param('$rr1', 'uid_t euid'), Param('$rr2', 'uid_t suid')])
-syscall_table[0x9000d1] = Entry('getresuid32', [Param('$rr0', 'uid_t *ruidp'), Param('$rr1', 'uid_t *euidp'), Param('$rr2', 'uid_t *suidp')])
-syscall_table[0x9000d2] = Entry('setresgid32', [Param('$rr0', 'gid_t rgid'), Param('$rr1', 'gid_t egid'), Param('$rr2', 'gid_t sgid')])
-syscall_table[0x9000d3] = Entry('getresgid32', [Param('$rr0', 'gid_t *rgidp'), Param('$rr1', 'gid_t *egidp'), Param('$rr2', 'gid_t *sgidp')])
-syscall_table[0x9000d4] = Entry('chown32', [Param('$rr0', 'const char *filename'), Param('$rr1', 'uid_t user'), Param('$rr2', 'gid_t group')])
-syscall_table[0x9000d5] = Entry('setuid32', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x9000d6] = Entry('setgid32', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x9000d7] = Entry('setfsuid32', [Param('$rr0', 'uid_t uid')])
-syscall_table[0x9000d8] = Entry('setfsgid32', [Param('$rr0', 'gid_t gid')])
-syscall_table[0x9000d9] = Entry('getdents64', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'struct linux_dirent64 *dirent'), Param('$rr2', 'unsigned int count')])
-syscall_table[0x9000da] = Entry('pivot_root', [Param('$rr0', 'const char *new_root'), Param('$rr1', 'const char *put_old')])
-syscall_table[0x9000db] = Entry('mincore', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len'), Param('$rr2', 'unsigned char *vec')])
-syscall_table[0x9000dc] = Entry('madvise', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'size_t len_in'), Param('$rr2', 'int behavior')])
-syscall_table[0x9000dd] = Entry('fcntl64', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'unsigned int cmd'), Param('$rr2', 'unsigned long arg')])
-syscall_table[0x9000e0] = Entry('gettid', [])
-syscall_table[0x9000e1] = Entry('readahead', [Param('$rr0', 'loff_t offset size_t count')])
-syscall_table[0x9000e2] = Entry('setxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'const void *value'), Param('$rr3', 'size_t size'), Param('$rr4', 'int flags')])
-syscall_table[0x9000e3] = Entry('lsetxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'const void *value'), Param('$rr3', 'size_t size'), Param('$rr4', 'int flags')])
-syscall_table[0x9000e4] = Entry('fsetxattr', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *name'), Param('$rr2', 'const void *value'), Param('$rr3', 'size_t size'), Param('$rr4', 'int flags')])
-syscall_table[0x9000e5] = Entry('getxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'void *value'), Param('$rr3', 'size_t size')])
-syscall_table[0x9000e6] = Entry('lgetxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name'), Param('$rr2', 'void *value'), Param('$rr3', 'size_t size')])
-syscall_table[0x9000e7] = Entry('fgetxattr', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *name'), Param('$rr2', 'void *value'), Param('$rr3', 'size_t size')])
-syscall_table[0x9000e8] = Entry('listxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'char *list'), Param('$rr2', 'size_t size')])
-syscall_table[0x9000e9] = Entry('llistxattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'char *list'), Param('$rr2', 'size_t size')])
-syscall_table[0x9000ea] = Entry('flistxattr', [Param('$rr0', 'int fd'), Param('$rr1', 'char *list'), Param('$rr2', 'size_t size')])
-syscall_table[0x9000eb] = Entry('removexattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name')])
-syscall_table[0x9000ec] = Entry('lremovexattr', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'const char *name')])
-syscall_table[0x9000ed] = Entry('fremovexattr', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *name')])
-syscall_table[0x9000ee] = Entry('tkill', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'int sig')])
-syscall_table[0x9000ef] = Entry('sendfile64', [Param('$rr0', 'int out_fd'), Param('$rr1', 'int in_fd'), Param('$rr2', 'loff_t *offset'), Param('$rr3', 'size_t count')])
-syscall_table[0x9000f0] = Entry('futex', [Param('$rr0', 'u32 *uaddr'), Param('$rr1', 'int op'), Param('$rr2', 'u32 val'), Param('$rr3', 'struct timespec *utime'), Param('$rr4', 'u32 *uaddr2'), Param('$rr5', 'u32 val3')])
-syscall_table[0x9000f1] = Entry('sched_setaffinity', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned int len'), Param('$rr2', 'unsigned long *user_mask_ptr')])
-syscall_table[0x9000f2] = Entry('sched_getaffinity', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned int len'), Param('$rr2', 'unsigned long *user_mask_ptr')])
-syscall_table[0x9000f3] = Entry('io_setup', [Param('$rr0', 'unsigned nr_events'), Param('$rr1', 'aio_context_t *ctxp')])
-syscall_table[0x9000f4] = Entry('io_destroy', [Param('$rr0', 'aio_context_t ctx')])
-syscall_table[0x9000f5] = Entry('io_getevents', [Param('$rr0', 'aio_context_t ctx_id'), Param('$rr1', 'long min_nr'), Param('$rr2', 'long nr'), Param('$rr3', 'struct io_event *events'), Param('$rr4', 'struct timespec *timeout')])
-syscall_table[0x9000f6] = Entry('io_submit', [Param('$rr0', 'aio_context_t ctx_id'), Param('$rr1', 'long nr'), Param('$rr2', 'struct iocb * *iocbpp')])
-syscall_table[0x9000f7] = Entry('io_cancel', [Param('$rr0', 'aio_context_t ctx_id'), Param('$rr1', 'struct iocb *iocb'), Param('$rr2', 'struct io_event *result')])
-syscall_table[0x9000f8] = Entry('exit_group', [Param('$rr0', 'int error_code')])
-syscall_table[0x9000f9] = Entry('lookup_dcookie', [Param('$rr0', 'char *buf size_t len')])
-syscall_table[0x9000fa] = Entry('epoll_create', [Param('$rr0', 'int size')])
-syscall_table[0x9000fb] = Entry('epoll_ctl', [Param('$rr0', 'int epfd'), Param('$rr1', 'int op'), Param('$rr2', 'int fd'), Param('$rr3', 'struct epoll_event *event')])
-syscall_table[0x9000fc] = Entry('epoll_wait', [Param('$rr0', 'int epfd'), Param('$rr1', 'struct epoll_event *events'), Param('$rr2', 'int maxevents'), Param('$rr3', 'int timeout')])
-syscall_table[0x9000fd] = Entry('remap_file_pages', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'unsigned long size'), Param('$rr2', 'unsigned long prot'), Param('$rr3', 'unsigned long pgoff'), Param('$rr4', 'unsigned long flags')])
-syscall_table[0x900100] = Entry('set_tid_address', [Param('$rr0', 'int *tidptr')])
-syscall_table[0x900101] = Entry('timer_create', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct sigevent *timer_event_spec'), Param('$rr2', 'timer_t *created_timer_id')])
-syscall_table[0x900102] = Entry('timer_settime', [Param('$rr0', 'timer_t timer_id'), Param('$rr1', 'int flags'), Param('$rr2', 'const struct itimerspec *new_setting'), Param('$rr3', 'struct itimerspec *old_setting')])
-syscall_table[0x900103] = Entry('timer_gettime', [Param('$rr0', 'timer_t timer_id'), Param('$rr1', 'struct itimerspec *setting')])
-syscall_table[0x900104] = Entry('timer_getoverrun', [Param('$rr0', 'timer_t timer_id')])
-syscall_table[0x900105] = Entry('timer_delete', [Param('$rr0', 'timer_t timer_id')])
-syscall_table[0x900106] = Entry('clock_settime', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'const struct timespec *tp')])
-syscall_table[0x900107] = Entry('clock_gettime', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct timespec *tp')])
-syscall_table[0x900108] = Entry('clock_getres', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct timespec *tp')])
-syscall_table[0x900109] = Entry('clock_nanosleep', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'int flags'), Param('$rr2', 'const struct timespec *rqtp'), Param('$rr3', 'struct timespec *rmtp')])
-syscall_table[0x90010a] = Entry('statfs64', [Param('$rr0', 'const char *pathname'), Param('$rr1', 'size_t sz'), Param('$rr2', 'struct statfs64 *buf')])
-syscall_table[0x90010b] = Entry('fstatfs64', [Param('$rr0', 'unsigned int fd'), Param('$rr1', 'size_t sz'), Param('$rr2', 'struct statfs64 *buf')])
-syscall_table[0x90010c] = Entry('tgkill', [Param('$rr0', 'pid_t tgid'), Param('$rr1', 'pid_t pid'), Param('$rr2', 'int sig')])
-syscall_table[0x90010d] = Entry('utimes', [Param('$rr0', 'char *filename'), Param('$rr1', 'struct timeval *utimes')])
-syscall_table[0x90010e] = Entry('arm_fadvise64_64', [Param('$rr0', 'int fd'), Param('$rr1', 'int advice'), Param('$rr2', 'loff_t offset'), Param('$rr3', 'loff_t len')])
-syscall_table[0x900110] = Entry('pciconfig_read', [Param('$rr0', 'unsigned long bus'), Param('$rr1', 'unsigned long dfn'), Param('$rr2', 'unsigned long off'), Param('$rr3', 'unsigned long len'), Param('$rr4', 'void *buf')])
-syscall_table[0x900111] = Entry('pciconfig_write', [Param('$rr0', 'unsigned long bus'), Param('$rr1', 'unsigned long dfn'), Param('$rr2', 'unsigned long off'), Param('$rr3', 'unsigned long len'), Param('$rr4', 'void *buf')])
-syscall_table[0x900112] = Entry('mq_open', [Param('$rr0', 'const char *u_name'), Param('$rr1', 'int oflag'), Param('$rr2', 'umode_t mode'), Param('$rr3', 'struct mq_attr *u_attr')])
-syscall_table[0x900113] = Entry('mq_unlink', [Param('$rr0', 'const char *u_name')])
-syscall_table[0x900114] = Entry('mq_timedsend', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'const char *u_msg_ptr'), Param('$rr2', 'size_t msg_len'), Param('$rr3', 'unsigned int msg_prio'), Param('$rr4', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x900115] = Entry('mq_timedreceive', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'char *u_msg_ptr'), Param('$rr2', 'size_t msg_len'), Param('$rr3', 'unsigned int *u_msg_prio'), Param('$rr4', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x900116] = Entry('mq_notify', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'const struct sigevent *u_notification')])
-syscall_table[0x900117] = Entry('mq_getsetattr', [Param('$rr0', 'mqd_t mqdes'), Param('$rr1', 'const struct mq_attr *u_mqstat'), Param('$rr2', 'struct mq_attr *u_omqstat')])
-syscall_table[0x900118] = Entry('waitid', [Param('$rr0', 'int which'), Param('$rr1', 'pid_t upid'), Param('$rr2', 'struct siginfo *infop'), Param('$rr3', 'int options'), Param('$rr4', 'struct rusage *ru')])
-syscall_table[0x900119] = Entry('socket', [Param('$rr0', 'int family'), Param('$rr1', 'int type'), Param('$rr2', 'int protocol')])
-syscall_table[0x90011a] = Entry('bind', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *umyaddr'), Param('$rr2', 'int addrlen')])
-syscall_table[0x90011b] = Entry('connect', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *uservaddr'), Param('$rr2', 'int addrlen')])
-syscall_table[0x90011c] = Entry('listen', [Param('$rr0', 'int fd'), Param('$rr1', 'int backlog')])
-syscall_table[0x90011d] = Entry('accept', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *upeer_sockaddr'), Param('$rr2', 'int *upeer_addrlen')])
-syscall_table[0x90011e] = Entry('getsockname', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *usockaddr'), Param('$rr2', 'int *usockaddr_len')])
-syscall_table[0x90011f] = Entry('getpeername', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *usockaddr'), Param('$rr2', 'int *usockaddr_len')])
-syscall_table[0x900120] = Entry('socketpair', [Param('$rr0', 'int family'), Param('$rr1', 'int type'), Param('$rr2', 'int protocol'), Param('$rr3', 'int *usockvec')])
-syscall_table[0x900121] = Entry('send', [Param('$rr0', 'int fd'), Param('$rr1', 'void *buff'), Param('$rr2', 'size_t len'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x900122] = Entry('sendto', [Param('$rr0', 'int fd'), Param('$rr1', 'void *buff'), Param('$rr2', 'size_t len'), Param('$rr3', 'unsigned int flags'), Param('$rr4', 'struct sockaddr *addr'), Param('$rr5', 'int addr_len')])
-syscall_table[0x900123] = Entry('recv', [Param('$rr0', 'int fd'), Param('$rr1', 'void *ubuf'), Param('$rr2', 'size_t size'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x900124] = Entry('recvfrom', [Param('$rr0', 'int fd'), Param('$rr1', 'void *ubuf'), Param('$rr2', 'size_t size'), Param('$rr3', 'unsigned int flags'), Param('$rr4', 'struct sockaddr *addr'), Param('$rr5', 'int *addr_len')])
-syscall_table[0x900125] = Entry('shutdown', [Param('$rr0', 'int fd'), Param('$rr1', 'int how')])
-syscall_table[0x900126] = Entry('setsockopt', [Param('$rr0', 'int fd'), Param('$rr1', 'int level'), Param('$rr2', 'int optname'), Param('$rr3', 'char *optval'), Param('$rr4', 'int optlen')])
-syscall_table[0x900127] = Entry('getsockopt', [Param('$rr0', 'int fd'), Param('$rr1', 'int level'), Param('$rr2', 'int optname'), Param('$rr3', 'char *optval'), Param('$rr4', 'int *optlen')])
-syscall_table[0x900128] = Entry('sendmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct msghdr *msg'), Param('$rr2', 'unsigned int flags')])
-syscall_table[0x900129] = Entry('recvmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct msghdr *msg'), Param('$rr2', 'unsigned int flags')])
-syscall_table[0x90012a] = Entry('semop', [Param('$rr0', 'int semid'), Param('$rr1', 'struct sembuf *tsops'), Param('$rr2', 'unsigned nsops')])
-syscall_table[0x90012b] = Entry('semget', [Param('$rr0', 'key_t key'), Param('$rr1', 'int nsems'), Param('$rr2', 'int semflg')])
-syscall_table[0x90012c] = Entry('semctl', [Param('$rr0', 'int semnum int cmd'), Param('$rr1', 'union semun arg')])
-syscall_table[0x90012d] = Entry('msgsnd', [Param('$rr0', 'int msqid'), Param('$rr1', 'struct msgbuf *msgp'), Param('$rr2', 'size_t msgsz'), Param('$rr3', 'int msgflg')])
-syscall_table[0x90012e] = Entry('msgrcv', [Param('$rr0', 'int msqid'), Param('$rr1', 'struct msgbuf *msgp'), Param('$rr2', 'size_t msgsz'), Param('$rr3', 'long msgtyp'), Param('$rr4', 'int msgflg')])
-syscall_table[0x90012f] = Entry('msgget', [Param('$rr0', 'key_t key'), Param('$rr1', 'int msgflg')])
-syscall_table[0x900130] = Entry('msgctl', [Param('$rr0', 'int msqid'), Param('$rr1', 'int cmd'), Param('$rr2', 'struct msqid_ds *buf')])
-syscall_table[0x900131] = Entry('shmat', [Param('$rr0', 'int shmid'), Param('$rr1', 'char *shmaddr'), Param('$rr2', 'int shmflg')])
-syscall_table[0x900132] = Entry('shmdt', [Param('$rr0', 'char *shmaddr')])
-syscall_table[0x900133] = Entry('shmget', [Param('$rr0', 'key_t key'), Param('$rr1', 'size_t size'), Param('$rr2', 'int shmflg')])
-syscall_table[0x900134] = Entry('shmctl', [Param('$rr0', 'int shmid'), Param('$rr1', 'int cmd'), Param('$rr2', 'struct shmid_ds *buf')])
-syscall_table[0x900135] = Entry('add_key', [Param('$rr0', 'const char *_type'), Param('$rr1', 'const char *_description'), Param('$rr2', 'const void *_payload'), Param('$rr3', 'size_t plen'), Param('$rr4', 'key_serial_t ringid')])
-syscall_table[0x900136] = Entry('request_key', [Param('$rr0', 'const char *_type'), Param('$rr1', 'const char *_description'), Param('$rr2', 'const char *_callout_info'), Param('$rr3', 'key_serial_t destringid')])
-syscall_table[0x900137] = Entry('keyctl', [Param('$rr0', 'int option'), Param('$rr1', 'unsigned long arg2'), Param('$rr2', 'unsigned long arg3'), Param('$rr3', 'unsigned long arg4'), Param('$rr4', 'unsigned long arg5')])
-syscall_table[0x900138] = Entry('semtimedop', [Param('$rr0', 'int semid'), Param('$rr1', 'struct sembuf *tsops'), Param('$rr2', 'unsigned nsops'), Param('$rr3', 'const struct timespec *timeout')])
-syscall_table[0x90013a] = Entry('ioprio_set', [Param('$rr0', 'int which'), Param('$rr1', 'int who'), Param('$rr2', 'int ioprio')])
-syscall_table[0x90013b] = Entry('ioprio_get', [Param('$rr0', 'int which'), Param('$rr1', 'int who')])
-syscall_table[0x90013c] = Entry('inotify_init', [])
-syscall_table[0x90013d] = Entry('inotify_add_watch', [Param('$rr0', 'int fd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'u32 mask')])
-syscall_table[0x90013e] = Entry('inotify_rm_watch', [Param('$rr0', 'int fd'), Param('$rr1', '__s32 wd')])
-syscall_table[0x90013f] = Entry('mbind', [Param('$rr0', 'unsigned long start'), Param('$rr1', 'unsigned long len'), Param('$rr2', 'unsigned long mode'), Param('$rr3', 'unsigned long *nmask'), Param('$rr4', 'unsigned long maxnode'), Param('$rr5', 'unsigned flags')])
-syscall_table[0x900140] = Entry('get_mempolicy', [Param('$rr0', 'int *policy'), Param('$rr1', 'unsigned long *nmask'), Param('$rr2', 'unsigned long maxnode'), Param('$rr3', 'unsigned long addr'), Param('$rr4', 'unsigned long flags')])
-syscall_table[0x900141] = Entry('set_mempolicy', [Param('$rr0', 'int mode'), Param('$rr1', 'unsigned long *nmask'), Param('$rr2', 'unsigned long maxnode')])
-syscall_table[0x900142] = Entry('openat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'int flags'), Param('$rr3', 'umode_t mode')])
-syscall_table[0x900143] = Entry('mkdirat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'umode_t mode')])
-syscall_table[0x900144] = Entry('mknodat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'umode_t mode'), Param('$rr3', 'unsigned dev')])
-syscall_table[0x900145] = Entry('fchownat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'uid_t user'), Param('$rr3', 'gid_t group'), Param('$rr4', 'int flag')])
-syscall_table[0x900146] = Entry('futimesat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'struct timeval *utimes')])
-syscall_table[0x900147] = Entry('fstatat64', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'struct stat64 *statbuf'), Param('$rr3', 'int flag')])
-syscall_table[0x900148] = Entry('unlinkat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'int flag')])
-syscall_table[0x900149] = Entry('renameat', [Param('$rr0', 'int olddfd'), Param('$rr1', 'const char *oldname'), Param('$rr2', 'int newdfd'), Param('$rr3', 'const char *newname')])
-syscall_table[0x90014a] = Entry('linkat', [Param('$rr0', 'int olddfd'), Param('$rr1', 'const char *oldname'), Param('$rr2', 'int newdfd'), Param('$rr3', 'const char *newname'), Param('$rr4', 'int flags')])
-syscall_table[0x90014b] = Entry('symlinkat', [Param('$rr0', 'const char *oldname'), Param('$rr1', 'int newdfd'), Param('$rr2', 'const char *newname')])
-syscall_table[0x90014c] = Entry('readlinkat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *pathname'), Param('$rr2', 'char *buf'), Param('$rr3', 'int bufsiz')])
-syscall_table[0x90014d] = Entry('fchmodat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'umode_t mode')])
-syscall_table[0x90014e] = Entry('faccessat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'int mode')])
-syscall_table[0x90014f] = Entry('pselect6', [Param('$rr0', 'int n'), Param('$rr1', 'fd_set *inp'), Param('$rr2', 'fd_set *outp'), Param('$rr3', 'fd_set *exp'), Param('$rr4', 'struct timespec *tsp'), Param('$rr5', 'void *sig')])
-syscall_table[0x900150] = Entry('ppoll', [Param('$rr0', 'struct pollfd *ufds'), Param('$rr1', 'unsigned int nfds'), Param('$rr2', 'struct timespec *tsp'), Param('$rr3', 'const sigset_t *sigmask'), Param('$rr4', 'size_t sigsetsize')])
-syscall_table[0x900151] = Entry('unshare', [Param('$rr0', 'unsigned long unshare_flags')])
-syscall_table[0x900152] = Entry('set_robust_list', [Param('$rr0', 'struct robust_list_head *head'), Param('$rr1', 'size_t len')])
-syscall_table[0x900153] = Entry('get_robust_list', [Param('$rr0', 'int pid'), Param('$rr1', 'struct robust_list_head * *head_ptr'), Param('$rr2', 'size_t *len_ptr')])
-syscall_table[0x900154] = Entry('splice', [Param('$rr0', 'int fd_in'), Param('$rr1', 'loff_t *off_in'), Param('$rr2', 'int fd_out'), Param('$rr3', 'loff_t *off_out'), Param('$rr4', 'size_t len'), Param('$rr5', 'unsigned int flags')])
-syscall_table[0x900155] = Entry('sync_file_range2', [Param('$rr0', 'unsigned int flags loff_t offset'), Param('$rr1', 'loff_t nbytes')])
-syscall_table[0x900156] = Entry('tee', [Param('$rr0', 'int fdin'), Param('$rr1', 'int fdout'), Param('$rr2', 'size_t len'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x900157] = Entry('vmsplice', [Param('$rr0', 'int fd'), Param('$rr1', 'const struct iovec *iov'), Param('$rr2', 'unsigned long nr_segs'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x900158] = Entry('move_pages', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned long nr_pages'), Param('$rr2', 'const void * *pages'), Param('$rr3', 'const int *nodes'), Param('$rr4', 'int *status'), Param('$rr5', 'int flags')])
-syscall_table[0x900159] = Entry('getcpu', [Param('$rr0', 'unsigned *cpup'), Param('$rr1', 'unsigned *nodep'), Param('$rr2', 'struct getcpu_cache *unused')])
-syscall_table[0x90015a] = Entry('epoll_pwait', [Param('$rr0', 'int epfd'), Param('$rr1', 'struct epoll_event *events'), Param('$rr2', 'int maxevents'), Param('$rr3', 'int timeout'), Param('$rr4', 'const sigset_t *sigmask'), Param('$rr5', 'size_t sigsetsize')])
-syscall_table[0x90015b] = Entry('kexec_load', [Param('$rr0', 'unsigned long entry'), Param('$rr1', 'unsigned long nr_segments'), Param('$rr2', 'struct kexec_segment *segments'), Param('$rr3', 'unsigned long flags')])
-syscall_table[0x90015c] = Entry('utimensat', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *filename'), Param('$rr2', 'struct timespec *utimes'), Param('$rr3', 'int flags')])
-syscall_table[0x90015d] = Entry('signalfd', [Param('$rr0', 'int ufd'), Param('$rr1', 'sigset_t *user_mask'), Param('$rr2', 'size_t sizemask')])
-syscall_table[0x90015e] = Entry('timerfd_create', [Param('$rr0', 'int clockid'), Param('$rr1', 'int flags')])
-syscall_table[0x90015f] = Entry('eventfd', [Param('$rr0', 'unsigned int count')])
-syscall_table[0x900160] = Entry('fallocate', [Param('$rr0', 'int mode loff_t offset'), Param('$rr1', 'loff_t len')])
-syscall_table[0x900161] = Entry('timerfd_settime', [Param('$rr0', 'int ufd'), Param('$rr1', 'int flags'), Param('$rr2', 'const struct itimerspec *utmr'), Param('$rr3', 'struct itimerspec *otmr')])
-syscall_table[0x900162] = Entry('timerfd_gettime', [Param('$rr0', 'int ufd'), Param('$rr1', 'struct itimerspec *otmr')])
-syscall_table[0x900163] = Entry('signalfd4', [Param('$rr0', 'int ufd'), Param('$rr1', 'sigset_t *user_mask'), Param('$rr2', 'size_t sizemask'), Param('$rr3', 'int flags')])
-syscall_table[0x900164] = Entry('eventfd2', [Param('$rr0', 'unsigned int count'), Param('$rr1', 'int flags')])
-syscall_table[0x900165] = Entry('epoll_create1', [Param('$rr0', 'int flags')])
-syscall_table[0x900166] = Entry('dup3', [Param('$rr0', 'unsigned int oldfd'), Param('$rr1', 'unsigned int newfd'), Param('$rr2', 'int flags')])
-syscall_table[0x900167] = Entry('pipe2', [Param('$rr0', 'int *fildes'), Param('$rr1', 'int flags')])
-syscall_table[0x900168] = Entry('inotify_init1', [Param('$rr0', 'int flags')])
-syscall_table[0x900169] = Entry('preadv', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen'), Param('$rr3', 'unsigned long pos_l'), Param('$rr4', 'unsigned long pos_h')])
-syscall_table[0x90016a] = Entry('pwritev', [Param('$rr0', 'unsigned long fd'), Param('$rr1', 'const struct iovec *vec'), Param('$rr2', 'unsigned long vlen'), Param('$rr3', 'unsigned long pos_l'), Param('$rr4', 'unsigned long pos_h')])
-syscall_table[0x90016b] = Entry('rt_tgsigqueueinfo', [Param('$rr0', 'pid_t tgid'), Param('$rr1', 'pid_t pid'), Param('$rr2', 'int sig'), Param('$rr3', 'siginfo_t *uinfo')])
-syscall_table[0x90016c] = Entry('perf_event_open', [Param('$rr0', 'struct perf_event_attr *attr_uptr'), Param('$rr1', 'pid_t pid'), Param('$rr2', 'int cpu'), Param('$rr3', 'int group_fd'), Param('$rr4', 'unsigned long flags')])
-syscall_table[0x90016d] = Entry('recvmmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct mmsghdr *mmsg'), Param('$rr2', 'unsigned int vlen'), Param('$rr3', 'unsigned int flags'), Param('$rr4', 'struct timespec *timeout')])
-syscall_table[0x90016e] = Entry('accept4', [Param('$rr0', 'int fd'), Param('$rr1', 'struct sockaddr *upeer_sockaddr'), Param('$rr2', 'int *upeer_addrlen'), Param('$rr3', 'int flags')])
-syscall_table[0x90016f] = Entry('fanotify_init', [Param('$rr0', 'unsigned int flags'), Param('$rr1', 'unsigned int event_f_flags')])
-syscall_table[0x900170] = Entry('fanotify_mark', [Param('$rr0', 'unsigned int flags __u64 mask'), Param('$rr1', 'int dfd const char *pathname')])
-syscall_table[0x900171] = Entry('prlimit64', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'unsigned int resource'), Param('$rr2', 'const struct rlimit64 *new_rlim'), Param('$rr3', 'struct rlimit64 *old_rlim')])
-syscall_table[0x900172] = Entry('name_to_handle_at', [Param('$rr0', 'int dfd'), Param('$rr1', 'const char *name'), Param('$rr2', 'struct file_handle *handle'), Param('$rr3', 'int *mnt_id'), Param('$rr4', 'int flag')])
-syscall_table[0x900173] = Entry('open_by_handle_at', [Param('$rr0', 'int mountdirfd'), Param('$rr1', 'struct file_handle *handle'), Param('$rr2', 'int flags')])
-syscall_table[0x900174] = Entry('clock_adjtime', [Param('$rr0', 'const clockid_t which_clock'), Param('$rr1', 'struct timex *utx')])
-syscall_table[0x900175] = Entry('syncfs', [Param('$rr0', 'int fd')])
-syscall_table[0x900176] = Entry('sendmmsg', [Param('$rr0', 'int fd'), Param('$rr1', 'struct mmsghdr *mmsg'), Param('$rr2', 'unsigned int vlen'), Param('$rr3', 'unsigned int flags')])
-syscall_table[0x900177] = Entry('setns', [Param('$rr0', 'int fd'), Param('$rr1', 'int nstype')])
-syscall_table[0x900178] = Entry('process_vm_readv', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'const struct iovec *lvec'), Param('$rr2', 'unsigned long liovcnt'), Param('$rr3', 'const struct iovec *rvec'), Param('$rr4', 'unsigned long riovcnt'), Param('$rr5', 'unsigned long flags')])
-syscall_table[0x900179] = Entry('process_vm_writev', [Param('$rr0', 'pid_t pid'), Param('$rr1', 'const struct iovec *lvec'), Param('$rr2', 'unsigned long liovcnt'), Param('$rr3', 'const struct iovec *rvec'), Param('$rr4', 'unsigned long riovcnt'), Param('$rr5', 'unsigned long flags')])
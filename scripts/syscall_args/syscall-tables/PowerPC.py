@@ -1,332 +0,0 @@
-from collections import namedtuple
-
-Entry = namedtuple('Entry', 'name params')
-Param = namedtuple('Param', 'reg param')
-
-syscall_table = {}
-syscall_table[0x00] = Entry('restart_syscall', [])
-syscall_table[0x01] = Entry('exit', [Param('$r3', 'int error_code')])
-syscall_table[0x02] = Entry('fork', [Param('$r3', 'unsigned long p1'), Param('$r4', 'unsigned long p2'), Param('$r5', 'unsigned long p3'), Param('$r6', 'unsigned long p4'), Param('$r7', 'unsigned long p5'), Param('$r8', 'unsigned long p6')])
-syscall_table[0x03] = Entry('read', [Param('$r3', 'unsigned int fd'), Param('$r4', 'char *buf'), Param('$r5', 'size_t count')])
-syscall_table[0x04] = Entry('write', [Param('$r3', 'unsigned int fd'), Param('$r4', 'const char *buf'), Param('$r5', 'size_t count')])
-syscall_table[0x05] = Entry('open', [Param('$r3', 'const char *filename'), Param('$r4', 'int flags'), Param('$r5', 'umode_t mode')])
-syscall_table[0x06] = Entry('close', [Param('$r3', 'unsigned int fd')])
-syscall_table[0x07] = Entry('waitpid', [Param('$r3', 'pid_t pid'), Param('$r4', 'int *stat_addr'), Param('$r5', 'int options')])
-syscall_table[0x08] = Entry('creat', [Param('$r3', 'const char *pathname'), Param('$r4', 'umode_t mode')])
-syscall_table[0x09] = Entry('link', [Param('$r3', 'const char *oldname'), Param('$r4', 'const char *newname')])
-syscall_table[0x0a] = Entry('unlink', [Param('$r3', 'const char *pathname')])
-syscall_table[0x0b] = Entry('execve', [Param('$r3', 'unsigned long a0'), Param('$r4', 'unsigned long a1'), Param('$r5', 'unsigned long a2'), Param('$r6', 'unsigned long a3'), Param('$r7', 'unsigned long a4'), Param('$r8', 'unsigned long a5')])
-syscall_table[0x0c] = Entry('chdir', [Param('$r3', 'const char *filename')])
-syscall_table[0x0d] = Entry('time', [Param('$r3', 'time_t *tloc')])
-syscall_table[0x0e] = Entry('mknod', [Param('$r3', 'const char *filename'), Param('$r4', 'umode_t mode'), Param('$r5', 'unsigned dev')])
-syscall_table[0x0f] = Entry('chmod', [Param('$r3', 'const char *filename'), Param('$r4', 'umode_t mode')])
-syscall_table[0x10] = Entry('lchown', [Param('$r3', 'const char *filename'), Param('$r4', 'uid_t user'), Param('$r5', 'gid_t group')])
-syscall_table[0x12] = Entry('oldstat', [Param('$r3', 'const char *filename'), Param('$r4', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x13] = Entry('lseek', [Param('$r3', 'unsigned int fd'), Param('$r4', 'off_t offset'), Param('$r5', 'unsigned int origin')])
-syscall_table[0x14] = Entry('getpid', [])
-syscall_table[0x15] = Entry('mount', [Param('$r3', 'char *dev_name'), Param('$r4', 'char *dir_name'), Param('$r5', 'char *type'), Param('$r6', 'unsigned long flags'), Param('$r7', 'void *data')])
-syscall_table[0x16] = Entry('umount', [Param('$r3', 'char *name'), Param('$r4', 'int flags')])
-syscall_table[0x17] = Entry('setuid', [Param('$r3', 'uid_t uid')])
-syscall_table[0x18] = Entry('getuid', [])
-syscall_table[0x19] = Entry('stime', [Param('$r3', 'time_t *tptr')])
-syscall_table[0x1a] = Entry('ptrace', [Param('$r3', 'long request'), Param('$r4', 'long pid'), Param('$r5', 'unsigned long addr'), Param('$r6', 'unsigned long data')])
-syscall_table[0x1b] = Entry('alarm', [Param('$r3', 'unsigned int seconds')])
-syscall_table[0x1c] = Entry('oldfstat', [Param('$r3', 'unsigned int fd'), Param('$r4', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x1d] = Entry('pause', [])
-syscall_table[0x1e] = Entry('utime', [Param('$r3', 'char *filename'), Param('$r4', 'struct utimbuf *times')])
-syscall_table[0x21] = Entry('access', [Param('$r3', 'const char *filename'), Param('$r4', 'int mode')])
-syscall_table[0x22] = Entry('nice', [Param('$r3', 'int increment')])
-syscall_table[0x24] = Entry('sync', [])
-syscall_table[0x25] = Entry('kill', [Param('$r3', 'pid_t pid'), Param('$r4', 'int sig')])
-syscall_table[0x26] = Entry('rename', [Param('$r3', 'const char *oldname'), Param('$r4', 'const char *newname')])
-syscall_table[0x27] = Entry('mkdir', [Param('$r3', 'const char *pathname'), Param('$r4', 'umode_t mode')])
-syscall_table[0x28] = Entry('rmdir', [Param('$r3', 'const char *pathname')])
-syscall_table[0x29] = Entry('dup', [Param('$r3', 'unsigned int fildes')])
-syscall_table[0x2a] = Entry('pipe', [Param('$r3', 'int *fildes')])
-syscall_table[0x2b] = Entry('times', [Param('$r3', 'struct tms *tbuf')])
-syscall_table[0x2d] = Entry('brk', [Param('$r3', 'unsigned long brk')])
-syscall_table[0x2e] = Entry('setgid', [Param('$r3', 'gid_t gid')])
-syscall_table[0x2f] = Entry('getgid', [])
-syscall_table[0x30] = Entry('signal', [Param('$r3', 'int sig'), Param('$r4', '__sighandler_t handler')])
-syscall_table[0x31] = Entry('geteuid', [])
-syscall_table[0x32] = Entry('getegid', [])
-syscall_table[0x33] = Entry('acct', [Param('$r3', 'const char *name')])
-syscall_table[0x34] = Entry('umount2', [Param('$r3', 'char *name'), Param('$r4', 'int flags')])
-syscall_table[0x36] = Entry('ioctl', [Param('$r3', 'unsigned int fd'), Param('$r4', 'unsigned int cmd'), Param('$r5', 'unsigned long arg')])
-syscall_table[0x37] = Entry('fcntl', [Param('$r3', 'unsigned int fd'), Param('$r4', 'unsigned int cmd'), Param('$r5', 'unsigned long arg')])
-syscall_table[0x39] = Entry('setpgid', [Param('$r3', 'pid_t pid'), Param('$r4', 'pid_t pgid')])
-syscall_table[0x3b] = Entry('oldolduname', [Param('$r3', 'struct oldold_utsname *name')])
-syscall_table[0x3c] = Entry('umask', [Param('$r3', 'int mask')])
-syscall_table[0x3d] = Entry('chroot', [Param('$r3', 'const char *filename')])
-syscall_table[0x3e] = Entry('ustat', [Param('$r3', 'unsigned dev'), Param('$r4', 'struct ustat *ubuf')])
-syscall_table[0x3f] = Entry('dup2', [Param('$r3', 'unsigned int oldfd'), Param('$r4', 'unsigned int newfd')])
-syscall_table[0x40] = Entry('getppid', [])
-syscall_table[0x41] = Entry('getpgrp', [])
-syscall_table[0x42] = Entry('setsid', [])
-syscall_table[0x43] = Entry('sigaction', [Param('$r3', 'int sig'), Param('$r4', 'struct old_sigaction *act'), Param('$r5', 'struct old_sigaction *oact')])
-syscall_table[0x44] = Entry('sgetmask', [])
-syscall_table[0x45] = Entry('ssetmask', [Param('$r3', 'int newmask')])
-syscall_table[0x46] = Entry('setreuid', [Param('$r3', 'uid_t ruid'), Param('$r4', 'uid_t euid')])
-syscall_table[0x47] = Entry('setregid', [Param('$r3', 'gid_t rgid'), Param('$r4', 'gid_t egid')])
-syscall_table[0x48] = Entry('sigsuspend', [Param('$r3', 'old_sigset_t mask')])
-syscall_table[0x49] = Entry('sigpending', [Param('$r3', 'old_sigset_t *set')])
-syscall_table[0x4a] = Entry('sethostname', [Param('$r3', 'char *name'), Param('$r4', 'int len')])
-syscall_table[0x4b] = Entry('setrlimit', [Param('$r3', 'unsigned int resource'), Param('$r4', 'struct rlimit *rlim')])
-syscall_table[0x4c] = Entry('getrlimit', [Param('$r3', 'unsigned int resource'), Param('$r4', 'struct rlimit *rlim')])
-syscall_table[0x4d] = Entry('getrusage', [Param('$r3', 'int who'), Param('$r4', 'struct rusage *ru')])
-syscall_table[0x4e] = Entry('gettimeofday', [Param('$r3', 'struct timeval *tv'), Param('$r4', 'struct timezone *tz')])
-syscall_table[0x4f] = Entry('settimeofday', [Param('$r3', 'struct timeval *tv'), Param('$r4', 'struct timezone *tz')])
-syscall_table[0x50] = Entry('getgroups', [Param('$r3', 'int gidsetsize'), Param('$r4', 'gid_t *grouplist')])
-syscall_table[0x51] = Entry('setgroups', [Param('$r3', 'int gidsetsize'), Param('$r4', 'gid_t *grouplist')])
-syscall_table[0x52] = Entry('select', [Param('$r3', 'int n'), Param('$r4', 'fd_set *inp'), Param('$r5', 'fd_set *outp'), Param('$r6', 'fd_set *exp'), Param('$r7', 'struct timeval *tvp')])
-syscall_table[0x53] = Entry('symlink', [Param('$r3', 'const char *oldname'), Param('$r4', 'const char *newname')])
-syscall_table[0x54] = Entry('oldlstat', [Param('$r3', 'const char *filename'), Param('$r4', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x55] = Entry('readlink', [Param('$r3', 'const char *path'), Param('$r4', 'char *buf'), Param('$r5', 'int bufsiz')])
-syscall_table[0x56] = Entry('uselib', [Param('$r3', 'const char *library')])
-syscall_table[0x57] = Entry('swapon', [Param('$r3', 'const char *specialfile'), Param('$r4', 'int swap_flags')])
-syscall_table[0x58] = Entry('reboot', [Param('$r3', 'int magic1'), Param('$r4', 'int magic2'), Param('$r5', 'unsigned int cmd'), Param('$r6', 'void *arg')])
-syscall_table[0x59] = Entry('readdir', [Param('$r3', 'unsigned int fd'), Param('$r4', 'struct old_linux_dirent *dirent'), Param('$r5', 'unsigned int count')])
-syscall_table[0x5a] = Entry('mmap', [Param('$r3', 'unsigned long addr'), Param('$r4', 'size_t len'), Param('$r5', 'unsigned long prot'), Param('$r6', 'unsigned long flags'), Param('$r7', 'unsigned long fd'), Param('$r8', 'off_t offset')])
-syscall_table[0x5b] = Entry('munmap', [Param('$r3', 'unsigned long addr'), Param('$r4', 'size_t len')])
-syscall_table[0x5c] = Entry('truncate', [Param('$r3', 'const char *path'), Param('$r4', 'long length')])
-syscall_table[0x5d] = Entry('ftruncate', [Param('$r3', 'unsigned int fd'), Param('$r4', 'unsigned long length')])
-syscall_table[0x5e] = Entry('fchmod', [Param('$r3', 'unsigned int fd'), Param('$r4', 'umode_t mode')])
-syscall_table[0x5f] = Entry('fchown', [Param('$r3', 'unsigned int fd'), Param('$r4', 'uid_t user'), Param('$r5', 'gid_t group')])
-syscall_table[0x60] = Entry('getpriority', [Param('$r3', 'int which'), Param('$r4', 'int who')])
-syscall_table[0x61] = Entry('setpriority', [Param('$r3', 'int which'), Param('$r4', 'int who'), Param('$r5', 'int niceval')])
-syscall_table[0x63] = Entry('statfs', [Param('$r3', 'const char *pathname'), Param('$r4', 'struct statfs *buf')])
-syscall_table[0x64] = Entry('fstatfs', [Param('$r3', 'unsigned int fd'), Param('$r4', 'struct statfs *buf')])
-syscall_table[0x66] = Entry('socketcall', [Param('$r3', 'int call'), Param('$r4', 'unsigned long *args')])
-syscall_table[0x67] = Entry('syslog', [Param('$r3', 'int type'), Param('$r4', 'char *buf'), Param('$r5', 'int len')])
-syscall_table[0x68] = Entry('setitimer', [Param('$r3', 'int which'), Param('$r4', 'struct itimerval *value'), Param('$r5', 'struct itimerval *ovalue')])
-syscall_table[0x69] = Entry('getitimer', [Param('$r3', 'int which'), Param('$r4', 'struct itimerval *value')])
-syscall_table[0x6a] = Entry('stat', [Param('$r3', 'const char *filename'), Param('$r4', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x6b] = Entry('lstat', [Param('$r3', 'const char *filename'), Param('$r4', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x6c] = Entry('fstat', [Param('$r3', 'unsigned int fd'), Param('$r4', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x6d] = Entry('olduname', [Param('$r3', 'struct oldold_utsname *name')])
-syscall_table[0x6f] = Entry('vhangup', [])
-syscall_table[0x72] = Entry('wait4', [Param('$r3', 'pid_t upid'), Param('$r4', 'int *stat_addr'), Param('$r5', 'int options'), Param('$r6', 'struct rusage *ru')])
-syscall_table[0x73] = Entry('swapoff', [Param('$r3', 'const char *specialfile')])
-syscall_table[0x74] = Entry('sysinfo', [Param('$r3', 'struct sysinfo *info')])
-syscall_table[0x75] = Entry('ipc', [Param('$r3', 'unsigned int call'), Param('$r4', 'int first'), Param('$r5', 'unsigned long second'), Param('$r6', 'unsigned long third'), Param('$r7', 'void *ptr'), Param('$r8', 'long fifth')])
-syscall_table[0x76] = Entry('fsync', [Param('$r3', 'unsigned int fd')])
-syscall_table[0x77] = Entry('sigreturn', [Param('$r3', 'int r3'), Param('$r4', 'int r4'), Param('$r5', 'int r5'), Param('$r6', 'int r6'), Param('$r7', 'int r7'), Param('$r8', 'int r8')])
-syscall_table[0x78] = Entry('clone', [Param('$r3', 'unsigned long clone_flags'), Param('$r4', 'unsigned long usp'), Param('$r5', 'int *parent_tidp'), Param('$r6', 'void *child_threadptr'), Param('$r7', 'int *child_tidp'), Param('$r8', 'int p6')])
-syscall_table[0x79] = Entry('setdomainname', [Param('$r3', 'char *name'), Param('$r4', 'int len')])
-syscall_table[0x7a] = Entry('uname', [Param('$r3', 'struct old_utsname *name')])
-syscall_table[0x7c] = Entry('adjtimex', [Param('$r3', 'struct timex *txc_p')])
-syscall_table[0x7d] = Entry('mprotect', [Param('$r3', 'unsigned long start'), Param('$r4', 'size_t len'), Param('$r5', 'unsigned long prot')])
-syscall_table[0x7e] = Entry('sigprocmask', [Param('$r3', 'int how'), Param('$r4', 'old_sigset_t *nset'), Param('$r5', 'old_sigset_t *oset')])
-syscall_table[0x80] = Entry('init_module', [Param('$r3', 'void *umod'), Param('$r4', 'unsigned long len'), Param('$r5', 'const char *uargs')])
-syscall_table[0x81] = Entry('delete_module', [Param('$r3', 'const char *name_user'), Param('$r4', 'unsigned int flags')])
-syscall_table[0x83] = Entry('quotactl', [Param('$r3', 'unsigned int cmd'), Param('$r4', 'const char *special'), Param('$r5', 'qid_t id'), Param('$r6', 'void *addr')])
-syscall_table[0x84] = Entry('getpgid', [Param('$r3', 'pid_t pid')])
-syscall_table[0x85] = Entry('fchdir', [Param('$r3', 'unsigned int fd')])
-syscall_table[0x86] = Entry('bdflush', [Param('$r3', 'int func'), Param('$r4', 'long data')])
-syscall_table[0x87] = Entry('sysfs', [Param('$r3', 'int option'), Param('$r4', 'unsigned long arg1'), Param('$r5', 'unsigned long arg2')])
-syscall_table[0x88] = Entry('personality', [Param('$r3', 'unsigned int personality')])
-syscall_table[0x8a] = Entry('setfsuid', [Param('$r3', 'uid_t uid')])
-syscall_table[0x8b] = Entry('setfsgid', [Param('$r3', 'gid_t gid')])
-syscall_table[0x8c] = Entry('_llseek', [Param('$r3', 'unsigned int fd'), Param('$r4', 'unsigned long offset_high'), Param('$r5', 'unsigned long offset_low'), Param('$r6', 'loff_t *result'), Param('$r7', 'unsigned int origin')])
-syscall_table[0x8d] = Entry('getdents', [Param('$r3', 'unsigned int fd'), Param('$r4', 'struct linux_dirent *dirent'), Param('$r5', 'unsigned int count')])
-syscall_table[0x8e] = Entry('_newselect', [Param('$r3', 'int n'), Param('$r4', 'fd_set *inp'), Param('$r5', 'fd_set *outp'), Param('$r6', 'fd_set *exp'), Param('$r7', 'struct timeval *tvp')])
-syscall_table[0x8f] = Entry('flock', [Param('$r3', 'unsigned int fd'), Param('$r4', 'unsigned int cmd')])
-syscall_table[0x90] = Entry('msync', [Param('$r3', 'unsigned long start'), Param('$r4', 'size_t len'), Param('$r5', 'int flags')])
-syscall_table[0x91] = Entry('readv', [Param('$r3', 'unsigned long fd'), Param('$r4', 'const struct iovec *vec'), Param('$r5', 'unsigned long vlen')])
-syscall_table[0x92] = Entry('writev', [Param('$r3', 'unsigned long fd'), Param('$r4', 'const struct iovec *vec'), Param('$r5', 'unsigned long vlen')])
-syscall_table[0x93] = Entry('getsid', [Param('$r3', 'pid_t pid')])
-syscall_table[0x94] = Entry('fdatasync', [Param('$r3', 'unsigned int fd')])
-syscall_table[0x95] = Entry('_sysctl', [Param('$r3', 'struct __sysctl_args *args')])
-syscall_table[0x96] = Entry('mlock', [Param('$r3', 'unsigned long start'), Param('$r4', 'size_t len')])
-syscall_table[0x97] = Entry('munlock', [Param('$r3', 'unsigned long start'), Param('$r4', 'size_t len')])
-syscall_table[0x98] = Entry('mlockall', [Param('$r3', 'int flags')])
-syscall_table[0x99] = Entry('munlockall', [])
-syscall_table[0x9a] = Entry('sched_setparam', [Param('$r3', 'pid_t pid'), Param('$r4', 'struct sched_param *param')])
-syscall_table[0x9b] = Entry('sched_getparam', [Param('$r3', 'pid_t pid'), Param('$r4', 'struct sched_param *param')])
-syscall_table[0x9c] = Entry('sched_setscheduler', [Param('$r3', 'pid_t pid'), Param('$r4', 'int policy'), Param('$r5', 'struct sched_param *param')])
-syscall_table[0x9d] = Entry('sched_getscheduler', [Param('$r3', 'pid_t pid')])
-syscall_table[0x9e] = Entry('sched_yield', [])
-syscall_table[0x9f] = Entry('sched_get_priority_max', [Param('$r3', 'int policy')])
-syscall_table[0xa0] = Entry('sched_get_priority_min', [Param('$r3', 'int policy')])
-syscall_table[0xa1] = Entry('sched_rr_get_interval', [Param('$r3', 'pid_t pid'), Param('$r4', 'struct timespec *interval')])
-syscall_table[0xa2] = Entry('nanosleep', [Param('$r3', 'struct timespec *rqtp'), Param('$r4', 'struct timespec *rmtp')])
-syscall_table[0xa3] = Entry('mremap', [Param('$r3', 'unsigned long addr'), Param('$r4', 'unsigned long old_len'), Param('$r5', 'unsigned long new_len'), Param('$r6', 'unsigned long flags'), Param('$r7', 'unsigned long new_addr')])
-syscall_table[0xa4] = Entry('setresuid', [Param('$r3', 'uid_t ruid'), Param('$r4', 'uid_t euid'), Param('$r5', 'uid_t suid')])
-syscall_table[0xa5] = Entry('getresuid', [Param('$r3', 'uid_t *ruidp'), Param('$r4', 'uid_t *euidp'), Param('$r5', 'uid_t *suidp')])
-syscall_table[0xa7] = Entry('poll', [Param('$r3', 'struct pollfd *ufds'), Param('$r4', 'unsigned int nfds'), Param('$r5', 'int timeout_msecs')])
-syscall_table[0xa9] = Entry('setresgid', [Param('$r3', 'gid_t rgid'), Param('$r4', 'gid_t egid'), Param('$r5', 'gid_t sgid')])
-syscall_table[0xaa] = Entry('getresgid', [Param('$r3', 'gid_t *rgidp'), Param('$r4', 'gid_t *egidp'), Param('$r5', 'gid_t *sgidp')])
-syscall_table[0xab] = Entry('prctl', [Param('$r3', 'int option'), Param('$r4', 'unsigned long arg2'), Param('$r5', 'unsigned long arg3'), Param('$r6', 'unsigned long arg4'), Param('$r7', 'unsigned long arg5')])
-syscall_table[0xac] = Entry('rt_sigreturn', [Param('$r3', 'int r3'), Param('$r4', 'int r4'), Param('$r5', 'int r5'), Param('$r6', 'int r6'), Param('$r7', 'int r7'), Param('$r8', 'int r8')])
-syscall_table[0xad] = Entry('rt_sigaction', [Param('$r3', 'int sig'), Param('$r4', 'const struct sigaction *act'), Param('$r5', 'struct sigaction *oact'), Param('$r6', 'size_t sigsetsize')])
-syscall_table[0xae] = Entry('rt_sigprocmask', [Param('$r3', 'int how'), Param('$r4', 'sigset_t *nset'), Param('$r5', 'sigset_t *oset'), Param('$r6', 'size_t sigsetsize')])
-syscall_table[0xaf] = Entry('rt_sigpending', [Param('$r3', 'sigset_t *set'), Param('$r4', 'size_t sigsetsize')])
-syscall_table[0xb0] = Entry('rt_sigtimedwait', [Param('$r3', 'const sigset_t *uthese'), Param('$r4', 'siginfo_t *uinfo'), Param('$r5', 'const struct timespec *uts'), Param('$r6', 'size_t sigsetsize')])
-syscall_table[0xb1] = Entry('rt_sigqueueinfo', [Param('$r3', 'pid_t pid'), Param('$r4', 'int sig'), Param('$r5', 'siginfo_t *uinfo')])
-syscall_table[0xb2] = Entry('rt_sigsuspend', [Param('$r3', 'sigset_t *unewset'), Param('$r4', 'size_t sigsetsize')])
-syscall_table[0xb3] = Entry('pread64', [Param('$r3', 'char *buf size_t count'), Param('$r4', 'loff_t pos')])
-syscall_table[0xb4] = Entry('pwrite64', [Param('$r3', 'const char *buf size_t count'), Param('$r4', 'loff_t pos')])
-syscall_table[0xb5] = Entry('chown', [Param('$r3', 'const char *filename'), Param('$r4', 'uid_t user'), Param('$r5', 'gid_t group')])
-syscall_table[0xb6] = Entry('getcwd', [Param('$r3', 'char *buf'), Param('$r4', 'unsigned long size')])
-syscall_table[0xb7] = Entry('capget', [Param('$r3', 'cap_user_header_t header'), Param('$r4', 'cap_user_data_t dataptr')])
-syscall_table[0xb8] = Entry('capset', [Param('$r3', 'cap_user_header_t header'), Param('$r4', 'const cap_user_data_t data')])
-syscall_table[0xb9] = Entry('sigaltstack', [Param('$r3', 'const stack_t *uss'), Param('$r4', 'stack_t *uoss'), Param('$r5', 'unsigned long r5'), Param('$r6', 'unsigned long r6'), Param('$r7', 'unsigned long r7'), Param('$r8', 'unsigned long r8')])
-syscall_table[0xba] = Entry('sendfile', [Param('$r3', 'int out_fd'), Param('$r4', 'int in_fd'), Param('$r5', 'off_t *offset'), Param('$r6', 'size_t count')])
-syscall_table[0xbd] = Entry('vfork', [Param('$r3', 'unsigned long p1'), Param('$r4', 'unsigned long p2'), Param('$r5', 'unsigned long p3'), Param('$r6', 'unsigned long p4'), Param('$r7', 'unsigned long p5'), Param('$r8', 'unsigned long p6')])
-syscall_table[0xbe] = Entry('ugetrlimit', [Param('$r3', 'unsigned int resource'), Param('$r4', 'struct rlimit *rlim')])
-syscall_table[0xbf] = Entry('readahead', [Param('$r3', 'loff_t offset size_t count')])
-syscall_table[0xc0] = Entry('mmap2', [Param('$r3', 'unsigned long addr'), Param('$r4', 'size_t len'), Param('$r5', 'unsigned long prot'), Param('$r6', 'unsigned long flags'), Param('$r7', 'unsigned long fd'), Param('$r8', 'unsigned long pgoff')])
-syscall_table[0xc1] = Entry('truncate64', [Param('$r3', 'loff_t length')])
-syscall_table[0xc2] = Entry('ftruncate64', [Param('$r3', 'loff_t length')])
-syscall_table[0xc3] = Entry('stat64', [Param('$r3', 'const char *filename'), Param('$r4', 'struct stat64 *statbuf')])
-syscall_table[0xc4] = Entry('lstat64', [Param('$r3', 'const char *filename'), Param('$r4', 'struct stat64 *statbuf')])
-syscall_table[0xc5] = Entry('fstat64', [Param('$r3', 'unsigned long fd'), Param('$r4', 'struct stat64 *statbuf')])
-syscall_table[0xc6] = Entry('pciconfig_read', [Param('$r3', 'unsigned long bus'), Param('$r4', 'unsigned long dfn'), Param('$r5', 'unsigned long off'), Param('$r6', 'unsigned long len'), Param('$r7', 'void *buf')])
-syscall_table[0xc7] = Entry('pciconfig_write', [Param('$r3', 'unsigned long bus'), Param('$r4', 'unsigned long dfn'), Param('$r5', 'unsigned long off'), Param('$r6', 'unsigned long len'), Param('$r7', 'void *buf')])
-syscall_table[0xc8] = Entry('pciconfig_iobase', [Param('$r3', 'long which'), Param('$r4', 'unsigned long bus'), Param('$r5', 'unsigned long devfn')])
-syscall_table[0xca] = Entry('getdents64', [Param('$r3', 'unsigned int fd'), Param('$r4', 'struct linux_dirent64 *dirent'), Param('$r5', 'unsigned int count')])
-syscall_table[0xcb] = Entry('pivot_root', [Param('$r3', 'const char *new_root'), Param('$r4', 'const char *put_old')])
-syscall_table[0xcc] = Entry('fcntl64', [Param('$r3', 'unsigned int fd'), Param('$r4', 'unsigned int cmd'), Param('$r5', 'unsigned long arg')])
-syscall_table[0xcd] = Entry('madvise', [Param('$r3', 'unsigned long start'), Param('$r4', 'size_t len_in'), Param('$r5', 'int behavior')])
-syscall_table[0xce] = Entry('mincore', [Param('$r3', 'unsigned long start'), Param('$r4', 'size_t len'), Param('$r5', 'unsigned char *vec')])
-syscall_table[0xcf] = Entry('gettid', [])
-syscall_table[0xd0] = Entry('tkill', [Param('$r3', 'pid_t pid'), Param('$r4', 'int sig')])
-syscall_table[0xd1] = Entry('setxattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'const char *name'), Param('$r5', 'const void *value'), Param('$r6', 'size_t size'), Param('$r7', 'int flags')])
-syscall_table[0xd2] = Entry('lsetxattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'const char *name'), Param('$r5', 'const void *value'), Param('$r6', 'size_t size'), Param('$r7', 'int flags')])
-syscall_table[0xd3] = Entry('fsetxattr', [Param('$r3', 'int fd'), Param('$r4', 'const char *name'), Param('$r5', 'const void *value'), Param('$r6', 'size_t size'), Param('$r7', 'int flags')])
-syscall_table[0xd4] = Entry('getxattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'const char *name'), Param('$r5', 'void *value'), Param('$r6', 'size_t size')])
-syscall_table[0xd5] = Entry('lgetxattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'const char *name'), Param('$r5', 'void *value'), Param('$r6', 'size_t size')])
-syscall_table[0xd6] = Entry('fgetxattr', [Param('$r3', 'int fd'), Param('$r4', 'const char *name'), Param('$r5', 'void *value'), Param('$r6', 'size_t size')])
-syscall_table[0xd7] = Entry('listxattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'char *list'), Param('$r5', 'size_t size')])
-syscall_table[0xd8] = Entry('llistxattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'char *list'), Param('$r5', 'size_t size')])
-syscall_table[0xd9] = Entry('flistxattr', [Param('$r3', 'int fd'), Param('$r4', 'char *list'), Param('$r5', 'size_t size')])
-syscall_table[0xda] = Entry('removexattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'const char *name')])
-syscall_table[0xdb] = Entry('lremovexattr', [Param('$r3', 'const char *pathname'), Param('$r4', 'const char *name')])
-syscall_table[0xdc] = Entry('fremovexattr', [Param('$r3', 'int fd'), Param('$r4', 'const char *name')])
-syscall_table[0xdd] = Entry('futex', [Param('$r3', 'u32 *uaddr'), Param('$r4', 'int op'), Param('$r5', 'u32 val'), Param('$r6', 'struct timespec *utime'), Param('$r7', 'u32 *uaddr2'), Param('$r8', 'u32 val3')])
-syscall_table[0xde] = Entry('sched_setaffinity', [Param('$r3', 'pid_t pid'), Param('$r4', 'unsigned int len'), Param('$r5', 'unsigned long *user_mask_ptr')])
-syscall_table[0xdf] = Entry('sched_getaffinity', [Param('$r3', 'pid_t pid'), Param('$r4', 'unsigned int len'), Param('$r5', 'unsigned long *user_mask_ptr')])
-syscall_table[0xe2] = Entry('sendfile64', [Param('$r3', 'int out_fd'), Param('$r4', 'int in_fd'), Param('$r5', 'loff_t *offset'), Param('$r6', 'size_t count')])
-syscall_table[0xe3] = Entry('io_setup', [Param('$r3', 'unsigned nr_events'), Param('$r4', 'aio_context_t *ctxp')])
-syscall_table[0xe4] = Entry('io_destroy', [Param('$r3', 'aio_context_t ctx')])
-syscall_table[0xe5] = Entry('io_getevents', [Param('$r3', 'aio_context_t ctx_id'), Param('$r4', 'long min_nr'), Param('$r5', 'long nr'), Param('$r6', 'struct io_event *events'), Param('$r7', 'struct timespec *timeout')])
-syscall_table[0xe6] = Entry('io_submit', [Param('$r3', 'aio_context_t ctx_id'), Param('$r4', 'long nr'), Param('$r5', 'struct iocb * *iocbpp')])
-syscall_table[0xe7] = Entry('io_cancel', [Param('$r3', 'aio_context_t ctx_id'), Param('$r4', 'struct iocb *iocb'), Param('$r5', 'struct io_event *result')])
-syscall_table[0xe8] = Entry('set_tid_address', [Param('$r3', 'int *tidptr')])
-syscall_table[0xe9] = Entry('fadvise64', [Param('$r3', 'loff_t offset size_t len'), Param('$r4', 'int advice')])
-syscall_table[0xea] = Entry('exit_group', [Param('$r3', 'int error_code')])
-syscall_table[0xeb] = Entry('lookup_dcookie', [Param('$r3', 'char *buf size_t len')])
-syscall_table[0xec] = Entry('epoll_create', [Param('$r3', 'int size')])
-syscall_table[0xed] = Entry('epoll_ctl', [Param('$r3', 'int epfd'), Param('$r4', 'int op'), Param('$r5', 'int fd'), Param('$r6', 'struct epoll_event *event')])
-syscall_table[0xee] = Entry('epoll_wait', [Param('$r3', 'int epfd'), Param('$r4', 'struct epoll_event *events'), Param('$r5', 'int maxevents'), Param('$r6', 'int timeout')])
-syscall_table[0xef] = Entry('remap_file_pages', [Param('$r3', 'unsigned long start'), Param('$r4', 'unsigned long size'), Param('$r5', 'unsigned long prot'), Param('$r6', 'unsigned long pgoff'), Param('$r7', 'unsigned long flags')])
-syscall_table[0xf0] = Entry('timer_create', [Param('$r3', 'const clockid_t which_clock'), Param('$r4', 'struct sigevent *timer_event_spec'), Param('$r5', 'timer_t *created_timer_id')])
-syscall_table[0xf1] = Entry('timer_settime', [Param('$r3', 'timer_t timer_id'), Param('$r4', 'int flags'), Param('$r5', 'const struct itimerspec *new_setting'), Param('$r6', 'struct itimerspec *old_setting')])
-syscall_table[0xf2] = Entry('timer_gettime', [Param('$r3', 'timer_t timer_id'), Param('$r4', 'struct itimerspec *setting')])
-syscall_table[0xf3] = Entry('timer_getoverrun', [Param('$r3', 'timer_t timer_id')])
-syscall_table[0xf4] = Entry('timer_delete', [Param('$r3', 'timer_t timer_id')])
-syscall_table[0xf5] = Entry('clock_settime', [Param('$r3', 'const clockid_t which_clock'), Param('$r4', 'const struct timespec *tp')])
-syscall_table[0xf6] = Entry('clock_gettime', [Param('$r3', 'const clockid_t which_clock'), Param('$r4', 'struct timespec *tp')])
-syscall_table[0xf7] = Entry('clock_getres', [Param('$r3', 'const clockid_t which_clock'), Param('$r4', 'struct timespec *tp')])
-syscall_table[0xf8] = Entry('clock_nanosleep', [Param('$r3', 'const clockid_t which_clock'), Param('$r4', 'int flags'), Param('$r5', 'const struct timespec *rqtp'), Param('$r6', 'struct timespec *rmtp')])
-syscall_table[0xf9] = Entry('swapcontext', [Param('$r3', 'struct ucontext *old_ctx'), Param('$r4', 'struct ucontext *new_ctx'), Param('$r5', 'int ctx_size'), Param('$r6', 'int r6'), Param('$r7', 'int r7'), Param('$r8', 'int r8')])
-syscall_table[0xfa] = Entry('tgkill', [Param('$r3', 'pid_t tgid'), Param('$r4', 'pid_t pid'), Param('$r5', 'int sig')])
-syscall_table[0xfb] = Entry('utimes', [Param('$r3', 'char *filename'), Param('$r4', 'struct timeval *utimes')])
-syscall_table[0xfc] = Entry('statfs64', [Param('$r3', 'const char *pathname'), Param('$r4', 'size_t sz'), Param('$r5', 'struct statfs64 *buf')])
-syscall_table[0xfd] = Entry('fstatfs64', [Param('$r3', 'unsigned int fd'), Param('$r4', 'size_t sz'), Param('$r5', 'struct statfs64 *buf')])
-syscall_table[0xfe] = Entry('fadvise64_64', [Param('$r3', 'loff_t offset loff_t len'), Param('$r4', 'int advice')])
-syscall_table[0x102] = Entry('migrate_pages', [Param('$r3', 'pid_t pid'), Param('$r4', 'unsigned long maxnode'), Param('$r5', 'const unsigned long *old_nodes'), Param('$r6', 'const unsigned long *new_nodes')])
-syscall_table[0x103] = Entry('mbind', [Param('$r3', 'unsigned long start'), Param('$r4', 'unsigned long len'), Param('$r5', 'unsigned long mode'), Param('$r6', 'unsigned long *nmask'), Param('$r7', 'unsigned long maxnode'), Param('$r8', 'unsigned flags')])
-syscall_table[0x104] = Entry('get_mempolicy', [Param('$r3', 'int *policy'), Param('$r4', 'unsigned long *nmask'), Param('$r5', 'unsigned long maxnode'), Param('$r6', 'unsigned long addr'), Param('$r7', 'unsigned long flags')])
-syscall_table[0x105] = Entry('set_mempolicy', [Param('$r3', 'int mode'), Param('$r4', 'unsigned long *nmask'), Param('$r5', 'unsigned long maxnode')])
-syscall_table[0x106] = Entry('mq_open', [Param('$r3', 'const char *u_name'), Param('$r4', 'int oflag'), Param('$r5', 'umode_t mode'), Param('$r6', 'struct mq_attr *u_attr')])
-syscall_table[0x107] = Entry('mq_unlink', [Param('$r3', 'const char *u_name')])
-syscall_table[0x108] = Entry('mq_timedsend', [Param('$r3', 'mqd_t mqdes'), Param('$r4', 'const char *u_msg_ptr'), Param('$r5', 'size_t msg_len'), Param('$r6', 'unsigned int msg_prio'), Param('$r7', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x109] = Entry('mq_timedreceive', [Param('$r3', 'mqd_t mqdes'), Param('$r4', 'char *u_msg_ptr'), Param('$r5', 'size_t msg_len'), Param('$r6', 'unsigned int *u_msg_prio'), Param('$r7', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x10a] = Entry('mq_notify', [Param('$r3', 'mqd_t mqdes'), Param('$r4', 'const struct sigevent *u_notification')])
-syscall_table[0x10b] = Entry('mq_getsetattr', [Param('$r3', 'mqd_t mqdes'), Param('$r4', 'const struct mq_attr *u_mqstat'), Param('$r5', 'struct mq_attr *u_omqstat')])
-syscall_table[0x10c] = Entry('kexec_load', [Param('$r3', 'unsigned long entry'), Param('$r4', 'unsigned long nr_segments'), Param('$r5', 'struct kexec_segment *segments'), Param('$r6', 'unsigned long flags')])
-syscall_table[0x10d] = Entry('add_key', [Param('$r3', 'const char *_type'), Param('$r4', 'const char *_description'), Param('$r5', 'const void *_payload'), Param('$r6', 'size_t plen'), Param('$r7', 'key_serial_t ringid')])
-syscall_table[0x10e] = Entry('request_key', [Param('$r3', 'const char *_type'), Param('$r4', 'const char *_description'), Param('$r5', 'const char *_callout_info'), Param('$r6', 'key_serial_t destringid')])
-syscall_table[0x10f] = Entry('keyctl', [Param('$r3', 'int option'), Param('$r4', 'unsigned long arg2'), Param('$r5', 'unsigned long arg3'), Param('$r6', 'unsigned long arg4'), Param('$r7', 'unsigned long arg5')])
-syscall_table[0x110] = Entry('waitid', [Param('$r3', 'int which'), Param('$r4', 'pid_t upid'), Param('$r5', 'struct siginfo *infop'), Param('$r6', 'int options'), Param('$r7', 'struct rusage *ru')])
-syscall_table[0x111] = Entry('ioprio_set', [Param('$r3', 'int which'), Param('$r4', 'int who'), Param('$r5', 'int ioprio')])
-syscall_table[0x112] = Entry('ioprio_get', [Param('$r3', 'int which'), Param('$r4', 'int who')])
-syscall_table[0x113] = Entry('inotify_init', [])
-syscall_table[0x114] = Entry('inotify_add_watch', [Param('$r3', 'int fd'), Param('$r4', 'const char *pathname'), Param('$r5', 'u32 mask')])
-syscall_table[0x115] = Entry('inotify_rm_watch', [Param('$r3', 'int fd'), Param('$r4', '__s32 wd')])
-syscall_table[0x116] = Entry('spu_run', [Param('$r3', 'int fd'), Param('$r4', '__u32 *unpc'), Param('$r5', '__u32 *ustatus')])
-syscall_table[0x117] = Entry('spu_create', [Param('$r3', 'const char *name'), Param('$r4', 'unsigned int flags'), Param('$r5', 'umode_t mode'), Param('$r6', 'int neighbor_fd')])
-syscall_table[0x118] = Entry('pselect6', [Param('$r3', 'int n'), Param('$r4', 'fd_set *inp'), Param('$r5', 'fd_set *outp'), Param('$r6', 'fd_set *exp'), Param('$r7', 'struct timespec *tsp'), Param('$r8', 'void *sig')])
-syscall_table[0x119] = Entry('ppoll', [Param('$r3', 'struct pollfd *ufds'), Param('$r4', 'unsigned int nfds'), Param('$r5', 'struct timespec *tsp'), Param('$r6', 'const sigset_t *sigmask'), Param('$r7', 'size_t sigsetsize')])
-syscall_table[0x11a] = Entry('unshare', [Param('$r3', 'unsigned long unshare_flags')])
-syscall_table[0x11b] = Entry('splice', [Param('$r3', 'int fd_in'), Param('$r4', 'loff_t *off_in'), Param('$r5', 'int fd_out'), Param('$r6', 'loff_t *off_out'), Param('$r7', 'size_t len'), Param('$r8', 'unsigned int flags')])
-syscall_table[0x11c] = Entry('tee', [Param('$r3', 'int fdin'), Param('$r4', 'int fdout'), Param('$r5', 'size_t len'), Param('$r6', 'unsigned int flags')])
-syscall_table[0x11d] = Entry('vmsplice', [Param('$r3', 'int fd'), Param('$r4', 'const struct iovec *iov'), Param('$r5', 'unsigned long nr_segs'), Param('$r6', 'unsigned int flags')])
-syscall_table[0x11e] = Entry('openat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'int flags'), Param('$r6', 'umode_t mode')])
-syscall_table[0x11f] = Entry('mkdirat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *pathname'), Param('$r5', 'umode_t mode')])
-syscall_table[0x120] = Entry('mknodat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'umode_t mode'), Param('$r6', 'unsigned dev')])
-syscall_table[0x121] = Entry('fchownat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'uid_t user'), Param('$r6', 'gid_t group'), Param('$r7', 'int flag')])
-syscall_table[0x122] = Entry('futimesat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'struct timeval *utimes')])
-syscall_table[0x123] = Entry('fstatat64', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'struct stat64 *statbuf'), Param('$r6', 'int flag')])
-syscall_table[0x124] = Entry('unlinkat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *pathname'), Param('$r5', 'int flag')])
-syscall_table[0x125] = Entry('renameat', [Param('$r3', 'int olddfd'), Param('$r4', 'const char *oldname'), Param('$r5', 'int newdfd'), Param('$r6', 'const char *newname')])
-syscall_table[0x126] = Entry('linkat', [Param('$r3', 'int olddfd'), Param('$r4', 'const char *oldname'), Param('$r5', 'int newdfd'), Param('$r6', 'const char *newname'), Param('$r7', 'int flags')])
-syscall_table[0x127] = Entry('symlinkat', [Param('$r3', 'const char *oldname'), Param('$r4', 'int newdfd'), Param('$r5', 'const char *newname')])
-syscall_table[0x128] = Entry('readlinkat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *pathname'), Param('$r5', 'char *buf'), Param('$r6', 'int bufsiz')])
-syscall_table[0x129] = Entry('fchmodat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'umode_t mode')])
-syscall_table[0x12a] = Entry('faccessat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'int mode')])
-syscall_table[0x12b] = Entry('get_robust_list', [Param('$r3', 'int pid'), Param('$r4', 'struct robust_list_head * *head_ptr'), Param('$r5', 'size_t *len_ptr')])
-syscall_table[0x12c] = Entry('set_robust_list', [Param('$r3', 'struct robust_list_head *head'), Param('$r4', 'size_t len')])
-syscall_table[0x12d] = Entry('move_pages', [Param('$r3', 'pid_t pid'), Param('$r4', 'unsigned long nr_pages'), Param('$r5', 'const void * *pages'), Param('$r6', 'const int *nodes'), Param('$r7', 'int *status'), Param('$r8', 'int flags')])
-syscall_table[0x12e] = Entry('getcpu', [Param('$r3', 'unsigned *cpup'), Param('$r4', 'unsigned *nodep'), Param('$r5', 'struct getcpu_cache *unused')])
-syscall_table[0x12f] = Entry('epoll_pwait', [Param('$r3', 'int epfd'), Param('$r4', 'struct epoll_event *events'), Param('$r5', 'int maxevents'), Param('$r6', 'int timeout'), Param('$r7', 'const sigset_t *sigmask'), Param('$r8', 'size_t sigsetsize')])
-syscall_table[0x130] = Entry('utimensat', [Param('$r3', 'int dfd'), Param('$r4', 'const char *filename'), Param('$r5', 'struct timespec *utimes'), Param('$r6', 'int flags')])
-syscall_table[0x131] = Entry('signalfd', [Param('$r3', 'int ufd'), Param('$r4', 'sigset_t *user_mask'), Param('$r5', 'size_t sizemask')])
-syscall_table[0x132] = Entry('timerfd_create', [Param('$r3', 'int clockid'), Param('$r4', 'int flags')])
-syscall_table[0x133] = Entry('eventfd', [Param('$r3', 'unsigned int count')])
-syscall_table[0x134] = Entry('sync_file_range2', [Param('$r3', 'unsigned int flags loff_t offset'), Param('$r4', 'loff_t nbytes')])
-syscall_table[0x135] = Entry('fallocate', [Param('$r3', 'int mode loff_t offset'), Param('$r4', 'loff_t len')])
-syscall_table[0x136] = Entry('subpage_prot', [Param('$r3', 'unsigned long addr'), Param('$r4', 'unsigned long len'), Param('$r5', 'u32 *map')])
-syscall_table[0x137] = Entry('timerfd_settime', [Param('$r3', 'int ufd'), Param('$r4', 'int flags'), Param('$r5', 'const struct itimerspec *utmr'), Param('$r6', 'struct itimerspec *otmr')])
-syscall_table[0x138] = Entry('timerfd_gettime', [Param('$r3', 'int ufd'), Param('$r4', 'struct itimerspec *otmr')])
-syscall_table[0x139] = Entry('signalfd4', [Param('$r3', 'int ufd'), Param('$r4', 'sigset_t *user_mask'), Param('$r5', 'size_t sizemask'), Param('$r6', 'int flags')])
-syscall_table[0x13a] = Entry('eventfd2', [Param('$r3', 'unsigned int count'), Param('$r4', 'int flags')])
-syscall_table[0x13b] = Entry('epoll_create1', [Param('$r3', 'int flags')])
-syscall_table[0x13c] = Entry('dup3', [Param('$r3', 'unsigned int oldfd'), Param('$r4', 'unsigned int newfd'), Param('$r5', 'int flags')])
-syscall_table[0x13d] = Entry('pipe2', [Param('$r3', 'int *fildes'), Param('$r4', 'int flags')])
-syscall_table[0x13e] = Entry('inotify_init1', [Param('$r3', 'int flags')])
-syscall_table[0x13f] = Entry('perf_event_open', [Param('$r3', 'struct perf_event_attr *attr_uptr'), Param('$r4', 'pid_t pid'), Param('$r5', 'int cpu'), Param('$r6', 'int group_fd'), Param('$r7', 'unsigned long flags')])
-syscall_table[0x140] = Entry('preadv', [Param('$r3', 'unsigned long fd'), Param('$r4', 'const struct iovec *vec'), Param('$r5', 'unsigned long vlen'), Param('$r6', 'unsigned long pos_l'), Param('$r7', 'unsigned long pos_h')])
-syscall_table[0x141] = Entry('pwritev', [Param('$r3', 'unsigned long fd'), Param('$r4', 'const struct iovec *vec'), Param('$r5', 'unsigned long vlen'), Param('$r6', 'unsigned long pos_l'), Param('$r7', 'unsigned long pos_h')])
-syscall_table[0x142] = Entry('rt_tgsigqueueinfo', [Param('$r3', 'pid_t tgid'), Param('$r4', 'pid_t pid'), Param('$r5', 'int sig'), Param('$r6', 'siginfo_t *uinfo')])
-syscall_table[0x143] = Entry('fanotify_init', [Param('$r3', 'unsigned int flags'), Param('$r4', 'unsigned int event_f_flags')])
-syscall_table[0x144] = Entry('fanotify_mark', [Param('$r3', 'unsigned int flags __u64 mask'), Param('$r4', 'int dfd const char *pathname')])
-syscall_table[0x145] = Entry('prlimit64', [Param('$r3', 'pid_t pid'), Param('$r4', 'unsigned int resource'), Param('$r5', 'const struct rlimit64 *new_rlim'), Param('$r6', 'struct rlimit64 *old_rlim')])
-syscall_table[0x146] = Entry('socket', [Param('$r3', 'int family'), Param('$r4', 'int type'), Param('$r5', 'int protocol')])
-syscall_table[0x147] = Entry('bind', [Param('$r3', 'int fd'), Param('$r4', 'struct sockaddr *umyaddr'), Param('$r5', 'int addrlen')])
-syscall_table[0x148] = Entry('connect', [Param('$r3', 'int fd'), Param('$r4', 'struct sockaddr *uservaddr'), Param('$r5', 'int addrlen')])
-syscall_table[0x149] = Entry('listen', [Param('$r3', 'int fd'), Param('$r4', 'int backlog')])
-syscall_table[0x14a] = Entry('accept', [Param('$r3', 'int fd'), Param('$r4', 'struct sockaddr *upeer_sockaddr'), Param('$r5', 'int *upeer_addrlen')])
-syscall_table[0x14b] = Entry('getsockname', [Param('$r3', 'int fd'), Param('$r4', 'struct sockaddr *usockaddr'), Param('$r5', 'int *usockaddr_len')])
-syscall_table[0x14c] = Entry('getpeername', [Param('$r3', 'int fd'), Param('$r4', 'struct sockaddr *usockaddr'), Param('$r5', 'int *usockaddr_len')])
-syscall_table[0x14d] = Entry('socketpair', [Param('$r3', 'int family'), Param('$r4', 'int type'), Param('$r5', 'int protocol'), Param('$r6', 'int *usockvec')])
-syscall_table[0x14e] = Entry('send', [Param('$r3', 'int fd'), Param('$r4', 'void *buff'), Param('$r5', 'size_t len'), Param('$r6', 'unsigned int flags')])
-syscall_table[0x14f] = Entry('sendto', [Param('$r3', 'int fd'), Param('$r4', 'void *buff'), Param('$r5', 'size_t len'), Param('$r6', 'unsigned int flags'), Param('$r7', 'struct sockaddr *addr'), Param('$r8', 'int addr_len')])
-syscall_table[0x150] = Entry('recv', [Param('$r3', 'int fd'), Param('$r4', 'void *ubuf'), Param('$r5', 'size_t size'), Param('$r6', 'unsigned int flags')])
-syscall_table[0x151] = Entry('recvfrom', [Param('$r3', 'int fd'), Param('$r4', 'void *ubuf'), Param('$r5', 'size_t size'), Param('$r6', 'unsigned int flags'), Param('$r7', 'struct sockaddr *addr'), Param('$r8', 'int *addr_len')])
-syscall_table[0x152] = Entry('shutdown', [Param('$r3', 'int fd'), Param('$r4', 'int how')])
-syscall_table[0x153] = Entry('setsockopt', [Param('$r3', 'int fd'), Param('$r4', 'int level'), Param('$r5', 'int optname'), Param('$r6', 'char *optval'), Param('$r7', 'int optlen')])
-syscall_table[0x154] = Entry('getsockopt', [Param('$r3', 'int fd'), Param('$r4', 'int level'), Param('$r5', 'int optname'), Param('$r6', 'char *optval'), Param('$r7', 'int *optlen')])
-syscall_table[0x155] = Entry('sendmsg', [Param('$r3', 'int fd'), Param('$r4', 'struct msghdr *msg'), Param('$r5', 'unsigned int flags')])
-syscall_table[0x156] = Entry('recvmsg', [Param('$r3', 'int fd'), Param('$r4', 'struct msghdr *msg'), Param('$r5', 'unsigned int flags')])
-syscall_table[0x157] = Entry('recvmmsg', [Param('$r3', 'int fd'), Param('$r4', 'struct mmsghdr *mmsg'), Param('$r5', 'unsigned int vlen'), Param('$r6', 'unsigned int flags'), Param('$r7', 'struct timespec *timeout')])
-syscall_table[0x158] = Entry('accept4', [Param('$r3', 'int fd'), Param('$r4', 'struct sockaddr *upeer_sockaddr'), Param('$r5', 'int *upeer_addrlen'), Param('$r6', 'int flags')])
-syscall_table[0x159] = Entry('name_to_handle_at', [Param('$r3', 'int dfd'), Param('$r4', 'const char *name'), Param('$r5', 'struct file_handle *handle'), Param('$r6', 'int *mnt_id'), Param('$r7', 'int flag')])
-syscall_table[0x15a] = Entry('open_by_handle_at', [Param('$r3', 'int mountdirfd'), Param('$r4', 'struct file_handle *handle'), Param('$r5', 'int flags')])
-syscall_table[0x15b] = Entry('clock_adjtime', [Param('$r3', 'const clockid_t which_clock'), Param('$r4', 'struct timex *utx')])
-syscall_table[0x15c] = Entry('syncfs', [Param('$r3', 'int fd')])
-syscall_table[0x15d] = Entry('sendmmsg', [Param('$r3', 'int fd'), Param('$r4', 'struct mmsghdr *mmsg'), Param('$r5', 'unsigned int vlen'), Param('$r6', 'unsigned int flags')])
-syscall_table[0x15e] = Entry('setns', [Param('$r3', 'int fd'), Param('$r4', 'int nstype')])
-syscall_table[0x15f] = Entry('process_vm_readv', [Param('$r3', 'pid_t pid'), Param('$r4', 'const struct iovec *lvec'), Param('$r5', 'unsigned long liovcnt'), Param('$r6', 'const struct iovec *rvec'), Param('$r7', 'unsigned long riovcnt'), Param('$r8', 'unsigned long flags')])
-syscall_table[0x160] = Entry('process_vm_writev', [Param('$r3', 'pid_t pid'), Param('$r4', 'const struct iovec *lvec'), Param('$r5', 'unsigned long liovcnt'), Param('$r6', 'const struct iovec *rvec'), Param('$r7', 'unsigned long riovcnt'), Param('$r8', 'unsigned long flags')])
@@ -1,333 +0,0 @@
-from collections import namedtuple
-
-Entry = namedtuple('Entry', 'name params')
-Param = namedtuple('Param', 'reg param')
-
-syscall_table = {}
-syscall_table[0x00] = Entry('restart_syscall', [])
-syscall_table[0x01] = Entry('exit', [Param('$o0', 'int error_code')])
-syscall_table[0x02] = Entry('fork', [])
-syscall_table[0x03] = Entry('read', [Param('$o0', 'unsigned int fd'), Param('$o1', 'char *buf'), Param('$o2', 'size_t count')])
-syscall_table[0x04] = Entry('write', [Param('$o0', 'unsigned int fd'), Param('$o1', 'const char *buf'), Param('$o2', 'size_t count')])
-syscall_table[0x05] = Entry('open', [Param('$o0', 'const char *filename'), Param('$o1', 'int flags'), Param('$o2', 'umode_t mode')])
-syscall_table[0x06] = Entry('close', [Param('$o0', 'unsigned int fd')])
-syscall_table[0x07] = Entry('wait4', [Param('$o0', 'pid_t upid'), Param('$o1', 'int *stat_addr'), Param('$o2', 'int options'), Param('$o3', 'struct rusage *ru')])
-syscall_table[0x08] = Entry('creat', [Param('$o0', 'const char *pathname'), Param('$o1', 'umode_t mode')])
-syscall_table[0x09] = Entry('link', [Param('$o0', 'const char *oldname'), Param('$o1', 'const char *newname')])
-syscall_table[0x0a] = Entry('unlink', [Param('$o0', 'const char *pathname')])
-syscall_table[0x0c] = Entry('chdir', [Param('$o0', 'const char *filename')])
-syscall_table[0x0d] = Entry('chown', [Param('$o0', 'const char *filename'), Param('$o1', 'uid_t user'), Param('$o2', 'gid_t group')])
-syscall_table[0x0e] = Entry('mknod', [Param('$o0', 'const char *filename'), Param('$o1', 'umode_t mode'), Param('$o2', 'unsigned dev')])
-syscall_table[0x0f] = Entry('chmod', [Param('$o0', 'const char *filename'), Param('$o1', 'umode_t mode')])
-syscall_table[0x10] = Entry('lchown', [Param('$o0', 'const char *filename'), Param('$o1', 'uid_t user'), Param('$o2', 'gid_t group')])
-syscall_table[0x11] = Entry('brk', [Param('$o0', 'unsigned long brk')])
-syscall_table[0x13] = Entry('lseek', [Param('$o0', 'unsigned int fd'), Param('$o1', 'off_t offset'), Param('$o2', 'unsigned int origin')])
-syscall_table[0x14] = Entry('getpid', [])
-syscall_table[0x15] = Entry('capget', [Param('$o0', 'cap_user_header_t header'), Param('$o1', 'cap_user_data_t dataptr')])
-syscall_table[0x16] = Entry('capset', [Param('$o0', 'cap_user_header_t header'), Param('$o1', 'const cap_user_data_t data')])
-syscall_table[0x17] = Entry('setuid', [Param('$o0', 'uid_t uid')])
-syscall_table[0x18] = Entry('getuid', [])
-syscall_table[0x19] = Entry('vmsplice', [Param('$o0', 'int fd'), Param('$o1', 'const struct iovec *iov'), Param('$o2', 'unsigned long nr_segs'), Param('$o3', 'unsigned int flags')])
-syscall_table[0x1a] = Entry('ptrace', [Param('$o0', 'long request'), Param('$o1', 'long pid'), Param('$o2', 'unsigned long addr'), Param('$o3', 'unsigned long data')])
-syscall_table[0x1b] = Entry('alarm', [Param('$o0', 'unsigned int seconds')])
-syscall_table[0x1c] = Entry('sigaltstack', [Param('$o0', 'const stack_t *uss'), Param('$o1', 'stack_t *uoss')])
-syscall_table[0x1d] = Entry('pause', [])
-syscall_table[0x1e] = Entry('utime', [Param('$o0', 'char *filename'), Param('$o1', 'struct utimbuf *times')])
-syscall_table[0x1f] = Entry('lchown32', [Param('$o0', 'const char *filename'), Param('$o1', 'uid_t user'), Param('$o2', 'gid_t group')])
-syscall_table[0x20] = Entry('fchown32', [Param('$o0', 'unsigned int fd'), Param('$o1', 'uid_t user'), Param('$o2', 'gid_t group')])
-syscall_table[0x21] = Entry('access', [Param('$o0', 'const char *filename'), Param('$o1', 'int mode')])
-syscall_table[0x22] = Entry('nice', [Param('$o0', 'int increment')])
-syscall_table[0x23] = Entry('chown32', [Param('$o0', 'const char *filename'), Param('$o1', 'uid_t user'), Param('$o2', 'gid_t group')])
-syscall_table[0x24] = Entry('sync', [])
-syscall_table[0x25] = Entry('kill', [Param('$o0', 'pid_t pid'), Param('$o1', 'int sig')])
-syscall_table[0x26] = Entry('stat', [Param('$o0', 'const char *filename'), Param('$o1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x27] = Entry('sendfile', [Param('$o0', 'int out_fd'), Param('$o1', 'int in_fd'), Param('$o2', 'off_t *offset'), Param('$o3', 'size_t count')])
-syscall_table[0x28] = Entry('lstat', [Param('$o0', 'const char *filename'), Param('$o1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x29] = Entry('dup', [Param('$o0', 'unsigned int fildes')])
-syscall_table[0x2a] = Entry('pipe', [Param('$o0', 'int *fildes')])
-syscall_table[0x2b] = Entry('times', [Param('$o0', 'struct tms *tbuf')])
-syscall_table[0x2c] = Entry('getuid32', [])
-syscall_table[0x2d] = Entry('umount2', [Param('$o0', 'char *name'), Param('$o1', 'int flags')])
-syscall_table[0x2e] = Entry('setgid', [Param('$o0', 'gid_t gid')])
-syscall_table[0x2f] = Entry('getgid', [])
-syscall_table[0x30] = Entry('signal', [Param('$o0', 'int sig'), Param('$o1', '__sighandler_t handler')])
-syscall_table[0x31] = Entry('geteuid', [])
-syscall_table[0x32] = Entry('getegid', [])
-syscall_table[0x33] = Entry('acct', [Param('$o0', 'const char *name')])
-syscall_table[0x35] = Entry('getgid32', [])
-syscall_table[0x36] = Entry('ioctl', [Param('$o0', 'unsigned int fd'), Param('$o1', 'unsigned int cmd'), Param('$o2', 'unsigned long arg')])
-syscall_table[0x37] = Entry('reboot', [Param('$o0', 'int magic1'), Param('$o1', 'int magic2'), Param('$o2', 'unsigned int cmd'), Param('$o3', 'void *arg')])
-syscall_table[0x38] = Entry('mmap2', [Param('$o0', 'unsigned long addr'), Param('$o1', 'unsigned long len'), Param('$o2', 'unsigned long prot'), Param('$o3', 'unsigned long flags'), Param('$o4', 'unsigned long fd'), Param('$o5', 'unsigned long pgoff')])
-syscall_table[0x39] = Entry('symlink', [Param('$o0', 'const char *oldname'), Param('$o1', 'const char *newname')])
-syscall_table[0x3a] = Entry('readlink', [Param('$o0', 'const char *path'), Param('$o1', 'char *buf'), Param('$o2', 'int bufsiz')])
-syscall_table[0x3b] = Entry('execve', [Param('$o0', 'const char *name'), Param('$o1', 'const char *const *argv'), Param('$o2', 'const char *const *envp')])
-syscall_table[0x3c] = Entry('umask', [Param('$o0', 'int mask')])
-syscall_table[0x3d] = Entry('chroot', [Param('$o0', 'const char *filename')])
-syscall_table[0x3e] = Entry('fstat', [Param('$o0', 'unsigned int fd'), Param('$o1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x3f] = Entry('fstat64', [Param('$o0', 'unsigned long fd'), Param('$o1', 'struct stat64 *statbuf')])
-syscall_table[0x40] = Entry('getpagesize', [Param('$o0', 'void')])
-syscall_table[0x41] = Entry('msync', [Param('$o0', 'unsigned long start'), Param('$o1', 'size_t len'), Param('$o2', 'int flags')])
-syscall_table[0x42] = Entry('vfork', [])
-syscall_table[0x43] = Entry('pread64', [Param('$o0', 'char *buf size_t count'), Param('$o1', 'loff_t pos')])
-syscall_table[0x44] = Entry('pwrite64', [Param('$o0', 'const char *buf size_t count'), Param('$o1', 'loff_t pos')])
-syscall_table[0x45] = Entry('geteuid32', [])
-syscall_table[0x46] = Entry('getegid32', [])
-syscall_table[0x47] = Entry('mmap', [Param('$o0', 'unsigned long addr'), Param('$o1', 'unsigned long len'), Param('$o2', 'unsigned long prot'), Param('$o3', 'unsigned long flags'), Param('$o4', 'unsigned long fd'), Param('$o5', 'unsigned long off')])
-syscall_table[0x48] = Entry('setreuid32', [Param('$o0', 'uid_t ruid'), Param('$o1', 'uid_t euid')])
-syscall_table[0x49] = Entry('munmap', [Param('$o0', 'unsigned long addr'), Param('$o1', 'size_t len')])
-syscall_table[0x4a] = Entry('mprotect', [Param('$o0', 'unsigned long start'), Param('$o1', 'size_t len'), Param('$o2', 'unsigned long prot')])
-syscall_table[0x4b] = Entry('madvise', [Param('$o0', 'unsigned long start'), Param('$o1', 'size_t len_in'), Param('$o2', 'int behavior')])
-syscall_table[0x4c] = Entry('vhangup', [])
-syscall_table[0x4d] = Entry('truncate64', [Param('$o0', 'loff_t length')])
-syscall_table[0x4e] = Entry('mincore', [Param('$o0', 'unsigned long start'), Param('$o1', 'size_t len'), Param('$o2', 'unsigned char *vec')])
-syscall_table[0x4f] = Entry('getgroups', [Param('$o0', 'int gidsetsize'), Param('$o1', 'gid_t *grouplist')])
-syscall_table[0x50] = Entry('setgroups', [Param('$o0', 'int gidsetsize'), Param('$o1', 'gid_t *grouplist')])
-syscall_table[0x51] = Entry('getpgrp', [])
-syscall_table[0x52] = Entry('setgroups32', [Param('$o0', 'int gidsetsize'), Param('$o1', 'gid_t *grouplist')])
-syscall_table[0x53] = Entry('setitimer', [Param('$o0', 'int which'), Param('$o1', 'struct itimerval *value'), Param('$o2', 'struct itimerval *ovalue')])
-syscall_table[0x54] = Entry('ftruncate64', [Param('$o0', 'loff_t length')])
-syscall_table[0x55] = Entry('swapon', [Param('$o0', 'const char *specialfile'), Param('$o1', 'int swap_flags')])
-syscall_table[0x56] = Entry('getitimer', [Param('$o0', 'int which'), Param('$o1', 'struct itimerval *value')])
-syscall_table[0x57] = Entry('setuid32', [Param('$o0', 'uid_t uid')])
-syscall_table[0x58] = Entry('sethostname', [Param('$o0', 'char *name'), Param('$o1', 'int len')])
-syscall_table[0x59] = Entry('setgid32', [Param('$o0', 'gid_t gid')])
-syscall_table[0x5a] = Entry('dup2', [Param('$o0', 'unsigned int oldfd'), Param('$o1', 'unsigned int newfd')])
-syscall_table[0x5b] = Entry('setfsuid32', [Param('$o0', 'uid_t uid')])
-syscall_table[0x5c] = Entry('fcntl', [Param('$o0', 'unsigned int fd'), Param('$o1', 'unsigned int cmd'), Param('$o2', 'unsigned long arg')])
-syscall_table[0x5d] = Entry('select', [Param('$o0', 'int n'), Param('$o1', 'fd_set *inp'), Param('$o2', 'fd_set *outp'), Param('$o3', 'fd_set *exp'), Param('$o4', 'struct timeval *tvp')])
-syscall_table[0x5e] = Entry('setfsgid32', [Param('$o0', 'gid_t gid')])
-syscall_table[0x5f] = Entry('fsync', [Param('$o0', 'unsigned int fd')])
-syscall_table[0x60] = Entry('setpriority', [Param('$o0', 'int which'), Param('$o1', 'int who'), Param('$o2', 'int niceval')])
-syscall_table[0x61] = Entry('socket', [Param('$o0', 'int family'), Param('$o1', 'int type'), Param('$o2', 'int protocol')])
-syscall_table[0x62] = Entry('connect', [Param('$o0', 'int fd'), Param('$o1', 'struct sockaddr *uservaddr'), Param('$o2', 'int addrlen')])
-syscall_table[0x63] = Entry('accept', [Param('$o0', 'int fd'), Param('$o1', 'struct sockaddr *upeer_sockaddr'), Param('$o2', 'int *upeer_addrlen')])
-syscall_table[0x64] = Entry('getpriority', [Param('$o0', 'int which'), Param('$o1', 'int who')])
-syscall_table[0x65] = Entry('rt_sigreturn', [])
-syscall_table[0x66] = Entry('rt_sigaction', [Param('$o0', 'int sig'), Param('$o1', 'const struct sigaction *act'), Param('$o2', 'struct sigaction *oact'), Param('$o3', 'size_t sigsetsize')])
-syscall_table[0x67] = Entry('rt_sigprocmask', [Param('$o0', 'int how'), Param('$o1', 'sigset_t *nset'), Param('$o2', 'sigset_t *oset'), Param('$o3', 'size_t sigsetsize')])
-syscall_table[0x68] = Entry('rt_sigpending', [Param('$o0', 'sigset_t *set'), Param('$o1', 'size_t sigsetsize')])
-syscall_table[0x69] = Entry('rt_sigtimedwait', [Param('$o0', 'const sigset_t *uthese'), Param('$o1', 'siginfo_t *uinfo'), Param('$o2', 'const struct timespec *uts'), Param('$o3', 'size_t sigsetsize')])
-syscall_table[0x6a] = Entry('rt_sigqueueinfo', [Param('$o0', 'pid_t pid'), Param('$o1', 'int sig'), Param('$o2', 'siginfo_t *uinfo')])
-syscall_table[0x6b] = Entry('rt_sigsuspend', [Param('$o0', 'sigset_t *unewset'), Param('$o1', 'size_t sigsetsize')])
-syscall_table[0x6c] = Entry('setresuid32', [Param('$o0', 'uid_t ruid'), Param('$o1', 'uid_t euid'), Param('$o2', 'uid_t suid')])
-syscall_table[0x6d] = Entry('getresuid32', [Param('$o0', 'uid_t *ruidp'), Param('$o1', 'uid_t *euidp'), Param('$o2', 'uid_t *suidp')])
-syscall_table[0x6e] = Entry('setresgid32', [Param('$o0', 'gid_t rgid'), Param('$o1', 'gid_t egid'), Param('$o2', 'gid_t sgid')])
-syscall_table[0x6f] = Entry('getresgid32', [Param('$o0', 'gid_t *rgidp'), Param('$o1', 'gid_t *egidp'), Param('$o2', 'gid_t *sgidp')])
-syscall_table[0x70] = Entry('setregid32', [Param('$o0', 'gid_t rgid'), Param('$o1', 'gid_t egid')])
-syscall_table[0x71] = Entry('recvmsg', [Param('$o0', 'int fd'), Param('$o1', 'struct msghdr *msg'), Param('$o2', 'unsigned int flags')])
-syscall_table[0x72] = Entry('sendmsg', [Param('$o0', 'int fd'), Param('$o1', 'struct msghdr *msg'), Param('$o2', 'unsigned int flags')])
-syscall_table[0x73] = Entry('getgroups32', [Param('$o0', 'int gidsetsize'), Param('$o1', 'gid_t *grouplist')])
-syscall_table[0x74] = Entry('gettimeofday', [Param('$o0', 'struct timeval *tv'), Param('$o1', 'struct timezone *tz')])
-syscall_table[0x75] = Entry('getrusage', [Param('$o0', 'int who'), Param('$o1', 'struct rusage *ru')])
-syscall_table[0x76] = Entry('getsockopt', [Param('$o0', 'int fd'), Param('$o1', 'int level'), Param('$o2', 'int optname'), Param('$o3', 'char *optval'), Param('$o4', 'int *optlen')])
-syscall_table[0x77] = Entry('getcwd', [Param('$o0', 'char *buf'), Param('$o1', 'unsigned long size')])
-syscall_table[0x78] = Entry('readv', [Param('$o0', 'unsigned long fd'), Param('$o1', 'const struct iovec *vec'), Param('$o2', 'unsigned long vlen')])
-syscall_table[0x79] = Entry('writev', [Param('$o0', 'unsigned long fd'), Param('$o1', 'const struct iovec *vec'), Param('$o2', 'unsigned long vlen')])
-syscall_table[0x7a] = Entry('settimeofday', [Param('$o0', 'struct timeval *tv'), Param('$o1', 'struct timezone *tz')])
-syscall_table[0x7b] = Entry('fchown', [Param('$o0', 'unsigned int fd'), Param('$o1', 'uid_t user'), Param('$o2', 'gid_t group')])
-syscall_table[0x7c] = Entry('fchmod', [Param('$o0', 'unsigned int fd'), Param('$o1', 'umode_t mode')])
-syscall_table[0x7d] = Entry('recvfrom', [Param('$o0', 'int fd'), Param('$o1', 'void *ubuf'), Param('$o2', 'size_t size'), Param('$o3', 'unsigned int flags'), Param('$o4', 'struct sockaddr *addr'), Param('$o5', 'int *addr_len')])
-syscall_table[0x7e] = Entry('setreuid', [Param('$o0', 'uid_t ruid'), Param('$o1', 'uid_t euid')])
-syscall_table[0x7f] = Entry('setregid', [Param('$o0', 'gid_t rgid'), Param('$o1', 'gid_t egid')])
-syscall_table[0x80] = Entry('rename', [Param('$o0', 'const char *oldname'), Param('$o1', 'const char *newname')])
-syscall_table[0x81] = Entry('truncate', [Param('$o0', 'const char *path'), Param('$o1', 'long length')])
-syscall_table[0x82] = Entry('ftruncate', [Param('$o0', 'unsigned int fd'), Param('$o1', 'unsigned long length')])
-syscall_table[0x83] = Entry('flock', [Param('$o0', 'unsigned int fd'), Param('$o1', 'unsigned int cmd')])
-syscall_table[0x84] = Entry('lstat64', [Param('$o0', 'const char *filename'), Param('$o1', 'struct stat64 *statbuf')])
-syscall_table[0x85] = Entry('sendto', [Param('$o0', 'int fd'), Param('$o1', 'void *buff'), Param('$o2', 'size_t len'), Param('$o3', 'unsigned int flags'), Param('$o4', 'struct sockaddr *addr'), Param('$o5', 'int addr_len')])
-syscall_table[0x86] = Entry('shutdown', [Param('$o0', 'int fd'), Param('$o1', 'int how')])
-syscall_table[0x87] = Entry('socketpair', [Param('$o0', 'int family'), Param('$o1', 'int type'), Param('$o2', 'int protocol'), Param('$o3', 'int *usockvec')])
-syscall_table[0x88] = Entry('mkdir', [Param('$o0', 'const char *pathname'), Param('$o1', 'umode_t mode')])
-syscall_table[0x89] = Entry('rmdir', [Param('$o0', 'const char *pathname')])
-syscall_table[0x8a] = Entry('utimes', [Param('$o0', 'char *filename'), Param('$o1', 'struct timeval *utimes')])
-syscall_table[0x8b] = Entry('stat64', [Param('$o0', 'const char *filename'), Param('$o1', 'struct stat64 *statbuf')])
-syscall_table[0x8c] = Entry('sendfile64', [Param('$o0', 'int out_fd'), Param('$o1', 'int in_fd'), Param('$o2', 'loff_t *offset'), Param('$o3', 'size_t count')])
-syscall_table[0x8d] = Entry('getpeername', [Param('$o0', 'int fd'), Param('$o1', 'struct sockaddr *usockaddr'), Param('$o2', 'int *usockaddr_len')])
-syscall_table[0x8e] = Entry('futex', [Param('$o0', 'u32 *uaddr'), Param('$o1', 'int op'), Param('$o2', 'u32 val'), Param('$o3', 'struct timespec *utime'), Param('$o4', 'u32 *uaddr2'), Param('$o5', 'u32 val3')])
-syscall_table[0x8f] = Entry('gettid', [])
-syscall_table[0x90] = Entry('getrlimit', [Param('$o0', 'unsigned int resource'), Param('$o1', 'struct rlimit *rlim')])
-syscall_table[0x91] = Entry('setrlimit', [Param('$o0', 'unsigned int resource'), Param('$o1', 'struct rlimit *rlim')])
-syscall_table[0x92] = Entry('pivot_root', [Param('$o0', 'const char *new_root'), Param('$o1', 'const char *put_old')])
-syscall_table[0x93] = Entry('prctl', [Param('$o0', 'int option'), Param('$o1', 'unsigned long arg2'), Param('$o2', 'unsigned long arg3'), Param('$o3', 'unsigned long arg4'), Param('$o4', 'unsigned long arg5')])
-syscall_table[0x94] = Entry('pciconfig_read', [Param('$o0', 'unsigned long bus'), Param('$o1', 'unsigned long dfn'), Param('$o2', 'unsigned long off'), Param('$o3', 'unsigned long len'), Param('$o4', 'void *buf')])
-syscall_table[0x95] = Entry('pciconfig_write', [Param('$o0', 'unsigned long bus'), Param('$o1', 'unsigned long dfn'), Param('$o2', 'unsigned long off'), Param('$o3', 'unsigned long len'), Param('$o4', 'void *buf')])
-syscall_table[0x96] = Entry('getsockname', [Param('$o0', 'int fd'), Param('$o1', 'struct sockaddr *usockaddr'), Param('$o2', 'int *usockaddr_len')])
-syscall_table[0x97] = Entry('inotify_init', [])
-syscall_table[0x98] = Entry('inotify_add_watch', [Param('$o0', 'int fd'), Param('$o1', 'const char *pathname'), Param('$o2', 'u32 mask')])
-syscall_table[0x99] = Entry('poll', [Param('$o0', 'struct pollfd *ufds'), Param('$o1', 'unsigned int nfds'), Param('$o2', 'int timeout_msecs')])
-syscall_table[0x9a] = Entry('getdents64', [Param('$o0', 'unsigned int fd'), Param('$o1', 'struct linux_dirent64 *dirent'), Param('$o2', 'unsigned int count')])
-syscall_table[0x9b] = Entry('fcntl64', [Param('$o0', 'unsigned int fd'), Param('$o1', 'unsigned int cmd'), Param('$o2', 'unsigned long arg')])
-syscall_table[0x9c] = Entry('inotify_rm_watch', [Param('$o0', 'int fd'), Param('$o1', '__s32 wd')])
-syscall_table[0x9d] = Entry('statfs', [Param('$o0', 'const char *pathname'), Param('$o1', 'struct statfs *buf')])
-syscall_table[0x9e] = Entry('fstatfs', [Param('$o0', 'unsigned int fd'), Param('$o1', 'struct statfs *buf')])
-syscall_table[0x9f] = Entry('umount', [Param('$o0', 'char *name'), Param('$o1', 'int flags')])
-syscall_table[0xa2] = Entry('getdomainname', [Param('$o0', 'char *name'), Param('$o1', 'int len')])
-syscall_table[0xa3] = Entry('setdomainname', [Param('$o0', 'char *name'), Param('$o1', 'int len')])
-syscall_table[0xa5] = Entry('quotactl', [Param('$o0', 'unsigned int cmd'), Param('$o1', 'const char *special'), Param('$o2', 'qid_t id'), Param('$o3', 'void *addr')])
-syscall_table[0xa6] = Entry('set_tid_address', [Param('$o0', 'int *tidptr')])
-syscall_table[0xa7] = Entry('mount', [Param('$o0', 'char *dev_name'), Param('$o1', 'char *dir_name'), Param('$o2', 'char *type'), Param('$o3', 'unsigned long flags'), Param('$o4', 'void *data')])
-syscall_table[0xa8] = Entry('ustat', [Param('$o0', 'unsigned dev'), Param('$o1', 'struct ustat *ubuf')])
-syscall_table[0xa9] = Entry('setxattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'const char *name'), Param('$o2', 'const void *value'), Param('$o3', 'size_t size'), Param('$o4', 'int flags')])
-syscall_table[0xaa] = Entry('lsetxattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'const char *name'), Param('$o2', 'const void *value'), Param('$o3', 'size_t size'), Param('$o4', 'int flags')])
-syscall_table[0xab] = Entry('fsetxattr', [Param('$o0', 'int fd'), Param('$o1', 'const char *name'), Param('$o2', 'const void *value'), Param('$o3', 'size_t size'), Param('$o4', 'int flags')])
-syscall_table[0xac] = Entry('getxattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'const char *name'), Param('$o2', 'void *value'), Param('$o3', 'size_t size')])
-syscall_table[0xad] = Entry('lgetxattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'const char *name'), Param('$o2', 'void *value'), Param('$o3', 'size_t size')])
-syscall_table[0xae] = Entry('getdents', [Param('$o0', 'unsigned int fd'), Param('$o1', 'struct linux_dirent *dirent'), Param('$o2', 'unsigned int count')])
-syscall_table[0xaf] = Entry('setsid', [])
-syscall_table[0xb0] = Entry('fchdir', [Param('$o0', 'unsigned int fd')])
-syscall_table[0xb1] = Entry('fgetxattr', [Param('$o0', 'int fd'), Param('$o1', 'const char *name'), Param('$o2', 'void *value'), Param('$o3', 'size_t size')])
-syscall_table[0xb2] = Entry('listxattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'char *list'), Param('$o2', 'size_t size')])
-syscall_table[0xb3] = Entry('llistxattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'char *list'), Param('$o2', 'size_t size')])
-syscall_table[0xb4] = Entry('flistxattr', [Param('$o0', 'int fd'), Param('$o1', 'char *list'), Param('$o2', 'size_t size')])
-syscall_table[0xb5] = Entry('removexattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'const char *name')])
-syscall_table[0xb6] = Entry('lremovexattr', [Param('$o0', 'const char *pathname'), Param('$o1', 'const char *name')])
-syscall_table[0xb7] = Entry('sigpending', [Param('$o0', 'old_sigset_t *set')])
-syscall_table[0xb9] = Entry('setpgid', [Param('$o0', 'pid_t pid'), Param('$o1', 'pid_t pgid')])
-syscall_table[0xba] = Entry('fremovexattr', [Param('$o0', 'int fd'), Param('$o1', 'const char *name')])
-syscall_table[0xbb] = Entry('tkill', [Param('$o0', 'pid_t pid'), Param('$o1', 'int sig')])
-syscall_table[0xbc] = Entry('exit_group', [Param('$o0', 'int error_code')])
-syscall_table[0xbd] = Entry('uname', [Param('$o0', 'struct old_utsname *name')])
-syscall_table[0xbe] = Entry('init_module', [Param('$o0', 'void *umod'), Param('$o1', 'unsigned long len'), Param('$o2', 'const char *uargs')])
-syscall_table[0xbf] = Entry('personality', [Param('$o0', 'unsigned int personality')])
-syscall_table[0xc0] = Entry('remap_file_pages', [Param('$o0', 'unsigned long start'), Param('$o1', 'unsigned long size'), Param('$o2', 'unsigned long prot'), Param('$o3', 'unsigned long pgoff'), Param('$o4', 'unsigned long flags')])
-syscall_table[0xc1] = Entry('epoll_create', [Param('$o0', 'int size')])
-syscall_table[0xc2] = Entry('epoll_ctl', [Param('$o0', 'int epfd'), Param('$o1', 'int op'), Param('$o2', 'int fd'), Param('$o3', 'struct epoll_event *event')])
-syscall_table[0xc3] = Entry('epoll_wait', [Param('$o0', 'int epfd'), Param('$o1', 'struct epoll_event *events'), Param('$o2', 'int maxevents'), Param('$o3', 'int timeout')])
-syscall_table[0xc4] = Entry('ioprio_set', [Param('$o0', 'int which'), Param('$o1', 'int who'), Param('$o2', 'int ioprio')])
-syscall_table[0xc5] = Entry('getppid', [])
-syscall_table[0xc7] = Entry('sgetmask', [])
-syscall_table[0xc8] = Entry('ssetmask', [Param('$o0', 'int newmask')])
-syscall_table[0xc9] = Entry('sigsuspend', [Param('$o0', 'old_sigset_t set')])
-syscall_table[0xca] = Entry('oldlstat', [Param('$o0', 'const char *filename'), Param('$o1', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0xcb] = Entry('uselib', [Param('$o0', 'const char *library')])
-syscall_table[0xcc] = Entry('readdir', [Param('$o0', 'unsigned int fd'), Param('$o1', 'struct old_linux_dirent *dirent'), Param('$o2', 'unsigned int count')])
-syscall_table[0xcd] = Entry('readahead', [Param('$o0', 'loff_t offset size_t count')])
-syscall_table[0xce] = Entry('socketcall', [Param('$o0', 'int call'), Param('$o1', 'unsigned long *args')])
-syscall_table[0xcf] = Entry('syslog', [Param('$o0', 'int type'), Param('$o1', 'char *buf'), Param('$o2', 'int len')])
-syscall_table[0xd0] = Entry('lookup_dcookie', [Param('$o0', 'char *buf size_t len')])
-syscall_table[0xd1] = Entry('fadvise64', [Param('$o0', 'loff_t offset size_t len'), Param('$o1', 'int advice')])
-syscall_table[0xd2] = Entry('fadvise64_64', [Param('$o0', 'loff_t offset loff_t len'), Param('$o1', 'int advice')])
-syscall_table[0xd3] = Entry('tgkill', [Param('$o0', 'pid_t tgid'), Param('$o1', 'pid_t pid'), Param('$o2', 'int sig')])
-syscall_table[0xd4] = Entry('waitpid', [Param('$o0', 'pid_t pid'), Param('$o1', 'int *stat_addr'), Param('$o2', 'int options')])
-syscall_table[0xd5] = Entry('swapoff', [Param('$o0', 'const char *specialfile')])
-syscall_table[0xd6] = Entry('sysinfo', [Param('$o0', 'struct sysinfo *info')])
-syscall_table[0xd7] = Entry('ipc', [Param('$o0', 'unsigned int call'), Param('$o1', 'int first'), Param('$o2', 'unsigned long second'), Param('$o3', 'unsigned long third'), Param('$o4', 'void *ptr'), Param('$o5', 'long fifth')])
-syscall_table[0xd8] = Entry('sigreturn', [])
-syscall_table[0xd9] = Entry('clone', [Param('$o0', 'unsigned long clone_flags'), Param('$o1', 'unsigned long newsp'), Param('$o2', 'void *parent_tid'), Param('$o3', 'void *child_tid')])
-syscall_table[0xda] = Entry('ioprio_get', [Param('$o0', 'int which'), Param('$o1', 'int who')])
-syscall_table[0xdb] = Entry('adjtimex', [Param('$o0', 'struct timex *txc_p')])
-syscall_table[0xdc] = Entry('sigprocmask', [Param('$o0', 'int how'), Param('$o1', 'old_sigset_t *nset'), Param('$o2', 'old_sigset_t *oset')])
-syscall_table[0xde] = Entry('delete_module', [Param('$o0', 'const char *name_user'), Param('$o1', 'unsigned int flags')])
-syscall_table[0xe0] = Entry('getpgid', [Param('$o0', 'pid_t pid')])
-syscall_table[0xe1] = Entry('bdflush', [Param('$o0', 'int func'), Param('$o1', 'long data')])
-syscall_table[0xe2] = Entry('sysfs', [Param('$o0', 'int option'), Param('$o1', 'unsigned long arg1'), Param('$o2', 'unsigned long arg2')])
-syscall_table[0xe4] = Entry('setfsuid', [Param('$o0', 'uid_t uid')])
-syscall_table[0xe5] = Entry('setfsgid', [Param('$o0', 'gid_t gid')])
-syscall_table[0xe6] = Entry('_newselect', [Param('$o0', 'int n'), Param('$o1', 'fd_set *inp'), Param('$o2', 'fd_set *outp'), Param('$o3', 'fd_set *exp'), Param('$o4', 'struct timeval *tvp')])
-syscall_table[0xe7] = Entry('time', [Param('$o0', 'time_t *tloc')])
-syscall_table[0xe8] = Entry('splice', [Param('$o0', 'int fd_in'), Param('$o1', 'loff_t *off_in'), Param('$o2', 'int fd_out'), Param('$o3', 'loff_t *off_out'), Param('$o4', 'size_t len'), Param('$o5', 'unsigned int flags')])
-syscall_table[0xe9] = Entry('stime', [Param('$o0', 'time_t *tptr')])
-syscall_table[0xea] = Entry('statfs64', [Param('$o0', 'const char *pathname'), Param('$o1', 'size_t sz'), Param('$o2', 'struct statfs64 *buf')])
-syscall_table[0xeb] = Entry('fstatfs64', [Param('$o0', 'unsigned int fd'), Param('$o1', 'size_t sz'), Param('$o2', 'struct statfs64 *buf')])
-syscall_table[0xec] = Entry('_llseek', [Param('$o0', 'unsigned int fd'), Param('$o1', 'unsigned long offset_high'), Param('$o2', 'unsigned long offset_low'), Param('$o3', 'loff_t *result'), Param('$o4', 'unsigned int origin')])
-syscall_table[0xed] = Entry('mlock', [Param('$o0', 'unsigned long start'), Param('$o1', 'size_t len')])
-syscall_table[0xee] = Entry('munlock', [Param('$o0', 'unsigned long start'), Param('$o1', 'size_t len')])
-syscall_table[0xef] = Entry('mlockall', [Param('$o0', 'int flags')])
-syscall_table[0xf0] = Entry('munlockall', [])
-syscall_table[0xf1] = Entry('sched_setparam', [Param('$o0', 'pid_t pid'), Param('$o1', 'struct sched_param *param')])
-syscall_table[0xf2] = Entry('sched_getparam', [Param('$o0', 'pid_t pid'), Param('$o1', 'struct sched_param *param')])
-syscall_table[0xf3] = Entry('sched_setscheduler', [Param('$o0', 'pid_t pid'), Param('$o1', 'int policy'), Param('$o2', 'struct sched_param *param')])
-syscall_table[0xf4] = Entry('sched_getscheduler', [Param('$o0', 'pid_t pid')])
-syscall_table[0xf5] = Entry('sched_yield', [])
-syscall_table[0xf6] = Entry('sched_get_priority_max', [Param('$o0', 'int policy')])
-syscall_table[0xf7] = Entry('sched_get_priority_min', [Param('$o0', 'int policy')])
-syscall_table[0xf8] = Entry('sched_rr_get_interval', [Param('$o0', 'pid_t pid'), Param('$o1', 'struct timespec *interval')])
-syscall_table[0xf9] = Entry('nanosleep', [Param('$o0', 'struct timespec *rqtp'), Param('$o1', 'struct timespec *rmtp')])
-syscall_table[0xfa] = Entry('mremap', [Param('$o0', 'unsigned long addr'), Param('$o1', 'unsigned long old_len'), Param('$o2', 'unsigned long new_len'), Param('$o3', 'unsigned long flags'), Param('$o4', 'unsigned long new_addr')])
-syscall_table[0xfb] = Entry('_sysctl', [Param('$o0', 'struct __sysctl_args *args')])
-syscall_table[0xfc] = Entry('getsid', [Param('$o0', 'pid_t pid')])
-syscall_table[0xfd] = Entry('fdatasync', [Param('$o0', 'unsigned int fd')])
-syscall_table[0xff] = Entry('sync_file_range', [Param('$o0', 'loff_t offset loff_t nbytes'), Param('$o1', 'unsigned int flags')])
-syscall_table[0x100] = Entry('clock_settime', [Param('$o0', 'const clockid_t which_clock'), Param('$o1', 'const struct timespec *tp')])
-syscall_table[0x101] = Entry('clock_gettime', [Param('$o0', 'const clockid_t which_clock'), Param('$o1', 'struct timespec *tp')])
-syscall_table[0x102] = Entry('clock_getres', [Param('$o0', 'const clockid_t which_clock'), Param('$o1', 'struct timespec *tp')])
-syscall_table[0x103] = Entry('clock_nanosleep', [Param('$o0', 'const clockid_t which_clock'), Param('$o1', 'int flags'), Param('$o2', 'const struct timespec *rqtp'), Param('$o3', 'struct timespec *rmtp')])
-syscall_table[0x104] = Entry('sched_getaffinity', [Param('$o0', 'pid_t pid'), Param('$o1', 'unsigned int len'), Param('$o2', 'unsigned long *user_mask_ptr')])
-syscall_table[0x105] = Entry('sched_setaffinity', [Param('$o0', 'pid_t pid'), Param('$o1', 'unsigned int len'), Param('$o2', 'unsigned long *user_mask_ptr')])
-syscall_table[0x106] = Entry('timer_settime', [Param('$o0', 'timer_t timer_id'), Param('$o1', 'int flags'), Param('$o2', 'const struct itimerspec *new_setting'), Param('$o3', 'struct itimerspec *old_setting')])
-syscall_table[0x107] = Entry('timer_gettime', [Param('$o0', 'timer_t timer_id'), Param('$o1', 'struct itimerspec *setting')])
-syscall_table[0x108] = Entry('timer_getoverrun', [Param('$o0', 'timer_t timer_id')])
-syscall_table[0x109] = Entry('timer_delete', [Param('$o0', 'timer_t timer_id')])
-syscall_table[0x10a] = Entry('timer_create', [Param('$o0', 'const clockid_t which_clock'), Param('$o1', 'struct sigevent *timer_event_spec'), Param('$o2', 'timer_t *created_timer_id')])
-syscall_table[0x10c] = Entry('io_setup', [Param('$o0', 'unsigned nr_events'), Param('$o1', 'aio_context_t *ctxp')])
-syscall_table[0x10d] = Entry('io_destroy', [Param('$o0', 'aio_context_t ctx')])
-syscall_table[0x10e] = Entry('io_submit', [Param('$o0', 'aio_context_t ctx_id'), Param('$o1', 'long nr'), Param('$o2', 'struct iocb * *iocbpp')])
-syscall_table[0x10f] = Entry('io_cancel', [Param('$o0', 'aio_context_t ctx_id'), Param('$o1', 'struct iocb *iocb'), Param('$o2', 'struct io_event *result')])
-syscall_table[0x110] = Entry('io_getevents', [Param('$o0', 'aio_context_t ctx_id'), Param('$o1', 'long min_nr'), Param('$o2', 'long nr'), Param('$o3', 'struct io_event *events'), Param('$o4', 'struct timespec *timeout')])
-syscall_table[0x111] = Entry('mq_open', [Param('$o0', 'const char *u_name'), Param('$o1', 'int oflag'), Param('$o2', 'umode_t mode'), Param('$o3', 'struct mq_attr *u_attr')])
-syscall_table[0x112] = Entry('mq_unlink', [Param('$o0', 'const char *u_name')])
-syscall_table[0x113] = Entry('mq_timedsend', [Param('$o0', 'mqd_t mqdes'), Param('$o1', 'const char *u_msg_ptr'), Param('$o2', 'size_t msg_len'), Param('$o3', 'unsigned int msg_prio'), Param('$o4', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x114] = Entry('mq_timedreceive', [Param('$o0', 'mqd_t mqdes'), Param('$o1', 'char *u_msg_ptr'), Param('$o2', 'size_t msg_len'), Param('$o3', 'unsigned int *u_msg_prio'), Param('$o4', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x115] = Entry('mq_notify', [Param('$o0', 'mqd_t mqdes'), Param('$o1', 'const struct sigevent *u_notification')])
-syscall_table[0x116] = Entry('mq_getsetattr', [Param('$o0', 'mqd_t mqdes'), Param('$o1', 'const struct mq_attr *u_mqstat'), Param('$o2', 'struct mq_attr *u_omqstat')])
-syscall_table[0x117] = Entry('waitid', [Param('$o0', 'int which'), Param('$o1', 'pid_t upid'), Param('$o2', 'struct siginfo *infop'), Param('$o3', 'int options'), Param('$o4', 'struct rusage *ru')])
-syscall_table[0x118] = Entry('tee', [Param('$o0', 'int fdin'), Param('$o1', 'int fdout'), Param('$o2', 'size_t len'), Param('$o3', 'unsigned int flags')])
-syscall_table[0x119] = Entry('add_key', [Param('$o0', 'const char *_type'), Param('$o1', 'const char *_description'), Param('$o2', 'const void *_payload'), Param('$o3', 'size_t plen'), Param('$o4', 'key_serial_t ringid')])
-syscall_table[0x11a] = Entry('request_key', [Param('$o0', 'const char *_type'), Param('$o1', 'const char *_description'), Param('$o2', 'const char *_callout_info'), Param('$o3', 'key_serial_t destringid')])
-syscall_table[0x11b] = Entry('keyctl', [Param('$o0', 'int option'), Param('$o1', 'unsigned long arg2'), Param('$o2', 'unsigned long arg3'), Param('$o3', 'unsigned long arg4'), Param('$o4', 'unsigned long arg5')])
-syscall_table[0x11c] = Entry('openat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'int flags'), Param('$o3', 'umode_t mode')])
-syscall_table[0x11d] = Entry('mkdirat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *pathname'), Param('$o2', 'umode_t mode')])
-syscall_table[0x11e] = Entry('mknodat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'umode_t mode'), Param('$o3', 'unsigned dev')])
-syscall_table[0x11f] = Entry('fchownat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'uid_t user'), Param('$o3', 'gid_t group'), Param('$o4', 'int flag')])
-syscall_table[0x120] = Entry('futimesat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'struct timeval *utimes')])
-syscall_table[0x121] = Entry('fstatat64', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'struct stat64 *statbuf'), Param('$o3', 'int flag')])
-syscall_table[0x122] = Entry('unlinkat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *pathname'), Param('$o2', 'int flag')])
-syscall_table[0x123] = Entry('renameat', [Param('$o0', 'int olddfd'), Param('$o1', 'const char *oldname'), Param('$o2', 'int newdfd'), Param('$o3', 'const char *newname')])
-syscall_table[0x124] = Entry('linkat', [Param('$o0', 'int olddfd'), Param('$o1', 'const char *oldname'), Param('$o2', 'int newdfd'), Param('$o3', 'const char *newname'), Param('$o4', 'int flags')])
-syscall_table[0x125] = Entry('symlinkat', [Param('$o0', 'const char *oldname'), Param('$o1', 'int newdfd'), Param('$o2', 'const char *newname')])
-syscall_table[0x126] = Entry('readlinkat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *pathname'), Param('$o2', 'char *buf'), Param('$o3', 'int bufsiz')])
-syscall_table[0x127] = Entry('fchmodat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'umode_t mode')])
-syscall_table[0x128] = Entry('faccessat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'int mode')])
-syscall_table[0x129] = Entry('pselect6', [Param('$o0', 'int n'), Param('$o1', 'fd_set *inp'), Param('$o2', 'fd_set *outp'), Param('$o3', 'fd_set *exp'), Param('$o4', 'struct timespec *tsp'), Param('$o5', 'void *sig')])
-syscall_table[0x12a] = Entry('ppoll', [Param('$o0', 'struct pollfd *ufds'), Param('$o1', 'unsigned int nfds'), Param('$o2', 'struct timespec *tsp'), Param('$o3', 'const sigset_t *sigmask'), Param('$o4', 'size_t sigsetsize')])
-syscall_table[0x12b] = Entry('unshare', [Param('$o0', 'unsigned long unshare_flags')])
-syscall_table[0x12c] = Entry('set_robust_list', [Param('$o0', 'struct robust_list_head *head'), Param('$o1', 'size_t len')])
-syscall_table[0x12d] = Entry('get_robust_list', [Param('$o0', 'int pid'), Param('$o1', 'struct robust_list_head * *head_ptr'), Param('$o2', 'size_t *len_ptr')])
-syscall_table[0x12e] = Entry('migrate_pages', [Param('$o0', 'pid_t pid'), Param('$o1', 'unsigned long maxnode'), Param('$o2', 'const unsigned long *old_nodes'), Param('$o3', 'const unsigned long *new_nodes')])
-syscall_table[0x12f] = Entry('mbind', [Param('$o0', 'unsigned long start'), Param('$o1', 'unsigned long len'), Param('$o2', 'unsigned long mode'), Param('$o3', 'unsigned long *nmask'), Param('$o4', 'unsigned long maxnode'), Param('$o5', 'unsigned flags')])
-syscall_table[0x130] = Entry('get_mempolicy', [Param('$o0', 'int *policy'), Param('$o1', 'unsigned long *nmask'), Param('$o2', 'unsigned long maxnode'), Param('$o3', 'unsigned long addr'), Param('$o4', 'unsigned long flags')])
-syscall_table[0x131] = Entry('set_mempolicy', [Param('$o0', 'int mode'), Param('$o1', 'unsigned long *nmask'), Param('$o2', 'unsigned long maxnode')])
-syscall_table[0x132] = Entry('kexec_load', [Param('$o0', 'unsigned long entry'), Param('$o1', 'unsigned long nr_segments'), Param('$o2', 'struct kexec_segment *segments'), Param('$o3', 'unsigned long flags')])
-syscall_table[0x133] = Entry('move_pages', [Param('$o0', 'pid_t pid'), Param('$o1', 'unsigned long nr_pages'), Param('$o2', 'const void * *pages'), Param('$o3', 'const int *nodes'), Param('$o4', 'int *status'), Param('$o5', 'int flags')])
-syscall_table[0x134] = Entry('getcpu', [Param('$o0', 'unsigned *cpup'), Param('$o1', 'unsigned *nodep'), Param('$o2', 'struct getcpu_cache *unused')])
-syscall_table[0x135] = Entry('epoll_pwait', [Param('$o0', 'int epfd'), Param('$o1', 'struct epoll_event *events'), Param('$o2', 'int maxevents'), Param('$o3', 'int timeout'), Param('$o4', 'const sigset_t *sigmask'), Param('$o5', 'size_t sigsetsize')])
-syscall_table[0x136] = Entry('utimensat', [Param('$o0', 'int dfd'), Param('$o1', 'const char *filename'), Param('$o2', 'struct timespec *utimes'), Param('$o3', 'int flags')])
-syscall_table[0x137] = Entry('signalfd', [Param('$o0', 'int ufd'), Param('$o1', 'sigset_t *user_mask'), Param('$o2', 'size_t sizemask')])
-syscall_table[0x138] = Entry('timerfd_create', [Param('$o0', 'int clockid'), Param('$o1', 'int flags')])
-syscall_table[0x139] = Entry('eventfd', [Param('$o0', 'unsigned int count')])
-syscall_table[0x13a] = Entry('fallocate', [Param('$o0', 'int mode loff_t offset'), Param('$o1', 'loff_t len')])
-syscall_table[0x13b] = Entry('timerfd_settime', [Param('$o0', 'int ufd'), Param('$o1', 'int flags'), Param('$o2', 'const struct itimerspec *utmr'), Param('$o3', 'struct itimerspec *otmr')])
-syscall_table[0x13c] = Entry('timerfd_gettime', [Param('$o0', 'int ufd'), Param('$o1', 'struct itimerspec *otmr')])
-syscall_table[0x13d] = Entry('signalfd4', [Param('$o0', 'int ufd'), Param('$o1', 'sigset_t *user_mask'), Param('$o2', 'size_t sizemask'), Param('$o3', 'int flags')])
-syscall_table[0x13e] = Entry('eventfd2', [Param('$o0', 'unsigned int count'), Param('$o1', 'int flags')])
-syscall_table[0x13f] = Entry('epoll_create1', [Param('$o0', 'int flags')])
-syscall_table[0x140] = Entry('dup3', [Param('$o0', 'unsigned int oldfd'), Param('$o1', 'unsigned int newfd'), Param('$o2', 'int flags')])
-syscall_table[0x141] = Entry('pipe2', [Param('$o0', 'int *fildes'), Param('$o1', 'int flags')])
-syscall_table[0x142] = Entry('inotify_init1', [Param('$o0', 'int flags')])
-syscall_table[0x143] = Entry('accept4', [Param('$o0', 'int fd'), Param('$o1', 'struct sockaddr *upeer_sockaddr'), Param('$o2', 'int *upeer_addrlen'), Param('$o3', 'int flags')])
-syscall_table[0x144] = Entry('preadv', [Param('$o0', 'unsigned long fd'), Param('$o1', 'const struct iovec *vec'), Param('$o2', 'unsigned long vlen'), Param('$o3', 'unsigned long pos_l'), Param('$o4', 'unsigned long pos_h')])
-syscall_table[0x145] = Entry('pwritev', [Param('$o0', 'unsigned long fd'), Param('$o1', 'const struct iovec *vec'), Param('$o2', 'unsigned long vlen'), Param('$o3', 'unsigned long pos_l'), Param('$o4', 'unsigned long pos_h')])
-syscall_table[0x146] = Entry('rt_tgsigqueueinfo', [Param('$o0', 'pid_t tgid'), Param('$o1', 'pid_t pid'), Param('$o2', 'int sig'), Param('$o3', 'siginfo_t *uinfo')])
-syscall_table[0x147] = Entry('perf_event_open', [Param('$o0', 'struct perf_event_attr *attr_uptr'), Param('$o1', 'pid_t pid'), Param('$o2', 'int cpu'), Param('$o3', 'int group_fd'), Param('$o4', 'unsigned long flags')])
-syscall_table[0x148] = Entry('recvmmsg', [Param('$o0', 'int fd'), Param('$o1', 'struct mmsghdr *mmsg'), Param('$o2', 'unsigned int vlen'), Param('$o3', 'unsigned int flags'), Param('$o4', 'struct timespec *timeout')])
-syscall_table[0x149] = Entry('fanotify_init', [Param('$o0', 'unsigned int flags'), Param('$o1', 'unsigned int event_f_flags')])
-syscall_table[0x14a] = Entry('fanotify_mark', [Param('$o0', 'unsigned int flags __u64 mask'), Param('$o1', 'int dfd const char *pathname')])
-syscall_table[0x14b] = Entry('prlimit64', [Param('$o0', 'pid_t pid'), Param('$o1', 'unsigned int resource'), Param('$o2', 'const struct rlimit64 *new_rlim'), Param('$o3', 'struct rlimit64 *old_rlim')])
-syscall_table[0x14c] = Entry('name_to_handle_at', [Param('$o0', 'int dfd'), Param('$o1', 'const char *name'), Param('$o2', 'struct file_handle *handle'), Param('$o3', 'int *mnt_id'), Param('$o4', 'int flag')])
-syscall_table[0x14d] = Entry('open_by_handle_at', [Param('$o0', 'int mountdirfd'), Param('$o1', 'struct file_handle *handle'), Param('$o2', 'int flags')])
-syscall_table[0x14e] = Entry('clock_adjtime', [Param('$o0', 'const clockid_t which_clock'), Param('$o1', 'struct timex *utx')])
-syscall_table[0x14f] = Entry('syncfs', [Param('$o0', 'int fd')])
-syscall_table[0x150] = Entry('sendmmsg', [Param('$o0', 'int fd'), Param('$o1', 'struct mmsghdr *mmsg'), Param('$o2', 'unsigned int vlen'), Param('$o3', 'unsigned int flags')])
-syscall_table[0x151] = Entry('setns', [Param('$o0', 'int fd'), Param('$o1', 'int nstype')])
-syscall_table[0x152] = Entry('process_vm_readv', [Param('$o0', 'pid_t pid'), Param('$o1', 'const struct iovec *lvec'), Param('$o2', 'unsigned long liovcnt'), Param('$o3', 'const struct iovec *rvec'), Param('$o4', 'unsigned long riovcnt'), Param('$o5', 'unsigned long flags')])
-syscall_table[0x153] = Entry('process_vm_writev', [Param('$o0', 'pid_t pid'), Param('$o1', 'const struct iovec *lvec'), Param('$o2', 'unsigned long liovcnt'), Param('$o3', 'const struct iovec *rvec'), Param('$o4', 'unsigned long riovcnt'), Param('$o5', 'unsigned long flags')])
@@ -1,334 +0,0 @@
-from collections import namedtuple
-
-Entry = namedtuple('Entry', 'name params')
-Param = namedtuple('Param', 'reg param')
-
-syscall_table = {}
-syscall_table[0x00] = Entry('restart_syscall', [])
-syscall_table[0x01] = Entry('exit', [Param('$ebx', 'int error_code')])
-syscall_table[0x02] = Entry('fork', [])
-syscall_table[0x03] = Entry('read', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'char *buf'), Param('$edx', 'size_t count')])
-syscall_table[0x04] = Entry('write', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'const char *buf'), Param('$edx', 'size_t count')])
-syscall_table[0x05] = Entry('open', [Param('$ebx', 'const char *filename'), Param('$ecx', 'int flags'), Param('$edx', 'umode_t mode')])
-syscall_table[0x06] = Entry('close', [Param('$ebx', 'unsigned int fd')])
-syscall_table[0x07] = Entry('waitpid', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'int *stat_addr'), Param('$edx', 'int options')])
-syscall_table[0x08] = Entry('creat', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'umode_t mode')])
-syscall_table[0x09] = Entry('link', [Param('$ebx', 'const char *oldname'), Param('$ecx', 'const char *newname')])
-syscall_table[0x0a] = Entry('unlink', [Param('$ebx', 'const char *pathname')])
-syscall_table[0x0b] = Entry('execve', [Param('$ebx', 'const char *name'), Param('$ecx', 'const char *const *argv'), Param('$edx', 'const char *const *envp')])
-syscall_table[0x0c] = Entry('chdir', [Param('$ebx', 'const char *filename')])
-syscall_table[0x0d] = Entry('time', [Param('$ebx', 'time_t *tloc')])
-syscall_table[0x0e] = Entry('mknod', [Param('$ebx', 'const char *filename'), Param('$ecx', 'umode_t mode'), Param('$edx', 'unsigned dev')])
-syscall_table[0x0f] = Entry('chmod', [Param('$ebx', 'const char *filename'), Param('$ecx', 'umode_t mode')])
-syscall_table[0x10] = Entry('lchown', [Param('$ebx', 'const char *filename'), Param('$ecx', 'uid_t user'), Param('$edx', 'gid_t group')])
-syscall_table[0x12] = Entry('oldstat', [Param('$ebx', 'const char *filename'), Param('$ecx', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x13] = Entry('lseek', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'off_t offset'), Param('$edx', 'unsigned int origin')])
-syscall_table[0x14] = Entry('getpid', [])
-syscall_table[0x15] = Entry('mount', [Param('$ebx', 'char *dev_name'), Param('$ecx', 'char *dir_name'), Param('$edx', 'char *type'), Param('$esi', 'unsigned long flags'), Param('$edi', 'void *data')])
-syscall_table[0x16] = Entry('umount', [Param('$ebx', 'char *name'), Param('$ecx', 'int flags')])
-syscall_table[0x17] = Entry('setuid', [Param('$ebx', 'uid_t uid')])
-syscall_table[0x18] = Entry('getuid', [])
-syscall_table[0x19] = Entry('stime', [Param('$ebx', 'time_t *tptr')])
-syscall_table[0x1a] = Entry('ptrace', [Param('$ebx', 'long request'), Param('$ecx', 'long pid'), Param('$edx', 'unsigned long addr'), Param('$esi', 'unsigned long data')])
-syscall_table[0x1b] = Entry('alarm', [Param('$ebx', 'unsigned int seconds')])
-syscall_table[0x1c] = Entry('oldfstat', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x1d] = Entry('pause', [])
-syscall_table[0x1e] = Entry('utime', [Param('$ebx', 'char *filename'), Param('$ecx', 'struct utimbuf *times')])
-syscall_table[0x21] = Entry('access', [Param('$ebx', 'const char *filename'), Param('$ecx', 'int mode')])
-syscall_table[0x22] = Entry('nice', [Param('$ebx', 'int increment')])
-syscall_table[0x24] = Entry('sync', [])
-syscall_table[0x25] = Entry('kill', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'int sig')])
-syscall_table[0x26] = Entry('rename', [Param('$ebx', 'const char *oldname'), Param('$ecx', 'const char *newname')])
-syscall_table[0x27] = Entry('mkdir', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'umode_t mode')])
-syscall_table[0x28] = Entry('rmdir', [Param('$ebx', 'const char *pathname')])
-syscall_table[0x29] = Entry('dup', [Param('$ebx', 'unsigned int fildes')])
-syscall_table[0x2a] = Entry('pipe', [Param('$ebx', 'int *fildes')])
-syscall_table[0x2b] = Entry('times', [Param('$ebx', 'struct tms *tbuf')])
-syscall_table[0x2d] = Entry('brk', [Param('$ebx', 'unsigned long brk')])
-syscall_table[0x2e] = Entry('setgid', [Param('$ebx', 'gid_t gid')])
-syscall_table[0x2f] = Entry('getgid', [])
-syscall_table[0x30] = Entry('signal', [Param('$ebx', 'int sig'), Param('$ecx', '__sighandler_t handler')])
-syscall_table[0x31] = Entry('geteuid', [])
-syscall_table[0x32] = Entry('getegid', [])
-syscall_table[0x33] = Entry('acct', [Param('$ebx', 'const char *name')])
-syscall_table[0x34] = Entry('umount2', [Param('$ebx', 'char *name'), Param('$ecx', 'int flags')])
-syscall_table[0x36] = Entry('ioctl', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'unsigned int cmd'), Param('$edx', 'unsigned long arg')])
-syscall_table[0x37] = Entry('fcntl', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'unsigned int cmd'), Param('$edx', 'unsigned long arg')])
-syscall_table[0x39] = Entry('setpgid', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'pid_t pgid')])
-syscall_table[0x3b] = Entry('oldolduname', [Param('$ebx', 'struct oldold_utsname *name')])
-syscall_table[0x3c] = Entry('umask', [Param('$ebx', 'int mask')])
-syscall_table[0x3d] = Entry('chroot', [Param('$ebx', 'const char *filename')])
-syscall_table[0x3e] = Entry('ustat', [Param('$ebx', 'unsigned dev'), Param('$ecx', 'struct ustat *ubuf')])
-syscall_table[0x3f] = Entry('dup2', [Param('$ebx', 'unsigned int oldfd'), Param('$ecx', 'unsigned int newfd')])
-syscall_table[0x40] = Entry('getppid', [])
-syscall_table[0x41] = Entry('getpgrp', [])
-syscall_table[0x42] = Entry('setsid', [])
-syscall_table[0x43] = Entry('sigaction', [Param('$ebx', 'int sig'), Param('$ecx', 'const struct old_sigaction *act'), Param('$edx', 'struct old_sigaction *oact')])
-syscall_table[0x44] = Entry('sgetmask', [])
-syscall_table[0x45] = Entry('ssetmask', [Param('$ebx', 'int newmask')])
-syscall_table[0x46] = Entry('setreuid', [Param('$ebx', 'uid_t ruid'), Param('$ecx', 'uid_t euid')])
-syscall_table[0x47] = Entry('setregid', [Param('$ebx', 'gid_t rgid'), Param('$ecx', 'gid_t egid')])
-syscall_table[0x48] = Entry('sigsuspend', [Param('$ebx', 'int history0'), Param('$ecx', 'int history1'), Param('$edx', 'old_sigset_t mask')])
-syscall_table[0x49] = Entry('sigpending', [Param('$ebx', 'old_sigset_t *set')])
-syscall_table[0x4a] = Entry('sethostname', [Param('$ebx', 'char *name'), Param('$ecx', 'int len')])
-syscall_table[0x4b] = Entry('setrlimit', [Param('$ebx', 'unsigned int resource'), Param('$ecx', 'struct rlimit *rlim')])
-syscall_table[0x4c] = Entry('getrlimit', [Param('$ebx', 'unsigned int resource'), Param('$ecx', 'struct rlimit *rlim')])
-syscall_table[0x4d] = Entry('getrusage', [Param('$ebx', 'int who'), Param('$ecx', 'struct rusage *ru')])
-syscall_table[0x4e] = Entry('gettimeofday', [Param('$ebx', 'struct timeval *tv'), Param('$ecx', 'struct timezone *tz')])
-syscall_table[0x4f] = Entry('settimeofday', [Param('$ebx', 'struct timeval *tv'), Param('$ecx', 'struct timezone *tz')])
-syscall_table[0x50] = Entry('getgroups', [Param('$ebx', 'int gidsetsize'), Param('$ecx', 'gid_t *grouplist')])
-syscall_table[0x51] = Entry('setgroups', [Param('$ebx', 'int gidsetsize'), Param('$ecx', 'gid_t *grouplist')])
-syscall_table[0x52] = Entry('select', [Param('$ebx', 'int n'), Param('$ecx', 'fd_set *inp'), Param('$edx', 'fd_set *outp'), Param('$esi', 'fd_set *exp'), Param('$edi', 'struct timeval *tvp')])
-syscall_table[0x53] = Entry('symlink', [Param('$ebx', 'const char *oldname'), Param('$ecx', 'const char *newname')])
-syscall_table[0x54] = Entry('oldlstat', [Param('$ebx', 'const char *filename'), Param('$ecx', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x55] = Entry('readlink', [Param('$ebx', 'const char *path'), Param('$ecx', 'char *buf'), Param('$edx', 'int bufsiz')])
-syscall_table[0x56] = Entry('uselib', [Param('$ebx', 'const char *library')])
-syscall_table[0x57] = Entry('swapon', [Param('$ebx', 'const char *specialfile'), Param('$ecx', 'int swap_flags')])
-syscall_table[0x58] = Entry('reboot', [Param('$ebx', 'int magic1'), Param('$ecx', 'int magic2'), Param('$edx', 'unsigned int cmd'), Param('$esi', 'void *arg')])
-syscall_table[0x59] = Entry('readdir', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'struct old_linux_dirent *dirent'), Param('$edx', 'unsigned int count')])
-syscall_table[0x5a] = Entry('mmap', [Param('$ebx', 'unsigned long addr'), Param('$ecx', 'unsigned long len'), Param('$edx', 'unsigned long prot'), Param('$esi', 'unsigned long flags'), Param('$edi', 'unsigned long fd'), Param('$ebp', 'unsigned long off')])
-syscall_table[0x5b] = Entry('munmap', [Param('$ebx', 'unsigned long addr'), Param('$ecx', 'size_t len')])
-syscall_table[0x5c] = Entry('truncate', [Param('$ebx', 'const char *path'), Param('$ecx', 'long length')])
-syscall_table[0x5d] = Entry('ftruncate', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'unsigned long length')])
-syscall_table[0x5e] = Entry('fchmod', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'umode_t mode')])
-syscall_table[0x5f] = Entry('fchown', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'uid_t user'), Param('$edx', 'gid_t group')])
-syscall_table[0x60] = Entry('getpriority', [Param('$ebx', 'int which'), Param('$ecx', 'int who')])
-syscall_table[0x61] = Entry('setpriority', [Param('$ebx', 'int which'), Param('$ecx', 'int who'), Param('$edx', 'int niceval')])
-syscall_table[0x63] = Entry('statfs', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'struct statfs *buf')])
-syscall_table[0x64] = Entry('fstatfs', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'struct statfs *buf')])
-syscall_table[0x65] = Entry('ioperm', [Param('$ebx', 'unsigned long from'), Param('$ecx', 'unsigned long num'), Param('$edx', 'int turn_on')])
-syscall_table[0x66] = Entry('socketcall', [Param('$ebx', 'int call'), Param('$ecx', 'unsigned long *args')])
-syscall_table[0x67] = Entry('syslog', [Param('$ebx', 'int type'), Param('$ecx', 'char *buf'), Param('$edx', 'int len')])
-syscall_table[0x68] = Entry('setitimer', [Param('$ebx', 'int which'), Param('$ecx', 'struct itimerval *value'), Param('$edx', 'struct itimerval *ovalue')])
-syscall_table[0x69] = Entry('getitimer', [Param('$ebx', 'int which'), Param('$ecx', 'struct itimerval *value')])
-syscall_table[0x6a] = Entry('stat', [Param('$ebx', 'const char *filename'), Param('$ecx', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x6b] = Entry('lstat', [Param('$ebx', 'const char *filename'), Param('$ecx', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x6c] = Entry('fstat', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x6d] = Entry('olduname', [Param('$ebx', 'struct oldold_utsname *name')])
-syscall_table[0x6e] = Entry('iopl', [Param('$ebx', 'unsigned int level')])
-syscall_table[0x6f] = Entry('vhangup', [])
-syscall_table[0x71] = Entry('vm86old', [Param('$ebx', 'struct vm86_struct *v86')])
-syscall_table[0x72] = Entry('wait4', [Param('$ebx', 'pid_t upid'), Param('$ecx', 'int *stat_addr'), Param('$edx', 'int options'), Param('$esi', 'struct rusage *ru')])
-syscall_table[0x73] = Entry('swapoff', [Param('$ebx', 'const char *specialfile')])
-syscall_table[0x74] = Entry('sysinfo', [Param('$ebx', 'struct sysinfo *info')])
-syscall_table[0x75] = Entry('ipc', [Param('$ebx', 'unsigned int call'), Param('$ecx', 'int first'), Param('$edx', 'unsigned long second'), Param('$esi', 'unsigned long third'), Param('$edi', 'void *ptr'), Param('$ebp', 'long fifth')])
-syscall_table[0x76] = Entry('fsync', [Param('$ebx', 'unsigned int fd')])
-syscall_table[0x77] = Entry('sigreturn', [])
-syscall_table[0x78] = Entry('clone', [Param('$ebx', 'unsigned long clone_flags'), Param('$ecx', 'unsigned long newsp'), Param('$edx', 'void *parent_tid'), Param('$esi', 'void *child_tid')])
-syscall_table[0x79] = Entry('setdomainname', [Param('$ebx', 'char *name'), Param('$ecx', 'int len')])
-syscall_table[0x7a] = Entry('uname', [Param('$ebx', 'struct old_utsname *name')])
-syscall_table[0x7b] = Entry('modify_ldt', [Param('$ebx', 'int func'), Param('$ecx', 'void *ptr'), Param('$edx', 'unsigned long bytecount')])
-syscall_table[0x7c] = Entry('adjtimex', [Param('$ebx', 'struct timex *txc_p')])
-syscall_table[0x7d] = Entry('mprotect', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'size_t len'), Param('$edx', 'unsigned long prot')])
-syscall_table[0x7e] = Entry('sigprocmask', [Param('$ebx', 'int how'), Param('$ecx', 'old_sigset_t *nset'), Param('$edx', 'old_sigset_t *oset')])
-syscall_table[0x80] = Entry('init_module', [Param('$ebx', 'void *umod'), Param('$ecx', 'unsigned long len'), Param('$edx', 'const char *uargs')])
-syscall_table[0x81] = Entry('delete_module', [Param('$ebx', 'const char *name_user'), Param('$ecx', 'unsigned int flags')])
-syscall_table[0x83] = Entry('quotactl', [Param('$ebx', 'unsigned int cmd'), Param('$ecx', 'const char *special'), Param('$edx', 'qid_t id'), Param('$esi', 'void *addr')])
-syscall_table[0x84] = Entry('getpgid', [Param('$ebx', 'pid_t pid')])
-syscall_table[0x85] = Entry('fchdir', [Param('$ebx', 'unsigned int fd')])
-syscall_table[0x86] = Entry('bdflush', [Param('$ebx', 'int func'), Param('$ecx', 'long data')])
-syscall_table[0x87] = Entry('sysfs', [Param('$ebx', 'int option'), Param('$ecx', 'unsigned long arg1'), Param('$edx', 'unsigned long arg2')])
-syscall_table[0x88] = Entry('personality', [Param('$ebx', 'unsigned int personality')])
-syscall_table[0x8a] = Entry('setfsuid', [Param('$ebx', 'uid_t uid')])
-syscall_table[0x8b] = Entry('setfsgid', [Param('$ebx', 'gid_t gid')])
-syscall_table[0x8c] = Entry('_llseek', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'unsigned long offset_high'), Param('$edx', 'unsigned long offset_low'), Param('$esi', 'loff_t *result'), Param('$edi', 'unsigned int origin')])
-syscall_table[0x8d] = Entry('getdents', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'struct linux_dirent *dirent'), Param('$edx', 'unsigned int count')])
-syscall_table[0x8e] = Entry('_newselect', [Param('$ebx', 'int n'), Param('$ecx', 'fd_set *inp'), Param('$edx', 'fd_set *outp'), Param('$esi', 'fd_set *exp'), Param('$edi', 'struct timeval *tvp')])
-syscall_table[0x8f] = Entry('flock', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'unsigned int cmd')])
-syscall_table[0x90] = Entry('msync', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'size_t len'), Param('$edx', 'int flags')])
-syscall_table[0x91] = Entry('readv', [Param('$ebx', 'unsigned long fd'), Param('$ecx', 'const struct iovec *vec'), Param('$edx', 'unsigned long vlen')])
-syscall_table[0x92] = Entry('writev', [Param('$ebx', 'unsigned long fd'), Param('$ecx', 'const struct iovec *vec'), Param('$edx', 'unsigned long vlen')])
-syscall_table[0x93] = Entry('getsid', [Param('$ebx', 'pid_t pid')])
-syscall_table[0x94] = Entry('fdatasync', [Param('$ebx', 'unsigned int fd')])
-syscall_table[0x95] = Entry('_sysctl', [Param('$ebx', 'struct __sysctl_args *args')])
-syscall_table[0x96] = Entry('mlock', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'size_t len')])
-syscall_table[0x97] = Entry('munlock', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'size_t len')])
-syscall_table[0x98] = Entry('mlockall', [Param('$ebx', 'int flags')])
-syscall_table[0x99] = Entry('munlockall', [])
-syscall_table[0x9a] = Entry('sched_setparam', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'struct sched_param *param')])
-syscall_table[0x9b] = Entry('sched_getparam', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'struct sched_param *param')])
-syscall_table[0x9c] = Entry('sched_setscheduler', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'int policy'), Param('$edx', 'struct sched_param *param')])
-syscall_table[0x9d] = Entry('sched_getscheduler', [Param('$ebx', 'pid_t pid')])
-syscall_table[0x9e] = Entry('sched_yield', [])
-syscall_table[0x9f] = Entry('sched_get_priority_max', [Param('$ebx', 'int policy')])
-syscall_table[0xa0] = Entry('sched_get_priority_min', [Param('$ebx', 'int policy')])
-syscall_table[0xa1] = Entry('sched_rr_get_interval', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'struct timespec *interval')])
-syscall_table[0xa2] = Entry('nanosleep', [Param('$ebx', 'struct timespec *rqtp'), Param('$ecx', 'struct timespec *rmtp')])
-syscall_table[0xa3] = Entry('mremap', [Param('$ebx', 'unsigned long addr'), Param('$ecx', 'unsigned long old_len'), Param('$edx', 'unsigned long new_len'), Param('$esi', 'unsigned long flags'), Param('$edi', 'unsigned long new_addr')])
-syscall_table[0xa4] = Entry('setresuid', [Param('$ebx', 'uid_t ruid'), Param('$ecx', 'uid_t euid'), Param('$edx', 'uid_t suid')])
-syscall_table[0xa5] = Entry('getresuid', [Param('$ebx', 'uid_t *ruidp'), Param('$ecx', 'uid_t *euidp'), Param('$edx', 'uid_t *suidp')])
-syscall_table[0xa6] = Entry('vm86', [Param('$ebx', 'unsigned long cmd'), Param('$ecx', 'unsigned long arg')])
-syscall_table[0xa8] = Entry('poll', [Param('$ebx', 'struct pollfd *ufds'), Param('$ecx', 'unsigned int nfds'), Param('$edx', 'int timeout_msecs')])
-syscall_table[0xaa] = Entry('setresgid', [Param('$ebx', 'gid_t rgid'), Param('$ecx', 'gid_t egid'), Param('$edx', 'gid_t sgid')])
-syscall_table[0xab] = Entry('getresgid', [Param('$ebx', 'gid_t *rgidp'), Param('$ecx', 'gid_t *egidp'), Param('$edx', 'gid_t *sgidp')])
-syscall_table[0xac] = Entry('prctl', [Param('$ebx', 'int option'), Param('$ecx', 'unsigned long arg2'), Param('$edx', 'unsigned long arg3'), Param('$esi', 'unsigned long arg4'), Param('$edi', 'unsigned long arg5')])
-syscall_table[0xad] = Entry('rt_sigreturn', [])
-syscall_table[0xae] = Entry('rt_sigaction', [Param('$ebx', 'int sig'), Param('$ecx', 'const struct sigaction *act'), Param('$edx', 'struct sigaction *oact'), Param('$esi', 'size_t sigsetsize')])
-syscall_table[0xaf] = Entry('rt_sigprocmask', [Param('$ebx', 'int how'), Param('$ecx', 'sigset_t *nset'), Param('$edx', 'sigset_t *oset'), Param('$esi', 'size_t sigsetsize')])
-syscall_table[0xb0] = Entry('rt_sigpending', [Param('$ebx', 'sigset_t *set'), Param('$ecx', 'size_t sigsetsize')])
-syscall_table[0xb1] = Entry('rt_sigtimedwait', [Param('$ebx', 'const sigset_t *uthese'), Param('$ecx', 'siginfo_t *uinfo'), Param('$edx', 'const struct timespec *uts'), Param('$esi', 'size_t sigsetsize')])
-syscall_table[0xb2] = Entry('rt_sigqueueinfo', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'int sig'), Param('$edx', 'siginfo_t *uinfo')])
-syscall_table[0xb3] = Entry('rt_sigsuspend', [Param('$ebx', 'sigset_t *unewset'), Param('$ecx', 'size_t sigsetsize')])
-syscall_table[0xb4] = Entry('pread64', [Param('$ebx', 'char *buf size_t count'), Param('$ecx', 'loff_t pos')])
-syscall_table[0xb5] = Entry('pwrite64', [Param('$ebx', 'const char *buf size_t count'), Param('$ecx', 'loff_t pos')])
-syscall_table[0xb6] = Entry('chown', [Param('$ebx', 'const char *filename'), Param('$ecx', 'uid_t user'), Param('$edx', 'gid_t group')])
-syscall_table[0xb7] = Entry('getcwd', [Param('$ebx', 'char *buf'), Param('$ecx', 'unsigned long size')])
-syscall_table[0xb8] = Entry('capget', [Param('$ebx', 'cap_user_header_t header'), Param('$ecx', 'cap_user_data_t dataptr')])
-syscall_table[0xb9] = Entry('capset', [Param('$ebx', 'cap_user_header_t header'), Param('$ecx', 'const cap_user_data_t data')])
-syscall_table[0xba] = Entry('sigaltstack', [Param('$ebx', 'const stack_t *uss'), Param('$ecx', 'stack_t *uoss')])
-syscall_table[0xbb] = Entry('sendfile', [Param('$ebx', 'int out_fd'), Param('$ecx', 'int in_fd'), Param('$edx', 'off_t *offset'), Param('$esi', 'size_t count')])
-syscall_table[0xbe] = Entry('vfork', [])
-syscall_table[0xbf] = Entry('ugetrlimit', [Param('$ebx', 'unsigned int resource'), Param('$ecx', 'struct rlimit *rlim')])
-syscall_table[0xc0] = Entry('mmap2', [Param('$ebx', 'unsigned long addr'), Param('$ecx', 'unsigned long len'), Param('$edx', 'unsigned long prot'), Param('$esi', 'unsigned long flags'), Param('$edi', 'unsigned long fd'), Param('$ebp', 'unsigned long pgoff')])
-syscall_table[0xc1] = Entry('truncate64', [Param('$ebx', 'loff_t length')])
-syscall_table[0xc2] = Entry('ftruncate64', [Param('$ebx', 'loff_t length')])
-syscall_table[0xc3] = Entry('stat64', [Param('$ebx', 'const char *filename'), Param('$ecx', 'struct stat64 *statbuf')])
-syscall_table[0xc4] = Entry('lstat64', [Param('$ebx', 'const char *filename'), Param('$ecx', 'struct stat64 *statbuf')])
-syscall_table[0xc5] = Entry('fstat64', [Param('$ebx', 'unsigned long fd'), Param('$ecx', 'struct stat64 *statbuf')])
-syscall_table[0xc6] = Entry('lchown32', [Param('$ebx', 'const char *filename'), Param('$ecx', 'uid_t user'), Param('$edx', 'gid_t group')])
-syscall_table[0xc7] = Entry('getuid32', [])
-syscall_table[0xc8] = Entry('getgid32', [])
-syscall_table[0xc9] = Entry('geteuid32', [])
-syscall_table[0xca] = Entry('getegid32', [])
-syscall_table[0xcb] = Entry('setreuid32', [Param('$ebx', 'uid_t ruid'), Param('$ecx', 'uid_t euid')])
-syscall_table[0xcc] = Entry('setregid32', [Param('$ebx', 'gid_t rgid'), Param('$ecx', 'gid_t egid')])
-syscall_table[0xcd] = Entry('getgroups32', [Param('$ebx', 'int gidsetsize'), Param('$ecx', 'gid_t *grouplist')])
-syscall_table[0xce] = Entry('setgroups32', [Param('$ebx', 'int gidsetsize'), Param('$ecx', 'gid_t *grouplist')])
-syscall_table[0xcf] = Entry('fchown32', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'uid_t user'), Param('$edx', 'gid_t group')])
-syscall_table[0xd0] = Entry('setresuid32', [Param('$ebx', 'uid_t ruid'), Param('$ecx', 'uid_t euid'), Param('$edx', 'uid_t suid')])
-syscall_table[0xd1] = Entry('getresuid32', [Param('$ebx', 'uid_t *ruidp'), Param('$ecx', 'uid_t *euidp'), Param('$edx', 'uid_t *suidp')])
-syscall_table[0xd2] = Entry('setresgid32', [Param('$ebx', 'gid_t rgid'), Param('$ecx', 'gid_t egid'), Param('$edx', 'gid_t sgid')])
-syscall_table[0xd3] = Entry('getresgid32', [Param('$ebx', 'gid_t *rgidp'), Param('$ecx', 'gid_t *egidp'), Param('$edx', 'gid_t *sgidp')])
-syscall_table[0xd4] = Entry('chown32', [Param('$ebx', 'const char *filename'), Param('$ecx', 'uid_t user'), Param('$edx', 'gid_t group')])
-syscall_table[0xd5] = Entry('setuid32', [Param('$ebx', 'uid_t uid')])
-syscall_table[0xd6] = Entry('setgid32', [Param('$ebx', 'gid_t gid')])
-syscall_table[0xd7] = Entry('setfsuid32', [Param('$ebx', 'uid_t uid')])
-syscall_table[0xd8] = Entry('setfsgid32', [Param('$ebx', 'gid_t gid')])
-syscall_table[0xd9] = Entry('pivot_root', [Param('$ebx', 'const char *new_root'), Param('$ecx', 'const char *put_old')])
-syscall_table[0xda] = Entry('mincore', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'size_t len'), Param('$edx', 'unsigned char *vec')])
-syscall_table[0xdb] = Entry('madvise', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'size_t len_in'), Param('$edx', 'int behavior')])
-syscall_table[0xdc] = Entry('getdents64', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'struct linux_dirent64 *dirent'), Param('$edx', 'unsigned int count')])
-syscall_table[0xdd] = Entry('fcntl64', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'unsigned int cmd'), Param('$edx', 'unsigned long arg')])
-syscall_table[0xe0] = Entry('gettid', [])
-syscall_table[0xe1] = Entry('readahead', [Param('$ebx', 'loff_t offset size_t count')])
-syscall_table[0xe2] = Entry('setxattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'const char *name'), Param('$edx', 'const void *value'), Param('$esi', 'size_t size'), Param('$edi', 'int flags')])
-syscall_table[0xe3] = Entry('lsetxattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'const char *name'), Param('$edx', 'const void *value'), Param('$esi', 'size_t size'), Param('$edi', 'int flags')])
-syscall_table[0xe4] = Entry('fsetxattr', [Param('$ebx', 'int fd'), Param('$ecx', 'const char *name'), Param('$edx', 'const void *value'), Param('$esi', 'size_t size'), Param('$edi', 'int flags')])
-syscall_table[0xe5] = Entry('getxattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'const char *name'), Param('$edx', 'void *value'), Param('$esi', 'size_t size')])
-syscall_table[0xe6] = Entry('lgetxattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'const char *name'), Param('$edx', 'void *value'), Param('$esi', 'size_t size')])
-syscall_table[0xe7] = Entry('fgetxattr', [Param('$ebx', 'int fd'), Param('$ecx', 'const char *name'), Param('$edx', 'void *value'), Param('$esi', 'size_t size')])
-syscall_table[0xe8] = Entry('listxattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'char *list'), Param('$edx', 'size_t size')])
-syscall_table[0xe9] = Entry('llistxattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'char *list'), Param('$edx', 'size_t size')])
-syscall_table[0xea] = Entry('flistxattr', [Param('$ebx', 'int fd'), Param('$ecx', 'char *list'), Param('$edx', 'size_t size')])
-syscall_table[0xeb] = Entry('removexattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'const char *name')])
-syscall_table[0xec] = Entry('lremovexattr', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'const char *name')])
-syscall_table[0xed] = Entry('fremovexattr', [Param('$ebx', 'int fd'), Param('$ecx', 'const char *name')])
-syscall_table[0xee] = Entry('tkill', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'int sig')])
-syscall_table[0xef] = Entry('sendfile64', [Param('$ebx', 'int out_fd'), Param('$ecx', 'int in_fd'), Param('$edx', 'loff_t *offset'), Param('$esi', 'size_t count')])
-syscall_table[0xf0] = Entry('futex', [Param('$ebx', 'u32 *uaddr'), Param('$ecx', 'int op'), Param('$edx', 'u32 val'), Param('$esi', 'struct timespec *utime'), Param('$edi', 'u32 *uaddr2'), Param('$ebp', 'u32 val3')])
-syscall_table[0xf1] = Entry('sched_setaffinity', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'unsigned int len'), Param('$edx', 'unsigned long *user_mask_ptr')])
-syscall_table[0xf2] = Entry('sched_getaffinity', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'unsigned int len'), Param('$edx', 'unsigned long *user_mask_ptr')])
-syscall_table[0xf3] = Entry('set_thread_area', [Param('$ebx', 'struct user_desc *u_info')])
-syscall_table[0xf4] = Entry('get_thread_area', [Param('$ebx', 'struct user_desc *u_info')])
-syscall_table[0xf5] = Entry('io_setup', [Param('$ebx', 'unsigned nr_events'), Param('$ecx', 'aio_context_t *ctxp')])
-syscall_table[0xf6] = Entry('io_destroy', [Param('$ebx', 'aio_context_t ctx')])
-syscall_table[0xf7] = Entry('io_getevents', [Param('$ebx', 'aio_context_t ctx_id'), Param('$ecx', 'long min_nr'), Param('$edx', 'long nr'), Param('$esi', 'struct io_event *events'), Param('$edi', 'struct timespec *timeout')])
-syscall_table[0xf8] = Entry('io_submit', [Param('$ebx', 'aio_context_t ctx_id'), Param('$ecx', 'long nr'), Param('$edx', 'struct iocb * *iocbpp')])
-syscall_table[0xf9] = Entry('io_cancel', [Param('$ebx', 'aio_context_t ctx_id'), Param('$ecx', 'struct iocb *iocb'), Param('$edx', 'struct io_event *result')])
-syscall_table[0xfa] = Entry('fadvise64', [Param('$ebx', 'loff_t offset size_t len'), Param('$ecx', 'int advice')])
-syscall_table[0xfc] = Entry('exit_group', [Param('$ebx', 'int error_code')])
-syscall_table[0xfd] = Entry('lookup_dcookie', [Param('$ebx', 'char *buf size_t len')])
-syscall_table[0xfe] = Entry('epoll_create', [Param('$ebx', 'int size')])
-syscall_table[0xff] = Entry('epoll_ctl', [Param('$ebx', 'int epfd'), Param('$ecx', 'int op'), Param('$edx', 'int fd'), Param('$esi', 'struct epoll_event *event')])
-syscall_table[0x100] = Entry('epoll_wait', [Param('$ebx', 'int epfd'), Param('$ecx', 'struct epoll_event *events'), Param('$edx', 'int maxevents'), Param('$esi', 'int timeout')])
-syscall_table[0x101] = Entry('remap_file_pages', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'unsigned long size'), Param('$edx', 'unsigned long prot'), Param('$esi', 'unsigned long pgoff'), Param('$edi', 'unsigned long flags')])
-syscall_table[0x102] = Entry('set_tid_address', [Param('$ebx', 'int *tidptr')])
-syscall_table[0x103] = Entry('timer_create', [Param('$ebx', 'const clockid_t which_clock'), Param('$ecx', 'struct sigevent *timer_event_spec'), Param('$edx', 'timer_t *created_timer_id')])
-syscall_table[0x104] = Entry('timer_settime', [Param('$ebx', 'timer_t timer_id'), Param('$ecx', 'int flags'), Param('$edx', 'const struct itimerspec *new_setting'), Param('$esi', 'struct itimerspec *old_setting')])
-syscall_table[0x105] = Entry('timer_gettime', [Param('$ebx', 'timer_t timer_id'), Param('$ecx', 'struct itimerspec *setting')])
-syscall_table[0x106] = Entry('timer_getoverrun', [Param('$ebx', 'timer_t timer_id')])
-syscall_table[0x107] = Entry('timer_delete', [Param('$ebx', 'timer_t timer_id')])
-syscall_table[0x108] = Entry('clock_settime', [Param('$ebx', 'const clockid_t which_clock'), Param('$ecx', 'const struct timespec *tp')])
-syscall_table[0x109] = Entry('clock_gettime', [Param('$ebx', 'const clockid_t which_clock'), Param('$ecx', 'struct timespec *tp')])
-syscall_table[0x10a] = Entry('clock_getres', [Param('$ebx', 'const clockid_t which_clock'), Param('$ecx', 'struct timespec *tp')])
-syscall_table[0x10b] = Entry('clock_nanosleep', [Param('$ebx', 'const clockid_t which_clock'), Param('$ecx', 'int flags'), Param('$edx', 'const struct timespec *rqtp'), Param('$esi', 'struct timespec *rmtp')])
-syscall_table[0x10c] = Entry('statfs64', [Param('$ebx', 'const char *pathname'), Param('$ecx', 'size_t sz'), Param('$edx', 'struct statfs64 *buf')])
-syscall_table[0x10d] = Entry('fstatfs64', [Param('$ebx', 'unsigned int fd'), Param('$ecx', 'size_t sz'), Param('$edx', 'struct statfs64 *buf')])
-syscall_table[0x10e] = Entry('tgkill', [Param('$ebx', 'pid_t tgid'), Param('$ecx', 'pid_t pid'), Param('$edx', 'int sig')])
-syscall_table[0x10f] = Entry('utimes', [Param('$ebx', 'char *filename'), Param('$ecx', 'struct timeval *utimes')])
-syscall_table[0x110] = Entry('fadvise64_64', [Param('$ebx', 'loff_t offset loff_t len'), Param('$ecx', 'int advice')])
-syscall_table[0x112] = Entry('mbind', [Param('$ebx', 'unsigned long start'), Param('$ecx', 'unsigned long len'), Param('$edx', 'unsigned long mode'), Param('$esi', 'unsigned long *nmask'), Param('$edi', 'unsigned long maxnode'), Param('$ebp', 'unsigned flags')])
-syscall_table[0x113] = Entry('get_mempolicy', [Param('$ebx', 'int *policy'), Param('$ecx', 'unsigned long *nmask'), Param('$edx', 'unsigned long maxnode'), Param('$esi', 'unsigned long addr'), Param('$edi', 'unsigned long flags')])
-syscall_table[0x114] = Entry('set_mempolicy', [Param('$ebx', 'int mode'), Param('$ecx', 'unsigned long *nmask'), Param('$edx', 'unsigned long maxnode')])
-syscall_table[0x115] = Entry('mq_open', [Param('$ebx', 'const char *u_name'), Param('$ecx', 'int oflag'), Param('$edx', 'umode_t mode'), Param('$esi', 'struct mq_attr *u_attr')])
-syscall_table[0x116] = Entry('mq_unlink', [Param('$ebx', 'const char *u_name')])
-syscall_table[0x117] = Entry('mq_timedsend', [Param('$ebx', 'mqd_t mqdes'), Param('$ecx', 'const char *u_msg_ptr'), Param('$edx', 'size_t msg_len'), Param('$esi', 'unsigned int msg_prio'), Param('$edi', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x118] = Entry('mq_timedreceive', [Param('$ebx', 'mqd_t mqdes'), Param('$ecx', 'char *u_msg_ptr'), Param('$edx', 'size_t msg_len'), Param('$esi', 'unsigned int *u_msg_prio'), Param('$edi', 'const struct timespec *u_abs_timeout')])
-syscall_table[0x119] = Entry('mq_notify', [Param('$ebx', 'mqd_t mqdes'), Param('$ecx', 'const struct sigevent *u_notification')])
-syscall_table[0x11a] = Entry('mq_getsetattr', [Param('$ebx', 'mqd_t mqdes'), Param('$ecx', 'const struct mq_attr *u_mqstat'), Param('$edx', 'struct mq_attr *u_omqstat')])
-syscall_table[0x11b] = Entry('kexec_load', [Param('$ebx', 'unsigned long entry'), Param('$ecx', 'unsigned long nr_segments'), Param('$edx', 'struct kexec_segment *segments'), Param('$esi', 'unsigned long flags')])
-syscall_table[0x11c] = Entry('waitid', [Param('$ebx', 'int which'), Param('$ecx', 'pid_t upid'), Param('$edx', 'struct siginfo *infop'), Param('$esi', 'int options'), Param('$edi', 'struct rusage *ru')])
-syscall_table[0x11e] = Entry('add_key', [Param('$ebx', 'const char *_type'), Param('$ecx', 'const char *_description'), Param('$edx', 'const void *_payload'), Param('$esi', 'size_t plen'), Param('$edi', 'key_serial_t ringid')])
-syscall_table[0x11f] = Entry('request_key', [Param('$ebx', 'const char *_type'), Param('$ecx', 'const char *_description'), Param('$edx', 'const char *_callout_info'), Param('$esi', 'key_serial_t destringid')])
-syscall_table[0x120] = Entry('keyctl', [Param('$ebx', 'int option'), Param('$ecx', 'unsigned long arg2'), Param('$edx', 'unsigned long arg3'), Param('$esi', 'unsigned long arg4'), Param('$edi', 'unsigned long arg5')])
-syscall_table[0x121] = Entry('ioprio_set', [Param('$ebx', 'int which'), Param('$ecx', 'int who'), Param('$edx', 'int ioprio')])
-syscall_table[0x122] = Entry('ioprio_get', [Param('$ebx', 'int which'), Param('$ecx', 'int who')])
-syscall_table[0x123] = Entry('inotify_init', [])
-syscall_table[0x124] = Entry('inotify_add_watch', [Param('$ebx', 'int fd'), Param('$ecx', 'const char *pathname'), Param('$edx', 'u32 mask')])
-syscall_table[0x125] = Entry('inotify_rm_watch', [Param('$ebx', 'int fd'), Param('$ecx', '__s32 wd')])
-syscall_table[0x126] = Entry('migrate_pages', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'unsigned long maxnode'), Param('$edx', 'const unsigned long *old_nodes'), Param('$esi', 'const unsigned long *new_nodes')])
-syscall_table[0x127] = Entry('openat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'int flags'), Param('$esi', 'umode_t mode')])
-syscall_table[0x128] = Entry('mkdirat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *pathname'), Param('$edx', 'umode_t mode')])
-syscall_table[0x129] = Entry('mknodat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'umode_t mode'), Param('$esi', 'unsigned dev')])
-syscall_table[0x12a] = Entry('fchownat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'uid_t user'), Param('$esi', 'gid_t group'), Param('$edi', 'int flag')])
-syscall_table[0x12b] = Entry('futimesat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'struct timeval *utimes')])
-syscall_table[0x12c] = Entry('fstatat64', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'struct stat64 *statbuf'), Param('$esi', 'int flag')])
-syscall_table[0x12d] = Entry('unlinkat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *pathname'), Param('$edx', 'int flag')])
-syscall_table[0x12e] = Entry('renameat', [Param('$ebx', 'int olddfd'), Param('$ecx', 'const char *oldname'), Param('$edx', 'int newdfd'), Param('$esi', 'const char *newname')])
-syscall_table[0x12f] = Entry('linkat', [Param('$ebx', 'int olddfd'), Param('$ecx', 'const char *oldname'), Param('$edx', 'int newdfd'), Param('$esi', 'const char *newname'), Param('$edi', 'int flags')])
-syscall_table[0x130] = Entry('symlinkat', [Param('$ebx', 'const char *oldname'), Param('$ecx', 'int newdfd'), Param('$edx', 'const char *newname')])
-syscall_table[0x131] = Entry('readlinkat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *pathname'), Param('$edx', 'char *buf'), Param('$esi', 'int bufsiz')])
-syscall_table[0x132] = Entry('fchmodat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'umode_t mode')])
-syscall_table[0x133] = Entry('faccessat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'int mode')])
-syscall_table[0x134] = Entry('pselect6', [Param('$ebx', 'int n'), Param('$ecx', 'fd_set *inp'), Param('$edx', 'fd_set *outp'), Param('$esi', 'fd_set *exp'), Param('$edi', 'struct timespec *tsp'), Param('$ebp', 'void *sig')])
-syscall_table[0x135] = Entry('ppoll', [Param('$ebx', 'struct pollfd *ufds'), Param('$ecx', 'unsigned int nfds'), Param('$edx', 'struct timespec *tsp'), Param('$esi', 'const sigset_t *sigmask'), Param('$edi', 'size_t sigsetsize')])
-syscall_table[0x136] = Entry('unshare', [Param('$ebx', 'unsigned long unshare_flags')])
-syscall_table[0x137] = Entry('set_robust_list', [Param('$ebx', 'struct robust_list_head *head'), Param('$ecx', 'size_t len')])
-syscall_table[0x138] = Entry('get_robust_list', [Param('$ebx', 'int pid'), Param('$ecx', 'struct robust_list_head * *head_ptr'), Param('$edx', 'size_t *len_ptr')])
-syscall_table[0x139] = Entry('splice', [Param('$ebx', 'int fd_in'), Param('$ecx', 'loff_t *off_in'), Param('$edx', 'int fd_out'), Param('$esi', 'loff_t *off_out'), Param('$edi', 'size_t len'), Param('$ebp', 'unsigned int flags')])
-syscall_table[0x13a] = Entry('sync_file_range', [Param('$ebx', 'loff_t offset loff_t nbytes'), Param('$ecx', 'unsigned int flags')])
-syscall_table[0x13b] = Entry('tee', [Param('$ebx', 'int fdin'), Param('$ecx', 'int fdout'), Param('$edx', 'size_t len'), Param('$esi', 'unsigned int flags')])
-syscall_table[0x13c] = Entry('vmsplice', [Param('$ebx', 'int fd'), Param('$ecx', 'const struct iovec *iov'), Param('$edx', 'unsigned long nr_segs'), Param('$esi', 'unsigned int flags')])
-syscall_table[0x13d] = Entry('move_pages', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'unsigned long nr_pages'), Param('$edx', 'const void * *pages'), Param('$esi', 'const int *nodes'), Param('$edi', 'int *status'), Param('$ebp', 'int flags')])
-syscall_table[0x13e] = Entry('getcpu', [Param('$ebx', 'unsigned *cpup'), Param('$ecx', 'unsigned *nodep'), Param('$edx', 'struct getcpu_cache *unused')])
-syscall_table[0x13f] = Entry('epoll_pwait', [Param('$ebx', 'int epfd'), Param('$ecx', 'struct epoll_event *events'), Param('$edx', 'int maxevents'), Param('$esi', 'int timeout'), Param('$edi', 'const sigset_t *sigmask'), Param('$ebp', 'size_t sigsetsize')])
-syscall_table[0x140] = Entry('utimensat', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *filename'), Param('$edx', 'struct timespec *utimes'), Param('$esi', 'int flags')])
-syscall_table[0x141] = Entry('signalfd', [Param('$ebx', 'int ufd'), Param('$ecx', 'sigset_t *user_mask'), Param('$edx', 'size_t sizemask')])
-syscall_table[0x142] = Entry('timerfd_create', [Param('$ebx', 'int clockid'), Param('$ecx', 'int flags')])
-syscall_table[0x143] = Entry('eventfd', [Param('$ebx', 'unsigned int count')])
-syscall_table[0x144] = Entry('fallocate', [Param('$ebx', 'int mode loff_t offset'), Param('$ecx', 'loff_t len')])
-syscall_table[0x145] = Entry('timerfd_settime', [Param('$ebx', 'int ufd'), Param('$ecx', 'int flags'), Param('$edx', 'const struct itimerspec *utmr'), Param('$esi', 'struct itimerspec *otmr')])
-syscall_table[0x146] = Entry('timerfd_gettime', [Param('$ebx', 'int ufd'), Param('$ecx', 'struct itimerspec *otmr')])
-syscall_table[0x147] = Entry('signalfd4', [Param('$ebx', 'int ufd'), Param('$ecx', 'sigset_t *user_mask'), Param('$edx', 'size_t sizemask'), Param('$esi', 'int flags')])
-syscall_table[0x148] = Entry('eventfd2', [Param('$ebx', 'unsigned int count'), Param('$ecx', 'int flags')])
-syscall_table[0x149] = Entry('epoll_create1', [Param('$ebx', 'int flags')])
-syscall_table[0x14a] = Entry('dup3', [Param('$ebx', 'unsigned int oldfd'), Param('$ecx', 'unsigned int newfd'), Param('$edx', 'int flags')])
-syscall_table[0x14b] = Entry('pipe2', [Param('$ebx', 'int *fildes'), Param('$ecx', 'int flags')])
-syscall_table[0x14c] = Entry('inotify_init1', [Param('$ebx', 'int flags')])
-syscall_table[0x14d] = Entry('preadv', [Param('$ebx', 'unsigned long fd'), Param('$ecx', 'const struct iovec *vec'), Param('$edx', 'unsigned long vlen'), Param('$esi', 'unsigned long pos_l'), Param('$edi', 'unsigned long pos_h')])
-syscall_table[0x14e] = Entry('pwritev', [Param('$ebx', 'unsigned long fd'), Param('$ecx', 'const struct iovec *vec'), Param('$edx', 'unsigned long vlen'), Param('$esi', 'unsigned long pos_l'), Param('$edi', 'unsigned long pos_h')])
-syscall_table[0x14f] = Entry('rt_tgsigqueueinfo', [Param('$ebx', 'pid_t tgid'), Param('$ecx', 'pid_t pid'), Param('$edx', 'int sig'), Param('$esi', 'siginfo_t *uinfo')])
-syscall_table[0x150] = Entry('perf_event_open', [Param('$ebx', 'struct perf_event_attr *attr_uptr'), Param('$ecx', 'pid_t pid'), Param('$edx', 'int cpu'), Param('$esi', 'int group_fd'), Param('$edi', 'unsigned long flags')])
-syscall_table[0x151] = Entry('recvmmsg', [Param('$ebx', 'int fd'), Param('$ecx', 'struct mmsghdr *mmsg'), Param('$edx', 'unsigned int vlen'), Param('$esi', 'unsigned int flags'), Param('$edi', 'struct timespec *timeout')])
-syscall_table[0x152] = Entry('fanotify_init', [Param('$ebx', 'unsigned int flags'), Param('$ecx', 'unsigned int event_f_flags')])
-syscall_table[0x153] = Entry('fanotify_mark', [Param('$ebx', 'unsigned int flags __u64 mask'), Param('$ecx', 'int dfd const char *pathname')])
-syscall_table[0x154] = Entry('prlimit64', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'unsigned int resource'), Param('$edx', 'const struct rlimit64 *new_rlim'), Param('$esi', 'struct rlimit64 *old_rlim')])
-syscall_table[0x155] = Entry('name_to_handle_at', [Param('$ebx', 'int dfd'), Param('$ecx', 'const char *name'), Param('$edx', 'struct file_handle *handle'), Param('$esi', 'int *mnt_id'), Param('$edi', 'int flag')])
-syscall_table[0x156] = Entry('open_by_handle_at', [Param('$ebx', 'int mountdirfd'), Param('$ecx', 'struct file_handle *handle'), Param('$edx', 'int flags')])
-syscall_table[0x157] = Entry('clock_adjtime', [Param('$ebx', 'const clockid_t which_clock'), Param('$ecx', 'struct timex *utx')])
-syscall_table[0x158] = Entry('syncfs', [Param('$ebx', 'int fd')])
-syscall_table[0x159] = Entry('sendmmsg', [Param('$ebx', 'int fd'), Param('$ecx', 'struct mmsghdr *mmsg'), Param('$edx', 'unsigned int vlen'), Param('$esi', 'unsigned int flags')])
-syscall_table[0x15a] = Entry('setns', [Param('$ebx', 'int fd'), Param('$ecx', 'int nstype')])
-syscall_table[0x15b] = Entry('process_vm_readv', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'const struct iovec *lvec'), Param('$edx', 'unsigned long liovcnt'), Param('$esi', 'const struct iovec *rvec'), Param('$edi', 'unsigned long riovcnt'), Param('$ebp', 'unsigned long flags')])
-syscall_table[0x15c] = Entry('process_vm_writev', [Param('$ebx', 'pid_t pid'), Param('$ecx', 'const struct iovec *lvec'), Param('$edx', 'unsigned long liovcnt'), Param('$esi', 'const struct iovec *rvec'), Param('$edi', 'unsigned long riovcnt'), Param('$ebp', 'unsigned long flags')])
-syscall_table[0x15d] = Entry('kcmp', [Param('$ebx', 'pid_t pid1'), Param('$ecx', 'pid_t pid2'), Param('$edx', 'int type'), Param('$esi', 'unsigned long idx1'), Param('$edi', 'unsigned long idx2')])
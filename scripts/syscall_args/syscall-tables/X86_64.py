@@ -1,304 +0,0 @@
-from collections import namedtuple
-
-Entry = namedtuple('Entry', 'name params')
-Param = namedtuple('Param', 'reg param')
-
-syscall_table = {}
-syscall_table[0x00] = Entry('read', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'char *buf'), Param('$rdx', 'size_t count')])
-syscall_table[0x01] = Entry('write', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'const char *buf'), Param('$rdx', 'size_t count')])
-syscall_table[0x02] = Entry('open', [Param('$rdi', 'const char *filename'), Param('$rsi', 'int flags'), Param('$rdx', 'umode_t mode')])
-syscall_table[0x03] = Entry('close', [Param('$rdi', 'unsigned int fd')])
-syscall_table[0x04] = Entry('stat', [Param('$rdi', 'const char *filename'), Param('$rsi', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x05] = Entry('fstat', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x06] = Entry('lstat', [Param('$rdi', 'const char *filename'), Param('$rsi', 'struct __old_kernel_stat *statbuf')])
-syscall_table[0x07] = Entry('poll', [Param('$rdi', 'struct pollfd *ufds'), Param('$rsi', 'unsigned int nfds'), Param('$rdx', 'int timeout_msecs')])
-syscall_table[0x08] = Entry('lseek', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'off_t offset'), Param('$rdx', 'unsigned int origin')])
-syscall_table[0x09] = Entry('mmap', [Param('$rdi', 'unsigned long addr'), Param('$rsi', 'unsigned long len'), Param('$rdx', 'unsigned long prot'), Param('$r10', 'unsigned long flags'), Param('$r8', 'unsigned long fd'), Param('$r9', 'unsigned long off')])
-syscall_table[0x0a] = Entry('mprotect', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'size_t len'), Param('$rdx', 'unsigned long prot')])
-syscall_table[0x0b] = Entry('munmap', [Param('$rdi', 'unsigned long addr'), Param('$rsi', 'size_t len')])
-syscall_table[0x0c] = Entry('brk', [Param('$rdi', 'unsigned long brk')])
-syscall_table[0x0d] = Entry('rt_sigaction', [Param('$rdi', 'int sig'), Param('$rsi', 'const struct sigaction *act'), Param('$rdx', 'struct sigaction *oact'), Param('$r10', 'size_t sigsetsize')])
-syscall_table[0x0e] = Entry('rt_sigprocmask', [Param('$rdi', 'int how'), Param('$rsi', 'sigset_t *nset'), Param('$rdx', 'sigset_t *oset'), Param('$r10', 'size_t sigsetsize')])
-syscall_table[0x0f] = Entry('rt_sigreturn', [])
-syscall_table[0x10] = Entry('ioctl', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'unsigned int cmd'), Param('$rdx', 'unsigned long arg')])
-syscall_table[0x11] = Entry('pread64', [Param('$rdi', 'char *buf size_t count'), Param('$rsi', 'loff_t pos')])
-syscall_table[0x12] = Entry('pwrite64', [Param('$rdi', 'const char *buf size_t count'), Param('$rsi', 'loff_t pos')])
-syscall_table[0x13] = Entry('readv', [Param('$rdi', 'unsigned long fd'), Param('$rsi', 'const struct iovec *vec'), Param('$rdx', 'unsigned long vlen')])
-syscall_table[0x14] = Entry('writev', [Param('$rdi', 'unsigned long fd'), Param('$rsi', 'const struct iovec *vec'), Param('$rdx', 'unsigned long vlen')])
-syscall_table[0x15] = Entry('access', [Param('$rdi', 'const char *filename'), Param('$rsi', 'int mode')])
-syscall_table[0x16] = Entry('pipe', [Param('$rdi', 'int *fildes')])
-syscall_table[0x17] = Entry('select', [Param('$rdi', 'int n'), Param('$rsi', 'fd_set *inp'), Param('$rdx', 'fd_set *outp'), Param('$r10', 'fd_set *exp'), Param('$r8', 'struct timeval *tvp')])
-syscall_table[0x18] = Entry('sched_yield', [])
-syscall_table[0x19] = Entry('mremap', [Param('$rdi', 'unsigned long addr'), Param('$rsi', 'unsigned long old_len'), Param('$rdx', 'unsigned long new_len'), Param('$r10', 'unsigned long flags'), Param('$r8', 'unsigned long new_addr')])
-syscall_table[0x1a] = Entry('msync', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'size_t len'), Param('$rdx', 'int flags')])
-syscall_table[0x1b] = Entry('mincore', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'size_t len'), Param('$rdx', 'unsigned char *vec')])
-syscall_table[0x1c] = Entry('madvise', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'size_t len_in'), Param('$rdx', 'int behavior')])
-syscall_table[0x1d] = Entry('shmget', [Param('$rdi', 'key_t key'), Param('$rsi', 'size_t size'), Param('$rdx', 'int shmflg')])
-syscall_table[0x1e] = Entry('shmat', [Param('$rdi', 'int shmid'), Param('$rsi', 'char *shmaddr'), Param('$rdx', 'int shmflg')])
-syscall_table[0x1f] = Entry('shmctl', [Param('$rdi', 'int shmid'), Param('$rsi', 'int cmd'), Param('$rdx', 'struct shmid_ds *buf')])
-syscall_table[0x20] = Entry('dup', [Param('$rdi', 'unsigned int fildes')])
-syscall_table[0x21] = Entry('dup2', [Param('$rdi', 'unsigned int oldfd'), Param('$rsi', 'unsigned int newfd')])
-syscall_table[0x22] = Entry('pause', [])
-syscall_table[0x23] = Entry('nanosleep', [Param('$rdi', 'struct timespec *rqtp'), Param('$rsi', 'struct timespec *rmtp')])
-syscall_table[0x24] = Entry('getitimer', [Param('$rdi', 'int which'), Param('$rsi', 'struct itimerval *value')])
-syscall_table[0x25] = Entry('alarm', [Param('$rdi', 'unsigned int seconds')])
-syscall_table[0x26] = Entry('setitimer', [Param('$rdi', 'int which'), Param('$rsi', 'struct itimerval *value'), Param('$rdx', 'struct itimerval *ovalue')])
-syscall_table[0x27] = Entry('getpid', [])
-syscall_table[0x28] = Entry('sendfile', [Param('$rdi', 'int out_fd'), Param('$rsi', 'int in_fd'), Param('$rdx', 'off_t *offset'), Param('$r10', 'size_t count')])
-syscall_table[0x29] = Entry('socket', [Param('$rdi', 'int family'), Param('$rsi', 'int type'), Param('$rdx', 'int protocol')])
-syscall_table[0x2a] = Entry('connect', [Param('$rdi', 'int fd'), Param('$rsi', 'struct sockaddr *uservaddr'), Param('$rdx', 'int addrlen')])
-syscall_table[0x2b] = Entry('accept', [Param('$rdi', 'int fd'), Param('$rsi', 'struct sockaddr *upeer_sockaddr'), Param('$rdx', 'int *upeer_addrlen')])
-syscall_table[0x2c] = Entry('sendto', [Param('$rdi', 'int fd'), Param('$rsi', 'void *buff'), Param('$rdx', 'size_t len'), Param('$r10', 'unsigned int flags'), Param('$r8', 'struct sockaddr *addr'), Param('$r9', 'int addr_len')])
-syscall_table[0x2d] = Entry('recvfrom', [Param('$rdi', 'int fd'), Param('$rsi', 'void *ubuf'), Param('$rdx', 'size_t size'), Param('$r10', 'unsigned int flags'), Param('$r8', 'struct sockaddr *addr'), Param('$r9', 'int *addr_len')])
-syscall_table[0x2e] = Entry('sendmsg', [Param('$rdi', 'int fd'), Param('$rsi', 'struct msghdr *msg'), Param('$rdx', 'unsigned int flags')])
-syscall_table[0x2f] = Entry('recvmsg', [Param('$rdi', 'int fd'), Param('$rsi', 'struct msghdr *msg'), Param('$rdx', 'unsigned int flags')])
-syscall_table[0x30] = Entry('shutdown', [Param('$rdi', 'int fd'), Param('$rsi', 'int how')])
-syscall_table[0x31] = Entry('bind', [Param('$rdi', 'int fd'), Param('$rsi', 'struct sockaddr *umyaddr'), Param('$rdx', 'int addrlen')])
-syscall_table[0x32] = Entry('listen', [Param('$rdi', 'int fd'), Param('$rsi', 'int backlog')])
-syscall_table[0x33] = Entry('getsockname', [Param('$rdi', 'int fd'), Param('$rsi', 'struct sockaddr *usockaddr'), Param('$rdx', 'int *usockaddr_len')])
-syscall_table[0x34] = Entry('getpeername', [Param('$rdi', 'int fd'), Param('$rsi', 'struct sockaddr *usockaddr'), Param('$rdx', 'int *usockaddr_len')])
-syscall_table[0x35] = Entry('socketpair', [Param('$rdi', 'int family'), Param('$rsi', 'int type'), Param('$rdx', 'int protocol'), Param('$r10', 'int *usockvec')])
-syscall_table[0x36] = Entry('setsockopt', [Param('$rdi', 'int fd'), Param('$rsi', 'int level'), Param('$rdx', 'int optname'), Param('$r10', 'char *optval'), Param('$r8', 'int optlen')])
-syscall_table[0x37] = Entry('getsockopt', [Param('$rdi', 'int fd'), Param('$rsi', 'int level'), Param('$rdx', 'int optname'), Param('$r10', 'char *optval'), Param('$r8', 'int *optlen')])
-syscall_table[0x38] = Entry('clone', [Param('$rdi', 'unsigned long clone_flags'), Param('$rsi', 'unsigned long newsp'), Param('$rdx', 'void *parent_tid'), Param('$r10', 'void *child_tid')])
-syscall_table[0x39] = Entry('fork', [])
-syscall_table[0x3a] = Entry('vfork', [])
-syscall_table[0x3b] = Entry('execve', [Param('$rdi', 'const char *name'), Param('$rsi', 'const char *const *argv'), Param('$rdx', 'const char *const *envp')])
-syscall_table[0x3c] = Entry('exit', [Param('$rdi', 'int error_code')])
-syscall_table[0x3d] = Entry('wait4', [Param('$rdi', 'pid_t upid'), Param('$rsi', 'int *stat_addr'), Param('$rdx', 'int options'), Param('$r10', 'struct rusage *ru')])
-syscall_table[0x3e] = Entry('kill', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'int sig')])
-syscall_table[0x3f] = Entry('uname', [Param('$rdi', 'struct old_utsname *name')])
-syscall_table[0x40] = Entry('semget', [Param('$rdi', 'key_t key'), Param('$rsi', 'int nsems'), Param('$rdx', 'int semflg')])
-syscall_table[0x41] = Entry('semop', [Param('$rdi', 'int semid'), Param('$rsi', 'struct sembuf *tsops'), Param('$rdx', 'unsigned nsops')])
-syscall_table[0x42] = Entry('semctl', [Param('$rdi', 'int semnum int cmd'), Param('$rsi', 'union semun arg')])
-syscall_table[0x43] = Entry('shmdt', [Param('$rdi', 'char *shmaddr')])
-syscall_table[0x44] = Entry('msgget', [Param('$rdi', 'key_t key'), Param('$rsi', 'int msgflg')])
-syscall_table[0x45] = Entry('msgsnd', [Param('$rdi', 'int msqid'), Param('$rsi', 'struct msgbuf *msgp'), Param('$rdx', 'size_t msgsz'), Param('$r10', 'int msgflg')])
-syscall_table[0x46] = Entry('msgrcv', [Param('$rdi', 'int msqid'), Param('$rsi', 'struct msgbuf *msgp'), Param('$rdx', 'size_t msgsz'), Param('$r10', 'long msgtyp'), Param('$r8', 'int msgflg')])
-syscall_table[0x47] = Entry('msgctl', [Param('$rdi', 'int msqid'), Param('$rsi', 'int cmd'), Param('$rdx', 'struct msqid_ds *buf')])
-syscall_table[0x48] = Entry('fcntl', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'unsigned int cmd'), Param('$rdx', 'unsigned long arg')])
-syscall_table[0x49] = Entry('flock', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'unsigned int cmd')])
-syscall_table[0x4a] = Entry('fsync', [Param('$rdi', 'unsigned int fd')])
-syscall_table[0x4b] = Entry('fdatasync', [Param('$rdi', 'unsigned int fd')])
-syscall_table[0x4c] = Entry('truncate', [Param('$rdi', 'const char *path'), Param('$rsi', 'long length')])
-syscall_table[0x4d] = Entry('ftruncate', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'unsigned long length')])
-syscall_table[0x4e] = Entry('getdents', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'struct linux_dirent *dirent'), Param('$rdx', 'unsigned int count')])
-syscall_table[0x4f] = Entry('getcwd', [Param('$rdi', 'char *buf'), Param('$rsi', 'unsigned long size')])
-syscall_table[0x50] = Entry('chdir', [Param('$rdi', 'const char *filename')])
-syscall_table[0x51] = Entry('fchdir', [Param('$rdi', 'unsigned int fd')])
-syscall_table[0x52] = Entry('rename', [Param('$rdi', 'const char *oldname'), Param('$rsi', 'const char *newname')])
-syscall_table[0x53] = Entry('mkdir', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'umode_t mode')])
-syscall_table[0x54] = Entry('rmdir', [Param('$rdi', 'const char *pathname')])
-syscall_table[0x55] = Entry('creat', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'umode_t mode')])
-syscall_table[0x56] = Entry('link', [Param('$rdi', 'const char *oldname'), Param('$rsi', 'const char *newname')])
-syscall_table[0x57] = Entry('unlink', [Param('$rdi', 'const char *pathname')])
-syscall_table[0x58] = Entry('symlink', [Param('$rdi', 'const char *oldname'), Param('$rsi', 'const char *newname')])
-syscall_table[0x59] = Entry('readlink', [Param('$rdi', 'const char *path'), Param('$rsi', 'char *buf'), Param('$rdx', 'int bufsiz')])
-syscall_table[0x5a] = Entry('chmod', [Param('$rdi', 'const char *filename'), Param('$rsi', 'umode_t mode')])
-syscall_table[0x5b] = Entry('fchmod', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'umode_t mode')])
-syscall_table[0x5c] = Entry('chown', [Param('$rdi', 'const char *filename'), Param('$rsi', 'uid_t user'), Param('$rdx', 'gid_t group')])
-syscall_table[0x5d] = Entry('fchown', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'uid_t user'), Param('$rdx', 'gid_t group')])
-syscall_table[0x5e] = Entry('lchown', [Param('$rdi', 'const char *filename'), Param('$rsi', 'uid_t user'), Param('$rdx', 'gid_t group')])
-syscall_table[0x5f] = Entry('umask', [Param('$rdi', 'int mask')])
-syscall_table[0x60] = Entry('gettimeofday', [Param('$rdi', 'struct timeval *tv'), Param('$rsi', 'struct timezone *tz')])
-syscall_table[0x61] = Entry('getrlimit', [Param('$rdi', 'unsigned int resource'), Param('$rsi', 'struct rlimit *rlim')])
-syscall_table[0x62] = Entry('getrusage', [Param('$rdi', 'int who'), Param('$rsi', 'struct rusage *ru')])
-syscall_table[0x63] = Entry('sysinfo', [Param('$rdi', 'struct sysinfo *info')])
-syscall_table[0x64] = Entry('times', [Param('$rdi', 'struct tms *tbuf')])
-syscall_table[0x65] = Entry('ptrace', [Param('$rdi', 'long request'), Param('$rsi', 'long pid'), Param('$rdx', 'unsigned long addr'), Param('$r10', 'unsigned long data')])
-syscall_table[0x66] = Entry('getuid', [])
-syscall_table[0x67] = Entry('syslog', [Param('$rdi', 'int type'), Param('$rsi', 'char *buf'), Param('$rdx', 'int len')])
-syscall_table[0x68] = Entry('getgid', [])
-syscall_table[0x69] = Entry('setuid', [Param('$rdi', 'uid_t uid')])
-syscall_table[0x6a] = Entry('setgid', [Param('$rdi', 'gid_t gid')])
-syscall_table[0x6b] = Entry('geteuid', [])
-syscall_table[0x6c] = Entry('getegid', [])
-syscall_table[0x6d] = Entry('setpgid', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'pid_t pgid')])
-syscall_table[0x6e] = Entry('getppid', [])
-syscall_table[0x6f] = Entry('getpgrp', [])
-syscall_table[0x70] = Entry('setsid', [])
-syscall_table[0x71] = Entry('setreuid', [Param('$rdi', 'uid_t ruid'), Param('$rsi', 'uid_t euid')])
-syscall_table[0x72] = Entry('setregid', [Param('$rdi', 'gid_t rgid'), Param('$rsi', 'gid_t egid')])
-syscall_table[0x73] = Entry('getgroups', [Param('$rdi', 'int gidsetsize'), Param('$rsi', 'gid_t *grouplist')])
-syscall_table[0x74] = Entry('setgroups', [Param('$rdi', 'int gidsetsize'), Param('$rsi', 'gid_t *grouplist')])
-syscall_table[0x75] = Entry('setresuid', [Param('$rdi', 'uid_t ruid'), Param('$rsi', 'uid_t euid'), Param('$rdx', 'uid_t suid')])
-syscall_table[0x76] = Entry('getresuid', [Param('$rdi', 'uid_t *ruidp'), Param('$rsi', 'uid_t *euidp'), Param('$rdx', 'uid_t *suidp')])
-syscall_table[0x77] = Entry('setresgid', [Param('$rdi', 'gid_t rgid'), Param('$rsi', 'gid_t egid'), Param('$rdx', 'gid_t sgid')])
-syscall_table[0x78] = Entry('getresgid', [Param('$rdi', 'gid_t *rgidp'), Param('$rsi', 'gid_t *egidp'), Param('$rdx', 'gid_t *sgidp')])
-syscall_table[0x79] = Entry('getpgid', [Param('$rdi', 'pid_t pid')])
-syscall_table[0x7a] = Entry('setfsuid', [Param('$rdi', 'uid_t uid')])
-syscall_table[0x7b] = Entry('setfsgid', [Param('$rdi', 'gid_t gid')])
-syscall_table[0x7c] = Entry('getsid', [Param('$rdi', 'pid_t pid')])
-syscall_table[0x7d] = Entry('capget', [Param('$rdi', 'cap_user_header_t header'), Param('$rsi', 'cap_user_data_t dataptr')])
-syscall_table[0x7e] = Entry('capset', [Param('$rdi', 'cap_user_header_t header'), Param('$rsi', 'const cap_user_data_t data')])
-syscall_table[0x7f] = Entry('rt_sigpending', [Param('$rdi', 'sigset_t *set'), Param('$rsi', 'size_t sigsetsize')])
-syscall_table[0x80] = Entry('rt_sigtimedwait', [Param('$rdi', 'const sigset_t *uthese'), Param('$rsi', 'siginfo_t *uinfo'), Param('$rdx', 'const struct timespec *uts'), Param('$r10', 'size_t sigsetsize')])
-syscall_table[0x81] = Entry('rt_sigqueueinfo', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'int sig'), Param('$rdx', 'siginfo_t *uinfo')])
-syscall_table[0x82] = Entry('rt_sigsuspend', [Param('$rdi', 'sigset_t *unewset'), Param('$rsi', 'size_t sigsetsize')])
-syscall_table[0x83] = Entry('sigaltstack', [Param('$rdi', 'const stack_t *uss'), Param('$rsi', 'stack_t *uoss')])
-syscall_table[0x84] = Entry('utime', [Param('$rdi', 'char *filename'), Param('$rsi', 'struct utimbuf *times')])
-syscall_table[0x85] = Entry('mknod', [Param('$rdi', 'const char *filename'), Param('$rsi', 'umode_t mode'), Param('$rdx', 'unsigned dev')])
-syscall_table[0x87] = Entry('personality', [Param('$rdi', 'unsigned int personality')])
-syscall_table[0x88] = Entry('ustat', [Param('$rdi', 'unsigned dev'), Param('$rsi', 'struct ustat *ubuf')])
-syscall_table[0x89] = Entry('statfs', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'struct statfs *buf')])
-syscall_table[0x8a] = Entry('fstatfs', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'struct statfs *buf')])
-syscall_table[0x8b] = Entry('sysfs', [Param('$rdi', 'int option'), Param('$rsi', 'unsigned long arg1'), Param('$rdx', 'unsigned long arg2')])
-syscall_table[0x8c] = Entry('getpriority', [Param('$rdi', 'int which'), Param('$rsi', 'int who')])
-syscall_table[0x8d] = Entry('setpriority', [Param('$rdi', 'int which'), Param('$rsi', 'int who'), Param('$rdx', 'int niceval')])
-syscall_table[0x8e] = Entry('sched_setparam', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'struct sched_param *param')])
-syscall_table[0x8f] = Entry('sched_getparam', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'struct sched_param *param')])
-syscall_table[0x90] = Entry('sched_setscheduler', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'int policy'), Param('$rdx', 'struct sched_param *param')])
-syscall_table[0x91] = Entry('sched_getscheduler', [Param('$rdi', 'pid_t pid')])
-syscall_table[0x92] = Entry('sched_get_priority_max', [Param('$rdi', 'int policy')])
-syscall_table[0x93] = Entry('sched_get_priority_min', [Param('$rdi', 'int policy')])
-syscall_table[0x94] = Entry('sched_rr_get_interval', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'struct timespec *interval')])
-syscall_table[0x95] = Entry('mlock', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'size_t len')])
-syscall_table[0x96] = Entry('munlock', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'size_t len')])
-syscall_table[0x97] = Entry('mlockall', [Param('$rdi', 'int flags')])
-syscall_table[0x98] = Entry('munlockall', [])
-syscall_table[0x99] = Entry('vhangup', [])
-syscall_table[0x9a] = Entry('modify_ldt', [Param('$rdi', 'int func'), Param('$rsi', 'void *ptr'), Param('$rdx', 'unsigned long bytecount')])
-syscall_table[0x9b] = Entry('pivot_root', [Param('$rdi', 'const char *new_root'), Param('$rsi', 'const char *put_old')])
-syscall_table[0x9c] = Entry('_sysctl', [Param('$rdi', 'struct __sysctl_args *args')])
-syscall_table[0x9d] = Entry('prctl', [Param('$rdi', 'int option'), Param('$rsi', 'unsigned long arg2'), Param('$rdx', 'unsigned long arg3'), Param('$r10', 'unsigned long arg4'), Param('$r8', 'unsigned long arg5')])
-syscall_table[0x9e] = Entry('arch_prctl', [Param('$rdi', 'int code'), Param('$rsi', 'unsigned long addr')])
-syscall_table[0x9f] = Entry('adjtimex', [Param('$rdi', 'struct timex *txc_p')])
-syscall_table[0xa0] = Entry('setrlimit', [Param('$rdi', 'unsigned int resource'), Param('$rsi', 'struct rlimit *rlim')])
-syscall_table[0xa1] = Entry('chroot', [Param('$rdi', 'const char *filename')])
-syscall_table[0xa2] = Entry('sync', [])
-syscall_table[0xa3] = Entry('acct', [Param('$rdi', 'const char *name')])
-syscall_table[0xa4] = Entry('settimeofday', [Param('$rdi', 'struct timeval *tv'), Param('$rsi', 'struct timezone *tz')])
-syscall_table[0xa5] = Entry('mount', [Param('$rdi', 'char *dev_name'), Param('$rsi', 'char *dir_name'), Param('$rdx', 'char *type'), Param('$r10', 'unsigned long flags'), Param('$r8', 'void *data')])
-syscall_table[0xa6] = Entry('umount2', [Param('$rdi', 'char *name'), Param('$rsi', 'int flags')])
-syscall_table[0xa7] = Entry('swapon', [Param('$rdi', 'const char *specialfile'), Param('$rsi', 'int swap_flags')])
-syscall_table[0xa8] = Entry('swapoff', [Param('$rdi', 'const char *specialfile')])
-syscall_table[0xa9] = Entry('reboot', [Param('$rdi', 'int magic1'), Param('$rsi', 'int magic2'), Param('$rdx', 'unsigned int cmd'), Param('$r10', 'void *arg')])
-syscall_table[0xaa] = Entry('sethostname', [Param('$rdi', 'char *name'), Param('$rsi', 'int len')])
-syscall_table[0xab] = Entry('setdomainname', [Param('$rdi', 'char *name'), Param('$rsi', 'int len')])
-syscall_table[0xac] = Entry('iopl', [Param('$rdi', 'unsigned int level')])
-syscall_table[0xad] = Entry('ioperm', [Param('$rdi', 'unsigned long from'), Param('$rsi', 'unsigned long num'), Param('$rdx', 'int turn_on')])
-syscall_table[0xaf] = Entry('init_module', [Param('$rdi', 'void *umod'), Param('$rsi', 'unsigned long len'), Param('$rdx', 'const char *uargs')])
-syscall_table[0xb0] = Entry('delete_module', [Param('$rdi', 'const char *name_user'), Param('$rsi', 'unsigned int flags')])
-syscall_table[0xb3] = Entry('quotactl', [Param('$rdi', 'unsigned int cmd'), Param('$rsi', 'const char *special'), Param('$rdx', 'qid_t id'), Param('$r10', 'void *addr')])
-syscall_table[0xba] = Entry('gettid', [])
-syscall_table[0xbb] = Entry('readahead', [Param('$rdi', 'loff_t offset size_t count')])
-syscall_table[0xbc] = Entry('setxattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'const char *name'), Param('$rdx', 'const void *value'), Param('$r10', 'size_t size'), Param('$r8', 'int flags')])
-syscall_table[0xbd] = Entry('lsetxattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'const char *name'), Param('$rdx', 'const void *value'), Param('$r10', 'size_t size'), Param('$r8', 'int flags')])
-syscall_table[0xbe] = Entry('fsetxattr', [Param('$rdi', 'int fd'), Param('$rsi', 'const char *name'), Param('$rdx', 'const void *value'), Param('$r10', 'size_t size'), Param('$r8', 'int flags')])
-syscall_table[0xbf] = Entry('getxattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'const char *name'), Param('$rdx', 'void *value'), Param('$r10', 'size_t size')])
-syscall_table[0xc0] = Entry('lgetxattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'const char *name'), Param('$rdx', 'void *value'), Param('$r10', 'size_t size')])
-syscall_table[0xc1] = Entry('fgetxattr', [Param('$rdi', 'int fd'), Param('$rsi', 'const char *name'), Param('$rdx', 'void *value'), Param('$r10', 'size_t size')])
-syscall_table[0xc2] = Entry('listxattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'char *list'), Param('$rdx', 'size_t size')])
-syscall_table[0xc3] = Entry('llistxattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'char *list'), Param('$rdx', 'size_t size')])
-syscall_table[0xc4] = Entry('flistxattr', [Param('$rdi', 'int fd'), Param('$rsi', 'char *list'), Param('$rdx', 'size_t size')])
-syscall_table[0xc5] = Entry('removexattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'const char *name')])
-syscall_table[0xc6] = Entry('lremovexattr', [Param('$rdi', 'const char *pathname'), Param('$rsi', 'const char *name')])
-syscall_table[0xc7] = Entry('fremovexattr', [Param('$rdi', 'int fd'), Param('$rsi', 'const char *name')])
-syscall_table[0xc8] = Entry('tkill', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'int sig')])
-syscall_table[0xc9] = Entry('time', [Param('$rdi', 'time_t *tloc')])
-syscall_table[0xca] = Entry('futex', [Param('$rdi', 'u32 *uaddr'), Param('$rsi', 'int op'), Param('$rdx', 'u32 val'), Param('$r10', 'struct timespec *utime'), Param('$r8', 'u32 *uaddr2'), Param('$r9', 'u32 val3')])
-syscall_table[0xcb] = Entry('sched_setaffinity', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'unsigned int len'), Param('$rdx', 'unsigned long *user_mask_ptr')])
-syscall_table[0xcc] = Entry('sched_getaffinity', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'unsigned int len'), Param('$rdx', 'unsigned long *user_mask_ptr')])
-syscall_table[0xce] = Entry('io_setup', [Param('$rdi', 'unsigned nr_events'), Param('$rsi', 'aio_context_t *ctxp')])
-syscall_table[0xcf] = Entry('io_destroy', [Param('$rdi', 'aio_context_t ctx')])
-syscall_table[0xd0] = Entry('io_getevents', [Param('$rdi', 'aio_context_t ctx_id'), Param('$rsi', 'long min_nr'), Param('$rdx', 'long nr'), Param('$r10', 'struct io_event *events'), Param('$r8', 'struct timespec *timeout')])
-syscall_table[0xd1] = Entry('io_submit', [Param('$rdi', 'aio_context_t ctx_id'), Param('$rsi', 'long nr'), Param('$rdx', 'struct iocb * *iocbpp')])
-syscall_table[0xd2] = Entry('io_cancel', [Param('$rdi', 'aio_context_t ctx_id'), Param('$rsi', 'struct iocb *iocb'), Param('$rdx', 'struct io_event *result')])
-syscall_table[0xd4] = Entry('lookup_dcookie', [Param('$rdi', 'char *buf size_t len')])
-syscall_table[0xd5] = Entry('epoll_create', [Param('$rdi', 'int size')])
-syscall_table[0xd8] = Entry('remap_file_pages', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'unsigned long size'), Param('$rdx', 'unsigned long prot'), Param('$r10', 'unsigned long pgoff'), Param('$r8', 'unsigned long flags')])
-syscall_table[0xd9] = Entry('getdents64', [Param('$rdi', 'unsigned int fd'), Param('$rsi', 'struct linux_dirent64 *dirent'), Param('$rdx', 'unsigned int count')])
-syscall_table[0xda] = Entry('set_tid_address', [Param('$rdi', 'int *tidptr')])
-syscall_table[0xdb] = Entry('restart_syscall', [])
-syscall_table[0xdc] = Entry('semtimedop', [Param('$rdi', 'int semid'), Param('$rsi', 'struct sembuf *tsops'), Param('$rdx', 'unsigned nsops'), Param('$r10', 'const struct timespec *timeout')])
-syscall_table[0xdd] = Entry('fadvise64', [Param('$rdi', 'loff_t offset size_t len'), Param('$rsi', 'int advice')])
-syscall_table[0xde] = Entry('timer_create', [Param('$rdi', 'const clockid_t which_clock'), Param('$rsi', 'struct sigevent *timer_event_spec'), Param('$rdx', 'timer_t *created_timer_id')])
-syscall_table[0xdf] = Entry('timer_settime', [Param('$rdi', 'timer_t timer_id'), Param('$rsi', 'int flags'), Param('$rdx', 'const struct itimerspec *new_setting'), Param('$r10', 'struct itimerspec *old_setting')])
-syscall_table[0xe0] = Entry('timer_gettime', [Param('$rdi', 'timer_t timer_id'), Param('$rsi', 'struct itimerspec *setting')])
-syscall_table[0xe1] = Entry('timer_getoverrun', [Param('$rdi', 'timer_t timer_id')])
-syscall_table[0xe2] = Entry('timer_delete', [Param('$rdi', 'timer_t timer_id')])
-syscall_table[0xe3] = Entry('clock_settime', [Param('$rdi', 'const clockid_t which_clock'), Param('$rsi', 'const struct timespec *tp')])
-syscall_table[0xe4] = Entry('clock_gettime', [Param('$rdi', 'const clockid_t which_clock'), Param('$rsi', 'struct timespec *tp')])
-syscall_table[0xe5] = Entry('clock_getres', [Param('$rdi', 'const clockid_t which_clock'), Param('$rsi', 'struct timespec *tp')])
-syscall_table[0xe6] = Entry('clock_nanosleep', [Param('$rdi', 'const clockid_t which_clock'), Param('$rsi', 'int flags'), Param('$rdx', 'const struct timespec *rqtp'), Param('$r10', 'struct timespec *rmtp')])
-syscall_table[0xe7] = Entry('exit_group', [Param('$rdi', 'int error_code')])
-syscall_table[0xe8] = Entry('epoll_wait', [Param('$rdi', 'int epfd'), Param('$rsi', 'struct epoll_event *events'), Param('$rdx', 'int maxevents'), Param('$r10', 'int timeout')])
-syscall_table[0xe9] = Entry('epoll_ctl', [Param('$rdi', 'int epfd'), Param('$rsi', 'int op'), Param('$rdx', 'int fd'), Param('$r10', 'struct epoll_event *event')])
-syscall_table[0xea] = Entry('tgkill', [Param('$rdi', 'pid_t tgid'), Param('$rsi', 'pid_t pid'), Param('$rdx', 'int sig')])
-syscall_table[0xeb] = Entry('utimes', [Param('$rdi', 'char *filename'), Param('$rsi', 'struct timeval *utimes')])
-syscall_table[0xed] = Entry('mbind', [Param('$rdi', 'unsigned long start'), Param('$rsi', 'unsigned long len'), Param('$rdx', 'unsigned long mode'), Param('$r10', 'unsigned long *nmask'), Param('$r8', 'unsigned long maxnode'), Param('$r9', 'unsigned flags')])
-syscall_table[0xee] = Entry('set_mempolicy', [Param('$rdi', 'int mode'), Param('$rsi', 'unsigned long *nmask'), Param('$rdx', 'unsigned long maxnode')])
-syscall_table[0xef] = Entry('get_mempolicy', [Param('$rdi', 'int *policy'), Param('$rsi', 'unsigned long *nmask'), Param('$rdx', 'unsigned long maxnode'), Param('$r10', 'unsigned long addr'), Param('$r8', 'unsigned long flags')])
-syscall_table[0xf0] = Entry('mq_open', [Param('$rdi', 'const char *u_name'), Param('$rsi', 'int oflag'), Param('$rdx', 'umode_t mode'), Param('$r10', 'struct mq_attr *u_attr')])
-syscall_table[0xf1] = Entry('mq_unlink', [Param('$rdi', 'const char *u_name')])
-syscall_table[0xf2] = Entry('mq_timedsend', [Param('$rdi', 'mqd_t mqdes'), Param('$rsi', 'const char *u_msg_ptr'), Param('$rdx', 'size_t msg_len'), Param('$r10', 'unsigned int msg_prio'), Param('$r8', 'const struct timespec *u_abs_timeout')])
-syscall_table[0xf3] = Entry('mq_timedreceive', [Param('$rdi', 'mqd_t mqdes'), Param('$rsi', 'char *u_msg_ptr'), Param('$rdx', 'size_t msg_len'), Param('$r10', 'unsigned int *u_msg_prio'), Param('$r8', 'const struct timespec *u_abs_timeout')])
-syscall_table[0xf4] = Entry('mq_notify', [Param('$rdi', 'mqd_t mqdes'), Param('$rsi', 'const struct sigevent *u_notification')])
-syscall_table[0xf5] = Entry('mq_getsetattr', [Param('$rdi', 'mqd_t mqdes'), Param('$rsi', 'const struct mq_attr *u_mqstat'), Param('$rdx', 'struct mq_attr *u_omqstat')])
-syscall_table[0xf6] = Entry('kexec_load', [Param('$rdi', 'unsigned long entry'), Param('$rsi', 'unsigned long nr_segments'), Param('$rdx', 'struct kexec_segment *segments'), Param('$r10', 'unsigned long flags')])
-syscall_table[0xf7] = Entry('waitid', [Param('$rdi', 'int which'), Param('$rsi', 'pid_t upid'), Param('$rdx', 'struct siginfo *infop'), Param('$r10', 'int options'), Param('$r8', 'struct rusage *ru')])
-syscall_table[0xf8] = Entry('add_key', [Param('$rdi', 'const char *_type'), Param('$rsi', 'const char *_description'), Param('$rdx', 'const void *_payload'), Param('$r10', 'size_t plen'), Param('$r8', 'key_serial_t ringid')])
-syscall_table[0xf9] = Entry('request_key', [Param('$rdi', 'const char *_type'), Param('$rsi', 'const char *_description'), Param('$rdx', 'const char *_callout_info'), Param('$r10', 'key_serial_t destringid')])
-syscall_table[0xfa] = Entry('keyctl', [Param('$rdi', 'int option'), Param('$rsi', 'unsigned long arg2'), Param('$rdx', 'unsigned long arg3'), Param('$r10', 'unsigned long arg4'), Param('$r8', 'unsigned long arg5')])
-syscall_table[0xfb] = Entry('ioprio_set', [Param('$rdi', 'int which'), Param('$rsi', 'int who'), Param('$rdx', 'int ioprio')])
-syscall_table[0xfc] = Entry('ioprio_get', [Param('$rdi', 'int which'), Param('$rsi', 'int who')])
-syscall_table[0xfd] = Entry('inotify_init', [])
-syscall_table[0xfe] = Entry('inotify_add_watch', [Param('$rdi', 'int fd'), Param('$rsi', 'const char *pathname'), Param('$rdx', 'u32 mask')])
-syscall_table[0xff] = Entry('inotify_rm_watch', [Param('$rdi', 'int fd'), Param('$rsi', '__s32 wd')])
-syscall_table[0x100] = Entry('migrate_pages', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'unsigned long maxnode'), Param('$rdx', 'const unsigned long *old_nodes'), Param('$r10', 'const unsigned long *new_nodes')])
-syscall_table[0x101] = Entry('openat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'int flags'), Param('$r10', 'umode_t mode')])
-syscall_table[0x102] = Entry('mkdirat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *pathname'), Param('$rdx', 'umode_t mode')])
-syscall_table[0x103] = Entry('mknodat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'umode_t mode'), Param('$r10', 'unsigned dev')])
-syscall_table[0x104] = Entry('fchownat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'uid_t user'), Param('$r10', 'gid_t group'), Param('$r8', 'int flag')])
-syscall_table[0x105] = Entry('futimesat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'struct timeval *utimes')])
-syscall_table[0x106] = Entry('newfstatat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'struct stat *statbuf'), Param('$r10', 'int flag')])
-syscall_table[0x107] = Entry('unlinkat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *pathname'), Param('$rdx', 'int flag')])
-syscall_table[0x108] = Entry('renameat', [Param('$rdi', 'int olddfd'), Param('$rsi', 'const char *oldname'), Param('$rdx', 'int newdfd'), Param('$r10', 'const char *newname')])
-syscall_table[0x109] = Entry('linkat', [Param('$rdi', 'int olddfd'), Param('$rsi', 'const char *oldname'), Param('$rdx', 'int newdfd'), Param('$r10', 'const char *newname'), Param('$r8', 'int flags')])
-syscall_table[0x10a] = Entry('symlinkat', [Param('$rdi', 'const char *oldname'), Param('$rsi', 'int newdfd'), Param('$rdx', 'const char *newname')])
-syscall_table[0x10b] = Entry('readlinkat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *pathname'), Param('$rdx', 'char *buf'), Param('$r10', 'int bufsiz')])
-syscall_table[0x10c] = Entry('fchmodat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'umode_t mode')])
-syscall_table[0x10d] = Entry('faccessat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'int mode')])
-syscall_table[0x10e] = Entry('pselect6', [Param('$rdi', 'int n'), Param('$rsi', 'fd_set *inp'), Param('$rdx', 'fd_set *outp'), Param('$r10', 'fd_set *exp'), Param('$r8', 'struct timespec *tsp'), Param('$r9', 'void *sig')])
-syscall_table[0x10f] = Entry('ppoll', [Param('$rdi', 'struct pollfd *ufds'), Param('$rsi', 'unsigned int nfds'), Param('$rdx', 'struct timespec *tsp'), Param('$r10', 'const sigset_t *sigmask'), Param('$r8', 'size_t sigsetsize')])
-syscall_table[0x110] = Entry('unshare', [Param('$rdi', 'unsigned long unshare_flags')])
-syscall_table[0x111] = Entry('set_robust_list', [Param('$rdi', 'struct robust_list_head *head'), Param('$rsi', 'size_t len')])
-syscall_table[0x112] = Entry('get_robust_list', [Param('$rdi', 'int pid'), Param('$rsi', 'struct robust_list_head * *head_ptr'), Param('$rdx', 'size_t *len_ptr')])
-syscall_table[0x113] = Entry('splice', [Param('$rdi', 'int fd_in'), Param('$rsi', 'loff_t *off_in'), Param('$rdx', 'int fd_out'), Param('$r10', 'loff_t *off_out'), Param('$r8', 'size_t len'), Param('$r9', 'unsigned int flags')])
-syscall_table[0x114] = Entry('tee', [Param('$rdi', 'int fdin'), Param('$rsi', 'int fdout'), Param('$rdx', 'size_t len'), Param('$r10', 'unsigned int flags')])
-syscall_table[0x115] = Entry('sync_file_range', [Param('$rdi', 'loff_t offset loff_t nbytes'), Param('$rsi', 'unsigned int flags')])
-syscall_table[0x116] = Entry('vmsplice', [Param('$rdi', 'int fd'), Param('$rsi', 'const struct iovec *iov'), Param('$rdx', 'unsigned long nr_segs'), Param('$r10', 'unsigned int flags')])
-syscall_table[0x117] = Entry('move_pages', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'unsigned long nr_pages'), Param('$rdx', 'const void * *pages'), Param('$r10', 'const int *nodes'), Param('$r8', 'int *status'), Param('$r9', 'int flags')])
-syscall_table[0x118] = Entry('utimensat', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *filename'), Param('$rdx', 'struct timespec *utimes'), Param('$r10', 'int flags')])
-syscall_table[0x119] = Entry('epoll_pwait', [Param('$rdi', 'int epfd'), Param('$rsi', 'struct epoll_event *events'), Param('$rdx', 'int maxevents'), Param('$r10', 'int timeout'), Param('$r8', 'const sigset_t *sigmask'), Param('$r9', 'size_t sigsetsize')])
-syscall_table[0x11a] = Entry('signalfd', [Param('$rdi', 'int ufd'), Param('$rsi', 'sigset_t *user_mask'), Param('$rdx', 'size_t sizemask')])
-syscall_table[0x11b] = Entry('timerfd_create', [Param('$rdi', 'int clockid'), Param('$rsi', 'int flags')])
-syscall_table[0x11c] = Entry('eventfd', [Param('$rdi', 'unsigned int count')])
-syscall_table[0x11d] = Entry('fallocate', [Param('$rdi', 'int mode loff_t offset'), Param('$rsi', 'loff_t len')])
-syscall_table[0x11e] = Entry('timerfd_settime', [Param('$rdi', 'int ufd'), Param('$rsi', 'int flags'), Param('$rdx', 'const struct itimerspec *utmr'), Param('$r10', 'struct itimerspec *otmr')])
-syscall_table[0x11f] = Entry('timerfd_gettime', [Param('$rdi', 'int ufd'), Param('$rsi', 'struct itimerspec *otmr')])
-syscall_table[0x120] = Entry('accept4', [Param('$rdi', 'int fd'), Param('$rsi', 'struct sockaddr *upeer_sockaddr'), Param('$rdx', 'int *upeer_addrlen'), Param('$r10', 'int flags')])
-syscall_table[0x121] = Entry('signalfd4', [Param('$rdi', 'int ufd'), Param('$rsi', 'sigset_t *user_mask'), Param('$rdx', 'size_t sizemask'), Param('$r10', 'int flags')])
-syscall_table[0x122] = Entry('eventfd2', [Param('$rdi', 'unsigned int count'), Param('$rsi', 'int flags')])
-syscall_table[0x123] = Entry('epoll_create1', [Param('$rdi', 'int flags')])
-syscall_table[0x124] = Entry('dup3', [Param('$rdi', 'unsigned int oldfd'), Param('$rsi', 'unsigned int newfd'), Param('$rdx', 'int flags')])
-syscall_table[0x125] = Entry('pipe2', [Param('$rdi', 'int *fildes'), Param('$rsi', 'int flags')])
-syscall_table[0x126] = Entry('inotify_init1', [Param('$rdi', 'int flags')])
-syscall_table[0x127] = Entry('preadv', [Param('$rdi', 'unsigned long fd'), Param('$rsi', 'const struct iovec *vec'), Param('$rdx', 'unsigned long vlen'), Param('$r10', 'unsigned long pos_l'), Param('$r8', 'unsigned long pos_h')])
-syscall_table[0x128] = Entry('pwritev', [Param('$rdi', 'unsigned long fd'), Param('$rsi', 'const struct iovec *vec'), Param('$rdx', 'unsigned long vlen'), Param('$r10', 'unsigned long pos_l'), Param('$r8', 'unsigned long pos_h')])
-syscall_table[0x129] = Entry('rt_tgsigqueueinfo', [Param('$rdi', 'pid_t tgid'), Param('$rsi', 'pid_t pid'), Param('$rdx', 'int sig'), Param('$r10', 'siginfo_t *uinfo')])
-syscall_table[0x12a] = Entry('perf_event_open', [Param('$rdi', 'struct perf_event_attr *attr_uptr'), Param('$rsi', 'pid_t pid'), Param('$rdx', 'int cpu'), Param('$r10', 'int group_fd'), Param('$r8', 'unsigned long flags')])
-syscall_table[0x12b] = Entry('recvmmsg', [Param('$rdi', 'int fd'), Param('$rsi', 'struct mmsghdr *mmsg'), Param('$rdx', 'unsigned int vlen'), Param('$r10', 'unsigned int flags'), Param('$r8', 'struct timespec *timeout')])
-syscall_table[0x12c] = Entry('fanotify_init', [Param('$rdi', 'unsigned int flags'), Param('$rsi', 'unsigned int event_f_flags')])
-syscall_table[0x12d] = Entry('fanotify_mark', [Param('$rdi', 'unsigned int flags __u64 mask'), Param('$rsi', 'int dfd const char *pathname')])
-syscall_table[0x12e] = Entry('prlimit64', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'unsigned int resource'), Param('$rdx', 'const struct rlimit64 *new_rlim'), Param('$r10', 'struct rlimit64 *old_rlim')])
-syscall_table[0x12f] = Entry('name_to_handle_at', [Param('$rdi', 'int dfd'), Param('$rsi', 'const char *name'), Param('$rdx', 'struct file_handle *handle'), Param('$r10', 'int *mnt_id'), Param('$r8', 'int flag')])
-syscall_table[0x130] = Entry('open_by_handle_at', [Param('$rdi', 'int mountdirfd'), Param('$rsi', 'struct file_handle *handle'), Param('$rdx', 'int flags')])
-syscall_table[0x131] = Entry('clock_adjtime', [Param('$rdi', 'const clockid_t which_clock'), Param('$rsi', 'struct timex *utx')])
-syscall_table[0x132] = Entry('syncfs', [Param('$rdi', 'int fd')])
-syscall_table[0x133] = Entry('sendmmsg', [Param('$rdi', 'int fd'), Param('$rsi', 'struct mmsghdr *mmsg'), Param('$rdx', 'unsigned int vlen'), Param('$r10', 'unsigned int flags')])
-syscall_table[0x134] = Entry('setns', [Param('$rdi', 'int fd'), Param('$rsi', 'int nstype')])
-syscall_table[0x135] = Entry('getcpu', [Param('$rdi', 'unsigned *cpup'), Param('$rsi', 'unsigned *nodep'), Param('$rdx', 'struct getcpu_cache *unused')])
-syscall_table[0x136] = Entry('process_vm_readv', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'const struct iovec *lvec'), Param('$rdx', 'unsigned long liovcnt'), Param('$r10', 'const struct iovec *rvec'), Param('$r8', 'unsigned long riovcnt'), Param('$r9', 'unsigned long flags')])
-syscall_table[0x137] = Entry('process_vm_writev', [Param('$rdi', 'pid_t pid'), Param('$rsi', 'const struct iovec *lvec'), Param('$rdx', 'unsigned long liovcnt'), Param('$r10', 'const struct iovec *rvec'), Param('$r8', 'unsigned long riovcnt'), Param('$r9', 'unsigned long flags')])
-syscall_table[0x138] = Entry('kcmp', [Param('$rdi', 'pid_t pid1'), Param('$rsi', 'pid_t pid2'), Param('$rdx', 'int type'), Param('$r10', 'unsigned long idx1'), Param('$r8', 'unsigned long idx2')])
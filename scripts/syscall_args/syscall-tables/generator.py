@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Compile the syscall tables into compact JSON files, one per architecture, loaded by `syscall-args`
+and `syscall-trace` with a single parse.
+
+The legacy tables are Python modules filling a `syscall_table` dict with `Entry(name, params)`
+namedtuples. In the JSON files, every string is stored once in `strings`, and every syscall is
+a row `[number, name, register, parameter, register, parameter, ...]` of indices in `strings`.
+
+Usage:
+    generator.py compile [TABLE.py ...]     compile the given (or all the) legacy tables
+    generator.py benchmark [--rounds N]     compare the loading of the JSON and legacy tables
+"""
+
+__AUTHOR__ = "hugsy"
+__VERSION__ = 0.1
+
+import argparse
+import inspect
+import json
+import pathlib
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib.machinery import SourceFileLoader
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SYSCALL_TABLES_DIRECTORY = pathlib.Path(inspect.getfile(inspect.currentframe())).parent.resolve()
+SYSCALL_TABLES_FORMAT_VERSION = 1
+
+
+class SyscallParam:
+    """One parameter of a syscall: the register holding it, its declaration and its name."""
+
+    __slots__ = ("reg", "param", "name")
+
+    def __init__(self, reg: str, param: str) -> None:
+        self.reg = reg
+        self.param = param
+        self.name = sys.intern(re.split(r" |\*", param)[-1])
+        return
+
+
+class SyscallEntry:
+    """One syscall: its name and its parameters."""
+
+    __slots__ = ("name", "params")
+
+    def __init__(self, name: str, params: Tuple[SyscallParam, ...]) -> None:
+        self.name = name
+        self.params = params
+        return
+
+
+def syscall_table_load(path: pathlib.Path) -> Dict[int, SyscallEntry]:
+    """Load a syscall table, either a compiled JSON file or a legacy Python module. The strings
+    are interned, and the identical parameters are shared between the syscalls."""
+    if path.suffix != ".json":
+        shared: Dict[Tuple[str, str], SyscallParam] = {}
+        table = {}
+        for nr, entry in syscall_table_load_legacy(path).items():
+            params = []
+            for reg, param in entry.params:
+                key = (sys.intern(reg), sys.intern(param))
+                if key not in shared:
+                    shared[key] = SyscallParam(*key)
+                params.append(shared[key])
+            table[nr] = SyscallEntry(sys.intern(entry.name), tuple(params))
+        return table
+
+    with path.open() as fd:
+        data = json.load(fd)
+    if data.get("version") != SYSCALL_TABLES_FORMAT_VERSION:
+        raise ValueError(f"Unsupported syscall table format in '{path}'")
+    strings = [sys.intern(s) for s in data["strings"]]
+    shared_params: Dict[Tuple[int, int], SyscallParam] = {}
+    table = {}
+    for nr, name, *params in data["syscalls"]:
+        entry_params = []
+        for reg, param in zip(params[::2], params[1::2]):
+            if (reg, param) not in shared_params:
+                shared_params[(reg, param)] = SyscallParam(strings[reg], strings[param])
+            entry_params.append(shared_params[(reg, param)])
+        table[nr] = SyscallEntry(strings[name], tuple(entry_params))
+    return table
+
+
+def syscall_table_dump(table: Dict[int, SyscallEntry], path: pathlib.Path) -> None:
+    """Write a syscall table as a compiled JSON file."""
+    strings: Dict[str, int] = {}
+
+    def index(s: str) -> int:
+        return strings.setdefault(s, len(strings))
+
+    rows = []
+    for nr in sorted(table):
+        entry = table[nr]
+        row = [nr, index(entry.name)]
+        for param in entry.params:
+            row += [index(param.reg), index(param.param)]
+        rows.append(json.dumps(row, separators=(",", ":")))
+
+    with path.open("w") as fd:
+        fd.write(f'{{"version":{SYSCALL_TABLES_FORMAT_VERSION},\n')
+        fd.write(f'"strings":{json.dumps(list(strings), separators=(",", ":"))},\n')
+        fd.write('"syscalls":[\n' + ",\n".join(rows) + "\n]}\n")
+    return
+
+
+def syscall_table_dump_legacy(table: Dict[int, SyscallEntry], path: pathlib.Path) -> None:
+    """Write a syscall table as a legacy Python module."""
+    with path.open("w") as fd:
+        fd.write("from collections import namedtuple\n\n"
+                 "Entry = namedtuple('Entry', 'name params')\n"
+                 "Param = namedtuple('Param', 'reg param')\n\n"
+                 "syscall_table = {}\n")
+        for nr in sorted(table):
+            entry = table[nr]
+            params = ", ".join(f"Param({p.reg!r}, {p.param!r})" for p in entry.params)
+            fd.write(f"syscall_table[{nr:#04x}] = Entry({entry.name!r}, [{params}])\n")
+    return
+
+
+def syscall_tables_compile(paths: List[pathlib.Path]) -> None:
+    for path in paths:
+        output = path.with_suffix(".json")
+        table = syscall_table_load(path)
+        syscall_table_dump(table, output)
+        print(f"{path.name}: {len(table)} syscalls written to '{output}'")
+    return
+
+
+def syscall_table_load_legacy(path: pathlib.Path) -> Dict[int, Any]:
+    "Load a legacy table as it used to be, by executing the module."
+    return SourceFileLoader(path.stem, str(path.absolute())).load_module(None).syscall_table
+
+
+def syscall_tables_measure(load: Callable[[pathlib.Path], Dict[int, Any]], path: pathlib.Path,
+                           rounds: int) -> Tuple[float, int]:
+    "Return the average load time (in ms) and the memory allocated by the loaded table."
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        load(path)
+    elapsed = (time.perf_counter() - start_time) * 1000 / rounds
+
+    tracemalloc.start()
+    table = load(path)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del table
+    return elapsed, size
+
+
+def syscall_tables_benchmark(rounds: int) -> None:
+    print(f"{'Table':<12} {'Syscalls':>8} {'JSON (ms)':>10} {'Python (ms)':>12} "
+          f"{'JSON (KiB)':>11} {'Python (KiB)':>13}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for path in sorted(SYSCALL_TABLES_DIRECTORY.glob("*.json")):
+            table = syscall_table_load(path)
+            legacy = pathlib.Path(tmpdir) / f"{path.stem}.py"
+            syscall_table_dump_legacy(table, legacy)
+            # warm up the bytecode cache, as for the tables sourced by GEF
+            syscall_table_load_legacy(legacy)
+            json_time, json_size = syscall_tables_measure(syscall_table_load, path, rounds)
+            py_time, py_size = syscall_tables_measure(syscall_table_load_legacy, legacy, rounds)
+            print(f"{path.stem:<12} {len(table):>8} {json_time:>10.2f} {py_time:>12.2f} "
+                  f"{json_size / 1024:>11.1f} {py_size / 1024:>13.1f}")
+    return
+
+
+def syscall_tables_main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile and benchmark the syscall tables")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    compile_parser = subparsers.add_parser("compile", help="compile legacy tables to JSON")
+    compile_parser.add_argument("tables", nargs="*", type=pathlib.Path,
+                                help="legacy table modules (default: all in this directory)")
+    benchmark_parser = subparsers.add_parser("benchmark", help="compare JSON and legacy tables")
+    benchmark_parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    if args.action == "compile":
+        tables = args.tables or sorted(p for p in SYSCALL_TABLES_DIRECTORY.glob("*.py")
+                                       if p.name != "generator.py")
+        syscall_tables_compile(tables)
+    else:
+        syscall_tables_benchmark(args.rounds)
+    return
+
+
+# this file is also sourced by GEF with the other scripts, only run when executed directly
+if __name__ == "__main__" and "gdb" not in sys.modules:
+    syscall_tables_main()
@@ -5,12 +5,16 @@ Note: Mostly done for x64, other architectures were not throughly tested.
 """
 
 __AUTHOR__ = "hugsy"
-__VERSION__ = 0.4
+__VERSION__ = 0.5
 __LICENSE__ = "MIT"
 
+import array
+import bisect
+import json
 import os
+import sys
 from functools import lru_cache
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple
 
 import gdb
 
@@ -27,24 +31,70 @@ def nfastbins():
     return fastbin_index((80 * gef.arch.ptrsize // 4)) - 1
 
 
-def get_tcache_count():
+def get_tcache_counts() -> List[int]:
+    "Return the counts of all the bins of the tcache of the selected thread, read at once."
     version = gef.libc.version
     if version is None:
         raise RuntimeError("Cannot get the libc version")
     if version < (2, 27):
-        return 0
-    base = gef.heap.base_address
-    if not base:
+        return []
+    # the counts are at the start of the tcache of the current thread, before its entries
+    count_addr = current_tcache()
+    if not count_addr:
         raise RuntimeError(
-            "Failed to get the heap base address. Heap not initialized?")
-    count_addr = base + 2*gef.arch.ptrsize
-    count = p8(count_addr) if version < (2, 30) else p16(count_addr)
-    return count
+            "Failed to find the tcache. Heap not initialized?")
+    nb_bins = GlibcHeapTcachebinsCommand.TCACHE_MAX_BINS
+    if version < (2, 30):
+        return list(gef.memory.read(count_addr, nb_bins))
+    counts = array.array("H")
+    counts.frombytes(gef.memory.read(count_addr, 2 * nb_bins))
+    if (gef.arch.endianness == Endianness.BIG_ENDIAN) != (sys.byteorder == "big"):
+        counts.byteswap()
+    return counts.tolist()
+
+
+def heap_reveal_ptr(pos: int, ptr: int) -> int:
+    "Decode a safe-linking protected pointer (glibc 2.32+) stored at `pos`."
+    if gef.libc.version and gef.libc.version >= (2, 32):
+        return (pos >> 12) ^ ptr
+    return ptr
+
+
+def walk_free_list(reader: "HeapMemoryReader", head: int, fd_offset: int, protected: bool,
+                   stop: int = 0) -> Generator[int, None, None]:
+    """Follow a free-list from the chunk `head`, reading the forward pointers at `fd_offset`
+    from the bulk reader. Stop on NULL, on `stop`, on a cycle or on unreadable memory."""
+    seen = set()
+    current = head
+    while current and current != stop and current not in seen:
+        yield current
+        seen.add(current)
+        pos = current + fd_offset
+        try:
+            fd = reader.read_word(pos)
+        except gdb.MemoryError:
+            break
+        current = heap_reveal_ptr(pos, fd) if protected else fd
+    return
+
+
+def current_tcache() -> int:
+    "Return the address of the tcache of the selected thread, 0 if the libc has no tcache."
+    version = gef.libc.version
+    if not version or version < (2, 27):
+        return 0
+    return GlibcHeapTcachebinsCommand.find_tcache()
 
 
 @lru_cache(128)
-def collect_known_values() -> Dict[int, str]:
+def collect_known_values(arena_address: int = 0, tcache_address: int = 0) -> Dict[int, str]:
+    """Map the address (both base and data) of every chunk of the free-lists of an arena (the
+    main arena by default) to the name of its bin. The tcache at `tcache_address` (the one of
+    the selected thread) is only used if it is allocated in the arena. The bin heads and the
+    chains are decoded from bulk reads, and the result is cached until the next stop."""
     arena = gef.heap.main_arena
+    if arena_address:
+        arena = next((a for a in gef.heap.arenas if int(a) == arena_address), None)
     if not arena:
         raise RuntimeError
 
@@ -52,65 +102,47 @@ def collect_known_values() -> Dict[int, str]:
     if not version:
         raise RuntimeError
 
+    ptrsize = gef.arch.ptrsize
+    reader = HeapMemoryReader()
     result: Dict[int, str] = {}  # format is { 0xaddress : "name" ,}
 
-    # tcache
-    if version >= (2, 27):
-        tcache_addr = GlibcHeapTcachebinsCommand.find_tcache()
-        for i in range(GlibcHeapTcachebinsCommand.TCACHE_MAX_BINS):
-            chunk, _ = GlibcHeapTcachebinsCommand.tcachebin(tcache_addr, i)
-            j = 0
-            while True:
-                if chunk is None:
-                    break
-                sz = (i+1)*0x10+0x10
-                result[chunk.data_address] = f"tcachebins[{i}/{j}] (size={sz:#x})"
-                next_chunk_address = chunk.get_fwd_ptr(True)
-                if not next_chunk_address:
-                    break
-                next_chunk = GlibcChunk(next_chunk_address)
-                j += 1
-                chunk = next_chunk
+    def add(base: int, name: str) -> None:
+        result[base] = name
+        result[base + 2 * ptrsize] = name
+        return
 
-    # fastbins
+    # tcache: the entries point to the user data, the next pointer is at offset 0
+    tcache_addr = tcache_address if any(start <= tcache_address < end for start, end
+                                        in heap_arena_segments(arena, reader)) else 0
+    if tcache_addr:
+        nb_bins = GlibcHeapTcachebinsCommand.TCACHE_MAX_BINS
+        counts_size = nb_bins * (1 if version < (2, 30) else 2)
+        entries = reader.read_words(tcache_addr + counts_size, nb_bins * ptrsize)
+        for i, entry in enumerate(entries):
+            sz = gef.heap.tidx2size(i)
+            for j, data_address in enumerate(walk_free_list(reader, entry, 0, True)):
+                add(data_address - 2 * ptrsize, f"tcachebins[{i}/{j}] (size={sz:#x})")
+
+    # fastbins: the heads are the chunk base addresses, fd follows the chunk header
     for i in range(nfastbins()):
-        chunk = arena.fastbin(i)
-        j = 0
-        while True:
-            if chunk is None:
-                break
-            result[chunk.data_address] = f"fastbins[{i}/{j}]"
-            next_chunk_address = chunk.get_fwd_ptr(True)
-            if not next_chunk_address:
-                break
-            next_chunk = GlibcChunk(next_chunk_address)
-            j += 1
-            chunk = next_chunk
-
-    # other bins
-    for name in ["unorderedbins", "smallbins", "largebins"]:
-        i = 0
-        while True:
-            (fw, bk) = arena.bin(i)
-            if (fw, bk) == (0, 0):
-                break
+        for j, base in enumerate(walk_free_list(reader, int(arena.fastbinsY[i]), 2 * ptrsize, True)):
+            add(base, f"fastbins[{i}/{j}]")
 
-            head = GlibcChunk(bk, from_base=True).fwd
-            if head == fw:
-                continue
-
-            chunk = GlibcChunk(head, from_base=True)
-            j = 0
-            while True:
-                if chunk is None:
-                    break
-                result[chunk.data_address] = f"{name}[{i}/{j}]"
-                next_chunk_address = chunk.get_fwd_ptr(True)
-                if not next_chunk_address:
-                    break
-                next_chunk = GlibcChunk(next_chunk_address, from_base=True)
-                j += 1
-                chunk = next_chunk
+    # other bins: doubly linked lists, circular through the bin head in the arena
+    for i in range(len(arena.bins) // 2):
+        fw, bk = arena.bin(i)
+        if (fw, bk) == (0, 0):
+            continue
+        try:
+            head = reader.read_word(bk + 2 * ptrsize)
+        except gdb.MemoryError:
+            continue
+        if head == fw:
+            # empty bin, it points to itself
+            continue
+        name = "unsortedbin" if i == 0 else "smallbins" if i < 63 else "largebins"
+        for j, base in enumerate(walk_free_list(reader, fw, 2 * ptrsize, False, stop=head)):
+            add(base, f"{name}[{i}/{j}]")
 
     return result
 
@@ -126,13 +158,260 @@ def collect_known_ranges() -> List[Tuple[range, str]]:
     return result
 
 
-def is_corrupted(chunk: GlibcChunk, arena: GlibcArena) -> bool:
-    """Various checks to see if a chunk is corrupted"""
+class KnownRanges:
+    """Sorted interval table of the named memory mappings."""
+
+    def __init__(self, ranges: List[Tuple[range, str]]) -> None:
+        ranges = sorted(ranges, key=lambda x: x[0].start)
+        self.starts = [r.start for r, _ in ranges]
+        self.ends = [r.stop for r, _ in ranges]
+        self.names = [name for _, name in ranges]
+        return
+
+    def lookup(self, value: int) -> Optional[str]:
+        idx = bisect.bisect_right(self.starts, value) - 1
+        if idx >= 0 and value < self.ends[idx]:
+            return self.names[idx]
+        return None
+
+    def end_of(self, value: int) -> int:
+        "End of the range containing `value`, or `value` itself if it is not in any range."
+        idx = bisect.bisect_right(self.starts, value) - 1
+        if idx >= 0 and value < self.ends[idx]:
+            return self.ends[idx]
+        return value
+
+
+def mapped_ranges() -> KnownRanges:
+    "Interval table of all the mappings, named or not."
+    return KnownRanges([(range(entry.page_start, entry.page_end), entry.path)
+                        for entry in gef.memory.maps])
+
+
+class HeapMemoryReader:
+    """Read the heap memory by large blocks, so that the chunks are decoded from local buffers
+    instead of one GDB memory request per word."""
+
+    def __init__(self, block_size: int = 0x100000) -> None:
+        self.block_size = block_size
+        self.__block_start = -1
+        self.__block = b""
+        self.__mapped = mapped_ranges()
+        return
+
+    def read(self, address: int, size: int) -> bytes:
+        offset = address - self.__block_start
+        if self.__block_start < 0 or offset < 0 or offset + size > len(self.__block):
+            # read ahead, but not past the end of the mapping
+            block_size = max(size, min(self.block_size, self.__mapped.end_of(address) - address))
+            self.__block_start = address
+            self.__block = bytes(gef.memory.read(address, block_size))
+            offset = 0
+        return self.__block[offset:offset + size]
+
+    def read_word(self, address: int) -> int:
+        byteorder = "big" if gef.arch.endianness == Endianness.BIG_ENDIAN else "little"
+        return int.from_bytes(self.read(address, gef.arch.ptrsize), byteorder)
+
+    def read_words(self, address: int, size: int) -> "array.array[int]":
+        words = array.array("Q" if gef.arch.ptrsize == 8 else "I")
+        words.frombytes(self.read(address, size - size % gef.arch.ptrsize))
+        if (gef.arch.endianness == Endianness.BIG_ENDIAN) != (sys.byteorder == "big"):
+            words.byteswap()
+        return words
+
+
+# printable ASCII characters are kept, the others displayed as '.'
+HEXDUMP_TABLE = bytes(b if 0x20 <= b < 0x7F else ord(".") for b in range(256))
+
+
+def reset_heap_caches(_: "gdb.Event") -> None:
+    "The bins and the memory layout can only change while the process runs."
+    collect_known_values.cache_clear()
+    collect_known_ranges.cache_clear()
+    return
+
+
+gef_on_stop_hook(reset_heap_caches)
+
+
+CHUNK_PREV_INUSE = 1
+
+
+def heap_arena_segments(arena: GlibcArena, reader: HeapMemoryReader) -> List[Tuple[int, int]]:
+    """Return the (start, end) bounds of the heaps of an arena: the main heap for the main
+    arena, the list of heaps (`heap_info`) for the others."""
+    if arena.is_main_arena():
+        top_size = reader.read_word(arena.top + gef.arch.ptrsize) & ~0x7
+        return [(gef.heap.base_address, arena.top + top_size)]
+    return [(heap_info.heap_start, heap_info.heap_end)
+            for heap_info in arena.get_heap_info_list() or []]
+
+
+def walk_heap_chunks(reader: HeapMemoryReader, start: int, end: int,
+                     top: int) -> Generator[Tuple[int, int], None, None]:
+    """Yield the (base address, size field) of the chunks in [`start`, `end`), decoded from bulk
+    reads, until the top chunk (included). Stop on a null size (e.g. the fencepost closing a
+    heap of a thread arena) or an out of bounds size."""
+    ptrsize = gef.arch.ptrsize
+    address = start
+    while address < end:
+        size_field = reader.read_word(address + ptrsize)
+        size = size_field & ~0x7
+        if size == 0:
+            break
+        yield address, size_field
+        if address == top or address + size > end:
+            break
+        address += size
+    return
+
+
+class HeapArenaSummary:
+    """Chunk count and in-use/free bytes of an arena."""
+
+    __slots__ = ("address", "is_main", "nb_chunks", "nb_free", "in_use", "free", "largest_free")
+
+    def __init__(self, address: int, is_main: bool) -> None:
+        self.address = address
+        self.is_main = is_main
+        self.nb_chunks = 0
+        self.nb_free = 0
+        self.in_use = 0
+        self.free = 0
+        self.largest_free = 0
+        return
+
+    def add(self, size: int, is_free: bool) -> None:
+        self.nb_chunks += 1
+        if is_free:
+            self.nb_free += 1
+            self.free += size
+            self.largest_free = max(self.largest_free, size)
+        else:
+            self.in_use += size
+        return
+
+    @property
+    def fragmentation(self) -> float:
+        "Share of the free memory that is not in the largest free chunk."
+        return 1 - self.largest_free / self.free if self.free else 0.0
+
+    def __str__(self) -> str:
+        name = "main_arena" if self.is_main else "arena"
+        return (f"{name}@{self.address:#x}: {self.nb_chunks} chunk(s), in use: {self.in_use:#x} bytes, "
+                f"free: {self.free:#x} bytes in {self.nb_free} chunk(s), "
+                f"fragmentation: {self.fragmentation:.1%}")
+
+
+def arena_chunks_status(arena: GlibcArena) -> Generator[Tuple[int, int, bool], None, None]:
+    """Walk all the chunks of one arena (excluding the top chunk) from bulk reads, and yield
+    their (base address, size, is free) status. A chunk is free if the next chunk does not have
+    the PREV_INUSE bit, or if it is in a tcache/fast bin. The arenas are independent, so this
+    can be done for each one separately."""
+    reader = HeapMemoryReader()
+    try:
+        known_values = collect_known_values(int(arena), current_tcache())
+    except (RuntimeError, gdb.MemoryError):
+        known_values = {}
+
+    top = arena.top
+    for start, end in heap_arena_segments(arena, reader):
+        prev = None
+        for base, size_field in walk_heap_chunks(reader, start, end, top):
+            if prev:
+                yield prev[0], prev[1], not size_field & CHUNK_PREV_INUSE or prev[0] in known_values
+            prev = (base, size_field & ~0x7) if base != top else None
+        if prev:
+            yield prev[0], prev[1], prev[0] in known_values
+    return
+
+
+def summarize_arena(arena: GlibcArena) -> HeapArenaSummary:
+    summary = HeapArenaSummary(int(arena), arena.is_main_arena())
+    for _, size, is_free in arena_chunks_status(arena):
+        summary.add(size, is_free)
+    return summary
+
+
+class HeapSnapshot:
+    """Compact record of the chunks of all the arenas: base address, size, flags and content
+    hash of every chunk, stored in arrays sorted by address."""
+
+    __slots__ = ("bases", "sizes", "flags", "hashes")
+
+    def __init__(self) -> None:
+        self.bases = array.array("Q")
+        self.sizes = array.array("Q")
+        self.flags = array.array("B")
+        self.hashes = array.array("q")
+        return
+
+    def __len__(self) -> int:
+        return len(self.bases)
+
+    @classmethod
+    def take(cls) -> "HeapSnapshot":
+        """Record the chunks of all the arenas (except their top chunk), decoded from bulk
+        reads of their heaps."""
+        reader = HeapMemoryReader()
+        ptrsize = gef.arch.ptrsize
+        # the heaps of the different arenas are interleaved in memory
+        segments = sorted((start, end, arena.top) for arena in gef.heap.arenas
+                          for start, end in heap_arena_segments(arena, reader))
+        snapshot = cls()
+        for start, end, top in segments:
+            for base, size_field in walk_heap_chunks(reader, start, end, top):
+                if base == top:
+                    break
+                size = size_field & ~0x7
+                snapshot.bases.append(base)
+                snapshot.sizes.append(size)
+                snapshot.flags.append(size_field & 0x7)
+                snapshot.hashes.append(hash(reader.read(base + 2 * ptrsize,
+                                                        max(0, size - 2 * ptrsize))))
+        return snapshot
+
+    def diff(self, other: "HeapSnapshot") -> Generator[Tuple[str, int, str], None, None]:
+        """Sorted merge of two snapshots, yield (kind, base, description) for every difference,
+        `kind` being one of "+" (new chunk), "-" (removed chunk) or "~" (modified chunk)."""
+        i, j = 0, 0
+        while i < len(self) or j < len(other):
+            a = self.bases[i] if i < len(self) else None
+            b = other.bases[j] if j < len(other) else None
+            if b is None or (a is not None and a < b):
+                yield "-", a, f"size={self.sizes[i]:#x}"
+                i += 1
+            elif a is None or b < a:
+                yield "+", b, f"size={other.sizes[j]:#x}"
+                j += 1
+            else:
+                changes = []
+                if self.sizes[i] != other.sizes[j]:
+                    changes.append(f"size={self.sizes[i]:#x}{RIGHT_ARROW}{other.sizes[j]:#x}")
+                if self.flags[i] != other.flags[j]:
+                    changes.append(f"flags={self.flags[i]:#x}{RIGHT_ARROW}{other.flags[j]:#x}")
+                if self.hashes[i] != other.hashes[j]:
+                    changes.append("content")
+                if changes:
+                    yield "~", a, ", ".join(changes)
+                i += 1
+                j += 1
+        return
+
+
+# snapshots taken with `heap-view --snapshot NAME`
+heap_snapshots: Dict[str, HeapSnapshot] = {}
+
+
+def is_corrupted(chunk: GlibcChunk, limit: int) -> bool:
+    """Various checks to see if a chunk is corrupted, `limit` being the highest address a chunk
+    of its heap can start at (see `VisualizeHeapChunksCommand.arena_chunks()`)"""
 
     if chunk.base_address > chunk.data_address:
         return False
 
-    if chunk.base_address > arena.top:
+    if chunk.base_address > limit:
         return True
 
     if chunk.size == 0:
@@ -146,49 +425,115 @@ class VisualizeHeapChunksCommand(GenericCommand):
     """Visual helper for glibc heap chunks"""
 
     _cmdline_ = "visualize-libc-heap-chunks"
-    _syntax_ = f"{_cmdline_:s}"
+    _syntax_ = f"{_cmdline_:s} [--summary] [--snapshot NAME] [--diff NAME_A NAME_B]"
     _aliases_ = ["heap-view", ]
-    _example_ = f"{_cmdline_:s}"
+    _example_ = [f"{_cmdline_:s}",
+                 f"{_cmdline_:s} --summary",
+                 f"{_cmdline_:s} --snapshot before",
+                 f"{_cmdline_:s} --diff before after"]
 
     def __init__(self):
         super().__init__(complete=gdb.COMPLETE_SYMBOL)
         return
 
     @only_if_gdb_running
-    def do_invoke(self, _):
+    @parse_arguments({"names": [""]}, {"--summary": False, "--snapshot": False, "--diff": False})
+    def do_invoke(self, _, **kwargs):
+        args = kwargs["arguments"]
+        names = [name for name in args.names if name]
+
+        if args.diff:
+            if len(names) != 2:
+                err("--diff expects two snapshot names")
+                return
+            self.diff(*names)
+            return
+
         if not gef.heap.main_arena or not gef.heap.base_address:
             err("The heap has not been initialized")
             return
 
+        if args.snapshot:
+            if len(names) != 1:
+                err("--snapshot expects a snapshot name")
+                return
+            heap_snapshots[names[0]] = HeapSnapshot.take()
+            ok(f"Snapshot '{names[0]}': {len(heap_snapshots[names[0]])} chunk(s)")
+            return
+
+        arenas = list(gef.heap.arenas)
+        lines: List[str] = []
+        for arena in arenas:
+            if args.summary or len(arenas) > 1:
+                lines.append(Color.colorify(str(summarize_arena(arena)), "bold"))
+            if not args.summary and not self.render_arena(arena, lines):
+                break
+        self.flush(lines)
+        return
+
+    def arena_chunks(self, arena: GlibcArena) -> Generator[Tuple[GlibcChunk, int], None, None]:
+        """Iterate over the chunks of all the heaps of an arena, with the highest address a
+        chunk of their heap can start at: the top chunk in the heap holding it, the end of the
+        heap in the others. The heaps of a thread arena are mmap'd, so the older ones are
+        usually located above the top chunk."""
+        top = arena.top
+        for start, end in heap_arena_segments(arena, HeapMemoryReader()):
+            limit = top if start <= top < end else end
+            address = start
+            while address < end:
+                chunk = GlibcChunk(address, from_base=True)
+                if chunk.size == 0 and limit != top:
+                    # fencepost closing a heap, written when the next one was created
+                    break
+                yield chunk, limit
+                if address == top or chunk.size == 0:
+                    break
+                address += chunk.size
+        return
+
+    def render_arena(self, arena: GlibcArena, lines: List[str]) -> bool:
+        """Render all the chunks of one arena into `lines`. Return False if the heap is corrupted."""
         ptrsize = gef.arch.ptrsize
-        arena = gef.heap.main_arena
 
         colors = ("cyan", "red", "yellow", "blue", "green")
         color_idx = 0
         chunk_idx = 0
 
-        known_ranges = collect_known_ranges()
-        known_values = []  # collect_known_values()
-
-        for chunk in gef.heap.chunks:
-            if is_corrupted(chunk, arena):
+        known_ranges = KnownRanges(collect_known_ranges())
+        mapped = mapped_ranges()
+        try:
+            known_values = collect_known_values(int(arena), current_tcache())
+        except (RuntimeError, gdb.MemoryError):
+            known_values = {}
+        reader = HeapMemoryReader()
+        derefs_cache: Dict[int, List[str]] = {}
+        little_endian = gef.arch.endianness == Endianness.LITTLE_ENDIAN
+
+        for chunk, limit in self.arena_chunks(arena):
+            if is_corrupted(chunk, limit):
+                self.flush(lines)
                 err("Corrupted heap, cannot continue.")
-                return
+                return False
 
             aggregate_nuls = 0
             base = chunk.base_address
 
             if base == arena.top:
-                gef_print(
-                    f"{format_address(base)}    {format_address(gef.memory.read_integer(base))}   {Color.colorify(LEFT_ARROW + 'Top Chunk', 'red bold')}\n"
-                    f"{format_address(base+ptrsize)}    {format_address(gef.memory.read_integer(base+ptrsize))}   {Color.colorify(LEFT_ARROW + 'Top Chunk Size', 'red bold')}"
+                top = reader.read_words(base, 2 * ptrsize)
+                lines.append(
+                    f"{format_address(base)}    {format_address(top[0])}   {Color.colorify(LEFT_ARROW + 'Top Chunk', 'red bold')}\n"
+                    f"{format_address(base+ptrsize)}    {format_address(top[1])}   {Color.colorify(LEFT_ARROW + 'Top Chunk Size', 'red bold')}"
                 )
                 break
 
-            for current in range(base, base + chunk.size, ptrsize):
-                value = gef.memory.read_integer(current)
+            # the whole chunk is decoded from a single buffer
+            data = reader.read(base, chunk.size)
+            words = reader.read_words(base, chunk.size)
+            last = base + chunk.size - ptrsize
+            for i, value in enumerate(words):
+                current = base + i * ptrsize
                 if value == 0:
-                    if current != base and current != (base + chunk.size - ptrsize):
+                    if current != base and current != last:
                         # Only aggregate null bytes that are not starting/finishing the chunk
                         aggregate_nuls += 1
                         if aggregate_nuls > 1:
@@ -196,21 +541,26 @@ class VisualizeHeapChunksCommand(GenericCommand):
 
                 if aggregate_nuls > 2:
                     # If here, we have some aggregated null bytes, print a small thing to mention that
-                    gef_print("        ↓        [...]        ↓")
+                    lines.append("        ↓        [...]        ↓")
                     aggregate_nuls = 0
 
                 # Read the context in a hexdump-like format
-                hexdump = "".join(map(lambda b: chr(b) if 0x20 <= b < 0x7F else ".",
-                                      gef.memory.read(current, ptrsize)))
+                hexdump = data[i * ptrsize:(i + 1) * ptrsize].translate(HEXDUMP_TABLE).decode("ascii")
 
-                if gef.arch.endianness == Endianness.LITTLE_ENDIAN:
+                if little_endian:
                     hexdump = hexdump[::-1]
 
                 line = f"{format_address(current)}    {Color.colorify(format_address(value), colors[color_idx])}"
                 line += f"    {hexdump}"
-                derefs = dereference_from(current)
-                if len(derefs) > 2:
-                    line += f"    [{LEFT_ARROW}{derefs[-1]}]"
+
+                # Only the values pointing to mapped memory can be dereferenced
+                range_name = known_ranges.lookup(value)
+                if mapped.lookup(value) is not None:
+                    if value not in derefs_cache:
+                        derefs_cache[value] = dereference_from(current)
+                    derefs = derefs_cache[value]
+                    if len(derefs) > 2:
+                        line += f"    [{LEFT_ARROW}{derefs[-1]}]"
 
                 # The first entry of the chunk gets added some extra info about the chunk itself
                 if current == base:
@@ -218,17 +568,150 @@ class VisualizeHeapChunksCommand(GenericCommand):
                     chunk_idx += 1
 
                 # Populate information for known ranges, if any
-                for _range, _value in known_ranges:
-                    if value in _range:
-                        line += f" (in {Color.redify(_value)})"
+                if range_name:
+                    line += f" (in {Color.redify(range_name)})"
 
                 # Populate information from other chunks/bins, if any
                 if value in known_values:
                     line += f"{RIGHT_ARROW}{Color.cyanify(known_values[value])}"
 
-                # All good, print it out
-                gef_print(line)
+                # All good, buffer it
+                lines.append(line)
+                if len(lines) >= 0x1000:
+                    self.flush(lines)
 
             color_idx = (color_idx + 1) % len(colors)
 
+        return True
+
+    def diff(self, name_a: str, name_b: str) -> None:
+        """Print the chunks added, removed or modified between two snapshots."""
+        for name in (name_a, name_b):
+            if name not in heap_snapshots:
+                err(f"Unknown snapshot '{name}'")
+                return
+
+        colors = {"+": "green", "-": "red", "~": "yellow"}
+        lines: List[str] = []
+        nb_diffs = 0
+        for kind, base, description in heap_snapshots[name_a].diff(heap_snapshots[name_b]):
+            lines.append(f"{Color.colorify(kind, colors[kind])} {format_address(base)}    {description}")
+            nb_diffs += 1
+            if len(lines) >= 0x1000:
+                self.flush(lines)
+        self.flush(lines)
+        info(f"{nb_diffs} difference(s) between '{name_a}' and '{name_b}'")
+        return
+
+    def flush(self, lines: List[str]) -> None:
+        """Print the buffered lines at once, and empty the buffer."""
+        if lines:
+            gef_print("\n".join(lines))
+            lines.clear()
+        return
+
+
+@register
+class HeapStatsCommand(GenericCommand):
+    """Aggregate statistics of the glibc heap: size-class histogram, in-use and free bytes,
+    largest free run, and tcache/fastbin occupancy per size."""
+
+    _cmdline_ = "heap-stats"
+    _syntax_ = f"{_cmdline_:s} [--json]"
+    _example_ = [f"{_cmdline_:s}", f"{_cmdline_:s} --json"]
+
+    @only_if_gdb_running
+    @parse_arguments({}, {"--json": False})
+    def do_invoke(self, _, **kwargs):
+        args = kwargs["arguments"]
+        if not gef.heap.main_arena or not gef.heap.base_address:
+            err("The heap has not been initialized")
+            return
+
+        stats = self.compute()
+        if args.json:
+            gef_print(json.dumps(stats))
+        else:
+            self.print_table(stats)
+        return
+
+    def compute(self) -> Dict:
+        """Compute all the statistics in a single pass over the chunks of all the arenas,
+        without keeping anything per chunk."""
+        # size class (power of two) -> [in use chunks, free chunks, in use bytes, free bytes]
+        histogram: Dict[int, List[int]] = {}
+        totals = [0, 0, 0, 0]
+        largest_run = run = 0
+        run_end = -1
+        for arena in gef.heap.arenas:
+            for base, size, is_free in arena_chunks_status(arena):
+                size_class = 1 << (size.bit_length() - 1) if size else 0
+                entry = histogram.setdefault(size_class, [0, 0, 0, 0])
+                idx = 1 if is_free else 0
+                entry[idx] += 1
+                entry[idx + 2] += size
+                totals[idx] += 1
+                totals[idx + 2] += size
+                if is_free:
+                    # consecutive free chunks form a single run
+                    run = run + size if base == run_end else size
+                    run_end = base + size
+                    largest_run = max(largest_run, run)
+                else:
+                    run_end = -1
+
+        return {
+            "chunks": totals[0] + totals[1],
+            "in_use": {"chunks": totals[0], "bytes": totals[2]},
+            "free": {"chunks": totals[1], "bytes": totals[3]},
+            "largest_free_run": largest_run,
+            "histogram": [
+                {"size_class": size_class, "in_use": entry[0], "free": entry[1],
+                 "in_use_bytes": entry[2], "free_bytes": entry[3]}
+                for size_class, entry in sorted(histogram.items())
+            ],
+            "tcache": self.tcache_occupancy(),
+            "fastbins": self.fastbins_occupancy(),
+        }
+
+    def tcache_occupancy(self) -> List[Dict[str, int]]:
+        version = gef.libc.version
+        if not version or version < (2, 27):
+            return []
+        return [{"size": gef.heap.tidx2size(i), "count": count}
+                for i, count in enumerate(get_tcache_counts()) if count]
+
+    def fastbins_occupancy(self) -> List[Dict[str, int]]:
+        ptrsize = gef.arch.ptrsize
+        sizes: Dict[int, int] = {}
+        for sz in range(0, 0x100, 2 * ptrsize):
+            sizes.setdefault(fastbin_index(sz), sz)
+
+        reader = HeapMemoryReader()
+        counts: Dict[int, int] = {}
+        for arena in gef.heap.arenas:
+            for i in range(nfastbins()):
+                head = int(arena.fastbinsY[i])
+                count = sum(1 for _ in walk_free_list(reader, head, 2 * ptrsize, True))
+                if count:
+                    counts[sizes[i]] = counts.get(sizes[i], 0) + count
+        return [{"size": size, "count": count} for size, count in sorted(counts.items())]
+
+    def print_table(self, stats: Dict) -> None:
+        lines = [
+            titlify("Heap statistics"),
+            f"Chunks: {stats['chunks']}",
+            f"In use: {stats['in_use']['bytes']:#x} bytes in {stats['in_use']['chunks']} chunk(s)",
+            f"Free: {stats['free']['bytes']:#x} bytes in {stats['free']['chunks']} chunk(s)",
+            f"Largest free run: {stats['largest_free_run']:#x} bytes",
+            titlify("Size classes"),
+            f"{'size':>12s} {'in use':>10s} {'free':>10s} {'in use bytes':>14s} {'free bytes':>14s}",
+        ]
+        for entry in stats["histogram"]:
+            lines.append(f"{'>=' + hex(entry['size_class']):>12s} {entry['in_use']:>10d} {entry['free']:>10d} "
+                         f"{entry['in_use_bytes']:>#14x} {entry['free_bytes']:>#14x}")
+        for name in ("tcache", "fastbins"):
+            lines.append(titlify(f"{name.capitalize()} occupancy"))
+            lines += [f"{entry['size']:>#12x} {entry['count']:>10d}" for entry in stats[name]]
+        gef_print("\n".join(lines))
         return
@@ -221,7 +221,9 @@ class WindbgUCommand(GenericCommand):
                     else:
                         location = int(loc, 0)  # type: ignore
 
-        for insn in gef_disassemble(location, length):
+        # use the same disassembler as the `context` (Capstone, if `capstone-disassemble.use-capstone` is set)
+        ctx = gef.gdb.commands["context"]
+        for insn in ctx.instruction_iterator(location, length):
             gef_print(str(insn))
         return
 
@@ -1,7 +1,10 @@
 __AUTHOR__ = "io12"
-__VERSION__ = 0.2
+__VERSION__ = 0.3
 
-from typing import TYPE_CHECKING
+import array
+import json
+import sys
+from typing import TYPE_CHECKING, Dict, List, Set
 
 if TYPE_CHECKING:
     from . import *
@@ -12,18 +15,121 @@ class XRefTelescopeCommand(SearchPatternCommand):
     """Recursively search for cross-references to a pattern in memory"""
 
     _cmdline_ = "xref-telescope"
-    _syntax_ = f"{_cmdline_} PATTERN [depth]"
+    _syntax_ = (f"{_cmdline_} [--breadth-first] [--max-results N] [--max-fanout N] "
+                "[--output FILE] PATTERN [depth]")
     _example_ = [
         f"{_cmdline_} AAAAAAAA",
-        f"{_cmdline_} 0x555555554000 15"
+        f"{_cmdline_} 0x555555554000 15",
+        f"{_cmdline_} --breadth-first 0x555555554000 5",
+        f"{_cmdline_} --max-fanout 10 --max-results 1000 --output /tmp/xrefs.jsonl 0x555555554000 8"
     ]
 
-    def xref_telescope_(self, pattern, depth, tree_heading):
-        """Recursively search a pattern within the whole userland memory."""
+    # size of the memory blocks read at once by the breadth-first search
+    read_size = 0x100000
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reset()
+        return
+
+    def reset(self, max_results=0, max_fanout=0, output=None):
+        """Reset the limits and the state of the walk."""
+        self.max_results = max_results
+        self.max_fanout = max_fanout
+        self.output = output
+        self.nb_results = 0
+        self.visited = set()
+        return
+
+    @property
+    def limit_reached(self):
+        return bool(self.max_results) and self.nb_results >= self.max_results
+
+    def xref_telescope_(self, pattern, depth, tree_heading, parent=None, level=1):
+        """Recursively search a pattern within the whole userland memory. Below the first level,
+        `pattern` is the address of the node whose references are searched."""
 
         if depth <= 0:
             return
 
+        if isinstance(pattern, int):
+            locs = self.find_references(pattern)
+        else:
+            locs = self.find_locations(pattern)[:self.max_fanout or None]
+        if tree_heading == "" and not self.output:
+            gef_print(" .")
+        for i, loc in enumerate(locs):
+            if self.limit_reached:
+                return
+            expand, tree_suffix_post = self.emit_node(loc, parent, level, tree_heading,
+                                                      i == len(locs) - 1)
+            if expand:
+                self.xref_telescope_(loc[0], depth - 1,
+                                     tree_heading + tree_suffix_post, loc[0], level + 1)
+
+    def emit_node(self, loc, parent, level, tree_heading, is_last):
+        """Output one node, either in the printed tree or as a JSON line in the output file.
+        Return whether the references to the node must be searched (i.e. it was not visited yet),
+        and the heading suffix of its children."""
+        visited = loc[0] in self.visited
+        if visited and self.output:
+            # the node and the references to it are already written
+            return False, ""
+        self.nb_results += 1
+        self.visited.add(loc[0])
+        if self.output:
+            section = lookup_address(loc[0]).section
+            self.output.write(json.dumps({
+                "address": loc[0], "parent": parent, "depth": level, "path": section.path,
+                "perm": str(section.permission), "value": loc[2],
+            }) + "\n")
+            return not visited, ""
+        return not visited, self.print_node(loc, tree_heading, is_last, visited)
+
+    def print_node(self, loc, tree_heading, is_last, visited=False):
+        """Print one location of the tree, return the heading suffix of its children."""
+        addr_loc_start = lookup_address(loc[0])
+        path = addr_loc_start.section.path
+        perm = addr_loc_start.section.permission
+        if is_last:
+            tree_suffix_pre = " └──"
+            tree_suffix_post = "    "
+        else:
+            tree_suffix_pre = " ├──"
+            tree_suffix_post = " │  "
+
+        line = f'{tree_heading + tree_suffix_pre} {loc[0]:#x} {Color.blueify(path)} {perm} "{Color.pinkify(loc[2])}"'
+        if visited:
+            line += Color.grayify(" (already visited)")
+        gef_print(line)
+        return tree_suffix_post
+
+    @staticmethod
+    def make_location(address, size):
+        """Return the (start, end, string) location of the `size` bytes at `address`, with the
+        same string as the matches of `search_pattern_by_address()`."""
+        if is_ascii_string(address):
+            ustr = gef.memory.read_ascii_string(address)
+            return address, address + len(ustr), ustr
+        return address, address + size, gef_pystring(gef.memory.read(address, size)) + "[...]"
+
+    def find_locations(self, pattern):
+        """Return the (start, end, string) locations of a pattern."""
+        if is_hex(pattern) and pointer_index.built:
+            # the references to an address are directly known by the pointer index
+            return [self.make_location(source, gef.arch.ptrsize)
+                    for source in pointer_index.sources_of(int(pattern, 16))]
+        return self.search_locations(pattern)
+
+    def find_references(self, address):
+        """Return the (start, end, string) locations of the words equal to `address`, the
+        search stopping after `max_fanout` of them."""
+        ptrsize = gef.arch.ptrsize
+        return [self.make_location(loc, ptrsize)
+                for loc in self.search_words({address}, self.max_fanout).get(address, [])]
+
+    def search_locations(self, pattern):
+        """Search a pattern in all the readable sections."""
         if is_hex(pattern):
             if gef.arch.endianness == Endianness.BIG_ENDIAN:
                 pattern = "".join(["\\\\x" + pattern[i:i + 2]
@@ -43,40 +149,137 @@ class XRefTelescopeCommand(SearchPatternCommand):
             end = section.page_end - 1
 
             locs += self.search_pattern_by_address(pattern, start, end)
-        if tree_heading == "":
-            gef_print(" .")
-        for i, loc in enumerate(locs):
-            addr_loc_start = lookup_address(loc[0])
-            path = addr_loc_start.section.path
-            perm = addr_loc_start.section.permission
-            if i == len(locs) - 1:
-                tree_suffix_pre = " └──"
-                tree_suffix_post = "    "
-            else:
-                tree_suffix_pre = " ├──"
-                tree_suffix_post = " │  "
+        return locs
 
-            line = f'{tree_heading + tree_suffix_pre} {loc[0]:#x} {Color.blueify(path)} {perm} "{Color.pinkify(loc[2])}"'
-            gef_print(line)
-            self.xref_telescope_(hex(loc[0]), depth - 1,
-                                 tree_heading + tree_suffix_post)
+    def search_words(self, targets: Set[int], limit: int = 0) -> Dict[int, List[int]]:
+        """Find the occurrences of all the `targets` words (at any alignment) with a single sweep
+        of the readable sections, read by large blocks. Return the sorted addresses of the
+        occurrences of each target, at most `limit` of them if set: a target is not searched
+        anymore once its first `limit` occurrences are found."""
+        if pointer_index.built:
+            return {target: list(pointer_index.sources_of(target)[:limit or None])
+                    for target in targets}
+
+        ptrsize = gef.arch.ptrsize
+        fmt = "Q" if ptrsize == 8 else "I"
+        byteswap = (gef.arch.endianness == Endianness.BIG_ENDIAN) != (sys.byteorder == "big")
+        found: Dict[int, List[int]] = {}
+        remaining = set(targets)
+        for section in gef.memory.maps:
+            if not section.permission & Permission.READ or section.path == "[vvar]":
+                continue
+            for address in range(section.page_start, section.page_end, self.read_size):
+                if not remaining:
+                    return found
+                # read a bit more to match the words crossing the end of the block
+                size = min(self.read_size + ptrsize - 1, section.page_end - address)
+                try:
+                    data = gef.memory.read(address, size)
+                except gdb.MemoryError:
+                    continue
+                block_found: Dict[int, List[int]] = {}
+                for alignment in range(ptrsize):
+                    end = len(data) - (len(data) - alignment) % ptrsize
+                    words = array.array(fmt)
+                    words.frombytes(data[alignment:end])
+                    if byteswap:
+                        words.byteswap()
+                    # the set intersection runs at C speed, only walk the blocks with a match
+                    if remaining.isdisjoint(words):
+                        continue
+                    for i, word in enumerate(words):
+                        loc = address + alignment + i * ptrsize
+                        if word in remaining and loc < address + self.read_size:
+                            block_found.setdefault(word, []).append(loc)
+                # the blocks are swept in address order, only the matches of a block are sorted
+                for word, block_locs in block_found.items():
+                    locs = found.setdefault(word, [])
+                    locs += sorted(block_locs)
+                    if limit and len(locs) >= limit:
+                        del locs[limit:]
+                        remaining.discard(word)
+        return found
+
+    def xref_telescope_breadth_first(self, pattern, depth):
+        """Same as `xref_telescope()`, but all the addresses of a level of the tree are searched
+        together, with one sweep of the memory per level instead of one per node."""
+        if depth <= 0:
+            return
+
+        ptrsize = gef.arch.ptrsize
+        roots = self.find_locations(pattern)[:self.max_fanout or None]
+        if self.max_results:
+            roots = roots[:self.max_results]
+        discovered = len(roots)
+        if self.output:
+            for loc in roots:
+                self.emit_node(loc, None, 1, "", False)
+
+        children = {}
+        level = roots
+        for depth_level in range(2, depth + 1):
+            targets = {loc[0] for loc in level if loc[0] not in children}
+            if not targets or (self.max_results and discovered >= self.max_results):
+                break
+            found = self.search_words(targets, self.max_fanout)
+            level = []
+            for target in sorted(targets):
+                locs = [self.make_location(loc, ptrsize) for loc in found.get(target, [])]
+                if self.max_results:
+                    locs = locs[:self.max_results - discovered]
+                discovered += len(locs)
+                children[target] = locs
+                level += locs
+                if self.output:
+                    for loc in locs:
+                        self.emit_node(loc, target, depth_level, "", False)
+
+        if self.output:
+            return
+
+        gef_print(" .")
+        stack = [(loc, None, "", i == len(roots) - 1, 1)
+                 for i, loc in reversed(list(enumerate(roots)))]
+        while stack and not self.limit_reached:
+            loc, parent, tree_heading, is_last, node_level = stack.pop()
+            expand, tree_suffix_post = self.emit_node(loc, parent, node_level, tree_heading, is_last)
+            if not expand or node_level >= depth:
+                continue
+            locs = children.get(loc[0], [])
+            stack += [(child, loc[0], tree_heading + tree_suffix_post, i == len(locs) - 1,
+                       node_level + 1)
+                      for i, child in reversed(list(enumerate(locs)))]
+        return
 
     def xref_telescope(self, pattern, depth):
         self.xref_telescope_(pattern, depth, "")
 
     @only_if_gdb_running
-    def do_invoke(self, argv):
-        argc = len(argv)
-        if argc < 1:
+    @parse_arguments({"pattern": "", "depth": 3},
+                     {"--breadth-first": False, "--max-results": 0, "--max-fanout": 0,
+                      "--output": ""})
+    def do_invoke(self, _, **kwargs):
+        args = kwargs["arguments"]
+        if not args.pattern:
             self.usage()
             return
 
-        pattern = argv[0]
-        try:
-            depth = int(argv[1])
-        except (IndexError, ValueError):
-            depth = 3
+        pattern = args.pattern
+        depth = args.depth
 
         info(
             f"Recursively searching '{Color.yellowify(pattern):s}' in memory")
-        self.xref_telescope(pattern, depth)
+        output = open(args.output, "w") if args.output else None
+        try:
+            self.reset(args.max_results, args.max_fanout, output)
+            if args.breadth_first:
+                self.xref_telescope_breadth_first(pattern, depth)
+            else:
+                self.xref_telescope(pattern, depth)
+            if self.limit_reached:
+                warn(f"Stopped after {args.max_results} result(s)")
+        finally:
+            if output:
+                output.close()
+                ok(f"{self.nb_results} node(s) written to '{args.output}'")
+            self.reset()
@@ -0,0 +1,39 @@
+/**
+ * ftrace.c
+ * -*- mode: c -*-
+ * -*- coding: utf-8 -*-
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+
+#include "utils.h"
+
+#define NB_CALLS 4
+
+
+__attribute__((noinline)) size_t leaf(const char* s)
+{
+        usleep(10000);
+        return strlen(s);
+}
+
+
+__attribute__((noinline)) size_t branch(const char* s)
+{
+        usleep(10000);
+        return leaf(s) + leaf(s);
+}
+
+
+int main(int argc, char** argv, char** envp)
+{
+        size_t total = 0;
+        for (int i = 0; i < NB_CALLS; i++)
+                total += branch(argv[0]);
+        DebugBreak();
+        printf("%zu\n", total);
+        return EXIT_SUCCESS;
+}
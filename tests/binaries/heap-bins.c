@@ -0,0 +1,27 @@
+/**
+ * heap-bins.c
+ * -*- mode: c -*-
+ * -*- coding: utf-8 -*-
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "utils.h"
+
+/* the 7 first freed chunks fill the tcache, the last one goes to a fastbin */
+#define NB_CHUNKS 8
+
+
+int main(int argc, char** argv, char** envp)
+{
+        /* keep the (dangling) pointers to the freed chunks in the heap */
+        void** chunks = malloc(NB_CHUNKS * sizeof(void*));
+        for (int i = 0; i < NB_CHUNKS; i++)
+                chunks[i] = malloc(0x18);
+        for (int i = 0; i < NB_CHUNKS; i++)
+                free(chunks[i]);
+
+        DebugBreak();
+        return EXIT_SUCCESS;
+}
@@ -0,0 +1,48 @@
+/**
+ * heap-multiple-heaps.c
+ * -*- mode: c -*-
+ * -*- coding: utf-8 -*-
+ *
+ * A thread arena spanning several heaps: the chunks allocated by the thread fill more than the
+ * maximum size of a heap (64MB on 64-bit), so glibc maps a second heap for the arena.
+ */
+
+#include <pthread.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+
+#include "utils.h"
+
+#define CHUNK_SIZE 0x10000
+/* HEAP_MAX_SIZE in glibc */
+#define HEAP_MAX_SIZE (8 * 1024 * 1024 * sizeof(long))
+#define NB_CHUNKS (HEAP_MAX_SIZE / CHUNK_SIZE + 0x10)
+
+
+void *thread_main(void *arg)
+{
+    void **chunks = malloc(NB_CHUNKS * sizeof(void *));
+    for (size_t i = 0; i < NB_CHUNKS; i++)
+        chunks[i] = malloc(CHUNK_SIZE);
+
+    DebugBreak();
+
+    for (size_t i = 0; i < NB_CHUNKS; i++)
+        free(chunks[i]);
+    free(chunks);
+    return arg;
+}
+
+
+int main(int argc, char **argv)
+{
+    pthread_t thread;
+    void *p = malloc(0x20);
+    (void)p;
+
+    pthread_create(&thread, NULL, thread_main, NULL);
+    pthread_join(thread, NULL);
+    return EXIT_SUCCESS;
+}
@@ -0,0 +1,41 @@
+/**
+ * pointers.c
+ * -*- mode: c -*-
+ * -*- coding: utf-8 -*-
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "utils.h"
+
+#define NB_REFS 4
+
+
+struct node {
+        struct node* next;
+        const char* name;
+};
+
+/* a -> b -> c -> a */
+struct node a, b, c;
+struct node* refs[NB_REFS];
+char* buffer;
+
+
+int main(int argc, char** argv, char** envp)
+{
+        a.next = &b;
+        a.name = "node-a";
+        b.next = &c;
+        b.name = "node-b";
+        c.next = &a;
+        c.name = "node-c";
+        for (int i = 0; i < NB_REFS; i++)
+                refs[i] = &a;
+        buffer = calloc(1, 0x1000);
+
+        DebugBreak();
+        printf("%s %p\n", a.next->name, buffer);
+        return EXIT_SUCCESS;
+}
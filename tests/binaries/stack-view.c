@@ -0,0 +1,30 @@
+/**
+ * stack-view.c
+ * -*- mode: c -*-
+ * -*- coding: utf-8 -*-
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "utils.h"
+
+
+__attribute__((noinline)) void frame(void)
+{
+        char name[] = "a string on the stack";
+        const char* string = "a string in .rodata";
+        void (*code)(void) = frame;
+        void* self = &self;
+        long values[4] = {0x41414141, 0, -1, (long)name};
+
+        DebugBreak();
+        printf("%s %s %p %p %ld\n", name, string, code, self, values[0]);
+}
+
+
+int main(int argc, char** argv, char** envp)
+{
+        frame();
+        return EXIT_SUCCESS;
+}
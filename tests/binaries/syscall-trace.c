@@ -0,0 +1,19 @@
+/**
+ * syscall-trace.c
+ * -*- mode: c -*-
+ * -*- coding: utf-8 -*-
+ */
+
+#include <stdlib.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+
+#define NB_SYSCALLS 10000
+
+
+int main(int argc, char** argv, char** envp)
+{
+        for (int i = 0; i < NB_SYSCALLS; i++)
+                syscall(SYS_getppid);
+        return EXIT_SUCCESS;
+}
@@ -2,6 +2,9 @@
 capstone-disassemble command test module
 """
 
+import pathlib
+import tempfile
+
 import pytest
 from tests.base import RemoteGefUnitTestGeneric
 
@@ -69,3 +72,67 @@ class CapstoneDisassembleCommand(RemoteGefUnitTestGeneric):
         res = gdb.execute(cmd, to_string=True) or ""
         assert res
         self.assertGreater(len(res.splitlines()), 1)
+
+    @pytest.mark.skipif(ARCH not in ("x86_64", "i686"), reason=f"Skipped for {ARCH}")
+    def test_cmd_capstone_disassemble_patched(self):
+        gdb = self._gdb
+        gdb.execute("start")
+        cmd = "capstone-disassemble --show-opcodes --length 1 $pc"
+
+        res = gdb.execute(cmd, to_string=True) or ""
+        self.assertNotIn(" nop", res)
+        # twice, from the instruction cache
+        self.assertEqual(gdb.execute(cmd, to_string=True), res)
+
+        # the instructions decoded before the patch are dropped
+        gdb.execute("set {unsigned char}$pc = 0x90")
+        res = gdb.execute(cmd, to_string=True) or ""
+        self.assertIn(" nop", res)
+        self.assertIn(" 90 ", res)
+
+    def test_cmd_capstone_disassemble_sweep(self):
+        gdb = self._gdb
+        gdb.execute("start")
+
+        res = gdb.execute("capstone-disassemble --section .text", to_string=True) or ""
+        self.assertIn("<main>:", res)
+        self.assertIn("insn/s", res)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = pathlib.Path(tmpdir) / "text.asm"
+            cmd = f"capstone-disassemble --show-opcodes --range $pc-$pc+0x40 --output {output}"
+            res = gdb.execute(cmd, to_string=True) or ""
+            self.assertIn(f"written to '{output}'", res)
+            lines = [line for line in output.read_text().splitlines() if line.strip()]
+            self.assertGreater(len(lines), 1)
+            self.assertTrue(lines[0].strip().startswith("0x") or lines[0].startswith("<"))
+
+    def test_cmd_capstone_disassemble_sweep_settings(self):
+        gdb = self._gdb
+        gdb.execute("start")
+
+        # chunks smaller than an instruction must not stall the sweep
+        gdb.execute("gef config capstone-disassemble.sweep_chunk_size 8")
+        res = gdb.execute("capstone-disassemble --section .text", to_string=True) or ""
+        self.assertIn("<main>:", res)
+
+        res = gdb.execute("capstone-disassemble --range unknown_symbol-$pc", to_string=True) or ""
+        self.assertIn("Invalid range", res)
+        self.assertNotIn("Traceback", res)
+
+    def test_cmd_capstone_disassemble_index(self):
+        gdb = self._gdb
+        gdb.execute("start")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            listing = pathlib.Path(tmpdir) / "text.asm"
+            res = gdb.execute(f"capstone-disassemble --section .text --index {listing}",
+                              to_string=True) or ""
+            self.assertIn(f"index '{listing}.idx'", res)
+            self.assertTrue(listing.exists())
+            self.assertIn("<main>:", listing.read_text())
+
+            res = gdb.execute(f"capstone-disassemble --index {listing} --length 3 main",
+                              to_string=True) or ""
+            lines = [line for line in res.splitlines() if line.strip().startswith("0x")]
+            self.assertEqual(len(lines), 3)
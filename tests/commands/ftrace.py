@@ -0,0 +1,142 @@
+"""
+`ftrace` command test module
+"""
+
+import json
+import pathlib
+import tempfile
+
+from tests.base import RemoteGefUnitTestGeneric
+
+from tests.utils import GEF_DEFAULT_TEMPDIR, debug_target
+
+
+NB_CALLS = 4
+
+
+class FtraceCommand(RemoteGefUnitTestGeneric):
+    """`ftrace` command test module"""
+
+    def setUp(self) -> None:
+        self.tempdirfd = tempfile.TemporaryDirectory(prefix=GEF_DEFAULT_TEMPDIR)
+        self.output = pathlib.Path(self.tempdirfd.name) / "trace.jsonl"
+        self._target = debug_target("ftrace")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tempdirfd.cleanup()
+        return super().tearDown()
+
+    def read_records(self) -> list:
+        with self.output.open() as fd:
+            return [json.loads(line) for line in fd]
+
+    def test_cmd_ftrace_regex_ifunc(self):
+        gdb = self._gdb
+        gdb.execute("break main")
+        gdb.execute("run")
+        gdb.execute(f"gef config ftrace.output {self.output}")
+        gdb.execute("gef config ftrace.format jsonl")
+
+        # strlen is an indirect function in the glibc: the calls go to the implementation
+        # selected by its resolver, not to the address of the symbol
+        res = gdb.execute("ftrace --regex '^strlen$' --library libc.so.6", to_string=True) or ""
+        self.assertIn("added 'strlen()'", res)
+        gdb.execute("continue")
+
+        records = self.read_records()
+        self.assertEqual(len(records), NB_CALLS * 2)
+        for record in records:
+            self.assertEqual(record["function"], "strlen")
+            self.assertGreater(record["retval"], 0)
+
+    def test_cmd_ftrace_max_hits(self):
+        gdb = self._gdb
+        gdb.execute("break main")
+        gdb.execute("run")
+        gdb.execute(f"gef config ftrace.output {self.output}")
+        gdb.execute("gef config ftrace.format jsonl")
+
+        gdb.execute("ftrace leaf,1 --max-hits 2")
+        gdb.execute("continue")
+        records = self.read_records()
+        self.assertEqual(len(records), 2)
+        self.assertTrue(all(record["function"] == "leaf" for record in records))
+
+    def test_cmd_ftrace_flush_on_stop(self):
+        gdb = self._gdb
+        gdb.execute("break main")
+        gdb.execute("run")
+        gdb.execute(f"gef config ftrace.output {self.output}")
+        gdb.execute("gef config ftrace.format jsonl")
+        # nothing is written before the process stops
+        gdb.execute("gef config ftrace.buffer_size 100000")
+        gdb.execute("gef config ftrace.flush_interval 3600")
+
+        gdb.execute("ftrace leaf,1")
+        gdb.execute("continue")
+        records = self.read_records()
+        self.assertEqual(len(records), NB_CALLS * 2)
+        self.assertTrue(all(record["function"] == "leaf" for record in records))
+
+    def test_cmd_ftrace_nested_calls(self):
+        gdb = self._gdb
+        gdb.execute("break main")
+        gdb.execute("run")
+        gdb.execute(f"gef config ftrace.output {self.output}")
+        gdb.execute("gef config ftrace.format jsonl")
+        gdb.execute("ftrace branch,1 leaf,1")
+        gdb.execute("continue")
+
+        records = self.read_records()
+        branches = {r["id"]: r for r in records if r["function"] == "branch"}
+        leaves = [r for r in records if r["function"] == "leaf"]
+        self.assertEqual(len(branches), NB_CALLS)
+        self.assertEqual(len(leaves), NB_CALLS * 2)
+        for record in branches.values():
+            self.assertIsNone(record["parent"])
+            self.assertEqual(record["depth"], 1)
+        for record in leaves:
+            self.assertIn(record["parent"], branches)
+            self.assertEqual(record["depth"], 2)
+
+        # every call sleeps 10ms: the exclusive time of `branch` does not include its two
+        # calls to `leaf`, which do not call any traced function
+        res = gdb.execute("ftrace-report", to_string=True) or ""
+        times = {}
+        for line in res.splitlines():
+            fields = line.split()
+            if fields and fields[0] in ("branch", "leaf"):
+                times[fields[0]] = (int(fields[1]), float(fields[2]), float(fields[3]))
+        self.assertEqual(times["branch"][0], NB_CALLS)
+        self.assertEqual(times["leaf"][0], NB_CALLS * 2)
+        self.assertEqual(times["leaf"][1], times["leaf"][2])
+        self.assertGreaterEqual(times["branch"][2], NB_CALLS * 10)
+        self.assertAlmostEqual(times["branch"][1], times["branch"][2] + times["leaf"][1],
+                               delta=0.01)
+        self.assertGreater(times["branch"][1], times["leaf"][1])
+
+    def test_cmd_ftrace_report_jsonl(self):
+        gdb = self._gdb
+        gdb.execute("break main")
+        gdb.execute("run")
+        gdb.execute(f"gef config ftrace.output {self.output}")
+        gdb.execute("gef config ftrace.format jsonl")
+        gdb.execute("ftrace branch,1 leaf,1")
+        gdb.execute("continue")
+        live = gdb.execute("ftrace-report --sort calls", to_string=True) or ""
+
+        # the profile aggregated from the file is the one measured during the trace
+        res = gdb.execute(f"ftrace-report --sort calls {self.output}", to_string=True) or ""
+        self.assertEqual(res, live)
+        res = gdb.execute(f"ftrace-report --tree {self.output}", to_string=True) or ""
+        self.assertIn(f"branch() calls={NB_CALLS} ", res)
+        self.assertIn(f"\n  leaf() calls={NB_CALLS * 2} ", res)
+
+        res = gdb.execute(f"ftrace-report --function leaf {self.output}", to_string=True) or ""
+        self.assertIn("leaf() arg0", res)
+        self.assertIn("leaf() retval", res)
+        self.assertIn(f"{NB_CALLS * 2} (100.0%)", res)
+
+        res = gdb.execute(f"ftrace-report {self.output}.missing", to_string=True) or ""
+        self.assertIn("Failed to read", res)
@@ -0,0 +1,47 @@
+"""
+`peek-pointers` command test module
+"""
+
+from tests.base import RemoteGefUnitTestGeneric
+
+from tests.utils import ERROR_INACTIVE_SESSION_MESSAGE, debug_target
+
+
+class PeekPointersCommand(RemoteGefUnitTestGeneric):
+    """`peek-pointers` command test module"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("pointers")
+        return super().setUp()
+
+    def test_cmd_peek_pointers(self):
+        gdb = self._gdb
+        cmd = "peek-pointers"
+        self.assertEqual(
+            ERROR_INACTIVE_SESSION_MESSAGE, gdb.execute(f"{cmd} 0x1000", to_string=True)
+        )
+
+        gdb.execute("run")
+        node_a = int(gdb.parse_and_eval("(long)&a"))
+        node_b = int(gdb.parse_and_eval("(long)&b"))
+        buffer_var = int(gdb.parse_and_eval("(long)&buffer"))
+        buffer = int(gdb.parse_and_eval("(long)buffer"))
+        page = node_a & ~0xfff
+
+        res = gdb.execute(f"{cmd} {page + 8:#x}", to_string=True) or ""
+        self.assertIn("must be aligned to a page", res)
+
+        # all the pointers of the data of the binary, to any section
+        res = gdb.execute(f"{cmd} {page:#x} all all", to_string=True) or ""
+        self.assertIn(f"Found pointer at {node_a:#x} to {node_b:#x}", res)
+        self.assertIn(f"Found pointer at {buffer_var:#x} to {buffer:#x}", res)
+        self.assertIn("'[heap]'", res)
+
+        # the same, with the memory read by small blocks
+        gdb.execute("python gef.gdb.commands['peek-pointers'].read_size = 0x10")
+        self.assertEqual(gdb.execute(f"{cmd} {page:#x} all all", to_string=True), res)
+
+        # only the first pointer to each section
+        res = gdb.execute(f"{cmd} {page:#x} heap", to_string=True) or ""
+        self.assertEqual(res.count("Found pointer"), 1)
+        self.assertIn(f"Found pointer at {buffer_var:#x} to {buffer:#x}", res)
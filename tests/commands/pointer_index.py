@@ -0,0 +1,69 @@
+"""
+`pointer-index` command test module
+"""
+
+import re
+
+from tests.base import RemoteGefUnitTestGeneric
+
+from tests.utils import ERROR_INACTIVE_SESSION_MESSAGE, debug_target
+
+
+class PointerIndexCommand(RemoteGefUnitTestGeneric):
+    """`pointer-index` command test module"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("pointers")
+        return super().setUp()
+
+    def nb_edges(self, res: str) -> int:
+        return int(re.search(r"(\d+) pointer\(s\) indexed", res).group(1))
+
+    def test_cmd_pointer_index(self):
+        gdb = self._gdb
+        self.assertEqual(
+            ERROR_INACTIVE_SESSION_MESSAGE, gdb.execute("pointer-index build", to_string=True)
+        )
+
+        gdb.execute("run")
+        res = gdb.execute("pointer-index status", to_string=True) or ""
+        self.assertIn("The pointer index is not built", res)
+        res = gdb.execute("pointer-index refresh", to_string=True) or ""
+        self.assertIn("The pointer index is not built", res)
+
+        res = gdb.execute("pointer-index build", to_string=True) or ""
+        nb_edges = self.nb_edges(res)
+        self.assertGreater(nb_edges, 0)
+        res = gdb.execute("pointer-index status", to_string=True) or ""
+        self.assertEqual(self.nb_edges(res), nb_edges)
+
+        buffer = int(gdb.parse_and_eval("(long)buffer"))
+        node_a = int(gdb.parse_and_eval("(long)&a"))
+        node_b = int(gdb.parse_and_eval("(long)&b"))
+        page = buffer & ~0xfff
+        peek = f"peek-pointers {page:#x} pointers all"
+
+        # only the modified page of the heap is scanned again
+        gdb.execute(f"set {{long}}{buffer:#x} = {node_a:#x}")
+        res = gdb.execute("pointer-index refresh", to_string=True) or ""
+        self.assertRegex(res, r" [1-9]\d* page\(s\) scanned again")
+        self.assertEqual(self.nb_edges(res), nb_edges + 1)
+        res = gdb.execute(peek, to_string=True) or ""
+        self.assertIn(f"Found pointer at {buffer:#x} to {node_a:#x}", res)
+
+        # the pointer moved: the stale one is dropped
+        gdb.execute(f"set {{long}}{buffer:#x} = 0")
+        gdb.execute(f"set {{long}}{buffer + 8:#x} = {node_b:#x}")
+        res = gdb.execute("pointer-index refresh", to_string=True) or ""
+        self.assertEqual(self.nb_edges(res), nb_edges + 1)
+        res = gdb.execute(peek, to_string=True) or ""
+        self.assertNotIn(f"Found pointer at {buffer:#x} ", res)
+        self.assertIn(f"Found pointer at {buffer + 8:#x} to {node_b:#x}", res)
+
+        # nothing changed since the last scan
+        res = gdb.execute("pointer-index refresh", to_string=True) or ""
+        self.assertIn(" 0 page(s) scanned again", res)
+
+        gdb.execute("pointer-index clear")
+        res = gdb.execute("pointer-index status", to_string=True) or ""
+        self.assertIn("The pointer index is not built", res)
@@ -0,0 +1,49 @@
+"""
+`current-stack-frame` command test module
+"""
+
+import re
+from typing import Dict
+
+from tests.base import RemoteGefUnitTestGeneric
+
+from tests.utils import ERROR_INACTIVE_SESSION_MESSAGE, debug_target
+
+
+class CurrentStackFrameCommand(RemoteGefUnitTestGeneric):
+    """`current-stack-frame` command test module"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("stack-view")
+        return super().setUp()
+
+    @staticmethod
+    def slots(res: str) -> Dict[int, str]:
+        "Return the dereference chain of every stack slot, without the register hints."
+        slots = {}
+        for m in re.finditer(r"^(0x[0-9a-f]+)│[+-]0x[0-9a-f]+: (.*)$", res, re.MULTILINE):
+            chain = m.group(2).split("\t")[0].replace(" ($savedip)", "")
+            slots[int(m.group(1), 16)] = chain.rstrip()
+        return slots
+
+    def test_cmd_stack_view(self):
+        gdb = self._gdb
+        cmd = "stack-view"
+        self.assertEqual(
+            ERROR_INACTIVE_SESSION_MESSAGE, gdb.execute(cmd, to_string=True)
+        )
+
+        gdb.execute("run")
+        res = gdb.execute(cmd, to_string=True) or ""
+        slots = self.slots(res)
+        self.assertTrue(slots)
+
+        # same output as the `dereference` command, slot by slot
+        res = gdb.execute(f"dereference -l {len(slots)} {min(slots):#x}", to_string=True) or ""
+        self.assertEqual(slots, self.slots(res))
+
+        chains = "\n".join(slots.values())
+        self.assertIn('"a string in .rodata"', chains)
+        self.assertIn('"a string on the stack"', chains)
+        self.assertIn("<frame+", chains)
+        self.assertIn("[loop detected]", chains)
@@ -0,0 +1,50 @@
+"""
+`symbol_index` test module
+"""
+
+import ast
+from typing import Any
+
+import pytest
+
+from tests.base import RemoteGefUnitTestGeneric
+
+from tests.utils import ARCH
+
+
+class SymbolIndex(RemoteGefUnitTestGeneric):
+    """`symbol_index` test module"""
+
+    def evaluate(self, expr: str) -> Any:
+        "Evaluate `expr` in the namespace of the scripts."
+        res = self._gdb.execute(f"python print(repr({expr}))", to_string=True) or ""
+        return ast.literal_eval(res.strip())
+
+    def test_symbol_index_lookup(self):
+        gdb = self._gdb
+        gdb.execute("start")
+        puts = int(gdb.parse_and_eval("(long)&puts"))
+
+        # `puts` and `_IO_puts` are aliases, the index keeps only one of them
+        name, offset = self.evaluate(f"symbol_index.lookup({puts:#x}, fallback=False)")
+        self.assertIn(name, ("puts", "_IO_puts"))
+        self.assertEqual(offset, 0)
+        name, offset = self.evaluate(f"symbol_index.lookup({puts + 1:#x}, fallback=False)")
+        self.assertIn(name, ("puts", "_IO_puts"))
+        self.assertEqual(offset, 1)
+
+        found = self.evaluate("symbol_index.search(r'^(_IO_)?puts$', 'libc')")
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0], (name, puts))
+
+        # the other objfiles are excluded
+        self.assertEqual(self.evaluate("symbol_index.search(r'^(_IO_)?puts$', 'ld-')"), [])
+
+    @pytest.mark.skipif(ARCH not in ("x86_64", "i686", "aarch64"),
+                        reason=f"Skipped for {ARCH}")
+    def test_symbol_index_search_ifunc(self):
+        gdb = self._gdb
+        gdb.execute("start")
+        # the symbol of `strlen` is its resolver, not the implementation used at runtime
+        found = self.evaluate("symbol_index.search(r'^strlen$', 'libc')")
+        self.assertEqual(found, [("strlen", None)])
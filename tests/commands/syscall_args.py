@@ -3,6 +3,8 @@
 """
 
 import pathlib
+import re
+import shutil
 import tempfile
 
 import pytest
@@ -12,8 +14,8 @@ from tests.utils import (
     ARCH,
     ERROR_INACTIVE_SESSION_MESSAGE,
     GEF_DEFAULT_TEMPDIR,
+    GEF_EXTRAS_SCRIPTS_PATH,
     debug_target,
-    download_file,
     removeafter,
     removeuntil,
 )
@@ -23,24 +25,17 @@ from tests.utils import (
 class SyscallArgsCommand(RemoteGefUnitTestGeneric):
     """`syscall-args` command test module"""
 
-    @pytest.mark.online
     def setUp(self) -> None:
         #
         # `syscall-args.out` only work for x86_64 and i686 architectures
         #
         self.tempdirfd = tempfile.TemporaryDirectory(prefix=GEF_DEFAULT_TEMPDIR)
         self.tempdirpath = pathlib.Path(self.tempdirfd.name).absolute()
-        # download some syscall tables from gef-extras
-        base = "https://raw.githubusercontent.com/hugsy/gef-extras/main/scripts/syscall_args/syscall-tables"
+        # copy some of the syscall tables, to use a custom `syscall-args.path`
+        tables = GEF_EXTRAS_SCRIPTS_PATH / "syscall_args" / "syscall-tables"
         # todo: maybe add "PowerPC", "PowerPC64", "SPARC", "SPARC64"
         for arch in ("ARM", "ARM_OABI", "X86", "X86_64"):
-            url = f"{base}/{arch}.py"
-            data = download_file(url)
-            if not data:
-                raise Exception(f"Failed to download {arch}.py ({url})")
-            fpath = self.tempdirpath / f"{arch}.py"
-            with fpath.open("wb") as fd:
-                fd.write(data)
+            shutil.copy(tables / f"{arch}.json", self.tempdirpath / f"{arch}.json")
 
         self._target = debug_target("syscall-args")
         return super().setUp()
@@ -67,6 +62,16 @@ class SyscallArgsCommand(RemoteGefUnitTestGeneric):
         res = gdb.execute("syscall-args", to_string=True) or ""
         self.assertIn("Detected syscall open", res)
 
+    def test_cmd_syscall_args_compiled_tables(self):
+        gdb = self._gdb
+        gdb.execute("catch syscall openat")
+        gdb.execute("run")
+
+        # default path, with the compiled JSON tables
+        res = gdb.execute("syscall-args", to_string=True) or ""
+        self.assertIn("Detected syscall open", res)
+        self.assertIn("filename", res)
+
 
 @pytest.mark.skipif(ARCH not in ("i686", "x86_64"), reason=f"Skipped for {ARCH}")
 class IsSyscallCommand(RemoteGefUnitTestGeneric):
@@ -107,3 +112,60 @@ class IsSyscallCommand(RemoteGefUnitTestGeneric):
         res = gdb.execute("is-syscall", to_string=True) or ""
         assert res
         self.assertIn("Current instruction is a syscall", res)
+
+
+@pytest.mark.skipif(ARCH not in ("i686", "x86_64"), reason=f"Skipped for {ARCH}")
+class SyscallTraceCommand(RemoteGefUnitTestGeneric):
+    """`syscall-trace` command test module"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("syscall-args")
+        return super().setUp()
+
+    def test_cmd_syscall_trace(self):
+        gdb = self._gdb
+        res = gdb.execute("syscall-trace start openat", to_string=True) or ""
+        self.assertIn("Tracing syscalls with catchpoint", res)
+
+        gdb.execute("run")
+        res = gdb.execute("syscall-trace show", to_string=True) or ""
+        self.assertIn("openat(", res)
+        self.assertIn(") = ", res)
+
+        gdb.execute("syscall-trace clear")
+        res = gdb.execute("syscall-trace show", to_string=True) or ""
+        self.assertNotIn("openat(", res)
+
+
+NB_SYSCALLS = 10000
+
+
+@pytest.mark.skipif(ARCH not in ("i686", "x86_64"), reason=f"Skipped for {ARCH}")
+class SyscallTraceRateCommand(RemoteGefUnitTestGeneric):
+    """`syscall-trace` command test module, on a process making many syscalls"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("syscall-trace")
+        return super().setUp()
+
+    def test_cmd_syscall_trace_no_stop(self):
+        gdb = self._gdb
+        gdb.execute("syscall-trace start --depth 0 --size 0 getppid")
+
+        # the traced syscalls do not stop the process
+        res = gdb.execute("run", to_string=True) or ""
+        self.assertIn(f"Syscall trace stopped, {NB_SYSCALLS} syscall(s) recorded", res)
+        res = gdb.execute("syscall-trace show", to_string=True) or ""
+        self.assertEqual(res.count("getppid() = "), NB_SYSCALLS)
+        res = gdb.execute("info breakpoints", to_string=True) or ""
+        self.assertNotIn("catchpoint", res)
+
+    @pytest.mark.benchmark
+    def test_cmd_syscall_trace_rate(self):
+        gdb = self._gdb
+        gdb.execute("syscall-trace start --depth 0 getppid")
+        res = gdb.execute("run", to_string=True) or ""
+        match = re.search(r"\((\d+) syscalls/s\)", res)
+        assert match
+        # far more than a stop and resume of GDB (with its stop hooks) per syscall
+        self.assertGreater(int(match.group(1)), 1000)
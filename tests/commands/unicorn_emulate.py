@@ -3,6 +3,10 @@ unicorn-emulate command test module
 """
 
 
+import json
+import pathlib
+import tempfile
+
 import pytest
 from tests.base import RemoteGefUnitTestGeneric
 
@@ -53,3 +57,67 @@ class UnicornEmulateCommand(RemoteGefUnitTestGeneric):
             res[res.find(start_marker) : res.find(end_marker)].splitlines()[1:-1]
         )
         self.assertGreaterEqual(insn_executed, nb_insn)
+
+    @pytest.mark.skipif(ARCH not in ["x86_64"], reason=f"Skipped for {ARCH}")
+    def test_cmd_unicorn_emulate_batch(self):
+        gdb = self._gdb
+        nb_insn = 4
+
+        gdb.execute("break function1")
+        gdb.execute("run")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            batch = pathlib.Path(tmpdir) / "variants.jsonl"
+            output = pathlib.Path(tmpdir) / "results.jsonl"
+            batch.write_text(
+                "\n".join(json.dumps({"registers": {"$rax": i}}) for i in range(8))
+            )
+
+            res = gdb.execute(
+                f"emu --batch {batch} --batch-output {output} {nb_insn}", to_string=True
+            ) or ""
+            self.assertNotIn("Cannot load batch file", res)
+
+            results = [json.loads(line) for line in output.read_text().splitlines()]
+
+            # the pages already mapped by the emulation of the same stop are not read again
+            gdb.execute(f"emu {nb_insn}")
+            gdb.execute("gef config unicorn-emulate.verbose True")
+            res = gdb.execute(
+                f"emu --batch {batch} --batch-output {output} {nb_insn}", to_string=True
+            ) or ""
+            self.assertRegex(res, r"Page cache: \d+ page\(s\) cached, [1-9]\d* hit\(s\)")
+
+        self.assertEqual(len(results), 8)
+        for i, result in enumerate(results):
+            self.assertEqual(result["id"], i)
+            self.assertEqual(result["stop_reason"], "end")
+            self.assertGreaterEqual(result["instructions"], nb_insn)
+
+    @pytest.mark.skipif(ARCH not in ["x86_64"], reason=f"Skipped for {ARCH}")
+    def test_cmd_unicorn_emulate_trace(self):
+        gdb = self._gdb
+        nb_insn = 4
+
+        gdb.execute("break function1")
+        gdb.execute("run")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trace = pathlib.Path(tmpdir) / "trace.bin"
+            res = gdb.execute(f"emu --trace {trace} {nb_insn}", to_string=True) or ""
+            self.assertNotIn("Emulation failed", res)
+            self.assertIn(f"traced into '{trace}'", res)
+            nb_blocks = int(res.split(" basic block(s) traced")[0].split()[-1])
+            self.assertGreater(nb_blocks, 0)
+
+            res = gdb.execute(f"emulate-trace show {trace}", to_string=True) or ""
+            self.assertIn(f"{nb_blocks} basic block(s)", res)
+            self.assertGreaterEqual(res.count(">>> 0x"), nb_insn)
+
+            res = gdb.execute(f"emulate-trace show --summary {trace}", to_string=True) or ""
+            self.assertNotIn(">>> 0x", res)
+
+            # the trace is only recorded by the emulation done in GEF
+            for option in (f"--batch {trace}", f"--output-file {tmpdir}/emu.py"):
+                res = gdb.execute(f"emu --trace {trace} {option} {nb_insn}", to_string=True) or ""
+                self.assertIn("--trace cannot be used", res)
@@ -3,6 +3,8 @@
 """
 
 
+import json
+
 import pytest
 from tests.base import RemoteGefUnitTestGeneric
 
@@ -34,3 +36,98 @@ class VisualizeLibcHeapChunksCommand(RemoteGefUnitTestGeneric):
 
         for i in range(4):
             self.assertIn(f"0x0000000000000000    ........   Chunk[{i}]", res)
+
+    @pytest.mark.skipif(ARCH not in ["x86_64", "i686"], reason=f"Skipped for {ARCH}")
+    def test_cmd_heap_view_snapshot_diff(self):
+        gdb = self._gdb
+        cmd = "visualize-libc-heap-chunks"
+        gdb.execute("run")
+
+        res = gdb.execute(f"{cmd} --snapshot a", to_string=True) or ""
+        self.assertIn("Snapshot 'a'", res)
+        gdb.execute(f"{cmd} --snapshot b")
+        res = gdb.execute(f"{cmd} --diff a b", to_string=True) or ""
+        self.assertIn("0 difference(s) between 'a' and 'b'", res)
+
+        res = gdb.execute(f"{cmd} --diff a missing", to_string=True) or ""
+        self.assertIn("Unknown snapshot 'missing'", res)
+
+    @pytest.mark.skipif(ARCH not in ["x86_64", "i686"], reason=f"Skipped for {ARCH}")
+    def test_cmd_heap_stats(self):
+        gdb = self._gdb
+        cmd = "heap-stats"
+        self.assertEqual(
+            ERROR_INACTIVE_SESSION_MESSAGE, gdb.execute(cmd, to_string=True)
+        )
+
+        gdb.execute("run")
+        res = gdb.execute(cmd, to_string=True) or ""
+        self.assertIn("Largest free run", res)
+
+        res = gdb.execute(f"{cmd} --json", to_string=True) or ""
+        stats = json.loads(res)
+        self.assertGreater(stats["chunks"], 0)
+        self.assertEqual(stats["chunks"], stats["in_use"]["chunks"] + stats["free"]["chunks"])
+        self.assertEqual(stats["chunks"], sum(x["in_use"] + x["free"] for x in stats["histogram"]))
+
+
+class VisualizeLibcHeapChunksBinsCommand(RemoteGefUnitTestGeneric):
+    """`visualize-libc-heap-chunks` command test module, for the annotations of the freed
+    chunks"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("heap-bins")
+        return super().setUp()
+
+    @pytest.mark.skipif(ARCH not in ["x86_64", "i686"], reason=f"Skipped for {ARCH}")
+    def test_cmd_heap_view_bins(self):
+        gdb = self._gdb
+        cmd = "visualize-libc-heap-chunks"
+        gdb.execute("run")
+
+        # the pointers to the freed chunks are annotated with their bin
+        res = gdb.execute(cmd, to_string=True) or ""
+        self.assertGreaterEqual(res.count("tcachebins["), 7)
+        self.assertIn("(size=0x20)", res)
+        self.assertGreaterEqual(res.count("fastbins["), 1)
+
+        res = gdb.execute("heap-stats --json", to_string=True) or ""
+        stats = json.loads(res)
+        self.assertEqual(stats["free"]["chunks"], 8)
+        self.assertEqual(stats["tcache"], [{"size": 0x20, "count": 7}])
+
+
+class VisualizeLibcHeapChunksMultipleHeapsCommand(RemoteGefUnitTestGeneric):
+    """`visualize-libc-heap-chunks` command test module, for a thread arena made of several
+    heaps"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("heap-multiple-heaps")
+        return super().setUp()
+
+    @pytest.mark.skipif(ARCH not in ["x86_64", "i686"], reason=f"Skipped for {ARCH}")
+    def test_cmd_heap_view_thread_arena_multiple_heaps(self):
+        gdb = self._gdb
+        cmd = "visualize-libc-heap-chunks"
+        gdb.execute("run")
+
+        res = gdb.execute(f"{cmd} --summary", to_string=True) or ""
+        self.assertIn("main_arena@", res)
+        self.assertIn("\narena@", res)
+
+        res = gdb.execute(cmd, to_string=True) or ""
+        self.assertNotIn("Corrupted heap", res)
+        # the chunks of the thread, on both heaps of its arena
+        self.assertGreater(res.count("   Chunk["), 512)
+        self.assertEqual(res.count("Top Chunk Size"), 2)
+
+    @pytest.mark.skipif(ARCH not in ["x86_64", "i686"], reason=f"Skipped for {ARCH}")
+    def test_cmd_heap_view_snapshot_all_arenas(self):
+        gdb = self._gdb
+        cmd = "visualize-libc-heap-chunks"
+        gdb.execute("run")
+
+        res = gdb.execute(f"{cmd} --snapshot a", to_string=True) or ""
+        # the chunks of the thread arena are recorded too
+        nb_chunks = int(res.split("Snapshot 'a': ")[1].split()[0])
+        self.assertGreater(nb_chunks, 512)
@@ -0,0 +1,93 @@
+"""
+`xref-telescope` command test module
+"""
+
+import json
+import pathlib
+import re
+import tempfile
+from typing import List, Tuple
+
+from tests.base import RemoteGefUnitTestGeneric
+
+from tests.utils import GEF_DEFAULT_TEMPDIR, debug_target
+
+
+class XRefTelescopeCommand(RemoteGefUnitTestGeneric):
+    """`xref-telescope` command test module"""
+
+    def setUp(self) -> None:
+        self._target = debug_target("pointers")
+        return super().setUp()
+
+    @staticmethod
+    def nodes(res: str) -> List[Tuple[int, bool]]:
+        "Return the (address, already visited) nodes of a printed tree."
+        return [(int(m.group(1), 16), m.group(2) is not None)
+                for m in re.finditer(r"[├└]── (0x[0-9a-f]+) .*?( \(already visited\))?$", res,
+                                     re.MULTILINE)]
+
+    def test_cmd_xref_telescope_breadth_first(self):
+        gdb = self._gdb
+        gdb.execute("run")
+        node_a = int(gdb.parse_and_eval("(long)&a"))
+        node_b = int(gdb.parse_and_eval("(long)&b"))
+        node_c = int(gdb.parse_and_eval("(long)&c"))
+
+        res = gdb.execute(f"xref-telescope {node_a:#x} 4", to_string=True) or ""
+        depth_first = self.nodes(res)
+        res = gdb.execute(f"xref-telescope --breadth-first {node_a:#x} 4", to_string=True) or ""
+        breadth_first = self.nodes(res)
+        self.assertEqual(depth_first, breadth_first)
+
+        # a <- c <- b <- a: the walk stops when it comes back to the visited nodes
+        addresses = [address for address, visited in breadth_first if not visited]
+        for node in (node_a, node_b, node_c):
+            self.assertIn(node, addresses)
+        self.assertEqual(len(addresses), len(set(addresses)))
+        self.assertIn((node_c, True), breadth_first)
+
+    def test_cmd_xref_telescope_limits(self):
+        gdb = self._gdb
+        gdb.execute("run")
+        node_a = int(gdb.parse_and_eval("(long)&a"))
+
+        for mode in ("", "--breadth-first "):
+            # `a` is referenced by `c` and by every item of `refs`
+            res = gdb.execute(f"xref-telescope {mode}--max-fanout 2 {node_a:#x} 1",
+                              to_string=True) or ""
+            self.assertEqual(len(self.nodes(res)), 2)
+            res = gdb.execute(f"xref-telescope {mode}--max-fanout 1 {node_a:#x} 4",
+                              to_string=True) or ""
+            for line in res.splitlines():
+                self.assertNotIn("├──", line)
+
+            res = gdb.execute(f"xref-telescope {mode}--max-results 3 {node_a:#x} 4",
+                              to_string=True) or ""
+            self.assertEqual(len(self.nodes(res)), 3)
+            self.assertIn("Stopped after 3 result(s)", res)
+
+    def test_cmd_xref_telescope_output(self):
+        gdb = self._gdb
+        gdb.execute("run")
+        node_a = int(gdb.parse_and_eval("(long)&a"))
+        res = gdb.execute(f"xref-telescope {node_a:#x} 4", to_string=True) or ""
+        expected = {address for address, visited in self.nodes(res) if not visited}
+
+        with tempfile.TemporaryDirectory(prefix=GEF_DEFAULT_TEMPDIR) as tmpdir:
+            output = pathlib.Path(tmpdir) / "xrefs.jsonl"
+            for mode in ("", "--breadth-first "):
+                res = gdb.execute(f"xref-telescope {mode}--output {output} {node_a:#x} 4",
+                                  to_string=True) or ""
+                self.assertIn(f"{len(expected)} node(s) written to '{output}'", res)
+                records = [json.loads(line) for line in output.read_text().splitlines()]
+
+                # every node is written once, after its parent
+                addresses = [record["address"] for record in records]
+                self.assertEqual(len(addresses), len(set(addresses)))
+                self.assertEqual(set(addresses), expected)
+                written = set()
+                for record in records:
+                    self.assertTrue(record["parent"] is None or record["parent"] in written)
+                    self.assertEqual(record["depth"] == 1, record["parent"] is None)
+                    written.add(record["address"])